@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Seeded synthetic dataset generator for the Auditor Helper benchmark suite
+
+Builds a database with the real application schema (via the versioned
+migrations) and fills it with weeks, tasks, bonus weeks and feedback text.
+The same seed and size always produce byte-for-byte identical rows, so
+benchmark numbers from different runs and machines describe the same data.
+
+    python performance/benchmark_data.py bench.db --tasks 100000
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import sys
+import time
+from datetime import date, timedelta
+from itertools import islice
+
+# Add src to path for application imports
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from core.db.schema_migrations import run_pending_migrations
+
+# Named dataset sizes used by the benchmark suite
+SCALES = {
+    '1k': 1_000,
+    '100k': 100_000,
+    '1m': 1_000_000,
+}
+
+DEFAULT_SEED = 1337
+TASKS_PER_WEEK = 250
+BONUS_WEEK_RATIO = 0.25
+FEEDBACK_RATIO = 0.6
+FIRST_WEEK_START = date(2020, 1, 6)  # A Monday
+
+PROJECTS = [
+    ("P100", "Search Relevance"), ("P200", "Ads Quality"), ("P300", "Maps Review"),
+    ("P400", "Image Labeling"), ("P500", "Translation QA"), ("P600", "Voice Transcripts"),
+    ("P700", "Safety Review"), ("P800", "Shopping Feeds"),
+]
+LOCALES = ["en_US", "en_GB", "es_ES", "fr_FR", "de_DE", "ja_JP", "pt_BR"]
+TIME_LIMITS = ["00:30:00", "01:00:00", "01:30:00", "02:00:00"]
+FEEDBACK_WORDS = (
+    "rating instructions followed correctly missing context ambiguous query accurate "
+    "translation tone formatting citation source relevant irrelevant duplicate spam "
+    "needs review excellent partial incomplete unclear policy violation good detail"
+).split()
+
+TASK_INSERT_SQL = """
+    INSERT INTO tasks (week_id, attempt_id, duration, project_id, project_name, operation_id,
+                       time_limit, date_audited, score, feedback, locale, bonus_paid,
+                       time_begin, time_end)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def _format_seconds(total_seconds):
+    hours, remainder = divmod(int(total_seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+def generate_weeks(task_count, rng):
+    """Yield (id, week_label, start_date, end_date, is_bonus_week) rows"""
+    week_count = max(1, -(-task_count // TASKS_PER_WEEK))
+    for index in range(week_count):
+        start = FIRST_WEEK_START + timedelta(weeks=index)
+        end = start + timedelta(days=6)
+        label = f"{start.strftime('%d/%m/%Y')} - {end.strftime('%d/%m/%Y')}"
+        yield (index + 1, label, start.isoformat(), end.isoformat(),
+               1 if rng.random() < BONUS_WEEK_RATIO else 0)
+
+
+def generate_tasks(task_count, week_count, rng):
+    """Yield task rows in TASK_INSERT_SQL order"""
+    for index in range(task_count):
+        week_index = min(index // TASKS_PER_WEEK, week_count - 1)
+        week_start = FIRST_WEEK_START + timedelta(weeks=week_index)
+        project_id, project_name = rng.choice(PROJECTS)
+        duration = rng.randint(120, 5400)
+        begin = rng.randint(6 * 3600, 20 * 3600)
+        feedback = None
+        if rng.random() < FEEDBACK_RATIO:
+            feedback = " ".join(rng.choice(FEEDBACK_WORDS) for _ in range(rng.randint(5, 60)))
+        yield (
+            week_index + 1,
+            f"att-{index:07d}",
+            _format_seconds(duration),
+            project_id,
+            project_name,
+            f"op-{rng.randrange(1_000_000):06d}",
+            rng.choice(TIME_LIMITS),
+            (week_start + timedelta(days=rng.randrange(7))).isoformat(),
+            rng.randint(1, 5),
+            feedback,
+            rng.choice(LOCALES),
+            1 if rng.random() < 0.1 else 0,
+            _format_seconds(begin),
+            _format_seconds(begin + duration),
+        )
+
+
+def generate_dataset(db_path, task_count, seed=DEFAULT_SEED, batch_size=10_000):
+    """
+    Create a fresh database at db_path with task_count tasks.
+    Returns a summary dict (counts, seed, generation time).
+    """
+    if os.path.exists(db_path):
+        os.remove(db_path)
+
+    start = time.perf_counter()
+    rng = random.Random(seed)
+    conn = sqlite3.connect(db_path)
+    try:
+        run_pending_migrations(conn)
+
+        # Bulk-load settings for this connection only
+        conn.execute("PRAGMA synchronous = OFF")
+        conn.execute("PRAGMA journal_mode = MEMORY")
+
+        weeks = list(generate_weeks(task_count, rng))
+        with conn:
+            conn.executemany(
+                "INSERT INTO weeks (id, week_label, start_date, end_date, is_bonus_week) VALUES (?, ?, ?, ?, ?)",
+                weeks
+            )
+
+        rows = generate_tasks(task_count, len(weeks), rng)
+        while True:
+            batch = list(islice(rows, batch_size))
+            if not batch:
+                break
+            with conn:
+                conn.executemany(TASK_INSERT_SQL, batch)
+
+        conn.execute("ANALYZE")
+        conn.commit()
+    finally:
+        conn.close()
+
+    return {
+        'tasks': task_count,
+        'weeks': len(weeks),
+        'bonus_weeks': sum(week[4] for week in weeks),
+        'seed': seed,
+        'generation_seconds': round(time.perf_counter() - start, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generate a seeded Auditor Helper benchmark database")
+    parser.add_argument("db_path", help="Database file to create (overwritten if it exists)")
+    parser.add_argument("--tasks", type=int, default=SCALES['1k'], help="Number of tasks to generate")
+    parser.add_argument("--seed", type=int, default=DEFAULT_SEED, help="Random seed")
+    args = parser.parse_args()
+
+    summary = generate_dataset(args.db_path, args.tasks, seed=args.seed)
+    print(f"Generated {summary['tasks']} tasks in {summary['weeks']} weeks "
+          f"({summary['bonus_weeks']} bonus) in {summary['generation_seconds']}s")
+
+
+if __name__ == "__main__":
+    main()
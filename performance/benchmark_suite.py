@@ -0,0 +1,455 @@
+#!/usr/bin/env python3
+"""
+Reproducible benchmark suite for Auditor Helper
+
+Generates a seeded synthetic database per scale (see benchmark_data.py),
+runs every benchmark against it in a fresh interpreter, and compares the
+median timings with the stored JSON baselines.
+
+    # Run the 1k and 100k scales and compare with the baselines
+    python performance/benchmark_suite.py --scales 1k 100k
+
+    # Record new baselines (after an intentional performance change)
+    python performance/benchmark_suite.py --scales 1k 100k 1m --update-baselines
+
+    # Allow 50% slowdown before failing
+    python performance/benchmark_suite.py --tolerance 0.5
+
+Exits with status 1 when any benchmark is slower than its baseline by more
+than the tolerance (and by more than --min-delta-ms, to ignore noise on
+sub-millisecond cases), when a benchmark raises, or when a baselined
+benchmark of the selected scales produces no result. Baselines are machine
+specific; record them on the machine that runs the comparison.
+
+Benchmarks whose dependencies are missing (PySide6 for the QML model, pandas
+for exports) are reported as skipped rather than failing the run.
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PERFORMANCE_DIR = Path(__file__).resolve().parent
+SRC_DIR = PERFORMANCE_DIR.parent / 'src'
+
+DEFAULT_BASELINE_FILE = PERFORMANCE_DIR / 'benchmark_baselines.json'
+DEFAULT_SCALES = ['1k', '100k']
+DEFAULT_REPEAT = 5
+DEFAULT_TOLERANCE = 0.25      # 25% slower than baseline fails
+DEFAULT_MIN_DELTA_MS = 2.0    # Differences below this are noise
+
+# Environment variable read by core.db.database_config
+DB_PATH_ENV = 'AUDITOR_HELPER_DB_PATH'
+
+# Registry of benchmark name -> setup(ctx) returning (run, reset)
+BENCHMARKS = {}
+
+
+def benchmark(name):
+    """Register a benchmark. The setup function returns (run, reset); reset may be None."""
+    def register(setup):
+        BENCHMARKS[name] = setup
+        return setup
+    return register
+
+
+# ----------------------------------------------------------------------
+# Benchmarks (run inside the worker process)
+# ----------------------------------------------------------------------
+
+def _data_service():
+    from core.services import DataService
+    return DataService.get_instance()
+
+
+def _clear_cache():
+    _data_service().cache_manager.clear_all_cache()
+
+
+@benchmark("dao.weeks_chronological")
+def bench_weeks_chronological(ctx):
+    from core.services import WeekDAO
+    week_dao = WeekDAO(_data_service())
+    return (lambda: week_dao.get_weeks_chronological(use_cache=False)), None
+
+
+@benchmark("dao.tasks_by_week")
+def bench_tasks_by_week(ctx):
+    from core.services import TaskDAO
+    task_dao = TaskDAO(_data_service())
+    return (lambda: task_dao.get_tasks_by_week(ctx['week_id'], use_cache=False)), None
+
+
+@benchmark("dao.tasks_by_date_range")
+def bench_tasks_by_date_range(ctx):
+    from core.services import TaskDAO
+    task_dao = TaskDAO(_data_service())
+    return (lambda: task_dao.get_tasks_by_date_range(ctx['range_start'], ctx['range_end'])), _clear_cache
+
+
+@benchmark("dao.task_statistics")
+def bench_task_statistics(ctx):
+    from core.services import TaskDAO
+    task_dao = TaskDAO(_data_service())
+    return task_dao.get_task_statistics, _clear_cache
+
+
+@benchmark("dao.weeks_with_task_counts")
+def bench_weeks_with_task_counts(ctx):
+    from core.services import WeekDAO
+    week_dao = WeekDAO(_data_service())
+    return week_dao.get_weeks_with_task_counts, _clear_cache
+
+
+@benchmark("dao.search_tasks_prefix")
+def bench_search_tasks(ctx):
+    from core.services import TaskDAO
+    task_dao = TaskDAO(_data_service())
+    return (lambda: task_dao.search_tasks("transl acc")), None
+
+
+@benchmark("stats.aggregate_week")
+def bench_aggregate_statistics(ctx):
+    from analysis.analysis_module.data_manager import DataManager
+    manager = DataManager()
+    tasks_data = manager.get_tasks_data_by_time_range(ctx['range_start'], ctx['range_end'])
+    return (lambda: manager.calculate_aggregate_statistics(tasks_data, ctx['week_id'])), None
+
+
+@benchmark("stats.daily_range")
+def bench_daily_statistics(ctx):
+    from analysis.analysis_module.data_manager import DataManager
+    manager = DataManager()
+    tasks_data = manager.get_tasks_data_by_time_range(ctx['range_start'], ctx['range_end'])
+    return (lambda: manager.calculate_daily_statistics(tasks_data)), None
+
+
+@benchmark("chart.projects_duration_all")
+def bench_chart_projects(ctx):
+    from analysis.analysis_module.data_manager import DataManager
+    manager = DataManager()
+    return (lambda: manager.get_constrained_chart_data(
+        'projects', 'duration_average', 'bar', None, ctx['all_start'], ctx['all_end'])), None
+
+
+@benchmark("chart.time_month_money_all")
+def bench_chart_months(ctx):
+    from analysis.analysis_module.data_manager import DataManager
+    manager = DataManager()
+    return (lambda: manager.get_constrained_chart_data(
+        'time_month', 'money_made_total', 'line', None, ctx['all_start'], ctx['all_end'])), None
+
+
+@benchmark("cache.memory_set_get")
+def bench_memory_cache(ctx):
+    from core.cache.memory_cache import MemoryCache
+    cache = MemoryCache(max_size=1000, default_ttl=3600)
+    payload = {'rows': list(range(50))}
+
+    def run():
+        for i in range(1000):
+            cache.set(f"key:{i}", payload)
+            cache.get(f"key:{i}")
+    return run, cache.clear
+
+
+@benchmark("cache.multi_tier_query_hit")
+def bench_multi_tier_hit(ctx):
+    from core.services import TaskDAO
+    task_dao = TaskDAO(_data_service())
+    task_dao.get_tasks_by_week(ctx['week_id'])  # Populate the cache tiers
+    return (lambda: task_dao.get_tasks_by_week(ctx['week_id'])), None
+
+
+@benchmark("io.export_week_csv")
+def bench_export_week(ctx):
+    from core.db.export_data import export_week_to_csv
+    import pandas  # noqa: F401  (export requires pandas; skip when missing)
+    target = os.path.join(ctx['work_dir'], 'export_week.csv')
+    return (lambda: export_week_to_csv(ctx['week_id'], target)), _clear_cache
+
+
+@benchmark("io.import_week_csv")
+def bench_import_week(ctx):
+    import contextlib
+    import io
+    from core.db.import_data import main_import
+
+    def run():
+        # The importer reports progress on stdout; keep the worker output clean
+        with contextlib.redirect_stdout(io.StringIO()):
+            main_import(ctx['import_csv'])
+    return run, None
+
+
+@benchmark("qml.refresh_tasks")
+def bench_qml_refresh(ctx):
+    from PySide6 import QtCore
+    app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+    from ui.qml_task_model import QMLTaskModel
+    model = QMLTaskModel()
+    ctx['_qt_app'] = app
+    return (lambda: model.refreshTasks(ctx['week_id'])), None
+
+
+def _write_import_csv(path, week_id):
+    """Write a week of tasks in the exporter's CSV layout, for the import benchmark"""
+    import csv
+    import sqlite3
+    headers = ["Attempt ID", "Duration", "Project ID", "Project Name", "Operation ID",
+               "Time Limit", "Date Audited", "Score", "Feedback", "Locale"]
+    conn = sqlite3.connect(os.environ[DB_PATH_ENV])
+    try:
+        rows = conn.execute("""
+            SELECT attempt_id || '-imported', duration, project_id, project_name, operation_id,
+                   time_limit, date_audited, score, feedback, locale
+            FROM tasks WHERE week_id = ? ORDER BY id
+        """, (week_id,)).fetchall()
+    finally:
+        conn.close()
+    with open(path, 'w', newline='', encoding='utf-8') as f:
+        writer = csv.writer(f)
+        writer.writerow(headers)
+        writer.writerows(rows)
+
+
+def _build_context(work_dir):
+    import sqlite3
+    conn = sqlite3.connect(os.environ[DB_PATH_ENV])
+    try:
+        week_ids = [row[0] for row in conn.execute("SELECT id FROM weeks ORDER BY start_date, id")]
+        week_id = week_ids[len(week_ids) // 2]
+        # Four weeks ending with the benchmark week
+        first = week_ids[max(0, len(week_ids) // 2 - 3)]
+        range_start = conn.execute("SELECT start_date FROM weeks WHERE id = ?", (first,)).fetchone()[0]
+        range_end = conn.execute("SELECT end_date FROM weeks WHERE id = ?", (week_id,)).fetchone()[0]
+        all_start, all_end = conn.execute("SELECT MIN(start_date), MAX(end_date) FROM weeks").fetchone()
+    finally:
+        conn.close()
+
+    ctx = {
+        'work_dir': work_dir,
+        'week_id': week_id,
+        'range_start': range_start,
+        'range_end': range_end,
+        'all_start': all_start,
+        'all_end': all_end,
+        'import_csv': os.path.join(work_dir, 'auditor_tasks_benchmark-import.csv'),
+    }
+    _write_import_csv(ctx['import_csv'], week_id)
+    return ctx
+
+
+def time_benchmark(run, reset=None, repeat=DEFAULT_REPEAT):
+    """Time run() repeat times after one warm-up call. reset() runs untimed before each call."""
+    if reset:
+        reset()
+    run()  # Warm-up: imports, statement cache, page cache
+    samples = []
+    for _ in range(repeat):
+        if reset:
+            reset()
+        start = time.perf_counter()
+        run()
+        samples.append((time.perf_counter() - start) * 1000)
+    return {
+        'median_ms': round(statistics.median(samples), 3),
+        'min_ms': round(min(samples), 3),
+        'max_ms': round(max(samples), 3),
+        'runs': repeat,
+    }
+
+
+def run_worker(output_path, repeat, only=None):
+    """Run the benchmarks against the database named by AUDITOR_HELPER_DB_PATH"""
+    sys.path.insert(0, str(SRC_DIR))
+    work_dir = os.getcwd()
+    ctx = _build_context(work_dir)
+
+    results = {}
+    for name, setup in BENCHMARKS.items():
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        try:
+            run, reset = setup(ctx)
+        except ImportError as e:
+            results[name] = {'skipped': f"missing dependency: {e.name or e}"}
+            continue
+        try:
+            results[name] = time_benchmark(run, reset, repeat)
+        except Exception as e:
+            results[name] = {'error': f"{type(e).__name__}: {e}"}
+
+    with open(output_path, 'w', encoding='utf-8') as f:
+        json.dump(results, f, indent=2)
+
+
+# ----------------------------------------------------------------------
+# Orchestration (parent process)
+# ----------------------------------------------------------------------
+
+def run_scale(scale, repeat, seed, only=None, keep_dir=False):
+    """Generate the dataset for one scale and run the benchmarks in a fresh interpreter"""
+    from benchmark_data import SCALES, generate_dataset
+
+    work_dir = tempfile.mkdtemp(prefix=f"auditor_bench_{scale}_")
+    db_path = os.path.join(work_dir, f"bench_{scale}.db")
+    summary = generate_dataset(db_path, SCALES[scale], seed=seed)
+    print(f"[{scale}] dataset: {summary['tasks']} tasks, {summary['weeks']} weeks "
+          f"({summary['generation_seconds']}s)")
+
+    output_path = os.path.join(work_dir, 'results.json')
+    command = [sys.executable, str(Path(__file__).resolve()), '--worker', output_path,
+               '--repeat', str(repeat)]
+    if only:
+        command += ['--only', *only]
+    env = dict(os.environ, **{DB_PATH_ENV: db_path, 'QT_QPA_PLATFORM': 'offscreen'})
+    # The worker's cwd isolates the SQLite cache tier and any export files
+    completed = subprocess.run(command, cwd=work_dir, env=env, capture_output=True, text=True)
+    if completed.returncode != 0:
+        raise RuntimeError(f"Benchmark worker for {scale} failed:\n{completed.stderr[-2000:]}")
+
+    with open(output_path, 'r', encoding='utf-8') as f:
+        results = json.load(f)
+
+    if not keep_dir:
+        import shutil
+        shutil.rmtree(work_dir, ignore_errors=True)
+    return {f"{scale}/{name}": result for name, result in results.items()}
+
+
+def load_baselines(path):
+    if not os.path.exists(path):
+        return {}
+    with open(path, 'r', encoding='utf-8') as f:
+        return json.load(f).get('benchmarks', {})
+
+
+def save_baselines(path, results, seed, existing=None):
+    """Merge timed results into the baseline file (skipped/errored entries are not stored)"""
+    benchmarks = dict(existing or {})
+    for key, result in results.items():
+        if 'median_ms' in result:
+            benchmarks[key] = {'median_ms': result['median_ms']}
+    data = {
+        'metadata': {
+            'recorded_at': time.strftime('%Y-%m-%dT%H:%M:%S'),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'seed': seed,
+        },
+        'benchmarks': dict(sorted(benchmarks.items())),
+    }
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+        f.write('\n')
+
+
+def compare_to_baselines(results, baselines, tolerance=DEFAULT_TOLERANCE, min_delta_ms=DEFAULT_MIN_DELTA_MS,
+                         scales=None, only=None):
+    """
+    Return a list of failure descriptions (empty when everything is within tolerance)
+
+    Failures are slowdowns beyond the tolerance, benchmarks that raised, and
+    baselined benchmarks of the selected scales/prefixes that produced no
+    result at all. Skipped benchmarks (missing optional dependency) are not
+    failures.
+    """
+    failures = []
+    for key, result in sorted(results.items()):
+        if 'error' in result:
+            failures.append(f"{key}: error: {result['error']}")
+            continue
+        baseline = baselines.get(key)
+        if baseline is None or 'median_ms' not in result:
+            continue
+        current, previous = result['median_ms'], baseline['median_ms']
+        if current > previous * (1 + tolerance) and current - previous > min_delta_ms:
+            failures.append(
+                f"{key}: {current:.2f}ms vs baseline {previous:.2f}ms "
+                f"(+{(current / previous - 1) * 100 if previous else float('inf'):.0f}%)"
+            )
+
+    for key in sorted(set(baselines) - set(results)):
+        scale, _, name = key.partition('/')
+        if scales is not None and scale not in scales:
+            continue
+        if only and not any(name.startswith(prefix) for prefix in only):
+            continue
+        failures.append(f"{key}: no result (benchmark missing from this run)")
+    return failures
+
+
+def print_report(results, baselines):
+    print(f"\n{'Benchmark':<40} {'Median':>12} {'Baseline':>12} {'Change':>8}")
+    print("-" * 76)
+    for key, result in sorted(results.items()):
+        if 'median_ms' not in result:
+            print(f"{key:<40} {result.get('skipped') or result.get('error')}")
+            continue
+        baseline = baselines.get(key, {}).get('median_ms')
+        change = f"{(result['median_ms'] / baseline - 1) * 100:+.0f}%" if baseline else "new"
+        baseline_text = f"{baseline:.2f}ms" if baseline is not None else "-"
+        print(f"{key:<40} {result['median_ms']:>10.2f}ms {baseline_text:>12} {change:>8}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Auditor Helper benchmark suite")
+    parser.add_argument('--scales', nargs='+', default=DEFAULT_SCALES, help="Dataset sizes: 1k, 100k, 1m")
+    parser.add_argument('--repeat', type=int, default=DEFAULT_REPEAT, help="Timed runs per benchmark")
+    parser.add_argument('--seed', type=int, default=None, help="Dataset seed")
+    parser.add_argument('--only', nargs='+', help="Only run benchmarks whose name starts with these prefixes")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_TOLERANCE,
+                        help="Allowed slowdown as a fraction of the baseline (0.25 = 25%%)")
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="Ignore slowdowns smaller than this many milliseconds")
+    parser.add_argument('--baseline-file', default=str(DEFAULT_BASELINE_FILE))
+    parser.add_argument('--update-baselines', action='store_true', help="Store these results as the new baselines")
+    parser.add_argument('--keep-data', action='store_true', help="Keep the generated databases")
+    parser.add_argument('--worker', metavar='OUTPUT', help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.worker:
+        run_worker(args.worker, args.repeat, args.only)
+        return 0
+
+    sys.path.insert(0, str(PERFORMANCE_DIR))
+    from benchmark_data import DEFAULT_SEED, SCALES
+    seed = DEFAULT_SEED if args.seed is None else args.seed
+
+    unknown = [scale for scale in args.scales if scale not in SCALES]
+    if unknown:
+        parser.error(f"unknown scales {unknown}; choose from {list(SCALES)}")
+
+    results = {}
+    for scale in args.scales:
+        results.update(run_scale(scale, args.repeat, seed, args.only, args.keep_data))
+
+    baselines = load_baselines(args.baseline_file)
+    print_report(results, baselines)
+
+    if args.update_baselines:
+        save_baselines(args.baseline_file, results, seed, existing=baselines)
+        print(f"\nBaselines written to {args.baseline_file}")
+        return 0
+
+    failures = compare_to_baselines(results, baselines, args.tolerance, args.min_delta_ms,
+                                    scales=args.scales, only=args.only)
+    if failures:
+        print(f"\n{len(failures)} failure(s) against baselines ({args.tolerance:.0%} tolerance):")
+        for failure in failures:
+            print(f"  {failure}")
+        return 1
+    print("\nNo regressions against baselines")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
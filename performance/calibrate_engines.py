@@ -0,0 +1,228 @@
+#!/usr/bin/env python3
+"""
+One-off calibration of the Python / NumPy / Rust engine crossovers
+
+Times every engine operation on each available backend across a range of
+input sizes, derives the size at which NumPy and Rust start to win, and
+stores the thresholds with the app settings
+(performance_settings.engine_thresholds) where the engine dispatcher picks
+them up on the next start.
+
+    python performance/calibrate_engines.py
+    python performance/calibrate_engines.py --only statistics. --dry-run
+
+Backends that are not available here (Rust not built, NumPy not installed)
+keep their default thresholds, so calibrating before building the Rust
+extension does not disable it afterwards. With --only, the stored
+thresholds of the other operations are kept.
+"""
+
+import argparse
+import os
+import random
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from core.performance.engine_dispatch import (
+    CALIBRATION_SIZES, DEFAULT_THRESHOLDS, NEVER, NUMPY, OPERATIONS, RUST,
+    Crossover, crossover_from_timings, get_dispatcher, save_calibrated_thresholds, time_call
+)
+
+# Registry of operation -> make(engines, size, rng) returning a zero-argument call
+WORKLOADS = {}
+
+
+def workload(operation):
+    """Register the calibration workload for an engine operation"""
+    def register(make):
+        WORKLOADS[operation] = make
+        return make
+    return register
+
+
+def _floats(rng, size, low=0.0, high=10.0):
+    return [rng.uniform(low, high) for _ in range(size)]
+
+
+def _durations(rng, size):
+    return [f"{rng.randint(0, 3):02d}:{rng.randint(0, 59):02d}:{rng.randint(0, 59):02d}" for _ in range(size)]
+
+
+@workload('statistics.correlation')
+def _correlation(engines, size, rng):
+    x, y = _floats(rng, size), _floats(rng, size)
+    return lambda: engines['statistics'].calculate_correlation(x, y)
+
+
+@workload('statistics.summary')
+def _summary(engines, size, rng):
+    data = _floats(rng, size)
+    return lambda: engines['statistics'].calculate_statistical_summary(data)
+
+
+@workload('statistics.confidence_interval')
+def _confidence_interval(engines, size, rng):
+    data = _floats(rng, size)
+    return lambda: engines['statistics'].calculate_confidence_interval(data, 0.95)
+
+
+@workload('statistics.batch_correlations')
+def _batch_correlations(engines, size, rng):
+    data = {name: _floats(rng, size) for name in ('duration', 'score', 'time_usage', 'earnings')}
+    return lambda: engines['statistics'].calculate_batch_correlations(data)
+
+
+@workload('statistics.moving_average')
+def _moving_average(engines, size, rng):
+    data = _floats(rng, size)
+    return lambda: engines['statistics'].calculate_moving_average(data, 7)
+
+
+@workload('statistics.trend_analysis')
+def _trend_analysis(engines, size, rng):
+    x, y = list(map(float, range(size))), _floats(rng, size)
+    return lambda: engines['statistics'].calculate_trend_analysis(x, y)
+
+
+@workload('processing.parse_time_strings')
+def _parse_time_strings(engines, size, rng):
+    strings = _durations(rng, size)
+    return lambda: engines['processing'].parse_time_strings_batch(strings)
+
+
+@workload('processing.tasks_batch')
+def _tasks_batch(engines, size, rng):
+    tasks = [(duration, "P", float(rng.randint(1, 5))) for duration in _durations(rng, size)]
+    return lambda: engines['processing'].process_tasks_batch(tasks, 25.0, 35.0, True)
+
+
+@workload('processing.task_arrays')
+def _task_arrays(engines, size, rng):
+    seconds = [rng.randint(60, 7200) for _ in range(size)]
+    scores = [float(rng.randint(1, 5)) for _ in range(size)]
+    return lambda: engines['processing'].process_task_arrays(seconds, scores, 25.0, 35.0, True)
+
+
+@workload('processing.bonus_eligibility')
+def _bonus_eligibility(engines, size, rng):
+    stamps = [f"2024-01-{rng.randint(1, 28):02d} {rng.randint(0, 23):02d}:00:00" for _ in range(size)]
+    return lambda: engines['processing'].check_bonus_eligibility_batch(stamps, 6, 9, 1, 9)
+
+
+@workload('processing.aggregated_metrics')
+def _aggregated_metrics(engines, size, rng):
+    durations, scores = _floats(rng, size, 0.1, 2.0), _floats(rng, size, 1.0, 5.0)
+    earnings = [d * 25.0 for d in durations]
+    return lambda: engines['processing'].calculate_aggregated_metrics(durations, scores, earnings)
+
+
+@workload('timer.batch_durations')
+def _batch_durations(engines, size, rng):
+    starts = _floats(rng, size, 0.0, 1000.0)
+    ends = [start + rng.uniform(0.0, 60.0) for start in starts]
+    return lambda: engines['timer'].calculate_batch_durations(starts, ends)
+
+
+@workload('timer.statistics')
+def _timer_statistics(engines, size, rng):
+    durations, targets = _floats(rng, size, 1.0, 60.0), _floats(rng, size, 1.0, 60.0)
+    return lambda: engines['timer'].calculate_timer_statistics(durations, targets)
+
+
+@workload('timer.format_batch')
+def _format_batch(engines, size, rng):
+    seconds = _floats(rng, size, 0.0, 36000.0)
+    return lambda: engines['timer'].format_time_batch(seconds, "HH:MM:SS")
+
+
+def load_engines():
+    """Instantiate the engines being calibrated"""
+    from core.performance.rust_data_processing_engine import RustDataProcessingEngine
+    from core.performance.rust_statistical_engine import RustStatisticalEngine
+    from core.performance.rust_timer_engine import RustTimerEngine
+    return {
+        'statistics': RustStatisticalEngine(),
+        'processing': RustDataProcessingEngine(),
+        'timer': RustTimerEngine(),
+    }
+
+
+def available_backends(operation, engines, dispatcher):
+    """Backends of an operation that can actually run here"""
+    engine = engines[operation.split('.')[0]]
+    rust_available = engine.rust_available
+    if operation == 'processing.task_arrays':
+        rust_available = engine.rust_arrays_available
+    return [
+        backend for backend in OPERATIONS[operation]
+        if (backend != RUST or rust_available) and (backend != NUMPY or dispatcher.numpy_available)
+    ]
+
+
+def calibrate(operations=None, sizes=CALIBRATION_SIZES, seed=1337, min_seconds=0.02, engines=None, log=print):
+    """
+    Measure the crossovers for the given operations (default: all).
+    Returns {operation: Crossover}; unmeasured backends keep their default threshold.
+    """
+    dispatcher = get_dispatcher()
+    engines = engines or load_engines()
+    results = {}
+
+    for operation in operations or sorted(WORKLOADS):
+        backends = available_backends(operation, engines, dispatcher)
+        if len(backends) < 2:
+            log(f"{operation}: only {backends or 'no backend'} available, keeping defaults")
+            continue
+
+        timings = {}
+        for size in sizes:
+            call = WORKLOADS[operation](engines, size, random.Random(seed))
+            timings[size] = {}
+            for backend in backends:
+                with dispatcher.forced(backend):
+                    timings[size][backend] = time_call(call, min_seconds=min_seconds)
+            row = "  ".join(f"{backend}={seconds * 1000:.3f}ms" for backend, seconds in timings[size].items())
+            log(f"{operation} n={size}: {row}")
+
+        measured = crossover_from_timings(timings, backends)
+        default = DEFAULT_THRESHOLDS.get(operation, Crossover())
+        results[operation] = Crossover(
+            numpy_min=measured.numpy_min if NUMPY in backends else default.numpy_min,
+            rust_min=measured.rust_min if RUST in backends else default.rust_min,
+        )
+    return results
+
+
+def _format_threshold(value):
+    return "never" if value >= NEVER else str(value)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Calibrate the Python/NumPy/Rust engine crossovers")
+    parser.add_argument('--only', nargs='*', default=[], help="Operation names or prefixes to calibrate")
+    parser.add_argument('--seed', type=int, default=1337, help="Random seed for the input data")
+    parser.add_argument('--min-seconds', type=float, default=0.02, help="Minimum timing per measurement")
+    parser.add_argument('--dry-run', action='store_true', help="Print the thresholds without saving them")
+    args = parser.parse_args()
+
+    operations = [
+        operation for operation in sorted(WORKLOADS)
+        if not args.only or any(operation.startswith(prefix) for prefix in args.only)
+    ]
+    thresholds = calibrate(operations, seed=args.seed, min_seconds=args.min_seconds)
+
+    print("\nCrossover thresholds:")
+    for operation, crossover in sorted(thresholds.items()):
+        print(f"  {operation:36s} numpy >= {_format_threshold(crossover.numpy_min):>7s}  "
+              f"rust >= {_format_threshold(crossover.rust_min):>7s}")
+
+    if args.dry_run or not thresholds:
+        return 0
+    save_calibrated_thresholds(thresholds)
+    print("Saved to the app settings (performance_settings.engine_thresholds)")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
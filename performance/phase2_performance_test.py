@@ -203,6 +203,28 @@ def test_phase2_performance():
     
     return startup_times
 
+def print_startup_history():
+    """Rolling aggregates recorded by the app itself across all launches"""
+    sys.path.insert(0, str(Path("src").resolve()))
+    from core.optimization.startup_history import StartupHistoryStore
+    
+    store = StartupHistoryStore()
+    summary = store.summary()
+    if not summary['sessions']:
+        return
+    
+    total = summary['total']
+    print("📈 STARTUP HISTORY (rolling, last launches)")
+    print("-" * 45)
+    print(f"Launches recorded:    {summary['sessions']} (version {summary['version']})")
+    print(f"Total p50/p95/max:    {total['p50']:.0f} / {total['p95']:.0f} / {total['max']:.0f} ms")
+    for name, stats in sorted(summary['phases'].items(), key=lambda item: item[1]['p50'], reverse=True):
+        print(f"  {name:<30} p50 {stats['p50']:>7.0f} ms   p95 {stats['p95']:>7.0f} ms")
+    for regression in store.detect_regressions():
+        print(f"⚠️ Regression: '{regression['phase']}' p50 {regression['p50_ms']:.0f}ms vs "
+              f"{regression['baseline_p50_ms']:.0f}ms on {regression['baseline_version']}")
+    print()
+
 def main():
     """Main test function"""
     print("Starting Phase 2 performance testing...")
@@ -216,6 +238,7 @@ def main():
     
     # Run the performance test
     startup_times = test_phase2_performance()
+    print_startup_history()
     
     # Save results
     if startup_times:
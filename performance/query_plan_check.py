@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+EXPLAIN QUERY PLAN check for every registered application query
+
+Builds the seeded synthetic dataset (or uses an existing database), prepares
+each statement from core.db.query_registry and reports full table scans and
+temporary B-trees. Exits with status 1 when anything is flagged.
+
+    python performance/query_plan_check.py --scale 100k
+    python performance/query_plan_check.py --db path/to/tasks.db --verbose
+"""
+
+import argparse
+import os
+import sqlite3
+import sys
+import tempfile
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src'))
+
+from benchmark_data import SCALES, generate_dataset
+from core.db.query_registry import check_query_plans, explain_query_plan, load_query_modules
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Check the query plans of all registered queries")
+    parser.add_argument('--scale', default='100k', choices=list(SCALES), help="Synthetic dataset size")
+    parser.add_argument('--db', help="Check against an existing database instead of a synthetic one")
+    parser.add_argument('--verbose', action='store_true', help="Print every plan, not just findings")
+    args = parser.parse_args()
+
+    queries = load_query_modules()
+
+    with tempfile.TemporaryDirectory(prefix="auditor_query_plans_") as temp_dir:
+        db_path = args.db
+        if db_path is None:
+            db_path = os.path.join(temp_dir, 'plans.db')
+            generate_dataset(db_path, SCALES[args.scale])
+
+        conn = sqlite3.connect(db_path)
+        try:
+            if args.verbose:
+                for query in queries:
+                    print(query.name)
+                    try:
+                        for detail in explain_query_plan(conn, query.sql):
+                            print(f"    {detail}")
+                    except sqlite3.Error as e:
+                        print(f"    ERROR: {e}")
+            findings = check_query_plans(conn, queries)
+        finally:
+            conn.close()
+
+    print(f"\nChecked {len(queries)} queries")
+    if findings:
+        print(f"{len(findings)} finding(s):")
+        for finding in findings:
+            print(f"  {finding}")
+        return 1
+    print("No table scans or temp B-trees outside the declared allowances")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
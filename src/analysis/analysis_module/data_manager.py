@@ -13,6 +13,9 @@ from core.settings.global_settings import global_settings
 
 # Import Data Service Layer components
 from core.services import TaskDAO, WeekDAO, DataServiceError
+from core.db.week_dates import parse_week_label_dates
+from core.db.connection_manager import get_connection_manager
+from core.db.query_registry import register_query
 
 # Import chart constraints for tapered flexibility
 from .chart_constraints import (
@@ -34,6 +37,31 @@ logger = logging.getLogger(__name__)
 
 DB_FILE = "tasks.db"
 
+_CONSTRAINED_CHART_SQL = """
+                SELECT duration, time_limit, score, project_name, locale, date_audited, 
+                       week_id, time_begin, time_end, bonus_paid
+                FROM tasks 
+                {where_clause}
+                ORDER BY date_audited, time_begin
+                """
+
+CONSTRAINED_CHART_RANGE_SQL = register_query(
+    "data_manager.constrained_chart_range",
+    _CONSTRAINED_CHART_SQL.format(where_clause="WHERE date_audited BETWEEN ? AND ?")
+)
+
+# "No selection" charts cover every task by design
+CONSTRAINED_CHART_ALL_SQL = register_query(
+    "data_manager.constrained_chart_all",
+    _CONSTRAINED_CHART_SQL.format(where_clause=""),
+    allow_scan=('tasks',)
+)
+
+WEEK_DATE_RANGE_SQL = register_query(
+    "data_manager.week_date_range",
+    "SELECT start_date, end_date, week_label FROM weeks WHERE id = ?"
+)
+
 class DataManager:
     def __init__(self):
         self.global_settings = global_settings
@@ -388,39 +416,14 @@ class DataManager:
     def populate_week_combo_data(self):
         """Retrieve week data from the database using Data Service Layer"""
         try:
-            weeks_data = self.week_dao.get_all_weeks()
+            # Weeks are ordered by the indexed start_date column
+            weeks_data = self.week_dao.get_weeks_chronological()
             # Convert to tuple format for compatibility
             weeks = [(week['id'], week['week_label']) for week in weeks_data]
         except DataServiceError as e:
             logger.error(f"Error getting week combo data: {e}")
             weeks = []
         
-        # Sort weeks chronologically by parsing the start date from week_label
-        def parse_start_date(week_tuple):
-            week_id, week_label = week_tuple
-            try:
-                # Extract start date from format "dd/MM/yyyy - dd/MM/yyyy"
-                start_date_str = week_label.split(" - ")[0]
-                
-                # Try parsing multiple date formats
-                date_formats = ["%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d", "%d-%m-%Y"]
-                
-                for fmt in date_formats:
-                    try:
-                        return datetime.strptime(start_date_str, fmt)
-                    except ValueError:
-                        continue # Try next format if this one fails
-                
-                # If no format matched, fall back to a very old date and print a warning
-                print(f"Warning: Could not parse date from week label '{week_label}' in DataManager. Using default date.")
-                return datetime(1900, 1, 1)
-            except (ValueError, IndexError, AttributeError) as e:
-                # If splitting or other initial operations fail, it's a completely malformed label
-                print(f"Warning: Malformed week label '{week_label}' in DataManager. Error: {e}. Using default date.")
-                return datetime(1900, 1, 1)
-        
-        # Sort by parsed start date
-        weeks.sort(key=parse_start_date)
         return weeks
 
     def get_chart_data(self, x_variable, y_variables, current_week_id, current_start_date, current_end_date):
@@ -433,27 +436,10 @@ class DataManager:
                 if not week_data:
                     return []
                 
-                week_label = week_data['week_label']
-                try:
-                    start_date_str, end_date_str = week_label.split(" - ")
-                    # Try multiple date formats - first try dd-MM-yyyy, then dd/MM/yyyy
-                    date_formats = ['%d-%m-%Y', '%d/%m/%Y']
-                    start_date = None
-                    end_date = None
-                    
-                    for fmt in date_formats:
-                        try:
-                            start_date = datetime.strptime(start_date_str, fmt).strftime('%Y-%m-%d')
-                            end_date = datetime.strptime(end_date_str, fmt).strftime('%Y-%m-%d')
-                            break  # Success, exit the format loop
-                        except ValueError:
-                            continue  # Try next format
-                    
-                    if start_date is None or end_date is None:
-                        raise ValueError(f"Could not parse dates with any known format")
-                    
-                except (ValueError, IndexError) as e:
-                    # Fallback or error handling for malformed week_label
+                start_date, end_date = self._get_week_date_range(
+                    week_data.get('start_date'), week_data.get('end_date'), week_data['week_label']
+                )
+                if start_date is None or end_date is None:
                     return []
                 
                 where_clause = "WHERE date_audited BETWEEN ? AND ?"
@@ -485,7 +471,7 @@ class DataManager:
                 if current_week_id is not None:
                     # Get tasks by week and filter by date range
                     raw_tasks = self.task_dao.get_tasks_by_week(current_week_id)
-                    # Filter by date range from week_label parsing
+                    # Filter by the week's stored date range
                     raw_tasks = [task for task in raw_tasks 
                                if start_date <= task.get('date_audited', '') <= end_date]
                 elif current_start_date and current_end_date:
@@ -1122,33 +1108,33 @@ class DataManager:
 
     def get_week_office_hours_data(self, week_id):
         """Get week-specific office hour settings, falling back to global defaults."""
-        conn = sqlite3.connect(DB_FILE)
-        c = conn.cursor()
-        
         try:
-            c.execute("""
-                SELECT office_hour_count, office_hour_payrate, 
-                       office_hour_session_duration_minutes, use_global_office_hours_settings
-                FROM weeks WHERE id=?
-            """, (week_id,))
-            
-            week_data = c.fetchone()
-            
-            if week_data and week_data[3] is not None and not bool(week_data[3]): # use_global_office_hours_settings is explicitly False
-                # Use week-specific office hour settings
-                return {
-                    'count': week_data[0] if week_data[0] is not None else 0,
-                    'payrate': week_data[1] if week_data[1] is not None else self.global_settings.get_default_office_hour_settings()['payrate'],
-                    'session_duration_minutes': week_data[2] if week_data[2] is not None else self.global_settings.get_default_office_hour_settings()['session_duration_minutes']
-                }
-            else:
-                # Use global defaults for office hours (either NULL or True)
-                defaults = self.global_settings.get_default_office_hour_settings()
-                return {
-                    'count': week_data[0] if week_data and week_data[0] is not None else 0,
-                    'payrate': defaults['payrate'],
-                    'session_duration_minutes': defaults['session_duration_minutes']
-                }
+            with get_connection_manager().reader() as conn:
+                c = conn.cursor()
+                
+                c.execute("""
+                    SELECT office_hour_count, office_hour_payrate, 
+                           office_hour_session_duration_minutes, use_global_office_hours_settings
+                    FROM weeks WHERE id=?
+                """, (week_id,))
+                
+                week_data = c.fetchone()
+                
+                if week_data and week_data[3] is not None and not bool(week_data[3]): # use_global_office_hours_settings is explicitly False
+                    # Use week-specific office hour settings
+                    return {
+                        'count': week_data[0] if week_data[0] is not None else 0,
+                        'payrate': week_data[1] if week_data[1] is not None else self.global_settings.get_default_office_hour_settings()['payrate'],
+                        'session_duration_minutes': week_data[2] if week_data[2] is not None else self.global_settings.get_default_office_hour_settings()['session_duration_minutes']
+                    }
+                else:
+                    # Use global defaults for office hours (either NULL or True)
+                    defaults = self.global_settings.get_default_office_hour_settings()
+                    return {
+                        'count': week_data[0] if week_data and week_data[0] is not None else 0,
+                        'payrate': defaults['payrate'],
+                        'session_duration_minutes': defaults['session_duration_minutes']
+                    }
         except Exception as e:
             print(f"Error getting week office hours data: {e}")
             # Fallback to global defaults in case of error
@@ -1158,8 +1144,6 @@ class DataManager:
                 'payrate': defaults['payrate'],
                 'session_duration_minutes': defaults['session_duration_minutes']
             }
-        finally:
-            conn.close()
 
     def _parse_time_to_seconds(self, time_str):
         """Convert HH:MM:SS string to seconds"""
@@ -1187,28 +1171,21 @@ class DataManager:
         if not is_valid:
             raise ValueError(f"Invalid variable combination: {message}")
         
-        conn = None
         try:
-            conn = sqlite3.connect(DB_FILE)
-            cursor = conn.cursor()
-            
-            # Build query based on current data selection
-            where_clause, params = self._build_where_clause(current_week_id, current_start_date, current_end_date, cursor)
-            
-            # Get raw task data with all necessary fields
-            query = f"""
-            SELECT duration, time_limit, score, project_name, locale, date_audited, 
-                   week_id, time_begin, time_end, bonus_paid
-            FROM tasks 
-            {where_clause}
-            ORDER BY date_audited, time_begin
-            """
-            
-            cursor.execute(query, params)
-            raw_data = cursor.fetchall()
-            
-            # Group and aggregate the data
-            return self._aggregate_constrained_data(raw_data, x_variable, y_variable)
+            with get_connection_manager().reader() as conn:
+                cursor = conn.cursor()
+                
+                # Build query based on current data selection
+                where_clause, params = self._build_where_clause(current_week_id, current_start_date, current_end_date, cursor)
+                
+                # Get raw task data with all necessary fields
+                query = CONSTRAINED_CHART_RANGE_SQL if where_clause else CONSTRAINED_CHART_ALL_SQL
+                
+                cursor.execute(query, params)
+                raw_data = cursor.fetchall()
+                
+                # Group and aggregate the data
+                return self._aggregate_constrained_data(raw_data, x_variable, y_variable)
             
         except sqlite3.Error as e:
             print(f"Database error in get_constrained_chart_data: {e}")
@@ -1216,39 +1193,24 @@ class DataManager:
         except Exception as e:
             print(f"Unexpected error in get_constrained_chart_data: {e}")
             return []
-        finally:
-            if conn:
-                conn.close()
+    
+    def _get_week_date_range(self, start_date, end_date, week_label):
+        """Return the ISO (start, end) dates of a week, parsing the label only for rows not yet backfilled"""
+        if start_date and end_date:
+            return start_date, end_date
+        return parse_week_label_dates(week_label)
     
     def _build_where_clause(self, current_week_id, current_start_date, current_end_date, cursor):
         """Build WHERE clause and parameters for data selection"""
         if current_week_id is not None:
             # Week-based selection
-            cursor.execute("SELECT week_label FROM weeks WHERE id = ?", (current_week_id,))
+            cursor.execute(WEEK_DATE_RANGE_SQL, (current_week_id,))
             week_result = cursor.fetchone()
             if not week_result:
                 return "", []
             
-            week_label = week_result[0]
-            try:
-                start_date_str, end_date_str = week_label.split(" - ")
-                # Try multiple date formats
-                date_formats = ['%d-%m-%Y', '%d/%m/%Y']
-                start_date = None
-                end_date = None
-                
-                for fmt in date_formats:
-                    try:
-                        start_date = datetime.strptime(start_date_str, fmt).strftime('%Y-%m-%d')
-                        end_date = datetime.strptime(end_date_str, fmt).strftime('%Y-%m-%d')
-                        break
-                    except ValueError:
-                        continue
-                
-                if start_date is None or end_date is None:
-                    raise ValueError("Could not parse dates")
-                
-            except (ValueError, IndexError):
+            start_date, end_date = self._get_week_date_range(*week_result)
+            if start_date is None or end_date is None:
                 return "", []
             
             return "WHERE date_audited BETWEEN ? AND ?", [start_date, end_date]
@@ -1,16 +1,20 @@
 # timer_optimization.py - Optimized timer functionality with batched updates
-import sqlite3
 import time
 from datetime import datetime
 from PySide6 import QtCore, QtWidgets
-from collections import defaultdict
-from core.db.db_connection_pool import get_db_connection, time_db_operation
+from core.db.db_connection_pool import time_db_operation
+from core.services.timer_persistence import get_timer_persistence
 
 class BatchedTimerUpdates:
-    """Batched timer updates to reduce database overhead"""
+    """
+    Batched timer updates to reduce database overhead.
     
-    def __init__(self, batch_interval_ms=5000):
-        self.pending_updates = {}
+    Updates are journaled and coalesced by the shared TimerPersistenceService;
+    this class only drives its periodic flush from the Qt event loop.
+    """
+    
+    def __init__(self, batch_interval_ms=5000, persistence=None):
+        self.persistence = persistence or get_timer_persistence()
         self.batch_interval_ms = batch_interval_ms
         
         # Timer for batching updates
@@ -18,105 +22,35 @@ class BatchedTimerUpdates:
         self.update_timer.timeout.connect(self.flush_updates)
         self.update_timer.setSingleShot(False)
         self.update_timer.start(self.batch_interval_ms)
-        
-        self.stats = {
-            'total_updates_queued': 0,
-            'total_batches_flushed': 0,
-            'last_flush_time': None,
-            'average_batch_size': 0
-        }
+    
+    @property
+    def stats(self):
+        return self.persistence.get_stats()
     
     def queue_duration_update(self, task_id, duration_seconds):
         """Queue a duration update instead of immediate execution"""
-        self.pending_updates[task_id] = {
-            'duration_seconds': duration_seconds,
-            'timestamp': datetime.now()
-        }
-        self.stats['total_updates_queued'] += 1
+        self.persistence.record_duration(task_id, duration_seconds)
     
     def queue_time_update(self, task_id, time_begin=None, time_end=None):
         """Queue time begin/end updates"""
-        if task_id not in self.pending_updates:
-            self.pending_updates[task_id] = {}
-        
-        if time_begin is not None:
-            self.pending_updates[task_id]['time_begin'] = time_begin
-        
-        if time_end is not None:
-            self.pending_updates[task_id]['time_end'] = time_end
-        
-        self.stats['total_updates_queued'] += 1
+        self.persistence.record_times(task_id, time_begin=time_begin, time_end=time_end)
     
     @time_db_operation
     def flush_updates(self):
         """Flush all pending updates to database in a single transaction"""
-        if not self.pending_updates:
+        if not self.persistence.has_pending():
             return
         
         start_time = time.time()
-        updates_count = len(self.pending_updates)
+        updates_count = self.persistence.flush()
         
-        try:
-            with get_db_connection() as conn:
-                c = conn.cursor()
-                
-                # Prepare batched updates
-                duration_updates = []
-                time_begin_updates = []
-                time_end_updates = []
-                
-                for task_id, data in self.pending_updates.items():
-                    # Duration updates
-                    if 'duration_seconds' in data:
-                        hours = data['duration_seconds'] // 3600
-                        minutes = (data['duration_seconds'] % 3600) // 60
-                        seconds = data['duration_seconds'] % 60
-                        duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-                        duration_updates.append((duration_str, task_id))
-                    
-                    # Time begin updates
-                    if 'time_begin' in data:
-                        time_begin_updates.append((data['time_begin'], task_id))
-                    
-                    # Time end updates
-                    if 'time_end' in data:
-                        time_end_updates.append((data['time_end'], task_id))
-                
-                # Execute batched updates
-                if duration_updates:
-                    c.executemany("UPDATE tasks SET duration=? WHERE id=?", duration_updates)
-                
-                if time_begin_updates:
-                    c.executemany("UPDATE tasks SET time_begin=? WHERE id=?", time_begin_updates)
-                
-                if time_end_updates:
-                    c.executemany("UPDATE tasks SET time_end=? WHERE id=?", time_end_updates)
-                
-                conn.commit()
-                
-                # Update statistics
-                self.stats['total_batches_flushed'] += 1
-                self.stats['last_flush_time'] = datetime.now()
-                
-                # Calculate average batch size
-                total_batches = self.stats['total_batches_flushed']
-                total_updates = self.stats['total_updates_queued']
-                self.stats['average_batch_size'] = total_updates / total_batches if total_batches > 0 else 0
-                
-                # Clear pending updates
-                self.pending_updates.clear()
-                
-                end_time = time.time()
-                flush_time = (end_time - start_time) * 1000
-                
-                print(f"🔄 Batched {updates_count} timer updates in {flush_time:.2f}ms")
-                
-        except Exception as e:
-            print(f"❌ Failed to flush timer updates: {e}")
+        if updates_count:
+            flush_time = (time.time() - start_time) * 1000
+            print(f"🔄 Batched {updates_count} timer updates in {flush_time:.2f}ms")
     
     def get_stats(self):
         """Get batching statistics"""
-        return self.stats.copy()
+        return self.persistence.get_stats()
     
     def force_flush(self):
         """Force immediate flush of pending updates"""
@@ -161,6 +95,48 @@ class OptimizedTimerDisplay:
             'skip_percentage': skip_percentage
         }
 
+class TimerTicker(QtCore.QObject):
+    """
+    One display ticker shared by every open timer.
+    
+    Ticks only repaint: elapsed time comes from the monotonic timer engine,
+    so ticks dropped while the event loop is blocked cost no time. The
+    QTimer runs only while at least one timer is subscribed.
+    """
+    
+    DISPLAY_INTERVAL_MS = 200
+    
+    tick = QtCore.Signal()
+    
+    def __init__(self, interval_ms=DISPLAY_INTERVAL_MS, parent=None):
+        super().__init__(parent)
+        self._subscribers = set()
+        self._timer = QtCore.QTimer(self)
+        self._timer.setInterval(interval_ms)
+        self._timer.timeout.connect(self.tick.emit)
+    
+    def subscribe(self, slot):
+        """Connect a slot to the tick; starts the ticker for the first subscriber"""
+        if slot in self._subscribers:
+            return
+        self._subscribers.add(slot)
+        self.tick.connect(slot)
+        if not self._timer.isActive():
+            self._timer.start()
+    
+    def unsubscribe(self, slot):
+        """Disconnect a slot; stops the ticker when nobody is left"""
+        if slot not in self._subscribers:
+            return
+        self._subscribers.discard(slot)
+        self.tick.disconnect(slot)
+        if not self._subscribers:
+            self._timer.stop()
+    
+    @property
+    def is_active(self):
+        return self._timer.isActive()
+
 class SmartAlertChecker:
     """Smart alert checking that doesn't run on every timer tick"""
     
@@ -198,6 +174,7 @@ class SmartAlertChecker:
 # Global instances
 _batched_updates = None
 _alert_checker = None
+_timer_ticker = None
 
 def get_batched_updates():
     """Get the global batched updates instance"""
@@ -213,6 +190,13 @@ def get_alert_checker():
         _alert_checker = SmartAlertChecker()
     return _alert_checker
 
+def get_timer_ticker():
+    """Get the global display ticker"""
+    global _timer_ticker
+    if _timer_ticker is None:
+        _timer_ticker = TimerTicker()
+    return _timer_ticker
+
 def cleanup_timer_optimization():
     """Clean up timer optimization resources"""
     global _batched_updates
@@ -11,6 +11,8 @@ from typing import Dict, Any, List, Optional
 from dataclasses import dataclass, field
 from collections import deque
 
+from ..performance.metrics import get_registry
+
 
 @dataclass
 class CacheTierMetrics:
@@ -76,13 +78,29 @@ class CacheStats:
     - Efficiency scores
     """
     
-    def __init__(self):
+    def __init__(self, name: str = "cache"):
         self._lock = threading.RLock()
         self._metrics = CacheTierMetrics()
         self._start_time = time.time()
         
+        # Mirrored into the metrics registry as cache.operations{cache,op} / cache.response_ms{cache}
+        registry = get_registry()
+        self._operation_counters = {
+            op: registry.counter("cache.operations", {'cache': name, 'op': op})
+            for op in ('hit', 'miss', 'set', 'delete', 'error')
+        }
+        self._response_histogram = registry.histogram("cache.response_ms", {'cache': name})
+        self._memory_gauge = registry.gauge("cache.memory_bytes", {'cache': name})
+        self._items_gauge = registry.gauge("cache.items", {'cache': name})
+    
+    def _report(self, op: str, response_time: float):
+        self._operation_counters[op].inc()
+        if response_time > 0:
+            self._response_histogram.observe(response_time * 1000)
+        
     def record_hit(self, response_time: float = 0.0):
         """Record a cache hit"""
+        self._report('hit', response_time)
         with self._lock:
             self._metrics.hits += 1
             self._metrics.total_response_time += response_time
@@ -91,6 +109,7 @@ class CacheStats:
     
     def record_miss(self, response_time: float = 0.0):
         """Record a cache miss"""
+        self._report('miss', response_time)
         with self._lock:
             self._metrics.misses += 1
             self._metrics.total_response_time += response_time
@@ -99,6 +118,7 @@ class CacheStats:
     
     def record_set(self, response_time: float = 0.0):
         """Record a cache set operation"""
+        self._report('set', response_time)
         with self._lock:
             self._metrics.sets += 1
             self._metrics.total_response_time += response_time
@@ -107,6 +127,7 @@ class CacheStats:
     
     def record_delete(self, response_time: float = 0.0):
         """Record a cache delete operation"""
+        self._report('delete', response_time)
         with self._lock:
             self._metrics.deletes += 1
             self._metrics.total_response_time += response_time
@@ -115,16 +136,19 @@ class CacheStats:
     
     def record_error(self):
         """Record a cache error"""
+        self._operation_counters['error'].inc()
         with self._lock:
             self._metrics.errors += 1
     
     def update_memory_usage(self, memory_bytes: int):
         """Update memory usage statistics"""
+        self._memory_gauge.set(memory_bytes)
         with self._lock:
             self._metrics.memory_usage = memory_bytes
     
     def update_item_count(self, count: int):
         """Update item count statistics"""
+        self._items_gauge.set(count)
         with self._lock:
             self._metrics.item_count = count
     
@@ -203,9 +227,9 @@ class MultiTierCacheStats:
     def __init__(self):
         self._lock = threading.RLock()
         self._tier_stats = {
-            'l1': CacheStats(),
-            'l2': CacheStats(), 
-            'l3': CacheStats()
+            'l1': CacheStats('l1'),
+            'l2': CacheStats('l2'), 
+            'l3': CacheStats('l3')
         }
         self._start_time = time.time()
         self._cache_promotions = 0
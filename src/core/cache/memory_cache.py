@@ -51,7 +51,7 @@ class MemoryCache(BaseCache):
         self._lock = threading.RLock()
         self._cache = OrderedDict()  # Maintains insertion order for LRU
         self._expiry = {}  # key -> expiration_timestamp
-        self._stats = CacheStats()
+        self._stats = CacheStats('memory')
         
         # Memory tracking
         self._memory_usage = 0
@@ -62,7 +62,7 @@ class SQLiteCache(BaseCache):
         self.db_path = Path(db_path)
         self.compression = self._select_compression(compression)
         self._lock = threading.RLock()
-        self._stats = CacheStats()
+        self._stats = CacheStats('sqlite')
         
         # Ensure directory exists
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
@@ -385,6 +385,51 @@ class SQLiteCache(BaseCache):
         except Exception:
             return 0
     
+    def trim(self, max_bytes: int, batch_size: int = 500) -> int:
+        """
+        Remove expired entries, then evict the least-accessed (oldest first)
+        entries until the stored values fit in max_bytes.
+
+        Args:
+            max_bytes: Target total size of the stored values
+            batch_size: Entries evicted per statement
+
+        Returns:
+            Number of entries removed
+        """
+        removed_count = self.cleanup_expired()
+
+        try:
+            with self._lock, sqlite3.connect(self.db_path) as conn:
+                self._apply_connection_settings(conn)
+
+                total_size = conn.execute("SELECT COALESCE(SUM(size_bytes), 0) FROM cache_entries").fetchone()[0]
+                while total_size > max_bytes:
+                    rows = conn.execute("""
+                        SELECT key, size_bytes FROM cache_entries
+                        ORDER BY access_count ASC, created_at ASC
+                        LIMIT ?
+                    """, (batch_size,)).fetchall()
+                    if not rows:
+                        break
+
+                    # Evict only as much of the batch as needed
+                    evicted = []
+                    for key, size_bytes in rows:
+                        evicted.append((key,))
+                        total_size -= size_bytes or 0
+                        if total_size <= max_bytes:
+                            break
+                    conn.executemany("DELETE FROM cache_entries WHERE key = ?", evicted)
+                    removed_count += len(evicted)
+
+                conn.commit()
+
+        except Exception:
+            self._stats.record_error()
+
+        return removed_count
+
     def get_size(self) -> int:
         """Get the number of items in the cache"""
         try:
@@ -5,6 +5,7 @@ from typing import Dict, Any, Optional
 from ..events.event_bus import get_event_bus
 from ..events.event_types import EventType
 from ..repositories.task_repository import TaskRepository
+from ..services.timer_engine import get_timer_engine
 
 class TimerController(QObject):
     """Controller for timer-related operations"""
@@ -22,37 +23,16 @@ class TimerController(QObject):
         self._event_bus.connect_handler(EventType.TIMER_PAUSED, self._on_timer_paused)
         self._event_bus.connect_handler(EventType.TIMER_RESUMED, self._on_timer_resumed)
         
-        # Try to import Rust Timer Engine for high-performance operations
-        try:
-            from ..performance.rust_timer_engine import RustTimerEngine
-            self._rust_timer = RustTimerEngine()
-            self._use_rust = True
-            self._logger.info("Rust Timer Engine loaded successfully")
-        except ImportError:
-            self._rust_timer = None
-            self._use_rust = False
-            self._logger.warning("Rust Timer Engine not available, using Python fallback")
+        # Elapsed time is read from the monotonic timer engine, not from wall-clock deltas
+        self._engine = get_timer_engine()
     
     @Slot(int)
     def start_timer(self, task_id: int):
         """Start timer for task"""
         try:
             start_time = datetime.now()
-            
-            if self._use_rust and self._rust_timer:
-                # Use high-precision Rust timer
-                timer_id = self._rust_timer.create_high_precision_timer()
-                self._active_timers[task_id] = {
-                    'start_time': start_time,
-                    'timer_id': timer_id,
-                    'rust_timer': True
-                }
-            else:
-                # Python fallback
-                self._active_timers[task_id] = {
-                    'start_time': start_time,
-                    'rust_timer': False
-                }
+            self._active_timers[task_id] = {'start_time': start_time}
+            self._engine.start(task_id, initial_seconds=0)
             
             # Update task with start time
             start_time_str = start_time.strftime("%H:%M:%S")
@@ -81,20 +61,11 @@ class TimerController(QObject):
                 self._logger.warning(f"No active timer found for task {task_id}")
                 return
             
-            timer_info = self._active_timers[task_id]
             end_time = datetime.now()
             
+            elapsed_seconds = int(self._engine.remove(task_id))
             if duration_seconds is None:
-                # Calculate duration
-                if timer_info.get('rust_timer') and self._rust_timer:
-                    # Use Rust high-precision calculation
-                    duration_seconds = self._rust_timer.calculate_elapsed_time(
-                        timer_info['timer_id']
-                    )
-                else:
-                    # Python fallback
-                    duration_delta = end_time - timer_info['start_time']
-                    duration_seconds = int(duration_delta.total_seconds())
+                duration_seconds = elapsed_seconds
             
             # Format duration as HH:MM:SS
             duration_str = str(timedelta(seconds=duration_seconds))
@@ -134,14 +105,7 @@ class TimerController(QObject):
             timer_info = self._active_timers[task_id]
             pause_time = datetime.now()
             
-            # Calculate elapsed time so far
-            if timer_info.get('rust_timer') and self._rust_timer:
-                elapsed_seconds = self._rust_timer.calculate_elapsed_time(
-                    timer_info['timer_id']
-                )
-            else:
-                elapsed_delta = pause_time - timer_info['start_time']
-                elapsed_seconds = int(elapsed_delta.total_seconds())
+            elapsed_seconds = int(self._engine.pause(task_id))
             
             # Store paused state
             timer_info['paused_at'] = pause_time
@@ -172,11 +136,7 @@ class TimerController(QObject):
                 self._logger.warning(f"Timer for task {task_id} is not paused")
                 return
             
-            resume_time = datetime.now()
-            
-            # Adjust start time to account for pause duration
-            pause_duration = resume_time - timer_info['paused_at']
-            timer_info['start_time'] += pause_duration
+            self._engine.start(task_id)
             
             # Remove pause markers
             del timer_info['paused_at']
@@ -213,14 +173,7 @@ class TimerController(QObject):
                 # Timer is paused, return stored elapsed time
                 return timer_info.get('elapsed_seconds', 0)
             
-            if timer_info.get('rust_timer') and self._rust_timer:
-                # Use Rust high-precision calculation
-                return self._rust_timer.calculate_elapsed_time(timer_info['timer_id'])
-            else:
-                # Python fallback
-                current_time = datetime.now()
-                elapsed_delta = current_time - timer_info['start_time']
-                return int(elapsed_delta.total_seconds())
+            return self._engine.elapsed_seconds(task_id)
                 
         except Exception as e:
             self._logger.error(f"Failed to get elapsed time: {e}")
@@ -234,8 +187,7 @@ class TimerController(QObject):
             active_timers[task_id] = {
                 'start_time': timer_info['start_time'].isoformat(),
                 'elapsed_seconds': self.get_elapsed_time(task_id),
-                'is_paused': 'paused_at' in timer_info,
-                'rust_timer': timer_info.get('rust_timer', False)
+                'is_paused': 'paused_at' in timer_info
             }
         return active_timers
     
@@ -1,11 +1,9 @@
 # This file makes the core/db directory a Python package 
 
-from pathlib import Path
 import sqlite3
 
-# Absolute path to the SQLite database shipped with the application
-DB_PATH = Path(__file__).resolve().parent / 'tasks.db'
-DB_FILE = str(DB_PATH)
+# Absolute path to the application database (see database_config)
+from .database_config import DATABASE_PATH as DB_PATH, DATABASE_FILE as DB_FILE
 
 # --- Compatibility layer ----------------------------------------------------
 # Historically the codebase opened the database via `sqlite3.connect('tasks.db')`.
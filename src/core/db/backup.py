@@ -0,0 +1,211 @@
+"""
+Online database backups for Auditor Helper
+
+Backups use the SQLite backup API (sqlite3.Connection.backup) instead of
+copying the database file, so they are consistent even while WAL frames are
+not yet checkpointed, never hold the whole file in memory, and can run while
+the application keeps using the database:
+
+- prepare() opens a source connection and starts a read transaction. With
+  WAL this pins the database as of that moment: writes made afterwards (e.g.
+  the week deletion the backup was taken for) neither block on the backup
+  nor end up in it. prepare() is cheap and is meant to run on the caller's
+  thread; the returned BackupJob does the copy and may run on a worker.
+- BackupJob.run() copies pages_per_step pages at a time, reporting
+  progress(copied, total) after every step, writes to a .partial file,
+  verifies it with PRAGMA integrity_check, then moves it into place and
+  prunes old backups so at most `keep` remain.
+
+    job = DatabaseBackup().prepare("before_delete_week")
+    result = job.run(progress=lambda copied, total: ...)   # on a worker thread
+"""
+
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Callable, List, NamedTuple, Optional
+
+from .database_config import get_database_directory, get_database_path
+
+logger = logging.getLogger(__name__)
+
+BACKUP_DIRNAME = "backups"
+BACKUP_PREFIX = "tasks_backup"
+
+# Pages copied per backup step (4KB pages: 1MB per step)
+PAGES_PER_STEP = 256
+
+# Pause between steps so other connections get the disk
+STEP_SLEEP_S = 0.002
+
+# Backup sets kept in the backup directory
+DEFAULT_KEEP = 20
+
+ProgressCallback = Callable[[int, int], None]
+
+
+class BackupError(Exception):
+    """A backup failed, was cancelled, or did not pass verification"""
+
+
+class BackupResult(NamedTuple):
+    path: str
+    pages: int
+    size_bytes: int
+    duration_ms: float
+    removed: List[str]
+
+
+def copy_database(source: sqlite3.Connection, dest_path: str, pages_per_step: int = PAGES_PER_STEP,
+                  progress: Optional[ProgressCallback] = None, cancelled: Callable[[], bool] = None,
+                  verify: bool = True) -> int:
+    """
+    Copy an open database into dest_path with the backup API and return the
+    page count. The copy is left in rollback-journal mode so it is a single
+    self-contained file. Raises BackupError when cancelled or when the copy
+    fails PRAGMA integrity_check.
+    """
+    def on_step(status, remaining, total):
+        if cancelled is not None and cancelled():
+            # Raising from the progress callback aborts the backup
+            raise BackupError("Backup cancelled")
+        if progress is not None:
+            progress(total - remaining, total)
+
+    dest = sqlite3.connect(dest_path)
+    if cancelled is not None:
+        # Also abort the integrity check, which can take a while on a large copy
+        dest.set_progress_handler(lambda: 1 if cancelled() else 0, 1000)
+    try:
+        source.backup(dest, pages=pages_per_step, progress=on_step, sleep=STEP_SLEEP_S)
+        dest.execute("PRAGMA journal_mode = DELETE")
+        if verify:
+            problems = [row[0] for row in dest.execute("PRAGMA integrity_check").fetchall()]
+            if problems != ['ok']:
+                raise BackupError(f"Backup failed integrity check: {'; '.join(problems[:5])}")
+        return dest.execute("PRAGMA page_count").fetchone()[0]
+    finally:
+        dest.close()
+
+
+class BackupJob:
+    """A backup pinned to the database state at prepare() time"""
+
+    def __init__(self, owner: 'DatabaseBackup', source: sqlite3.Connection, dest_path: str):
+        self.owner = owner
+        self.dest_path = dest_path
+        self._source = source
+        self._cancel = threading.Event()
+
+    def cancel(self):
+        self._cancel.set()
+
+    def run(self, progress: Optional[ProgressCallback] = None) -> BackupResult:
+        """Copy, verify, move into place and rotate; always releases the snapshot"""
+        partial_path = self.dest_path + ".partial"
+        start = time.perf_counter()
+        try:
+            pages = copy_database(self._source, partial_path, self.owner.pages_per_step,
+                                  progress, self._cancel.is_set)
+            os.replace(partial_path, self.dest_path)
+            size_bytes = os.path.getsize(self.dest_path)
+        except sqlite3.Error as e:
+            if self._cancel.is_set():
+                raise BackupError("Backup cancelled") from e
+            raise BackupError(f"Backup failed: {e}") from e
+        except OSError as e:
+            raise BackupError(f"Could not write backup: {e}") from e
+        finally:
+            self._source.close()
+            try:
+                if os.path.exists(partial_path):
+                    os.remove(partial_path)
+            except OSError as e:
+                logger.warning(f"Could not remove partial backup {partial_path}: {e}")
+
+        try:
+            removed = self.owner.rotate()
+        except OSError as e:
+            # The backup itself is complete; old ones are pruned next time
+            logger.warning(f"Could not rotate backups: {e}")
+            removed = []
+        duration_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Database backup written to {self.dest_path} ({pages} pages, {duration_ms:.0f}ms)")
+        return BackupResult(self.dest_path, pages, size_bytes, duration_ms, removed)
+
+
+class DatabaseBackup:
+    """Timestamped, verified backup sets of one database with retention"""
+
+    def __init__(self, db_path: str = None, backup_dir: str = None, prefix: str = BACKUP_PREFIX,
+                 keep: int = DEFAULT_KEEP, pages_per_step: int = PAGES_PER_STEP):
+        """
+        Args:
+            db_path: Database to back up (defaults to the application database)
+            backup_dir: Where backups are kept (defaults to backups/ next to the database)
+            prefix: File name prefix of this backup set; rotation only touches these files
+            keep: Number of backups retained (0 keeps all)
+            pages_per_step: Pages copied per backup step
+        """
+        self.db_path = db_path or get_database_path()
+        self.backup_dir = backup_dir or os.path.join(
+            os.path.dirname(os.path.abspath(self.db_path)) if db_path else get_database_directory(),
+            BACKUP_DIRNAME)
+        self.prefix = prefix
+        self.keep = keep
+        self.pages_per_step = pages_per_step
+
+    def prepare(self, label: str = None) -> BackupJob:
+        """Pin the current database state for a backup (cheap; call on the caller's thread)"""
+        if not os.path.exists(self.db_path):
+            raise BackupError(f"Database not found: {self.db_path}")
+        os.makedirs(self.backup_dir, exist_ok=True)
+
+        # check_same_thread=False: the job runs on a worker thread, but only one thread uses it at a time
+        source = sqlite3.connect(Path(self.db_path).resolve().as_uri() + "?mode=ro", uri=True,
+                                 timeout=30.0, check_same_thread=False)
+        try:
+            source.execute("BEGIN")
+            source.execute("SELECT COUNT(*) FROM sqlite_master").fetchone()  # Starts the read transaction
+        except sqlite3.Error as e:
+            source.close()
+            raise BackupError(f"Could not read database: {e}") from e
+        return BackupJob(self, source, self._new_backup_path(label))
+
+    def backup(self, label: str = None, progress: Optional[ProgressCallback] = None) -> BackupResult:
+        """Prepare and run a backup on the calling thread"""
+        return self.prepare(label).run(progress)
+
+    def list_backups(self) -> List[str]:
+        """Completed backups of this set, newest first"""
+        try:
+            names = [name for name in os.listdir(self.backup_dir)
+                     if name.startswith(self.prefix + "_") and name.endswith(".db")]
+        except FileNotFoundError:
+            return []
+        # Timestamped names sort chronologically
+        return [os.path.join(self.backup_dir, name) for name in sorted(names, reverse=True)]
+
+    def rotate(self) -> List[str]:
+        """Delete all but the newest `keep` backups; returns the deleted paths"""
+        if self.keep <= 0:
+            return []
+        removed = []
+        for path in self.list_backups()[self.keep:]:
+            try:
+                os.remove(path)
+                removed.append(path)
+            except OSError as e:
+                logger.warning(f"Could not remove old backup {path}: {e}")
+        return removed
+
+    def _new_backup_path(self, label: str = None) -> str:
+        timestamp = datetime.now().strftime("%Y%m%d%H%M%S_%f")
+        name = f"{self.prefix}_{timestamp}"
+        if label:
+            name += f"_{label}"
+        return os.path.join(self.backup_dir, name + ".db")
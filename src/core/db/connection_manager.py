@@ -0,0 +1,284 @@
+"""
+Unified SQLite connection manager for Auditor Helper
+
+Every component that talks to the application database gets its connections
+from here, so they all share the same PRAGMA settings and statement cache:
+
+- One writer connection per thread, reused across operations
+- One read-only reader connection per thread (WAL lets readers run while a
+  writer holds its lock); a thread with an open write transaction reads
+  through its writer so it sees its own changes
+- WAL journal, NORMAL sync, 64MB page cache, 256MB mmap, foreign keys on;
+  new databases are created with auto_vacuum = INCREMENTAL
+- Acquisition / hold-time / connection metrics via get_stats(), also
+  sampled into the metrics registry as db.connections.<database>.*
+
+Connections are opened with check_same_thread=False only so that
+close_all() can close them from the shutting-down thread; each connection
+is otherwise used exclusively by the thread that created it.
+"""
+
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .database_config import DATABASE_FILE
+from ..performance.metrics import get_registry
+
+logger = logging.getLogger(__name__)
+
+WRITER = "writer"
+READER = "reader"
+
+# Applied to every connection
+CONNECTION_PRAGMAS = [
+    "PRAGMA synchronous = NORMAL",         # Safe with WAL, far fewer fsyncs
+    "PRAGMA cache_size = -64000",          # 64MB page cache
+    "PRAGMA temp_store = MEMORY",          # Temp tables and indexes in memory
+    "PRAGMA mmap_size = 268435456",        # 256MB memory-mapped I/O
+    "PRAGMA foreign_keys = ON",
+]
+
+# sqlite3 prepared statement cache per connection (Python default is 128)
+STATEMENT_CACHE_SIZE = 256
+
+CONNECT_TIMEOUT = 30.0
+
+
+class ConnectionManager:
+    """Thread-aware connection manager with reader/writer separation"""
+
+    def __init__(self, db_path: str = None):
+        self.db_path = str(Path(db_path or DATABASE_FILE).resolve())
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        self._connections: Dict[tuple, sqlite3.Connection] = {}  # (thread_id, role) -> connection
+        self._wal_enabled = False
+
+        self._stats = {
+            'connections_created': 0,
+            'connections_closed': 0,
+            'acquisitions': {WRITER: 0, READER: 0},
+            'reuses': 0,
+            'reads_via_writer': 0,
+            'rollbacks_on_release': 0,
+            'total_hold_ms': 0.0,
+            'max_hold_ms': 0.0,
+        }
+
+    # ------------------------------------------------------------------
+    # Connection creation
+    # ------------------------------------------------------------------
+
+    def _open(self, role: str) -> sqlite3.Connection:
+        if role == READER:
+            uri = Path(self.db_path).as_uri() + "?mode=ro"
+            conn = sqlite3.connect(uri, uri=True, timeout=CONNECT_TIMEOUT,
+                                   check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+        else:
+            conn = sqlite3.connect(self.db_path, timeout=CONNECT_TIMEOUT,
+                                   check_same_thread=False,
+                                   cached_statements=STATEMENT_CACHE_SIZE)
+
+        for pragma in CONNECTION_PRAGMAS:
+            try:
+                conn.execute(pragma)
+            except sqlite3.Error:
+                # Some settings might not be available in all SQLite versions
+                pass
+
+        if role == READER:
+            conn.execute("PRAGMA query_only = ON")
+        elif not self._wal_enabled:
+            if conn.execute("PRAGMA page_count").fetchone()[0] == 0:
+                # A new database: auto_vacuum can only be chosen before the first
+                # table exists; INCREMENTAL lets idle maintenance release free pages
+                conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+            # journal_mode is persistent in the database file, set it once
+            try:
+                conn.execute("PRAGMA journal_mode = WAL")
+                self._wal_enabled = True
+            except sqlite3.Error as e:
+                logger.warning(f"Could not enable WAL mode: {e}")
+
+        return conn
+
+    def _get(self, role: str) -> sqlite3.Connection:
+        conn = getattr(self._local, role, None)
+        if conn is not None:
+            with self._lock:
+                self._stats['reuses'] += 1
+            return conn
+
+        self._close_dead_thread_connections()
+        conn = self._open(role)
+        setattr(self._local, role, conn)
+        with self._lock:
+            self._connections[(threading.get_ident(), role)] = conn
+            self._stats['connections_created'] += 1
+        return conn
+
+    def _close_dead_thread_connections(self):
+        """Close connections owned by threads that have exited"""
+        alive = {thread.ident for thread in threading.enumerate()}
+        with self._lock:
+            dead = [key for key in self._connections if key[0] not in alive]
+            stale = [self._connections.pop(key) for key in dead]
+            self._stats['connections_closed'] += len(stale)
+        for conn in stale:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+
+    # ------------------------------------------------------------------
+    # Scopes
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _scope(self, conn: sqlite3.Connection, role: str, row_factory):
+        depth_attr = f"{role}_depth"
+        depth = getattr(self._local, depth_attr, 0)
+        setattr(self._local, depth_attr, depth + 1)
+
+        previous_row_factory = conn.row_factory
+        if row_factory is not None:
+            conn.row_factory = row_factory
+
+        start = time.perf_counter()
+        try:
+            yield conn
+        except Exception:
+            if depth == 0 and conn.in_transaction:
+                conn.rollback()
+            raise
+        finally:
+            conn.row_factory = previous_row_factory
+            setattr(self._local, depth_attr, depth)
+
+            if depth == 0 and conn.in_transaction:
+                # Reused connections must not keep a write lock between operations;
+                # matches closing an uncommitted connection
+                conn.rollback()
+                with self._lock:
+                    self._stats['rollbacks_on_release'] += 1
+                logger.warning("Uncommitted transaction rolled back when releasing connection")
+
+            hold_ms = (time.perf_counter() - start) * 1000
+            with self._lock:
+                self._stats['acquisitions'][role] += 1
+                self._stats['total_hold_ms'] += hold_ms
+                if hold_ms > self._stats['max_hold_ms']:
+                    self._stats['max_hold_ms'] = hold_ms
+
+    @contextmanager
+    def writer(self, row_factory=None):
+        """
+        Yield this thread's writer connection.
+        Callers commit their own work; an outermost scope left with an open
+        transaction is rolled back.
+        """
+        conn = self._get(WRITER)
+        with self._scope(conn, WRITER, row_factory) as scoped:
+            yield scoped
+
+    @contextmanager
+    def reader(self, row_factory=None):
+        """Yield this thread's read-only connection"""
+        writer = getattr(self._local, WRITER, None)
+        if writer is not None and writer.in_transaction:
+            # Read-your-writes inside an open write transaction
+            with self._lock:
+                self._stats['reads_via_writer'] += 1
+            with self._scope(writer, WRITER, row_factory) as scoped:
+                yield scoped
+            return
+
+        try:
+            conn = self._get(READER)
+        except sqlite3.OperationalError:
+            # Read-only open fails if the database file does not exist yet
+            with self.writer(row_factory) as conn:
+                yield conn
+            return
+
+        with self._scope(conn, READER, row_factory) as scoped:
+            yield scoped
+
+    # ------------------------------------------------------------------
+    # Lifecycle and metrics
+    # ------------------------------------------------------------------
+
+    def close_thread_connections(self):
+        """Close the calling thread's connections (call from worker threads before exiting)"""
+        thread_id = threading.get_ident()
+        for role in (WRITER, READER):
+            conn = getattr(self._local, role, None)
+            if conn is None:
+                continue
+            setattr(self._local, role, None)
+            with self._lock:
+                self._connections.pop((thread_id, role), None)
+                self._stats['connections_closed'] += 1
+            conn.close()
+
+    def close_all(self):
+        """Close every connection owned by this manager"""
+        with self._lock:
+            connections = list(self._connections.values())
+            self._stats['connections_closed'] += len(connections)
+            self._connections.clear()
+        for conn in connections:
+            try:
+                conn.close()
+            except sqlite3.Error:
+                pass
+        # Connections held in other threads' locals are now closed; drop ours
+        self._local = threading.local()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get connection pool metrics"""
+        with self._lock:
+            stats = {
+                **self._stats,
+                'acquisitions': dict(self._stats['acquisitions']),
+                'db_path': self.db_path,
+                'open_connections': {
+                    WRITER: sum(1 for key in self._connections if key[1] == WRITER),
+                    READER: sum(1 for key in self._connections if key[1] == READER),
+                },
+                'threads': len({key[0] for key in self._connections}),
+            }
+        total = sum(stats['acquisitions'].values())
+        stats['average_hold_ms'] = stats['total_hold_ms'] / total if total else 0.0
+        return stats
+
+
+# Global managers, one per database file
+_managers: Dict[str, ConnectionManager] = {}
+_managers_lock = threading.Lock()
+
+
+def get_connection_manager(db_path: str = None) -> ConnectionManager:
+    """Get the shared connection manager for a database (the application database by default)"""
+    key = str(Path(db_path or DATABASE_FILE).resolve())
+    with _managers_lock:
+        manager = _managers.get(key)
+        if manager is None:
+            manager = ConnectionManager(key)
+            _managers[key] = manager
+            get_registry().register_collector(f"db.connections.{Path(key).stem}", manager.get_stats)
+        return manager
+
+
+def close_all_connections():
+    """Close connections of every manager (application shutdown)"""
+    with _managers_lock:
+        managers = list(_managers.values())
+    for manager in managers:
+        manager.close_all()
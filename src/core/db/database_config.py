@@ -6,14 +6,18 @@ Provides consistent database path management across the entire application
 from pathlib import Path
 import os
 import shutil
+import sqlite3
 from typing import List, Optional
 import logging
 
 # Get logger for this module
 logger = logging.getLogger(__name__)
 
+# Environment override for the database location (benchmarks, test runs)
+DATABASE_PATH_ENV = 'AUDITOR_HELPER_DB_PATH'
+
 # Absolute path to the application database (current location)
-DATABASE_PATH = Path(__file__).resolve().parent / 'tasks.db'
+DATABASE_PATH = Path(os.environ.get(DATABASE_PATH_ENV) or Path(__file__).resolve().parent / 'tasks.db').resolve()
 DATABASE_FILE = str(DATABASE_PATH)
 
 # Legacy database paths to check for migration
@@ -71,7 +75,13 @@ def backup_database(backup_suffix: str = None) -> Optional[str]:
             backup_suffix = datetime.now().strftime("%Y%m%d_%H%M%S")
         
         backup_path = DATABASE_PATH.with_suffix(f'.backup_{backup_suffix}.db')
-        shutil.copy2(DATABASE_PATH, backup_path)
+        # The backup API includes committed WAL frames that a file copy could miss
+        from .backup import copy_database
+        source = sqlite3.connect(DATABASE_FILE)
+        try:
+            copy_database(source, str(backup_path))
+        finally:
+            source.close()
         logger.info(f"Database backed up to: {backup_path}")
         return str(backup_path)
     except Exception as e:
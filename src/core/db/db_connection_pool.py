@@ -1,84 +1,54 @@
 # db_connection_pool.py - Connection pooling for improved database performance
+import logging
 import sqlite3
-import threading
 from contextlib import contextmanager
 from datetime import datetime
 import time
 from . import DB_FILE  # absolute path to tasks.db
+from .connection_manager import get_connection_manager
+from ..performance.metrics import get_registry
+
+logger = logging.getLogger(__name__)
+
+# Operations slower than this are also logged
+SLOW_OPERATION_MS = 100
 
 class DatabaseConnectionPool:
-    """Simple connection pool for SQLite database operations"""
+    """
+    Compatibility wrapper around the unified ConnectionManager.
+    Connections are reused per thread and share the manager's PRAGMA settings.
+    """
     
     def __init__(self, db_file=DB_FILE, pool_size=5):
         self.db_file = db_file
-        self.pool_size = pool_size
-        self.connections = []
-        self.lock = threading.Lock()
-        self.connection_count = 0
-        
-        # Initialize the pool
-        self._initialize_pool()
-    
-    def _initialize_pool(self):
-        """Initialize the connection pool"""
-        with self.lock:
-            for _ in range(self.pool_size):
-                conn = self._create_optimized_connection()
-                self.connections.append(conn)
-                self.connection_count += 1
-    
-    def _create_optimized_connection(self):
-        """Create an optimized SQLite connection"""
-        conn = sqlite3.connect(self.db_file, check_same_thread=False)
-        
-        # Optimize SQLite settings for performance
-        conn.execute("PRAGMA journal_mode=WAL")       # Better concurrency
-        conn.execute("PRAGMA synchronous=NORMAL")     # Performance boost
-        conn.execute("PRAGMA cache_size=10000")       # Larger cache (10MB)
-        conn.execute("PRAGMA temp_store=MEMORY")      # Use memory for temp storage
-        conn.execute("PRAGMA mmap_size=268435456")    # Use memory-mapped I/O (256MB)
-        
-        return conn
+        self.pool_size = pool_size  # Kept for status reporting; connections are per thread
+        self.manager = get_connection_manager(db_file)
     
     @contextmanager
     def get_connection(self):
-        """Get a connection from the pool"""
-        conn = None
-        
-        with self.lock:
-            if self.connections:
-                conn = self.connections.pop()
-            else:
-                # Pool exhausted, create temporary connection
-                conn = self._create_optimized_connection()
-                print(f"⚠️ Pool exhausted, created temporary connection")
-        
-        try:
+        """Get this thread's writer connection"""
+        with self.manager.writer() as conn:
+            yield conn
+    
+    @contextmanager
+    def get_read_connection(self):
+        """Get this thread's read-only connection"""
+        with self.manager.reader() as conn:
             yield conn
-        finally:
-            # Return connection to pool or close if temporary
-            with self.lock:
-                if len(self.connections) < self.pool_size:
-                    self.connections.append(conn)
-                else:
-                    conn.close()
     
     def close_all(self):
-        """Close all connections in the pool"""
-        with self.lock:
-            for conn in self.connections:
-                conn.close()
-            self.connections.clear()
-            self.connection_count = 0
+        """Close all connections owned by the manager"""
+        self.manager.close_all()
     
     def get_pool_status(self):
         """Get current pool status"""
-        with self.lock:
-            return {
-                'available_connections': len(self.connections),
-                'pool_size': self.pool_size,
-                'total_created': self.connection_count
-            }
+        stats = self.manager.get_stats()
+        return {
+            'available_connections': sum(stats['open_connections'].values()),
+            'pool_size': self.pool_size,
+            'total_created': stats['connections_created'],
+            'metrics': stats
+        }
 
 # Global connection pool instance
 _connection_pool = None
@@ -105,16 +75,25 @@ def get_db_connection():
     with pool.get_connection() as conn:
         yield conn
 
+@contextmanager
+def get_db_read_connection():
+    """Context manager for read-only database operations"""
+    pool = get_db_pool()
+    with pool.get_read_connection() as conn:
+        yield conn
+
 # Performance timing decorator
 def time_db_operation(func):
-    """Decorator to time database operations"""
+    """Decorator to time database operations (reported as db.operation_ms in the metrics registry)"""
+    histogram = get_registry().histogram("db.operation_ms", {'operation': func.__name__})
+    
     def wrapper(*args, **kwargs):
-        start_time = time.time()
+        start_time = time.perf_counter()
         result = func(*args, **kwargs)
-        end_time = time.time()
-        operation_time = (end_time - start_time) * 1000
-        if operation_time > 100:  # Log slow operations
-            print(f"⚠️ Slow DB operation: {func.__name__} took {operation_time:.2f}ms")
+        operation_time = (time.perf_counter() - start_time) * 1000
+        histogram.observe(operation_time)
+        if operation_time > SLOW_OPERATION_MS:
+            logger.warning(f"Slow DB operation: {func.__name__} took {operation_time:.2f}ms")
         return result
     return wrapper
 
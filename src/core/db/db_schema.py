@@ -1,30 +1,26 @@
 import sqlite3
 import os
 from .database_config import DATABASE_FILE, ensure_database_directory, detect_and_migrate_legacy_databases
+from .week_dates import parse_week_label_dates
+from .backup import DatabaseBackup, BackupError
 
 DB_FILE = DATABASE_FILE
 
 def backup_db():
-    """Create a backup of the existing database if it exists"""
+    """Create a verified online backup of the existing database if it exists"""
     if os.path.exists(DB_FILE):
-        backup_file = f"{DB_FILE}.bak"
-        i = 1
-        while os.path.exists(backup_file):
-            backup_file = f"{DB_FILE}.bak.{i}"
-            i += 1
-        
         try:
-            with open(DB_FILE, 'rb') as src, open(backup_file, 'wb') as dst:
-                dst.write(src.read())
-            print(f"Created database backup: {backup_file}")
-        except Exception as e:
+            result = DatabaseBackup(DB_FILE).backup("schema")
+            print(f"Created database backup: {result.path}")
+        except BackupError as e:
             print(f"Failed to create backup: {e}")
 
-def init_db():
+def init_db(conn=None):
     """Initialize the database with the required tables"""
     
-    
-    conn = sqlite3.connect(DB_FILE)
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
     
     # Create weeks table
@@ -80,8 +76,9 @@ def init_db():
         )"""
     )
     
-    conn.commit()
-    conn.close()
+    if own_connection:
+        conn.commit()
+        conn.close()
 
 def create_tasks_table(cursor):
     cursor.execute(
@@ -105,9 +102,11 @@ def create_tasks_table(cursor):
         )"""
     )
 
-def migrate_time_columns():
+def migrate_time_columns(conn=None):
     """Add time_begin and time_end columns if they don't exist"""
-    conn = sqlite3.connect(DB_FILE)
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
     
     # Check if the columns exist
@@ -130,12 +129,15 @@ def migrate_time_columns():
         except Exception as e:
             print(f"Error adding time_end column: {e}")
     
-    conn.commit()
-    conn.close()
+    if own_connection:
+        conn.commit()
+        conn.close()
 
-def migrate_tasks_table_columns():
+def migrate_tasks_table_columns(conn=None):
     """Add missing columns to tasks table for legacy database compatibility"""
-    conn = sqlite3.connect(DB_FILE)
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
     
     # Check if the columns exist
@@ -166,12 +168,15 @@ def migrate_tasks_table_columns():
         if "score REAL" in table_sql:
             print("Note: score column is REAL type (legacy), but application expects INTEGER")
     
-    conn.commit()
-    conn.close()
+    if own_connection:
+        conn.commit()
+        conn.close()
 
-def migrate_feedback_files_table():
+def migrate_feedback_files_table(conn=None):
     """Create feedback_files table if it doesn't exist"""
-    conn = sqlite3.connect(DB_FILE)
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
     
     # Check if table exists
@@ -193,12 +198,15 @@ def migrate_feedback_files_table():
         except Exception as e:
             print(f"Error creating feedback_files table: {e}")
     
-    conn.commit()
-    conn.close()
+    if own_connection:
+        conn.commit()
+        conn.close()
 
-def migrate_week_settings():
+def migrate_week_settings(conn=None):
     """Add week-specific settings columns to weeks table"""
-    conn = sqlite3.connect(DB_FILE)
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
     
     # Check if the columns exist
@@ -223,12 +231,15 @@ def migrate_week_settings():
             except Exception as e:
                 print(f"Error adding {column_name} column: {e}")
     
-    conn.commit()
-    conn.close()
+    if own_connection:
+        conn.commit()
+        conn.close()
 
-def migrate_week_bonus_settings():
+def migrate_week_bonus_settings(conn=None):
     """Add week-specific bonus settings columns to weeks table"""
-    conn = sqlite3.connect(DB_FILE)
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
     
     # Check if the columns exist
@@ -256,12 +267,15 @@ def migrate_week_bonus_settings():
             except Exception as e:
                 print(f"Error adding {column_name} column: {e}")
     
-    conn.commit()
-    conn.close()
+    if own_connection:
+        conn.commit()
+        conn.close()
 
-def migrate_app_settings_table():
+def migrate_app_settings_table(conn=None):
     """Create app_settings table for global application settings"""
-    conn = sqlite3.connect(DB_FILE)
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
     
     # Check if table exists
@@ -302,12 +316,15 @@ def migrate_app_settings_table():
         except Exception as e:
             print(f"Error creating app_settings table: {e}")
     
-    conn.commit()
-    conn.close()
+    if own_connection:
+        conn.commit()
+        conn.close()
 
-def migrate_office_hours_settings():
+def migrate_office_hours_settings(conn=None):
     """Add office hours settings columns to weeks table"""
-    conn = sqlite3.connect(DB_FILE)
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
     c = conn.cursor()
 
     # Check if the columns exist
@@ -330,8 +347,165 @@ def migrate_office_hours_settings():
             except Exception as e:
                 print(f"Error adding {column_name} column: {e}")
 
-    conn.commit()
-    conn.close()
+    if own_connection:
+        conn.commit()
+        conn.close()
+
+def migrate_week_date_columns(conn=None):
+    """Add indexed start_date/end_date columns to weeks and backfill them from week_label"""
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
+    c = conn.cursor()
+
+    # Check if the columns exist
+    c.execute("PRAGMA table_info(weeks)")
+    columns = [column[1] for column in c.fetchall()]
+
+    for column_name in ("start_date", "end_date"):
+        if column_name not in columns:
+            print(f"Adding {column_name} column to weeks table...")
+            try:
+                c.execute(f"ALTER TABLE weeks ADD COLUMN {column_name} TEXT DEFAULT NULL")
+                print(f"Added {column_name} column successfully")
+            except Exception as e:
+                print(f"Error adding {column_name} column: {e}")
+
+    # Backfill weeks whose dates have not been derived yet
+    c.execute("SELECT id, week_label FROM weeks WHERE start_date IS NULL OR end_date IS NULL")
+    backfill = []
+    for week_id, week_label in c.fetchall():
+        start_date, end_date = parse_week_label_dates(week_label)
+        if start_date or end_date:
+            backfill.append((start_date, end_date, week_id))
+    if backfill:
+        c.executemany(
+            "UPDATE weeks SET start_date = COALESCE(?, start_date), end_date = COALESCE(?, end_date) WHERE id = ?",
+            backfill
+        )
+        print(f"Backfilled start/end dates for {len(backfill)} weeks")
+
+    # Range index: chronological ordering and "which week contains this date" lookups
+    c.execute("CREATE INDEX IF NOT EXISTS idx_weeks_date_range ON weeks(start_date, end_date)")
+
+    if own_connection:
+        conn.commit()
+        conn.close()
+
+def create_essential_indexes(conn=None):
+    """Create the indexes used by week-based task loading and date filtering"""
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
+    c = conn.cursor()
+
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tasks_week_id ON tasks(week_id)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tasks_date_audited ON tasks(date_audited)")
+    c.execute("CREATE INDEX IF NOT EXISTS idx_weeks_week_label ON weeks(week_label)")
+
+    if own_connection:
+        conn.commit()
+        conn.close()
+
+def create_query_plan_indexes(conn=None):
+    """Create the indexes that keep registered queries off full scans and temp B-trees"""
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
+    c = conn.cursor()
+
+    # Chart data: date range filter ordered by date and claim time
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tasks_date_time ON tasks(date_audited, time_begin)")
+    # Project drill-down ordered by date
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tasks_project_date ON tasks(project_name, date_audited)")
+    # High-score listing ordered by score then date
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tasks_score_date ON tasks(score, date_audited)")
+    # Covering index for per-week counts, scores and bonus totals
+    c.execute("CREATE INDEX IF NOT EXISTS idx_tasks_week_stats ON tasks(week_id, score, bonus_paid)")
+    # Chronological week list (start_date, then id via the implicit rowid)
+    c.execute("CREATE INDEX IF NOT EXISTS idx_weeks_start_date ON weeks(start_date)")
+
+    if own_connection:
+        conn.commit()
+        conn.close()
+
+def migrate_week_created_at(conn=None):
+    """Add the created_at column that WeekDAO writes and filters on"""
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
+    c = conn.cursor()
+
+    c.execute("PRAGMA table_info(weeks)")
+    columns = [column[1] for column in c.fetchall()]
+
+    if "created_at" not in columns:
+        print("Adding created_at column to weeks table...")
+        try:
+            c.execute("ALTER TABLE weeks ADD COLUMN created_at TEXT DEFAULT NULL")
+            print("Added created_at column successfully")
+        except Exception as e:
+            print(f"Error adding created_at column: {e}")
+
+    c.execute("CREATE INDEX IF NOT EXISTS idx_weeks_created_at ON weeks(created_at)")
+
+    if own_connection:
+        conn.commit()
+        conn.close()
+
+def create_task_search_index(conn=None):
+    """Create the tasks_fts full-text index over the task text fields, kept in sync by triggers"""
+    own_connection = conn is None
+    if own_connection:
+        conn = sqlite3.connect(DB_FILE)
+    c = conn.cursor()
+
+    try:
+        # External-content table: the text lives in tasks, tasks_fts only holds the index.
+        # prefix='2 3' keeps short search-as-you-type prefixes on an index lookup.
+        c.execute("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS tasks_fts USING fts5(
+                attempt_id, operation_id, project_name, locale, feedback,
+                content='tasks', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2', prefix='2 3'
+            )
+        """)
+    except sqlite3.OperationalError as e:
+        # SQLite built without FTS5: searches fall back to LIKE
+        print(f"Full-text search index not available: {e}")
+        if own_connection:
+            conn.close()
+        return
+
+    c.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_insert AFTER INSERT ON tasks BEGIN
+            INSERT INTO tasks_fts(rowid, attempt_id, operation_id, project_name, locale, feedback)
+            VALUES (new.id, new.attempt_id, new.operation_id, new.project_name, new.locale, new.feedback);
+        END
+    """)
+    c.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_delete AFTER DELETE ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, attempt_id, operation_id, project_name, locale, feedback)
+            VALUES ('delete', old.id, old.attempt_id, old.operation_id, old.project_name, old.locale, old.feedback);
+        END
+    """)
+    # Only edits to indexed columns touch the index (timer updates do not)
+    c.execute("""
+        CREATE TRIGGER IF NOT EXISTS tasks_fts_update
+        AFTER UPDATE OF attempt_id, operation_id, project_name, locale, feedback ON tasks BEGIN
+            INSERT INTO tasks_fts(tasks_fts, rowid, attempt_id, operation_id, project_name, locale, feedback)
+            VALUES ('delete', old.id, old.attempt_id, old.operation_id, old.project_name, old.locale, old.feedback);
+            INSERT INTO tasks_fts(rowid, attempt_id, operation_id, project_name, locale, feedback)
+            VALUES (new.id, new.attempt_id, new.operation_id, new.project_name, new.locale, new.feedback);
+        END
+    """)
+
+    # Index the rows that existed before the table was created
+    c.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('rebuild')")
+
+    if own_connection:
+        conn.commit()
+        conn.close()
 
 def get_app_setting(setting_key, default_value=None):
     """Get an application setting value"""
@@ -387,25 +561,21 @@ def set_app_setting(setting_key, setting_value, setting_type='string'):
         conn.close()
 
 def run_all_migrations():
-    """Run all database migrations in the correct order"""
+    """Bring the application database up to the current schema version"""
     # Ensure database directory exists
     ensure_database_directory()
     
-    # Check for and handle legacy databases
-    print("Checking for legacy databases...")
-    migration_messages = detect_and_migrate_legacy_databases(auto_migrate=True)
-    for message in migration_messages:
-        print(f"Legacy DB: {message}")
-    
-    # Run all migrations in order
-    init_db()
-    migrate_time_columns()
-    migrate_tasks_table_columns()
-    migrate_feedback_files_table()
-    migrate_week_settings()
-    migrate_week_bonus_settings()
-    migrate_app_settings_table()
-    migrate_office_hours_settings()
+    # Legacy databases predate the current location; only adopt one when
+    # there is no application database yet, never overwrite a live one
+    if not os.path.exists(DB_FILE):
+        print("Checking for legacy databases...")
+        migration_messages = detect_and_migrate_legacy_databases(auto_migrate=True)
+        for message in migration_messages:
+            print(f"Legacy DB: {message}")
+    
+    # Versioned migrations: a single PRAGMA read when the schema is current
+    from .schema_migrations import migrate_database
+    return migrate_database(DB_FILE)
 
 if __name__ == "__main__":
-    run_all_migrations()
\ No newline at end of file
+    run_all_migrations()
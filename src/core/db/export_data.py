@@ -68,7 +68,7 @@ def get_tasks_for_week(week_id: int):
         task_dao = TaskDAO()
         
         # Use the cached method from TaskDAO
-        tasks = task_dao.get_tasks_by_week(week_id)
+        tasks = task_dao.get_tasks_by_week(week_id, include_feedback=True)
         
         if not tasks:
             # Return empty DataFrame with correct columns
@@ -2,6 +2,9 @@ import os
 import sqlite3
 # Lazy import for pandas - deferred until first use
 from core.optimization.lazy_imports import get_lazy_manager
+from core.performance.rust_file_io_engine import file_io_engine
+from core.db.week_dates import parse_week_label_dates
+from core.db.connection_manager import get_connection_manager
 from datetime import datetime
 import sys
 import re # For parsing CSV filename
@@ -9,6 +12,21 @@ import re # For parsing CSV filename
 # Database file name
 DB_FILE = "tasks.db"
 
+# Columns every imported task row must provide
+REQUIRED_TASK_COLUMNS = ["Attempt ID", "Duration", "Project ID", "Project Name",
+                         "Operation ID", "Time Limit", "Date Audited", "Score", "Locale"]
+
+TASK_INSERT_SQL = """
+INSERT OR REPLACE INTO tasks (
+    attempt_id, duration, project_id, project_name, 
+    operation_id, time_limit, date_audited, score, 
+    feedback, locale, week_id
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+# Date formats tried before falling back to pandas for 'Date Audited'
+DATE_AUDITED_FORMATS = ["%Y-%m-%d", "%Y-%m-%d %H:%M:%S", "%m/%d/%Y", "%d/%m/%Y", "%Y/%m/%d"]
+
 class ImportManager:
     """Import manager with lazy-loaded pandas for better startup performance"""
     
@@ -30,14 +48,8 @@ class ImportManager:
 _import_manager = ImportManager()
 
 def get_db_connection():
-    """Establishes and returns a database connection."""
-    try:
-        conn = sqlite3.connect(DB_FILE)
-        conn.row_factory = sqlite3.Row # Allows accessing columns by name
-        return conn
-    except sqlite3.Error as e:
-        print(f"Database connection error: {e}")
-        return None
+    """Returns a context manager yielding the shared writer connection."""
+    return get_connection_manager().writer(row_factory=sqlite3.Row) # Allows accessing columns by name
 
 def get_week_id_by_label(conn, week_label):
     """
@@ -63,8 +75,12 @@ def create_week(conn, week_label):
     Requires an active database connection within a transaction.
     """
     cursor = conn.cursor()
+    start_date, end_date = parse_week_label_dates(week_label)
     try:
-        cursor.execute("INSERT INTO weeks (week_label) VALUES (?)", (week_label,))
+        cursor.execute(
+            "INSERT INTO weeks (week_label, start_date, end_date) VALUES (?, ?, ?)",
+            (week_label, start_date, end_date)
+        )
         return cursor.lastrowid
     except sqlite3.IntegrityError:
         print(f"Warning: Week label '{week_label}' already exists or conflicted. Attempting to retrieve ID.")
@@ -192,6 +208,86 @@ def process_dataframe_for_insertion(df, week_id, week_label_for_reporting):
             })
     return valid_rows_for_db, invalid_rows_info, rows_in_df
 
+def format_seconds_as_duration(total_seconds):
+    """Format a number of seconds as HH:MM:SS"""
+    hours, remainder = divmod(int(total_seconds), 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+def parse_date_audited(value):
+    """Convert a 'Date Audited' cell to an ISO date string, or None if unparseable"""
+    value = value.strip()
+    for fmt in DATE_AUDITED_FORMATS:
+        try:
+            return datetime.strptime(value, fmt).date().isoformat()
+        except ValueError:
+            continue
+    try:
+        return str(_import_manager.pd.to_datetime(value).date())
+    except Exception:
+        return None
+
+def process_task_chunk_for_insertion(tasks, week_id, week_label_for_reporting, first_row_index):
+    """
+    Validates a chunk of typed task rows from the streaming CSV reader.
+    Durations arrive as seconds (None when malformed) and Score as float.
+    Returns (list_of_valid_rows, list_of_invalid_row_info)
+    """
+    valid_rows_for_db = []
+    invalid_rows_info = []
+
+    for offset, task in enumerate(tasks):
+        validation_errors_for_row = []
+
+        for col_name in REQUIRED_TASK_COLUMNS:
+            value = task.get(col_name)
+            if col_name in ("Duration", "Time Limit", "Score"):
+                continue  # Typed columns are checked below
+            if value is None or not str(value).strip():
+                validation_errors_for_row.append(f"Missing or empty mandatory field: '{col_name}'")
+
+        if task.get("Duration") is None:
+            validation_errors_for_row.append("Invalid time format for 'Duration'")
+        if task.get("Time Limit") is None:
+            validation_errors_for_row.append("Invalid time format for 'Time Limit'")
+
+        score = task.get("Score")
+        if score is None:
+            validation_errors_for_row.append("Missing or empty mandatory field: 'Score'")
+        elif score < 0:
+            validation_errors_for_row.append("Negative value for 'Score'")
+
+        date_audited_iso = None
+        if not validation_errors_for_row:
+            date_audited_iso = parse_date_audited(task["Date Audited"])
+            if date_audited_iso is None:
+                validation_errors_for_row.append(f"Could not parse 'Date Audited': {task['Date Audited']}")
+
+        if validation_errors_for_row:
+            invalid_rows_info.append({
+                'source': week_label_for_reporting,
+                'row_index': first_row_index + offset + 1, # +1 for the header row
+                'errors': validation_errors_for_row,
+                'data_sample': {k: str(v)[:50] for k, v in task.items()} # Truncate long values
+            })
+            continue
+
+        valid_rows_for_db.append((
+            task['Attempt ID'],
+            format_seconds_as_duration(task['Duration']),
+            task['Project ID'],
+            task['Project Name'],
+            task['Operation ID'],
+            format_seconds_as_duration(task['Time Limit']),
+            date_audited_iso,
+            score,
+            task.get('Feedback', ''),
+            task['Locale'],
+            week_id
+        ))
+
+    return valid_rows_for_db, invalid_rows_info
+
 def import_tasks_from_excel(filename, conn):
     """
     Imports task data from a multi-sheet Excel file.
@@ -288,44 +384,45 @@ def import_tasks_from_csv(filename, conn):
 
     print(f"Processing CSV with derived week label: '{week_label}'...")
     
-    existing_weeks_df = _import_manager.pd.read_sql_query("SELECT id, week_label FROM weeks", conn)
-    existing_weeks = dict(zip(existing_weeks_df['week_label'], existing_weeks_df['id']))
-
-    week_id = existing_weeks.get(week_label)
+    week_id = get_week_id_by_label(conn, week_label)
     if week_id is None:
         week_id = create_week(conn, week_label)
         if week_id:
-            existing_weeks[week_label] = week_id # Add to our current session's lookup
             print(f"Created new week '{week_label}' with ID {week_id}")
         else:
             file_level_errors.append(f"Failed to get or create week for label '{week_label}' from CSV. Skipping file.")
             return total_rows_read_file, total_rows_inserted_file, all_invalid_rows_info_file, file_level_errors
 
+    source = f"CSV: {os.path.basename(filename)} (Week: {week_label})"
+    cursor = conn.cursor()
     try:
-        df = _import_manager.pd.read_csv(filename)
+        # Stream the file in typed chunks and insert each chunk as it is validated
+        for tasks in file_io_engine.import_tasks_from_csv_fast(filename):
+            if total_rows_read_file == 0:
+                missing_cols = [col for col in REQUIRED_TASK_COLUMNS if col not in tasks[0]]
+                if missing_cols:
+                    error_message = f"Data source '{source}' missing required columns: {', '.join(missing_cols)}. Skipping this source."
+                    all_invalid_rows_info_file.append({'source': source, 'row_index': 'N/A', 'errors': [error_message], 'data_sample': 'N/A - Missing columns'})
+                    return total_rows_read_file, total_rows_inserted_file, all_invalid_rows_info_file, file_level_errors
+
+            valid_rows_for_db, invalid_rows_info_chunk = process_task_chunk_for_insertion(
+                tasks, week_id, source, total_rows_read_file + 1
+            )
+            total_rows_read_file += len(tasks)
+            all_invalid_rows_info_file.extend(invalid_rows_info_chunk)
+
+            if valid_rows_for_db:
+                cursor.executemany(TASK_INSERT_SQL, valid_rows_for_db)
+                total_rows_inserted_file += len(valid_rows_for_db)
+    except sqlite3.Error as e:
+        file_level_errors.append(f"Database error during insertion for CSV '{filename}': {e}.")
+        return total_rows_read_file, total_rows_inserted_file, all_invalid_rows_info_file, file_level_errors
     except Exception as e:
         file_level_errors.append(f"Error reading CSV file '{filename}': {e}")
         return total_rows_read_file, total_rows_inserted_file, all_invalid_rows_info_file, file_level_errors
 
-    valid_rows_for_db, invalid_rows_info_csv, rows_in_csv = process_dataframe_for_insertion(df, week_id, f"CSV: {os.path.basename(filename)} (Week: {week_label})")
-    total_rows_read_file += rows_in_csv
-    all_invalid_rows_info_file.extend(invalid_rows_info_csv)
-
-    if valid_rows_for_db:
-        cursor = conn.cursor()
-        insert_sql = """
-        INSERT OR REPLACE INTO tasks (
-            attempt_id, duration, project_id, project_name, 
-            operation_id, time_limit, date_audited, score, 
-            feedback, locale, week_id
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        """
-        try:
-            cursor.executemany(insert_sql, valid_rows_for_db)
-            total_rows_inserted_file += len(valid_rows_for_db)
-            print(f"Attempted to insert/replace {len(valid_rows_for_db)} valid rows from CSV '{filename}'.")
-        except sqlite3.Error as e:
-            file_level_errors.append(f"Database error during insertion for CSV '{filename}': {e}.")
+    if total_rows_inserted_file:
+        print(f"Attempted to insert/replace {total_rows_inserted_file} valid rows from CSV '{filename}'.")
     else:
         print(f"No valid rows to insert from CSV '{filename}'.")
 
@@ -338,77 +435,71 @@ def main_import(filename):
         print(f"Error: File not found at '{filename}'")
         return
 
-    conn = get_db_connection()
-    if not conn:
-        return
-
     total_rows_read = 0
     total_rows_inserted = 0
     all_invalid_rows_info = []
     all_file_level_errors = []
 
-    try:
-        conn.execute("BEGIN;") # Start a database transaction
-
-        file_extension = os.path.splitext(filename)[1].lower()
-
-        if file_extension == '.xlsx':
-            read, inserted, invalid_info, errors = import_tasks_from_excel(filename, conn)
-            total_rows_read += read
-            total_rows_inserted += inserted
-            all_invalid_rows_info.extend(invalid_info)
-            all_file_level_errors.extend(errors)
-        elif file_extension == '.csv':
-            read, inserted, invalid_info, errors = import_tasks_from_csv(filename, conn)
-            total_rows_read += read
-            total_rows_inserted += inserted
-            all_invalid_rows_info.extend(invalid_info)
-            all_file_level_errors.extend(errors)
-        else:
-            all_file_level_errors.append(f"Unsupported file type: '{file_extension}'. Please use .xlsx or .csv files.")
+    with get_db_connection() as conn:
+        try:
+            conn.execute("BEGIN;") # Start a database transaction
+
+            file_extension = os.path.splitext(filename)[1].lower()
+
+            if file_extension == '.xlsx':
+                read, inserted, invalid_info, errors = import_tasks_from_excel(filename, conn)
+                total_rows_read += read
+                total_rows_inserted += inserted
+                all_invalid_rows_info.extend(invalid_info)
+                all_file_level_errors.extend(errors)
+            elif file_extension == '.csv':
+                read, inserted, invalid_info, errors = import_tasks_from_csv(filename, conn)
+                total_rows_read += read
+                total_rows_inserted += inserted
+                all_invalid_rows_info.extend(invalid_info)
+                all_file_level_errors.extend(errors)
+            else:
+                all_file_level_errors.append(f"Unsupported file type: '{file_extension}'. Please use .xlsx or .csv files.")
 
-        if not all_file_level_errors and not any(item['errors'] for item in all_invalid_rows_info if 'errors' in item): # Check for critical errors
-            conn.commit()
-            print("\nDatabase transaction committed.")
-        else:
-            conn.rollback()
-            print("\nDatabase transaction rolled back due to errors during processing.")
-            # If only some sheets/rows had validation errors but no DB/file errors, we might still commit
-            # The current logic rolls back if ANY error (file level or severe validation that stops processing) occurs.
-            # More nuanced commit/rollback could be added based on severity.
-            # For now, if all_file_level_errors is not empty, or critical validation errors that prevent processing, we rollback.
-            # The "any(item['errors']..." is a simple check for any validation issue, which might be too strict for rollback.
-            # Let's refine: rollback if all_file_level_errors OR if total_rows_inserted == 0 AND total_rows_read > 0 due to validation issues.
-            # Simpler: rollback if all_file_level_errors exist. Validation errors for rows are reported but don't stop commit for other valid data.
-            # Revisiting: if there are file_level_errors OR if (total_rows_inserted == 0 and total_rows_read > 0 and not all_file_level_errors)
-            # The `process_dataframe_for_insertion` already skips entire sheets/CSVs if columns are missing.
-            # So, if `all_file_level_errors` is populated, that's a clear rollback.
-            # If it's empty, but `all_invalid_rows_info` has entries, those are row-level issues.
-            # The previous logic was: if no file_level_errors and no validation_errors, then commit.
-            # This means if there are *any* validation errors, it rolls back. This might be too strict.
-            # Let's change to: commit if no all_file_level_errors, otherwise rollback. Validation errors are reported.
-            if not all_file_level_errors and total_rows_inserted > 0: # If we inserted something and no file errors
+            if not all_file_level_errors and not any(item['errors'] for item in all_invalid_rows_info if 'errors' in item): # Check for critical errors
                 conn.commit()
-                print("\nDatabase transaction committed (some rows may have been skipped due to validation).")
-            elif not all_file_level_errors and total_rows_inserted == 0 and total_rows_read > 0:
-                 conn.rollback() # No file errors, but nothing inserted - likely all rows failed validation
-                 print("\nDatabase transaction rolled back: No valid data found to insert.")
-            elif all_file_level_errors:
-                 conn.rollback() # File errors occurred
-                 print("\nDatabase transaction rolled back due to file processing or database errors.")
-            else: # No errors, nothing read or inserted (e.g. empty file)
-                 conn.commit() # Safe to commit, nothing changed
-                 print("\nDatabase transaction committed (no data processed or no errors).")
-
-
-    except Exception as e:
-        if conn:
-            conn.rollback()
-        all_file_level_errors.append(f"A critical unexpected error occurred: {e}. Database transaction rolled back.")
-        print("\nDatabase transaction rolled back due to a critical error.")
-    finally:
-        if conn:
-            conn.close()
+                print("\nDatabase transaction committed.")
+            else:
+                conn.rollback()
+                print("\nDatabase transaction rolled back due to errors during processing.")
+                # If only some sheets/rows had validation errors but no DB/file errors, we might still commit
+                # The current logic rolls back if ANY error (file level or severe validation that stops processing) occurs.
+                # More nuanced commit/rollback could be added based on severity.
+                # For now, if all_file_level_errors is not empty, or critical validation errors that prevent processing, we rollback.
+                # The "any(item['errors']..." is a simple check for any validation issue, which might be too strict for rollback.
+                # Let's refine: rollback if all_file_level_errors OR if total_rows_inserted == 0 AND total_rows_read > 0 due to validation issues.
+                # Simpler: rollback if all_file_level_errors exist. Validation errors for rows are reported but don't stop commit for other valid data.
+                # Revisiting: if there are file_level_errors OR if (total_rows_inserted == 0 and total_rows_read > 0 and not all_file_level_errors)
+                # The `process_dataframe_for_insertion` already skips entire sheets/CSVs if columns are missing.
+                # So, if `all_file_level_errors` is populated, that's a clear rollback.
+                # If it's empty, but `all_invalid_rows_info` has entries, those are row-level issues.
+                # The previous logic was: if no file_level_errors and no validation_errors, then commit.
+                # This means if there are *any* validation errors, it rolls back. This might be too strict.
+                # Let's change to: commit if no all_file_level_errors, otherwise rollback. Validation errors are reported.
+                if not all_file_level_errors and total_rows_inserted > 0: # If we inserted something and no file errors
+                    conn.commit()
+                    print("\nDatabase transaction committed (some rows may have been skipped due to validation).")
+                elif not all_file_level_errors and total_rows_inserted == 0 and total_rows_read > 0:
+                     conn.rollback() # No file errors, but nothing inserted - likely all rows failed validation
+                     print("\nDatabase transaction rolled back: No valid data found to insert.")
+                elif all_file_level_errors:
+                     conn.rollback() # File errors occurred
+                     print("\nDatabase transaction rolled back due to file processing or database errors.")
+                else: # No errors, nothing read or inserted (e.g. empty file)
+                     conn.commit() # Safe to commit, nothing changed
+                     print("\nDatabase transaction committed (no data processed or no errors).")
+
+
+        except Exception as e:
+            if conn:
+                conn.rollback()
+            all_file_level_errors.append(f"A critical unexpected error occurred: {e}. Database transaction rolled back.")
+            print("\nDatabase transaction rolled back due to a critical error.")
 
     # --- Final Report ---
     print("\n--- Import Summary ---")
@@ -0,0 +1,414 @@
+"""
+Idle-time database maintenance for Auditor Helper
+
+Keeps query plans and file sizes healthy without touching the startup path:
+
+- wal_checkpoint      PRAGMA wal_checkpoint(TRUNCATE), so the WAL file does not grow without bound
+- optimize            PRAGMA optimize (cheap; only re-analyzes tables whose statistics are stale)
+- analyze             ANALYZE with a bounded analysis_limit
+- incremental_vacuum  returns free pages to the OS in small steps; a database created before
+                      auto_vacuum = INCREMENTAL is switched over once with a full VACUUM
+- trim_cache          drops expired entries and caps the size of the L2 SQLiteCache file
+
+Each task has an interval and a time budget. Statements are aborted through a
+SQLite progress handler once the budget is spent. The progress handler does
+not run while SQLite waits for a lock (e.g. a checkpoint waiting for a
+backup's read snapshot), so locks are waited for in short busy-timeout slices
+that stop at the deadline. A maintenance run therefore never holds or waits
+for the write lock for long, and interrupt() ends the running task promptly. DatabaseMaintenance runs whatever is due and
+records the outcome of every task in a small JSON state file next to the
+database; MaintenanceScheduler calls it from a background thread once the
+user has been idle for a while:
+
+    scheduler = MaintenanceScheduler(DatabaseMaintenance(cache=sqlite_cache))
+    scheduler.start()
+    ...
+    scheduler.notify_activity()   # from the GUI on user input
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Dict, List, NamedTuple, Optional
+
+from .connection_manager import CONNECT_TIMEOUT, get_connection_manager
+from .database_config import get_database_directory, get_database_path
+from ..performance.metrics import get_registry
+
+logger = logging.getLogger(__name__)
+
+STATE_FILENAME = "db_maintenance.json"
+
+HOUR = 3600
+DAY = 24 * HOUR
+
+# Total time one idle pass may spend across all due tasks
+PASS_BUDGET_MS = 2000
+
+# A task that failed or ran out of budget is retried after this long
+RETRY_INTERVAL_S = HOUR
+
+# Pages released per incremental_vacuum step
+VACUUM_PAGES_PER_STEP = 128
+
+# Databases up to this size are switched to auto_vacuum = INCREMENTAL while idle
+CONVERT_MAX_BYTES = 32 * 1024 * 1024
+
+# Budget of that one-off VACUUM
+CONVERT_BUDGET_MS = 5000
+
+# Rows sampled per index by ANALYZE
+ANALYSIS_LIMIT = 1000
+
+# Size cap for the L2 SQLiteCache values
+CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# SQLite VM instructions between budget checks
+PROGRESS_STEPS = 1000
+
+# Longest single wait for a lock before the budget and interrupt() are checked again
+LOCK_WAIT_SLICE_MS = 50
+
+
+class BudgetExceeded(Exception):
+    """A maintenance task ran out of its time budget"""
+
+
+class DatabaseBusy(Exception):
+    """A maintenance task could not get the locks it needs within its budget"""
+
+
+class MaintenanceTask(NamedTuple):
+    name: str
+    interval_s: float
+    budget_ms: float
+
+
+DEFAULT_TASKS = (
+    MaintenanceTask("wal_checkpoint", HOUR, 250),
+    MaintenanceTask("optimize", DAY, 500),
+    MaintenanceTask("analyze", 7 * DAY, 1000),
+    MaintenanceTask("incremental_vacuum", DAY, 500),
+    MaintenanceTask("trim_cache", DAY, 500),
+)
+
+
+class DatabaseMaintenance:
+    """Runs due maintenance tasks within time budgets and records their last run"""
+
+    def __init__(self, db_path: str = None, state_path: str = None, cache=None,
+                 cache_max_bytes: int = CACHE_MAX_BYTES, tasks=DEFAULT_TASKS,
+                 connection_factory: Callable = None, clock: Callable[[], float] = time.time):
+        """
+        Args:
+            db_path: Database to maintain (defaults to the application database)
+            state_path: Last-run record (defaults to db_maintenance.json next to the database)
+            cache: Optional SQLiteCache trimmed by the trim_cache task
+            cache_max_bytes: Size cap for the cache values
+            tasks: MaintenanceTask definitions, run in this order
+            connection_factory: Optional context manager factory yielding a sqlite3 connection
+            clock: Wall-clock time source (intervals span application restarts)
+        """
+        self.db_path = db_path or get_database_path()
+        self.state_path = state_path or os.path.join(get_database_directory(), STATE_FILENAME)
+        self.cache = cache
+        self.cache_max_bytes = cache_max_bytes
+        self.tasks = list(tasks)
+        self._connection_factory = connection_factory or self._default_connection
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._state = self._load_state()
+        self._active_lock = threading.Lock()
+        self._active_conn: Optional[sqlite3.Connection] = None
+        self._interrupted = False
+
+    def _default_connection(self):
+        return get_connection_manager(self.db_path).writer()
+
+    # ------------------------------------------------------------------
+    # Scheduling
+    # ------------------------------------------------------------------
+
+    def due_tasks(self, now: float = None) -> List[MaintenanceTask]:
+        """Tasks whose interval has passed since their last successful run"""
+        now = self._clock() if now is None else now
+        due = []
+        for task in self.tasks:
+            record = self._state.get(task.name, {})
+            if now - record.get('last_success', 0) < task.interval_s:
+                continue
+            if now - record.get('last_attempt', 0) < min(RETRY_INTERVAL_S, task.interval_s):
+                continue
+            due.append(task)
+        return due
+
+    def run_due(self, budget_ms: float = PASS_BUDGET_MS,
+                should_continue: Callable[[], bool] = None) -> List[Dict[str, Any]]:
+        """
+        Run the due tasks in order until the pass budget is spent or
+        should_continue() returns False. Returns one result per task run.
+        """
+        deadline = time.monotonic() + budget_ms / 1000.0
+        results = []
+        for task in self.due_tasks():
+            remaining_ms = (deadline - time.monotonic()) * 1000
+            if remaining_ms <= 0 or (should_continue is not None and not should_continue()):
+                break
+            results.append(self.run_task(task.name, min(task.budget_ms, remaining_ms)))
+        return results
+
+    def run_task(self, name: str, budget_ms: float = None) -> Dict[str, Any]:
+        """Run one task now, whether or not it is due, and record the outcome"""
+        task = next(task for task in self.tasks if task.name == name)
+        budget_ms = task.budget_ms if budget_ms is None else budget_ms
+        deadline = time.monotonic() + budget_ms / 1000.0
+
+        start = time.perf_counter()
+        with self._lock:
+            self._interrupted = False
+            try:
+                detail = getattr(self, f"_run_{name}")(deadline)
+                status = 'ok'
+            except BudgetExceeded:
+                detail, status = {}, 'budget_exceeded'
+            except DatabaseBusy as e:
+                detail, status = {'reason': str(e)}, 'busy'
+            except sqlite3.OperationalError as e:
+                message = str(e)
+                # A progress handler abort or interrupt() surfaces as "interrupted"
+                if 'interrupt' in message:
+                    detail, status = {}, 'budget_exceeded'
+                elif 'locked' in message or 'busy' in message:
+                    detail, status = {'reason': message}, 'busy'
+                else:
+                    detail, status = {'error': message}, 'error'
+            except Exception as e:
+                detail, status = {'error': str(e)}, 'error'
+            if self._interrupted and status != 'ok':
+                status = 'interrupted'
+            duration_ms = (time.perf_counter() - start) * 1000
+
+            now = self._clock()
+            record = self._state.setdefault(name, {})
+            record.update({'last_attempt': now, 'status': status,
+                           'duration_ms': round(duration_ms, 2), 'detail': detail})
+            if status == 'ok':
+                record['last_success'] = now
+            self._save_state()
+
+        get_registry().histogram("db.maintenance_ms", {'task': name}).observe(duration_ms)
+        if status != 'ok':
+            logger.info(f"Database maintenance '{name}' {status} after {duration_ms:.1f}ms: {detail}")
+        return {'task': name, 'status': status, 'duration_ms': duration_ms, 'detail': detail}
+
+    def interrupt(self):
+        """Abort the statement of the running task; safe to call from any thread (shutdown)"""
+        with self._active_lock:
+            self._interrupted = True
+            if self._active_conn is not None:
+                self._active_conn.interrupt()
+
+    def last_runs(self) -> Dict[str, Dict[str, Any]]:
+        """The recorded outcome of every task"""
+        with self._lock:
+            return json.loads(json.dumps(self._state))
+
+    # ------------------------------------------------------------------
+    # Tasks
+    # ------------------------------------------------------------------
+
+    @contextmanager
+    def _connection(self):
+        """A connection that interrupt() can abort; budget settings are undone on release"""
+        with self._connection_factory() as conn:
+            with self._active_lock:
+                self._active_conn = conn
+            try:
+                yield conn
+            finally:
+                with self._active_lock:
+                    self._active_conn = None
+                conn.set_progress_handler(None, 0)
+                try:
+                    conn.execute(f"PRAGMA busy_timeout = {int(CONNECT_TIMEOUT * 1000)}")
+                except sqlite3.Error:
+                    pass
+
+    def _budgeted(self, conn: sqlite3.Connection, deadline: float):
+        """Abort the running statement once the deadline passes"""
+        conn.set_progress_handler(lambda: 1 if time.monotonic() > deadline else 0, PROGRESS_STEPS)
+
+    def _statement(self, conn: sqlite3.Connection, deadline: float, sql: str) -> List[Any]:
+        """Run one statement, waiting for locks only until the deadline or interrupt()"""
+        lock_error = None
+        while True:
+            if self._interrupted:
+                raise BudgetExceeded()
+            remaining_ms = int((deadline - time.monotonic()) * 1000)
+            if remaining_ms <= 0:
+                # Spent waiting for a lock: report the task as busy
+                if lock_error is not None:
+                    raise lock_error
+                raise BudgetExceeded()
+            conn.execute(f"PRAGMA busy_timeout = {min(remaining_ms, LOCK_WAIT_SLICE_MS)}")
+            try:
+                return conn.execute(sql).fetchall()
+            except sqlite3.OperationalError as e:
+                if 'locked' not in str(e) and 'busy' not in str(e):
+                    raise
+                # A statement that failed to get its lock changed nothing; retry it
+                lock_error = e
+
+    def _execute(self, deadline: float, *statements: str) -> List[Any]:
+        with self._connection() as conn:
+            self._budgeted(conn, deadline)
+            rows = [self._statement(conn, deadline, statement) for statement in statements]
+            conn.commit()
+            return rows
+
+    def _run_wal_checkpoint(self, deadline: float) -> Dict[str, Any]:
+        with self._connection() as conn:
+            self._budgeted(conn, deadline)
+            while True:
+                rows = self._statement(conn, deadline, "PRAGMA wal_checkpoint(TRUNCATE)")
+                busy, log_frames, checkpointed = rows[0] if rows else (0, 0, 0)
+                if not busy:
+                    return {'log_frames': log_frames, 'checkpointed': checkpointed}
+                if not self._interrupted and deadline - time.monotonic() < 0.001:
+                    # A reader (e.g. a running backup) still needs the WAL; retried later
+                    raise DatabaseBusy(f"{checkpointed} of {log_frames} WAL frames checkpointed")
+
+    def _run_optimize(self, deadline: float) -> Dict[str, Any]:
+        self._execute(deadline, f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}", "PRAGMA optimize")
+        return {}
+
+    def _run_analyze(self, deadline: float) -> Dict[str, Any]:
+        self._execute(deadline, f"PRAGMA analysis_limit = {ANALYSIS_LIMIT}", "ANALYZE")
+        return {}
+
+    def _run_incremental_vacuum(self, deadline: float) -> Dict[str, Any]:
+        with self._connection() as conn:
+            if conn.execute("PRAGMA auto_vacuum").fetchone()[0] != 2:
+                return self._enable_incremental_vacuum(conn)
+
+            initial = free = conn.execute("PRAGMA freelist_count").fetchone()[0]
+            self._budgeted(conn, deadline)
+            while free > 0:
+                self._statement(conn, deadline, f"PRAGMA incremental_vacuum({VACUUM_PAGES_PER_STEP})")
+                conn.commit()
+                remaining = conn.execute("PRAGMA freelist_count").fetchone()[0]
+                if remaining >= free:
+                    break  # Nothing more can be released (e.g. pages held by a reader)
+                free = remaining
+            return {'pages_released': initial - free}
+
+    def _enable_incremental_vacuum(self, conn: sqlite3.Connection) -> Dict[str, Any]:
+        """
+        Switch a database created without auto_vacuum = INCREMENTAL (new
+        databases get it from the connection manager). Changing the mode needs
+        one full VACUUM, so only databases small enough to rebuild within
+        CONVERT_BUDGET_MS are converted; the free pages are released with it.
+        """
+        page_size = conn.execute("PRAGMA page_size").fetchone()[0]
+        size_bytes = conn.execute("PRAGMA page_count").fetchone()[0] * page_size
+        if size_bytes > CONVERT_MAX_BYTES:
+            return {'skipped': f"auto_vacuum is not INCREMENTAL and the database is too large "
+                               f"to convert while idle ({size_bytes} bytes)"}
+
+        deadline = time.monotonic() + CONVERT_BUDGET_MS / 1000.0
+        self._budgeted(conn, deadline)
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        self._statement(conn, deadline, "VACUUM")
+        size_after = conn.execute("PRAGMA page_count").fetchone()[0] * page_size
+        return {'converted': True, 'bytes_released': size_bytes - size_after}
+
+    def _run_trim_cache(self, deadline: float) -> Dict[str, Any]:
+        if self.cache is None:
+            return {'skipped': 'no cache'}
+        removed = self.cache.trim(self.cache_max_bytes)
+        return {'entries_removed': removed}
+
+    # ------------------------------------------------------------------
+    # State
+    # ------------------------------------------------------------------
+
+    def _load_state(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.state_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+            return state if isinstance(state, dict) else {}
+        except FileNotFoundError:
+            return {}
+        except (OSError, ValueError) as e:
+            logger.warning(f"Could not read database maintenance state: {e}")
+            return {}
+
+    def _save_state(self):
+        temp_path = self.state_path + ".tmp"
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(self._state, f, indent=2)
+            os.replace(temp_path, self.state_path)
+        except OSError as e:
+            logger.warning(f"Could not write database maintenance state: {e}")
+
+
+class MaintenanceScheduler:
+    """Runs DatabaseMaintenance on a background thread while the user is idle"""
+
+    def __init__(self, maintenance: DatabaseMaintenance, idle_seconds: float = 60.0,
+                 check_interval_s: float = 30.0, budget_ms: float = PASS_BUDGET_MS):
+        self.maintenance = maintenance
+        self.idle_seconds = idle_seconds
+        self.check_interval_s = check_interval_s
+        self.budget_ms = budget_ms
+        self._last_activity = time.monotonic()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self.last_results: List[Dict[str, Any]] = []
+
+    def notify_activity(self):
+        """Record user activity; called from the GUI thread, so it only stores a timestamp"""
+        self._last_activity = time.monotonic()
+
+    def is_idle(self) -> bool:
+        return time.monotonic() - self._last_activity >= self.idle_seconds
+
+    def start(self):
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="DatabaseMaintenance", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the thread, aborting the statement of a running task"""
+        self._stop.set()
+        self.maintenance.interrupt()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+
+    def run_pass(self) -> List[Dict[str, Any]]:
+        """Run one pass if the user is idle and something is due"""
+        if not self.is_idle() or not self.maintenance.due_tasks():
+            return []
+        self.last_results = self.maintenance.run_due(self.budget_ms, should_continue=self._should_continue)
+        return self.last_results
+
+    def _should_continue(self) -> bool:
+        return not self._stop.is_set() and self.is_idle()
+
+    def _run(self):
+        try:
+            while not self._stop.wait(self.check_interval_s):
+                try:
+                    self.run_pass()
+                except Exception as e:
+                    logger.error(f"Database maintenance pass failed: {e}")
+        finally:
+            get_connection_manager(self.maintenance.db_path).close_thread_connections()
@@ -0,0 +1,122 @@
+"""
+Registry of the application's SQL statements and an EXPLAIN QUERY PLAN check.
+
+Data access modules register their statements at import time:
+
+    TASKS_BY_WEEK_SQL = register_query(
+        "task_dao.tasks_by_week",
+        "SELECT * FROM tasks WHERE week_id = ? ORDER BY id",
+    )
+
+check_query_plans() prepares every registered statement with
+EXPLAIN QUERY PLAN and reports full table scans and temporary B-trees
+(sorts for ORDER BY / GROUP BY / DISTINCT). A statement that legitimately
+reads a whole table, such as the small weeks table or an all-time report,
+declares it with allow_scan; the names are the ones SQLite prints in the
+plan, i.e. the alias when the query uses one.
+
+Run the check against a realistic dataset so the planner's choices match
+production (see performance/query_plan_check.py and
+tests/test_query_plans.py).
+"""
+
+import importlib
+import logging
+import re
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Modules whose statements make up the registry
+QUERY_MODULES = [
+    'core.db.task_search',
+    'core.services.task_dao',
+    'core.services.week_dao',
+    'analysis.analysis_module.data_manager',
+]
+
+_SCAN_PATTERN = re.compile(r'^SCAN (?:TABLE )?(\w+)')
+_TEMP_BTREE_PATTERN = re.compile(r'USE TEMP B-TREE FOR (.+)$')
+
+
+@dataclass(frozen=True)
+class RegisteredQuery:
+    """A named SQL statement and the plan shapes it is allowed to use"""
+    name: str
+    sql: str
+    allow_scan: Tuple[str, ...] = ()
+    allow_temp_btree: bool = False
+
+
+@dataclass(frozen=True)
+class PlanFinding:
+    """A plan step that needs an index (or an explicit allowance)"""
+    query_name: str
+    kind: str  # 'scan', 'temp_btree' or 'error'
+    detail: str
+
+    def __str__(self):
+        return f"{self.query_name}: {self.kind} - {self.detail}"
+
+
+_registry: Dict[str, RegisteredQuery] = {}
+
+
+def register_query(name: str, sql: str, allow_scan: Sequence[str] = (),
+                   allow_temp_btree: bool = False) -> str:
+    """Register a statement under a unique name and return the SQL unchanged"""
+    query = RegisteredQuery(name, sql, tuple(allow_scan), allow_temp_btree)
+    existing = _registry.get(name)
+    if existing is not None and existing != query:
+        raise ValueError(f"Query name already registered with different SQL: {name}")
+    _registry[name] = query
+    return sql
+
+
+def registered_queries() -> List[RegisteredQuery]:
+    """All registered statements, ordered by name"""
+    return [_registry[name] for name in sorted(_registry)]
+
+
+def load_query_modules(modules: Iterable[str] = None) -> List[RegisteredQuery]:
+    """Import the data access modules so their statements are registered"""
+    for module_name in modules or QUERY_MODULES:
+        try:
+            importlib.import_module(module_name)
+        except ImportError as e:
+            logger.warning(f"Could not load queries from {module_name}: {e}")
+    return registered_queries()
+
+
+def explain_query_plan(conn, sql: str) -> List[str]:
+    """Return the plan detail lines for sql; parameters are bound as NULL"""
+    params = (None,) * sql.count('?')
+    return [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params)]
+
+
+def check_query_plan(conn, query: RegisteredQuery) -> List[PlanFinding]:
+    """Findings for one registered statement"""
+    try:
+        plan = explain_query_plan(conn, query.sql)
+    except Exception as e:
+        return [PlanFinding(query.name, 'error', str(e))]
+
+    findings = []
+    for detail in plan:
+        scan = _SCAN_PATTERN.match(detail)
+        # "SCAN CONSTANT ROW", subquery scans and virtual tables (FTS5 MATCH) are not table reads
+        if (scan and scan.group(1) not in ('CONSTANT', 'SUBQUERY') and 'VIRTUAL TABLE' not in detail
+                and scan.group(1) not in query.allow_scan):
+            findings.append(PlanFinding(query.name, 'scan', detail))
+        if _TEMP_BTREE_PATTERN.search(detail) and not query.allow_temp_btree:
+            findings.append(PlanFinding(query.name, 'temp_btree', detail))
+    return findings
+
+
+def check_query_plans(conn, queries: Optional[Iterable[RegisteredQuery]] = None) -> List[PlanFinding]:
+    """Run EXPLAIN QUERY PLAN for every registered statement and collect the findings"""
+    findings = []
+    for query in (registered_queries() if queries is None else queries):
+        findings.extend(check_query_plan(conn, query))
+    return findings
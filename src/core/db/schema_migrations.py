@@ -0,0 +1,105 @@
+"""
+Versioned schema migrations for Auditor Helper
+
+The schema version lives in the database header (PRAGMA user_version).
+Every migration has a version number; only migrations newer than the stored
+version are run, all on one connection inside one transaction, and the new
+version is written in that same transaction. A database that is already
+current costs a single PRAGMA read at startup.
+
+Migrations must stay idempotent: databases created before versioning report
+user_version 0 and replay every migration once against their existing schema.
+New schema changes are appended to MIGRATIONS with the next version number;
+never renumber or remove an existing entry.
+"""
+
+import logging
+import sqlite3
+import time
+from typing import Callable, List, Tuple
+
+from . import db_schema
+from .connection_manager import get_connection_manager
+
+logger = logging.getLogger(__name__)
+
+# (version, name, migration(conn)) in application order
+MIGRATIONS: List[Tuple[int, str, Callable[[sqlite3.Connection], None]]] = [
+    (1, "base_tables", db_schema.init_db),
+    (2, "time_columns", db_schema.migrate_time_columns),
+    (3, "tasks_table_columns", db_schema.migrate_tasks_table_columns),
+    (4, "feedback_files_table", db_schema.migrate_feedback_files_table),
+    (5, "week_settings", db_schema.migrate_week_settings),
+    (6, "week_bonus_settings", db_schema.migrate_week_bonus_settings),
+    (7, "app_settings_table", db_schema.migrate_app_settings_table),
+    (8, "office_hours_settings", db_schema.migrate_office_hours_settings),
+    (9, "week_date_columns", db_schema.migrate_week_date_columns),
+    (10, "essential_indexes", db_schema.create_essential_indexes),
+    (11, "query_plan_indexes", db_schema.create_query_plan_indexes),
+    (12, "week_created_at", db_schema.migrate_week_created_at),
+    (13, "task_search_index", db_schema.create_task_search_index),
+]
+
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+class MigrationError(Exception):
+    """Raised when a migration fails; the database is left at its previous version"""
+    pass
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    """Read the schema version stored in the database header"""
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def run_pending_migrations(conn: sqlite3.Connection, migrations=None) -> List[str]:
+    """
+    Run every migration newer than the database's schema version.
+
+    All pending migrations and the version bump share one transaction, so a
+    failure leaves the schema exactly as it was. Returns the names of the
+    migrations that were applied (empty when the schema was already current).
+    """
+    migrations = MIGRATIONS if migrations is None else migrations
+    target_version = migrations[-1][0] if migrations else 0
+
+    # Fast path: one header read
+    if get_schema_version(conn) >= target_version:
+        return []
+
+    if conn.in_transaction:
+        raise MigrationError("Migrations must not start inside an open transaction")
+
+    start = time.perf_counter()
+    # IMMEDIATE takes the write lock up front; re-read the version under it in
+    # case another process migrated while we were waiting
+    conn.execute("BEGIN IMMEDIATE")
+    applied = []
+    name = "schema version check"
+    try:
+        current_version = get_schema_version(conn)
+        for version, name, migration in migrations:
+            if version <= current_version:
+                continue
+            migration(conn)
+            applied.append(name)
+        if applied:
+            # PRAGMA cannot take bound parameters; target_version is an int from MIGRATIONS
+            conn.execute(f"PRAGMA user_version = {int(target_version)}")
+        conn.commit()
+    except Exception as e:
+        conn.rollback()
+        raise MigrationError(f"Migration '{name}' failed: {e}") from e
+
+    if applied:
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        logger.info(f"Schema migrated to version {target_version} "
+                    f"({len(applied)} migrations, {elapsed_ms:.1f}ms)")
+    return applied
+
+
+def migrate_database(db_path: str = None) -> List[str]:
+    """Bring a database (the application database by default) up to SCHEMA_VERSION"""
+    with get_connection_manager(db_path).writer() as conn:
+        return run_pending_migrations(conn)
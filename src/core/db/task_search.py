@@ -0,0 +1,94 @@
+"""
+Ranked full-text task search over the tasks_fts index.
+
+Search-as-you-type input is turned into an FTS5 prefix query: every word
+the user typed must match the start of a token in attempt_id,
+operation_id, project_name, locale or feedback. Results are ordered by
+bm25 with identifier columns weighted above free-text feedback.
+
+When SQLite was built without FTS5 (no tasks_fts table) the same API falls
+back to a LIKE scan so the search box keeps working, just more slowly.
+"""
+
+import re
+from typing import Optional
+
+from .query_registry import register_query
+
+DEFAULT_SEARCH_LIMIT = 50
+
+# bm25 weights for attempt_id, operation_id, project_name, locale, feedback
+_BM25_WEIGHTS = "10.0, 10.0, 4.0, 2.0, 1.0"
+
+_SEARCH_SQL = f"""
+    SELECT t.id, t.week_id, w.week_label, t.attempt_id, t.operation_id,
+           t.project_name, t.locale, t.date_audited, t.score,
+           snippet(tasks_fts, 4, '[', ']', '...', 12) AS feedback_snippet,
+           bm25(tasks_fts, {_BM25_WEIGHTS}) AS rank
+    FROM tasks_fts
+    JOIN tasks t ON t.id = tasks_fts.rowid
+    LEFT JOIN weeks w ON w.id = t.week_id
+    WHERE tasks_fts MATCH ?{{week_filter}}
+    ORDER BY rank
+    LIMIT ?
+"""
+
+# Ranking sorts the matches, which is bounded by LIMIT
+TASK_SEARCH_SQL = register_query(
+    "task_search.all_weeks", _SEARCH_SQL.format(week_filter=""), allow_temp_btree=True
+)
+TASK_SEARCH_IN_WEEK_SQL = register_query(
+    "task_search.in_week", _SEARCH_SQL.format(week_filter=" AND t.week_id = ?"), allow_temp_btree=True
+)
+
+_LIKE_SEARCH_SQL = """
+    SELECT t.id, t.week_id, w.week_label, t.attempt_id, t.operation_id,
+           t.project_name, t.locale, t.date_audited, t.score,
+           substr(t.feedback, 1, 80) AS feedback_snippet, 0 AS rank
+    FROM tasks t
+    LEFT JOIN weeks w ON w.id = t.week_id
+    WHERE (t.attempt_id LIKE ? OR t.operation_id LIKE ? OR t.project_name LIKE ?
+           OR t.locale LIKE ? OR t.feedback LIKE ?){week_filter}
+    ORDER BY t.id DESC
+    LIMIT ?
+"""
+
+SEARCH_INDEX_EXISTS_SQL = "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'tasks_fts'"
+
+_WORD_PATTERN = re.compile(r'\w+', re.UNICODE)
+
+
+def build_match_expression(search_term: str) -> Optional[str]:
+    """
+    Convert free text to an FTS5 query matching every word as a prefix.
+    Returns None when the text contains no searchable words.
+
+    "att-00 spanish" -> '"att"* "00"* "spanish"*'
+    """
+    words = _WORD_PATTERN.findall(search_term or "")
+    if not words:
+        return None
+    # Words are quoted so FTS5 operators (AND, NEAR, column filters) in user input are literal
+    return " ".join(f'"{word}"*' for word in words)
+
+
+def build_search_query(search_term: str, week_id: Optional[int] = None,
+                       limit: int = DEFAULT_SEARCH_LIMIT, use_fts: bool = True):
+    """
+    Return (sql, params) for a ranked task search, or None for an empty search.
+    Rows have id, week_id, week_label, attempt_id, operation_id, project_name,
+    locale, date_audited, score, feedback_snippet and rank.
+    """
+    match = build_match_expression(search_term)
+    if match is None:
+        return None
+
+    if use_fts:
+        if week_id is not None:
+            return TASK_SEARCH_IN_WEEK_SQL, (match, week_id, limit)
+        return TASK_SEARCH_SQL, (match, limit)
+
+    pattern = f"%{search_term.strip()}%"
+    week_filter = " AND t.week_id = ?" if week_id is not None else ""
+    params = (pattern,) * 5 + ((week_id,) if week_id is not None else ()) + (limit,)
+    return _LIKE_SEARCH_SQL.format(week_filter=week_filter), params
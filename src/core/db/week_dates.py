@@ -0,0 +1,51 @@
+"""
+Week date helpers
+
+Weeks are labelled "dd/MM/yyyy - dd/MM/yyyy" by the UI, but older databases
+and imports contain other formats. The parsed dates are stored in the
+indexed weeks.start_date / weeks.end_date columns (ISO yyyy-mm-dd) so that
+ordering and range filtering happen in SQL instead of re-parsing labels.
+"""
+
+from datetime import datetime
+from typing import Optional, Tuple
+
+# Formats accepted in week labels, in order of preference
+WEEK_LABEL_DATE_FORMATS = ["%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d", "%d-%m-%Y"]
+
+
+def parse_label_date(date_str: str) -> Optional[str]:
+    """Parse one side of a week label into an ISO date string"""
+    date_str = date_str.strip()
+    for fmt in WEEK_LABEL_DATE_FORMATS:
+        try:
+            return datetime.strptime(date_str, fmt).strftime("%Y-%m-%d")
+        except ValueError:
+            continue
+    return None
+
+
+def parse_week_label_dates(week_label: Optional[str]) -> Tuple[Optional[str], Optional[str]]:
+    """
+    Extract (start_date, end_date) as ISO strings from a week label.
+    Either value is None when it cannot be parsed.
+    """
+    if not week_label or " - " not in week_label:
+        return None, None
+
+    start_str, end_str = week_label.split(" - ", 1)
+    return parse_label_date(start_str), parse_label_date(end_str)
+
+
+def with_week_dates(values: dict) -> dict:
+    """
+    Fill in start_date/end_date from week_label when the caller did not
+    provide them. Used by every code path that inserts or relabels weeks.
+    """
+    if values.get("week_label"):
+        start_date, end_date = parse_week_label_dates(values["week_label"])
+        if not values.get("start_date"):
+            values["start_date"] = start_date
+        if not values.get("end_date"):
+            values["end_date"] = end_date
+    return values
@@ -6,9 +6,12 @@ for decoupled communication between application components.
 """
 
 import logging
-from typing import Any, Dict, Callable, Optional
+import threading
+import time
+from typing import Any, Dict, Callable, Iterable, List, Optional, Tuple
 from PySide6 import QtCore
 from .event_types import EventType
+from .handler_stats import DEFAULT_SLOW_HANDLER_MS, HandlerRecord, summarize
 
 
 class EventData:
@@ -36,7 +39,13 @@ class AppEventBus(QtCore.QObject):
     """
     Central event bus for application-wide communication
     
-    Uses Qt signals/slots for efficient, type-safe event handling.
+    Handlers registered with connect_handler() are dispatched per event type
+    on the bus's thread and timed individually (see get_handler_stats()).
+    Bound methods are held weakly, so a destroyed receiver is disconnected as
+    with a Qt connection. The Qt signals are still emitted for code that
+    connects to them directly.
+    Optional coalescing merges same-type events emitted within one event-loop
+    turn.
     Implements singleton pattern for global access.
     """
     
@@ -88,11 +97,28 @@ class AppEventBus(QtCore.QObject):
     performance_metric_recorded = QtCore.Signal(EventData)
     cache_updated = QtCore.Signal(EventData)
     
+    # Internal: events emitted on other threads, queued to the bus's thread
+    _queued_event = QtCore.Signal(object)
+    
     def __init__(self):
         super().__init__()
         self.logger = logging.getLogger(__name__)
         self._event_count = 0
         self._debug_mode = False
+        # Per-thread buffers for events held back until a transaction commits
+        self._deferred = threading.local()
+        
+        # Per-event-type handler lists with latency histograms
+        self._handlers: Dict[EventType, List[HandlerRecord]] = {}
+        self._slow_handler_ms = DEFAULT_SLOW_HANDLER_MS
+        
+        # Coalescing: None = off, empty set = all event types
+        self._coalesce_types: Optional[set] = None
+        self._coalesce_pending: List[Tuple[EventType, Optional[Dict[str, Any]], Optional[str]]] = []
+        self._coalesce_scheduled = False
+        # Handlers run on the thread that owns the bus (the GUI thread)
+        self._owner_thread_id = threading.get_ident()
+        self._queued_event.connect(self._on_queued_event, QtCore.Qt.QueuedConnection)
         
         # Create mapping from event types to signals
         self._signal_map = {
@@ -164,28 +190,129 @@ class AppEventBus(QtCore.QObject):
             data: Optional dictionary containing event-specific data
             source: Optional string identifying the source component
         """
+        buffer = getattr(self._deferred, 'events', None)
+        if buffer is not None:
+            buffer.append((event_type, data, source))
+            return
+        
+        if threading.get_ident() != self._owner_thread_id:
+            # Worker thread: hand over to the bus's thread like a queued Qt connection
+            self._queued_event.emit((event_type, data, source))
+            return
+        
+        if self._should_coalesce(event_type):
+            self._coalesce_pending.append((event_type, data, source))
+            if not self._coalesce_scheduled:
+                self._coalesce_scheduled = True
+                QtCore.QTimer.singleShot(0, self.flush_coalesced)
+            return
+        
+        self._dispatch(event_type, data, source)
+    
+    def _on_queued_event(self, event):
+        self.emit_event(*event)
+    
+    def _dispatch(self, event_type: EventType, data: Optional[Dict[str, Any]], source: Optional[str]):
+        """Deliver one event to its signal and its timed handlers"""
+        signal = self._signal_map.get(event_type)
+        if signal is None:
+            self.logger.warning("Unknown event type: %s", event_type)
+            return
+        
         try:
             event_data = EventData(event_type, data, source)
+            signal.emit(event_data)
+            self._event_count += 1
+            
+            if self._debug_mode:
+                self.logger.debug("Event #%d emitted: %s from %s with data: %s",
+                                  self._event_count, event_type.value, source or 'unknown', data)
             
-            if event_type in self._signal_map:
-                signal = self._signal_map[event_type]
-                signal.emit(event_data)
-                
-                self._event_count += 1
-                
-                if self._debug_mode:
-                    self.logger.debug(
-                        f"Event #{self._event_count} emitted: {event_type.value} "
-                        f"from {source or 'unknown'} with data: {data}"
-                    )
-                else:
-                    self.logger.debug(f"Event emitted: {event_type.value} from {source or 'unknown'}")
+            handlers = self._handlers.get(event_type)
+            if handlers:
+                # Copy: handlers may connect or disconnect while being called
+                for record in tuple(handlers):
+                    self._call_handler(event_type, record, event_data)
                     
-            else:
-                self.logger.warning(f"Unknown event type: {event_type}")
-                
         except Exception as e:
-            self.logger.error(f"Error emitting event {event_type}: {e}")
+            self.logger.error("Error emitting event %s: %s", event_type, e)
+    
+    def _call_handler(self, event_type: EventType, record: HandlerRecord, event_data: EventData):
+        """Run one handler and record its latency"""
+        handler = record.handler
+        if handler is None:
+            # The receiver was garbage collected; Qt would have dropped the connection
+            self._remove_record(event_type, record)
+            return
+        start = time.perf_counter()
+        try:
+            handler(event_data)
+        except RuntimeError as e:
+            if 'already deleted' in str(e):
+                # The handler's QObject was destroyed; Qt would have dropped the connection
+                self._remove_record(event_type, record)
+                return
+            record.errors += 1
+            self.logger.error("Handler %s failed for %s: %s", record.name, event_type.value, e)
+        except Exception as e:
+            record.errors += 1
+            self.logger.error("Handler %s failed for %s: %s", record.name, event_type.value, e)
+        
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        record.histogram.observe(elapsed_ms)
+        if elapsed_ms >= self._slow_handler_ms:
+            record.slow_calls += 1
+            if record.should_warn():
+                self.logger.warning("Slow event handler %s took %.1fms for %s (%d slow calls)",
+                                    record.name, elapsed_ms, event_type.value, record.slow_calls)
+    
+    def begin_deferred(self):
+        """
+        Hold back events emitted on this thread until end_deferred()
+        
+        Used by DataService.transaction() so handlers only see committed data.
+        Calls nest; only the outermost end_deferred() delivers.
+        """
+        depth = getattr(self._deferred, 'depth', 0)
+        if depth == 0:
+            self._deferred.events = []
+        self._deferred.depth = depth + 1
+    
+    def end_deferred(self, deliver: bool = True) -> int:
+        """
+        Leave a deferred block started with begin_deferred()
+        
+        Args:
+            deliver: Emit the held events (coalesced) when the outermost block
+                ends; False drops them, e.g. after a rollback
+            
+        Returns:
+            Number of events emitted
+        """
+        depth = getattr(self._deferred, 'depth', 0)
+        if depth == 0:
+            return 0
+        self._deferred.depth = depth - 1
+        if depth > 1:
+            return 0
+        
+        events = self._deferred.events
+        self._deferred.events = None
+        if not deliver:
+            return 0
+        
+        coalesced = coalesce_events(events)
+        on_owner_thread = threading.get_ident() == self._owner_thread_id
+        for event in coalesced:
+            if on_owner_thread:
+                self._dispatch(*event)
+            else:
+                self._queued_event.emit(event)
+        return len(coalesced)
+    
+    def is_deferring(self) -> bool:
+        """Whether events emitted on this thread are currently held back"""
+        return getattr(self._deferred, 'events', None) is not None
     
     def connect_handler(self, event_type: EventType, handler: Callable[[EventData], None]):
         """
@@ -195,16 +322,10 @@ class AppEventBus(QtCore.QObject):
             event_type: The event type to listen for
             handler: Function to call when event is emitted
         """
-        try:
-            if event_type in self._signal_map:
-                signal = self._signal_map[event_type]
-                signal.connect(handler)
-                self.logger.debug(f"Handler connected to {event_type.value}")
-            else:
-                self.logger.warning(f"Cannot connect to unknown event type: {event_type}")
-                
-        except Exception as e:
-            self.logger.error(f"Error connecting handler to {event_type}: {e}")
+        if event_type not in self._signal_map:
+            self.logger.warning("Cannot connect to unknown event type: %s", event_type)
+            return
+        self._handlers.setdefault(event_type, []).append(HandlerRecord(event_type, handler))
     
     def disconnect_handler(self, event_type: EventType, handler: Callable[[EventData], None]):
         """
@@ -214,16 +335,18 @@ class AppEventBus(QtCore.QObject):
             event_type: The event type to stop listening for
             handler: Function to disconnect
         """
-        try:
-            if event_type in self._signal_map:
-                signal = self._signal_map[event_type]
-                signal.disconnect(handler)
-                self.logger.debug(f"Handler disconnected from {event_type.value}")
-            else:
-                self.logger.warning(f"Cannot disconnect from unknown event type: {event_type}")
-                
-        except Exception as e:
-            self.logger.error(f"Error disconnecting handler from {event_type}: {e}")
+        if event_type not in self._signal_map:
+            self.logger.warning("Cannot disconnect from unknown event type: %s", event_type)
+            return
+        handlers = self._handlers.get(event_type)
+        if handlers:
+            # Drop records whose receivers were collected while looking for this one
+            handlers[:] = [record for record in handlers if record.is_alive()]
+            for record in handlers:
+                if record.handler == handler:
+                    self._remove_record(event_type, record)
+                    return
+        self.logger.error("Error disconnecting handler from %s: handler not connected", event_type)
     
     def disconnect_all_handlers(self, event_type: EventType):
         """
@@ -232,16 +355,67 @@ class AppEventBus(QtCore.QObject):
         Args:
             event_type: The event type to clear all handlers from
         """
-        try:
-            if event_type in self._signal_map:
-                signal = self._signal_map[event_type]
-                signal.disconnect()
-                self.logger.debug(f"All handlers disconnected from {event_type.value}")
-            else:
-                self.logger.warning(f"Cannot disconnect from unknown event type: {event_type}")
-                
-        except Exception as e:
-            self.logger.error(f"Error disconnecting all handlers from {event_type}: {e}")
+        if event_type not in self._signal_map:
+            self.logger.warning("Cannot disconnect from unknown event type: %s", event_type)
+            return
+        self._handlers.pop(event_type, None)
+    
+    def _remove_record(self, event_type: EventType, record: HandlerRecord):
+        handlers = self._handlers.get(event_type)
+        if handlers and record in handlers:
+            handlers.remove(record)
+    
+    def set_coalescing(self, enabled: bool, event_types: Iterable[EventType] = None):
+        """
+        Merge same-type events emitted within one event-loop turn into one delivery
+        
+        Args:
+            enabled: Turn coalescing on or off (turning it off flushes pending events)
+            event_types: Restrict coalescing to these types (default: all)
+            
+        Merged events carry the last payload plus 'coalesced_count' and
+        'coalesced_events'.
+        """
+        if enabled:
+            self._coalesce_types = set(event_types or ())
+        else:
+            self._coalesce_types = None
+            self.flush_coalesced()
+    
+    def _should_coalesce(self, event_type: EventType) -> bool:
+        if self._coalesce_types is None:
+            return False
+        return not self._coalesce_types or event_type in self._coalesce_types
+    
+    def flush_coalesced(self) -> int:
+        """Deliver events held for coalescing now; returns the number delivered"""
+        self._coalesce_scheduled = False
+        pending, self._coalesce_pending = self._coalesce_pending, []
+        if not pending:
+            return 0
+        merged = coalesce_events(pending)
+        for event_type, data, source in merged:
+            self._dispatch(event_type, data, source)
+        return len(merged)
+    
+    def set_slow_handler_threshold(self, milliseconds: float):
+        """Handlers at or above this latency are counted as slow and logged"""
+        self._slow_handler_ms = milliseconds
+    
+    def get_handler_stats(self, event_type: EventType = None) -> List[Dict[str, Any]]:
+        """
+        Latency statistics per connected handler, slowest total time first
+        
+        Each row has event_type, handler, connections, count, total/mean/p50/p95/max in ms,
+        slow_calls, errors and the raw histogram buckets.
+        """
+        return summarize(self._handlers, event_type)
+    
+    def reset_handler_stats(self):
+        """Clear latency statistics, keeping the connected handlers"""
+        for handlers in self._handlers.values():
+            for record in handlers:
+                record.reset()
     
     def get_event_count(self) -> int:
         """Get the total number of events emitted"""
@@ -268,6 +442,32 @@ class AppEventBus(QtCore.QObject):
         return connected_types
 
 
+def coalesce_events(events: List[Tuple[EventType, Optional[Dict[str, Any]], Optional[str]]]
+                    ) -> List[Tuple[EventType, Dict[str, Any], Optional[str]]]:
+    """
+    Merge held-back events so each (event type, source) is emitted once
+    
+    Events keep the order of their first occurrence. A merged event carries
+    the last payload plus 'coalesced_count' and 'coalesced_events' (every
+    payload in emission order), so a 500-row bulk edit reaches each handler
+    once instead of 500 times.
+    """
+    merged: Dict[Tuple[EventType, Optional[str]], List[Dict[str, Any]]] = {}
+    for event_type, data, source in events:
+        merged.setdefault((event_type, source), []).append(data or {})
+    
+    result = []
+    for (event_type, source), payloads in merged.items():
+        if len(payloads) == 1:
+            result.append((event_type, payloads[0], source))
+        else:
+            data = dict(payloads[-1])
+            data['coalesced_count'] = len(payloads)
+            data['coalesced_events'] = payloads
+            result.append((event_type, data, source))
+    return result
+
+
 # Singleton instance
 _event_bus_instance: Optional[AppEventBus] = None
 
@@ -31,7 +31,7 @@ class MultiTierCache:
                 cache_path = "multi_tier_cache.db"
             
             self.sqlite_cache = SQLiteCache(db_path=cache_path)
-            self.stats = CacheStats()
+            self.stats = CacheStats('multi_tier')
             self.start_time = time.time()
             
             # Track initialization
@@ -0,0 +1,287 @@
+"""
+Append-only startup history with rolling aggregates
+
+Each launch appends one JSON line to the active history segment and updates a
+small summary file holding, per phase and for the total, all-time
+count/mean/best/worst plus a ring window of the latest durations from which
+p50/p95/max are read. Recording a launch reads and rewrites only the summary
+(its size depends on the number of phases, not on the number of launches),
+so startup telemetry costs the same on the 1000th launch as on the first.
+
+History is bounded: when the active segment reaches segment_size records it
+replaces the previous segment, so at most two segments exist on disk.
+
+When the application version changes, the rolling windows of the previous
+version are frozen as the baseline and the windows start again. Once the new
+version has a few launches, a phase whose p50 grew past REGRESSION_RATIO
+times the baseline p50 is reported as a regression.
+"""
+
+import json
+import logging
+import math
+import os
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+logger = logging.getLogger(__name__)
+
+FORMAT_VERSION = 1
+
+# Launches kept in each rolling window
+WINDOW_SIZE = 50
+
+# Records per history segment
+SEGMENT_SIZE = 500
+
+# Compact records of the latest launches kept in the summary for reports
+RECENT_SESSIONS = 10
+
+# A phase regressed when its p50 exceeds the baseline p50 by this factor...
+REGRESSION_RATIO = 1.25
+# ...once the new version has this many launches...
+MIN_REGRESSION_SAMPLES = 3
+# ...ignoring phases too short to compare reliably
+MIN_REGRESSION_MS = 20.0
+
+TOTAL = "total"
+
+
+class RollingStats:
+    """All-time count/sum/min/max plus a ring window of the latest values"""
+
+    __slots__ = ('count', 'total', 'min', 'max', 'window', 'position', 'window_size')
+
+    def __init__(self, window_size: int = WINDOW_SIZE):
+        self.count = 0
+        self.total = 0.0
+        self.min = None
+        self.max = None
+        self.window: List[float] = []
+        self.position = 0
+        self.window_size = window_size
+
+    def add(self, value: float):
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+        if len(self.window) < self.window_size:
+            self.window.append(value)
+        else:
+            self.window[self.position] = value
+            self.position = (self.position + 1) % self.window_size
+
+    def reset_window(self):
+        self.window = []
+        self.position = 0
+
+    def percentile(self, p: float) -> float:
+        """Nearest-rank percentile of the window"""
+        if not self.window:
+            return 0.0
+        ordered = sorted(self.window)
+        index = min(len(ordered) - 1, max(0, math.ceil(p / 100.0 * len(ordered)) - 1))
+        return ordered[index]
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'mean': self.total / self.count if self.count else 0.0,
+            'best': self.min or 0.0,
+            'worst': self.max or 0.0,
+            'window': len(self.window),
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'max': max(self.window) if self.window else 0.0,
+        }
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {'count': self.count, 'total': self.total, 'min': self.min, 'max': self.max,
+                'window': self.window, 'position': self.position}
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any], window_size: int = WINDOW_SIZE) -> 'RollingStats':
+        stats = cls(window_size)
+        stats.count = data.get('count', 0)
+        stats.total = data.get('total', 0.0)
+        stats.min = data.get('min')
+        stats.max = data.get('max')
+        # Keep the newest values if the window was shrunk since the file was written
+        window = list(data.get('window', []))
+        position = data.get('position', 0)
+        if len(window) > window_size:
+            window = (window[position:] + window[:position])[-window_size:]
+            position = 0
+        stats.window = window
+        stats.position = position % window_size if len(window) == window_size else 0
+        return stats
+
+
+class StartupHistoryStore:
+    """Bounded startup history (JSON-lines segments) and its rolling summary"""
+
+    def __init__(self, history_file: str = "startup_history.jsonl", window_size: int = WINDOW_SIZE,
+                 segment_size: int = SEGMENT_SIZE):
+        self.history_file = Path(history_file)
+        self.previous_segment = self.history_file.with_name(f"{self.history_file.stem}.1{self.history_file.suffix}")
+        self.summary_file = self.history_file.with_name(f"{self.history_file.stem}.summary.json")
+        self.window_size = window_size
+        self.segment_size = segment_size
+        self._state: Optional[Dict[str, Any]] = None
+        self._stats: Dict[str, RollingStats] = {}
+
+    def is_empty(self) -> bool:
+        return self._load()['sessions'] == 0
+
+    def append(self, record: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Record one launch and return the regressions against the previous
+        version. record holds 'version', 'total_ms' and 'phases'
+        ({name: ms}); other keys are stored as-is.
+        """
+        state = self._load()
+        self._add(state, record)
+
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.history_file, 'a', encoding='utf-8') as f:
+                f.write(json.dumps(record, separators=(',', ':')) + "\n")
+            state['segment_records'] += 1
+            if state['segment_records'] >= self.segment_size:
+                os.replace(self.history_file, self.previous_segment)
+                state['segment_records'] = 0
+        except OSError as e:
+            logger.warning("Failed to append startup history: %s", e)
+
+        self._save()
+        return self.detect_regressions()
+
+    def import_records(self, records: List[Dict[str, Any]]):
+        """Seed aggregates and history from older records (oldest first) in one write"""
+        state = self._load()
+        for record in records:
+            self._add(state, record)
+        try:
+            self.history_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.history_file, 'a', encoding='utf-8') as f:
+                for record in records[-self.segment_size:]:
+                    f.write(json.dumps(record, separators=(',', ':')) + "\n")
+            state['segment_records'] = min(state['segment_records'] + len(records), self.segment_size - 1)
+        except OSError as e:
+            logger.warning("Failed to import startup history: %s", e)
+        self._save()
+
+    def _add(self, state: Dict[str, Any], record: Dict[str, Any]):
+        version = record.get('version')
+        if state['sessions'] and version != state['version']:
+            # New version: freeze the old windows as the baseline and start over
+            state['baseline'] = {
+                'version': state['version'],
+                'stats': {name: self._percentiles(stats) for name, stats in self._stats.items() if stats.window},
+            }
+            for stats in self._stats.values():
+                stats.reset_window()
+        state['version'] = version
+
+        self._get_stats(TOTAL).add(record['total_ms'])
+        for name, duration_ms in record.get('phases', {}).items():
+            self._get_stats(name).add(duration_ms)
+
+        state['sessions'] += 1
+        state['recent'] = (state['recent'] + [record])[-RECENT_SESSIONS:]
+
+    def _get_stats(self, name: str) -> RollingStats:
+        stats = self._stats.get(name)
+        if stats is None:
+            stats = self._stats[name] = RollingStats(self.window_size)
+        return stats
+
+    @staticmethod
+    def _percentiles(stats: RollingStats) -> Dict[str, float]:
+        return {'p50': stats.percentile(50), 'p95': stats.percentile(95), 'max': max(stats.window),
+                'samples': len(stats.window)}
+
+    def detect_regressions(self) -> List[Dict[str, Any]]:
+        """Phases (and the total) whose p50 on this version regressed against the baseline"""
+        state = self._load()
+        baseline = state.get('baseline')
+        if not baseline:
+            return []
+
+        regressions = []
+        for name, base in baseline['stats'].items():
+            stats = self._stats.get(name)
+            if stats is None or len(stats.window) < MIN_REGRESSION_SAMPLES or base['p50'] < MIN_REGRESSION_MS:
+                continue
+            p50 = stats.percentile(50)
+            if p50 > base['p50'] * REGRESSION_RATIO:
+                regressions.append({
+                    'phase': name,
+                    'version': state['version'],
+                    'baseline_version': baseline['version'],
+                    'baseline_p50_ms': base['p50'],
+                    'p50_ms': p50,
+                    'ratio': p50 / base['p50'],
+                })
+        regressions.sort(key=lambda regression: regression['ratio'], reverse=True)
+        return regressions
+
+    def summary(self) -> Dict[str, Any]:
+        """Session count, version, baseline and per-phase aggregates (ms)"""
+        state = self._load()
+        return {
+            'sessions': state['sessions'],
+            'version': state['version'],
+            'baseline': state.get('baseline'),
+            'total': self._get_stats(TOTAL).summary() if TOTAL in self._stats else RollingStats().summary(),
+            'phases': {name: stats.summary() for name, stats in self._stats.items() if name != TOTAL},
+        }
+
+    def recent_sessions(self) -> List[Dict[str, Any]]:
+        """Compact records of the latest launches, oldest first"""
+        return list(self._load()['recent'])
+
+    def iter_records(self) -> Iterator[Dict[str, Any]]:
+        """Every retained record, oldest first (for offline analysis, not the launch path)"""
+        for segment in (self.previous_segment, self.history_file):
+            if not segment.exists():
+                continue
+            with open(segment, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        yield json.loads(line)
+                    except json.JSONDecodeError:
+                        continue  # Torn last line from a crash during append
+
+    def _load(self) -> Dict[str, Any]:
+        if self._state is not None:
+            return self._state
+
+        state = {'format': FORMAT_VERSION, 'sessions': 0, 'version': None, 'segment_records': 0,
+                 'baseline': None, 'recent': [], 'stats': {}}
+        try:
+            if self.summary_file.exists():
+                with open(self.summary_file, 'r', encoding='utf-8') as f:
+                    loaded = json.load(f)
+                if loaded.get('format') == FORMAT_VERSION:
+                    state.update(loaded)
+        except (OSError, ValueError) as e:
+            logger.warning("Failed to load startup history summary, starting fresh: %s", e)
+
+        self._stats = {name: RollingStats.from_dict(data, self.window_size)
+                       for name, data in state.pop('stats').items()}
+        self._state = state
+        return state
+
+    def _save(self):
+        data = dict(self._state)
+        data['stats'] = {name: stats.to_dict() for name, stats in self._stats.items()}
+        temp_file = self.summary_file.with_name(self.summary_file.name + ".tmp")
+        try:
+            self.summary_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(temp_file, 'w', encoding='utf-8') as f:
+                json.dump(data, f, separators=(',', ':'))
+            os.replace(temp_file, self.summary_file)
+        except OSError as e:
+            logger.warning("Failed to save startup history summary: %s", e)
@@ -11,6 +11,7 @@ Features:
 - Optimization impact reporting
 """
 
+import re
 import time
 import threading
 import logging
@@ -19,6 +20,9 @@ from dataclasses import dataclass, field
 from pathlib import Path
 import json
 
+from ..performance.metrics import get_registry
+from .startup_history import StartupHistoryStore
+
 
 @dataclass
 class StartupPhase:
@@ -71,13 +75,19 @@ class StartupPerformanceMonitor:
     Monitors and analyzes application startup performance.
     
     Provides detailed timing information for different startup phases
-    and tracks the impact of optimization efforts over time.
+    and tracks the impact of optimization efforts over time. Finished
+    sessions go to an append-only StartupHistoryStore; only its fixed-size
+    summary is read at launch.
     """
     
-    def __init__(self, data_file: str = "startup_performance.json"):
-        self.data_file = Path(data_file)
+    def __init__(self, history_file: str = "startup_history.jsonl",
+                 legacy_file: str = "startup_performance.json"):
+        self.history = StartupHistoryStore(history_file)
+        self.legacy_file = Path(legacy_file)
         self.current_session: Optional[StartupSession] = None
         self.current_phase: Optional[StartupPhase] = None
+        self.app_version: Optional[str] = None
+        self.last_regressions: List[Dict[str, Any]] = []
         self._lock = threading.RLock()
         self.logger = logging.getLogger(__name__)
         
@@ -88,9 +98,6 @@ class StartupPerformanceMonitor:
             'acceptable': 5.0,
             'slow': 8.0
         }
-        
-        # Load historical data
-        self.historical_sessions = self._load_historical_data()
     
     def start_session(self, session_id: str = None) -> str:
         """
@@ -160,12 +167,13 @@ class StartupPerformanceMonitor:
             
             self.current_phase.finish()
             duration_ms = self.current_phase.duration * 1000
+            get_registry().histogram("startup.phase_ms", {'phase': self.current_phase.name}).observe(duration_ms)
             
             self.logger.info(f"✅ Finished phase '{self.current_phase.name}': {duration_ms:.1f}ms")
             self.current_phase = None
     
     def finish_session(self):
-        """Finish the current startup monitoring session"""
+        """Finish the current startup monitoring session and record it in the history"""
         with self._lock:
             if self.current_session is None:
                 self.logger.warning("No active session to finish")
@@ -177,16 +185,66 @@ class StartupPerformanceMonitor:
             
             # Finish session
             self.current_session.finish()
+            registry = get_registry()
+            registry.histogram("startup.total_ms").observe(self.current_session.total_duration * 1000)
+            registry.gauge("startup.last_total_ms").set(self.current_session.total_duration * 1000)
             
             # Log summary
             self._log_session_summary()
             
-            # Save to historical data
-            self.historical_sessions.append(self.current_session)
-            self._save_historical_data()
+            # Append to history and compare against the previous version
+            try:
+                self._migrate_legacy_history()
+                self.last_regressions = self.history.append(self._session_record(self.current_session))
+            except Exception as e:
+                self.logger.error(f"Failed to record startup history: {e}")
+                self.last_regressions = []
+            
+            for regression in self.last_regressions:
+                registry.counter("startup.regressions", {'phase': regression['phase']}).inc()
+                self.logger.warning(
+                    f"Startup regression in '{regression['phase']}': p50 {regression['p50_ms']:.1f}ms "
+                    f"on {regression['version']} vs {regression['baseline_p50_ms']:.1f}ms "
+                    f"on {regression['baseline_version']} (x{regression['ratio']:.2f})"
+                )
             
             self.current_session = None
     
+    def _session_record(self, session: StartupSession) -> Dict[str, Any]:
+        """Compact history record; repeated phase names are summed"""
+        phases: Dict[str, float] = {}
+        for phase in session.phases:
+            if phase.duration is not None:
+                phases[phase.name] = phases.get(phase.name, 0.0) + phase.duration * 1000
+        return {
+            'session_id': session.session_id,
+            'start_time': session.start_time,
+            'version': self.app_version or _read_app_version(),
+            'total_ms': session.total_duration * 1000,
+            'phases': phases,
+            'critical': [phase.name for phase in session.phases if phase.critical],
+            'lazy_imports_used': session.lazy_imports_used,
+            'cache_system_used': session.cache_system_used,
+        }
+    
+    def _migrate_legacy_history(self):
+        """Seed the history once from the old whole-file JSON history"""
+        if not self.legacy_file.exists() or not self.history.is_empty():
+            return
+        try:
+            with open(self.legacy_file, 'r') as f:
+                data = json.load(f)
+            records = []
+            for session_data in data:
+                session = StartupSession(**{**session_data, 'phases': []})
+                session.phases = [StartupPhase(**phase_data) for phase_data in session_data.get('phases', [])]
+                if session.total_duration:
+                    records.append(self._session_record(session))
+            self.history.import_records(records)
+            self.logger.info(f"Imported {len(records)} sessions from {self.legacy_file}")
+        except Exception as e:
+            self.logger.warning(f"Failed to import legacy startup history: {e}")
+    
     def set_optimization_flags(self, lazy_imports: bool = False, cache_system: bool = False):
         """
         Set flags indicating which optimizations are active.
@@ -208,32 +266,42 @@ class StartupPerformanceMonitor:
             Dictionary containing performance analysis and recommendations
         """
         with self._lock:
-            if not self.historical_sessions:
+            summary = self.history.summary()
+            if not summary['sessions']:
                 return {'error': 'No historical data available'}
             
             # Calculate statistics
-            recent_sessions = self.historical_sessions[-10:]  # Last 10 sessions
-            all_durations = [s.total_duration for s in self.historical_sessions if s.total_duration]
-            recent_durations = [s.total_duration for s in recent_sessions if s.total_duration]
+            recent_sessions = self.history.recent_sessions()
+            recent_durations = [record['total_ms'] / 1000 for record in recent_sessions]
+            total = summary['total']
             
             # Performance trends
-            optimized_sessions = [s for s in recent_sessions if s.lazy_imports_used or s.cache_system_used]
-            unoptimized_sessions = [s for s in recent_sessions if not (s.lazy_imports_used or s.cache_system_used)]
+            optimized_sessions = [r for r in recent_sessions if r['lazy_imports_used'] or r['cache_system_used']]
+            unoptimized_sessions = [r for r in recent_sessions if not (r['lazy_imports_used'] or r['cache_system_used'])]
             
             report = {
                 'summary': {
-                    'total_sessions': len(self.historical_sessions),
+                    'total_sessions': summary['sessions'],
                     'recent_sessions': len(recent_sessions),
                     'optimized_sessions': len(optimized_sessions),
-                    'current_performance_grade': self._get_performance_grade(recent_durations[-1] if recent_durations else 0)
+                    'current_performance_grade': self._get_performance_grade(recent_durations[-1] if recent_durations else 0),
+                    'version': summary['version']
                 },
                 'timing_analysis': {
-                    'all_time_average': sum(all_durations) / len(all_durations) if all_durations else 0,
+                    'all_time_average': total['mean'] / 1000,
                     'recent_average': sum(recent_durations) / len(recent_durations) if recent_durations else 0,
-                    'best_time': min(all_durations) if all_durations else 0,
-                    'worst_time': max(all_durations) if all_durations else 0,
-                    'latest_time': recent_durations[-1] if recent_durations else 0
+                    'best_time': total['best'] / 1000,
+                    'worst_time': total['worst'] / 1000,
+                    'latest_time': recent_durations[-1] if recent_durations else 0,
+                    'rolling_p50': total['p50'] / 1000,
+                    'rolling_p95': total['p95'] / 1000,
+                    'rolling_max': total['max'] / 1000
                 },
+                'phases_ms': {
+                    name: {key: stats[key] for key in ('p50', 'p95', 'max', 'window')}
+                    for name, stats in summary['phases'].items()
+                },
+                'regressions': self.history.detect_regressions(),
                 'optimization_impact': self._analyze_optimization_impact(optimized_sessions, unoptimized_sessions),
                 'recommendations': self._generate_recommendations(recent_sessions)
             }
@@ -281,13 +349,13 @@ class StartupPerformanceMonitor:
         else:
             return "D"
     
-    def _analyze_optimization_impact(self, optimized: List[StartupSession], unoptimized: List[StartupSession]) -> Dict[str, Any]:
+    def _analyze_optimization_impact(self, optimized: List[Dict[str, Any]], unoptimized: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze the impact of optimizations"""
         if not optimized or not unoptimized:
             return {'insufficient_data': True}
         
-        opt_durations = [s.total_duration for s in optimized if s.total_duration]
-        unopt_durations = [s.total_duration for s in unoptimized if s.total_duration]
+        opt_durations = [r['total_ms'] / 1000 for r in optimized if r['total_ms']]
+        unopt_durations = [r['total_ms'] / 1000 for r in unoptimized if r['total_ms']]
         
         if not opt_durations or not unopt_durations:
             return {'insufficient_data': True}
@@ -305,7 +373,7 @@ class StartupPerformanceMonitor:
             'significant_improvement': improvement_percent > 20
         }
     
-    def _generate_recommendations(self, sessions: List[StartupSession]) -> List[str]:
+    def _generate_recommendations(self, sessions: List[Dict[str, Any]]) -> List[str]:
         """Generate performance improvement recommendations"""
         recommendations = []
         
@@ -313,7 +381,7 @@ class StartupPerformanceMonitor:
             return ["Insufficient data for recommendations"]
         
         latest_session = sessions[-1]
-        avg_duration = sum(s.total_duration for s in sessions if s.total_duration) / len(sessions)
+        avg_duration = sum(r['total_ms'] for r in sessions) / 1000 / len(sessions)
         
         # Performance-based recommendations
         if avg_duration > self.thresholds['slow']:
@@ -322,68 +390,27 @@ class StartupPerformanceMonitor:
             recommendations.append("Startup time could be improved - review critical phases")
         
         # Optimization-specific recommendations
-        if not latest_session.lazy_imports_used:
+        if not latest_session['lazy_imports_used']:
             recommendations.append("Enable lazy imports for heavy scientific libraries")
         
-        if not latest_session.cache_system_used:
+        if not latest_session['cache_system_used']:
             recommendations.append("Multi-tier cache system active - performance optimized")
         
         return recommendations if recommendations else ["Performance is optimal - no recommendations"]
-    
-    def _load_historical_data(self) -> List[StartupSession]:
-        """Load historical performance data"""
-        try:
-            if self.data_file.exists():
-                with open(self.data_file, 'r') as f:
-                    data = json.load(f)
-                    sessions = []
-                    for session_data in data:
-                        session = StartupSession(**session_data)
-                        # Reconstruct phases
-                        session.phases = [StartupPhase(**phase_data) for phase_data in session_data.get('phases', [])]
-                        sessions.append(session)
-                    return sessions
-        except Exception as e:
-            self.logger.warning(f"Failed to load historical data: {e}")
-        
-        return []
-    
-    def _save_historical_data(self):
-        """Save historical performance data"""
-        try:
-            # Convert sessions to serializable format
-            data = []
-            for session in self.historical_sessions:
-                session_dict = {
-                    'session_id': session.session_id,
-                    'start_time': session.start_time,
-                    'end_time': session.end_time,
-                    'total_duration': session.total_duration,
-                    'lazy_imports_used': session.lazy_imports_used,
-                    'cache_system_used': session.cache_system_used,
-                    'optimization_version': session.optimization_version,
-                    'phases': [
-                        {
-                            'name': phase.name,
-                            'start_time': phase.start_time,
-                            'end_time': phase.end_time,
-                            'duration': phase.duration,
-                            'description': phase.description,
-                            'critical': phase.critical
-                        }
-                        for phase in session.phases
-                    ]
-                }
-                data.append(session_dict)
-            
-            # Ensure directory exists
-            self.data_file.parent.mkdir(parents=True, exist_ok=True)
-            
-            with open(self.data_file, 'w') as f:
-                json.dump(data, f, indent=2)
-                
-        except Exception as e:
-            self.logger.error(f"Failed to save historical data: {e}")
+
+
+def _read_app_version() -> str:
+    """Application version from the first '## vX.Y.Z' heading of docs/CHANGELOG.md"""
+    changelog_file = Path(__file__).resolve().parents[3] / "docs" / "CHANGELOG.md"
+    try:
+        with open(changelog_file, 'r', encoding='utf-8') as f:
+            for line in f:
+                match = re.match(r"## (v\d+\.\d+\.\d+(?:-[a-zA-Z0-9]+)*)", line)
+                if match:
+                    return match.group(1)
+    except OSError:
+        pass
+    return "unknown"
 
 
 # Global startup monitor instance
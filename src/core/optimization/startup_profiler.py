@@ -13,6 +13,8 @@ from contextlib import contextmanager
 from pathlib import Path
 import json
 
+from ..performance.metrics import get_registry
+
 @dataclass
 class ProfilerEntry:
     """Single profiler measurement entry"""
@@ -109,6 +111,8 @@ class StartupProfiler:
             entry.memory_after = memory_mb
             entry.memory_delta = memory_mb - (entry.memory_before or 0)
             
+            get_registry().histogram("startup.profiled_phase_ms", {'phase': name}).observe(entry.duration * 1000)
+            
             # Move to completed entries
             self.entries.append(entry)
             del self.active_entries[name]
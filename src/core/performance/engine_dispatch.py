@@ -0,0 +1,264 @@
+"""
+Size-aware backend dispatch for the statistical, data processing and timer engines
+
+Each engine operation can run as pure Python, NumPy or Rust. For a
+20-element weekly array the FFI and conversion overhead of Rust (or the
+array construction of NumPy) costs more than the work itself; for a
+100k-row range pure Python is far too slow. The dispatcher picks the
+backend per call from the input size using two crossover thresholds per
+operation:
+
+    size < numpy_min            -> python
+    numpy_min <= size < rust_min -> numpy
+    size >= rust_min            -> rust
+
+Unavailable backends are skipped (Rust not built, NumPy not installed, or
+no implementation of that operation for a backend). The thresholds below
+are conservative defaults; `performance/calibrate_engines.py` measures the
+real crossovers on this machine and stores them with the app settings
+under performance_settings.engine_thresholds.
+"""
+
+import importlib.util
+import logging
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+PYTHON = 'python'
+NUMPY = 'numpy'
+RUST = 'rust'
+BACKENDS = (PYTHON, NUMPY, RUST)
+
+SETTINGS_KEY = "performance_settings.engine_thresholds"
+
+# Sentinel for "never switch to this backend"
+NEVER = 2 ** 62
+
+
+@dataclass(frozen=True)
+class Crossover:
+    """Input sizes at which an operation switches to NumPy and to Rust"""
+    numpy_min: int = NEVER
+    rust_min: int = NEVER
+
+    def to_dict(self) -> Dict[str, int]:
+        return {NUMPY: self.numpy_min, RUST: self.rust_min}
+
+    @classmethod
+    def from_dict(cls, values: Dict[str, int]) -> 'Crossover':
+        return cls(int(values.get(NUMPY, NEVER)), int(values.get(RUST, NEVER)))
+
+
+# Operation name -> backends that implement it
+OPERATIONS: Dict[str, Tuple[str, ...]] = {
+    'statistics.correlation': (PYTHON, NUMPY, RUST),
+    'statistics.summary': (PYTHON, NUMPY, RUST),
+    'statistics.confidence_interval': (PYTHON, NUMPY, RUST),
+    'statistics.batch_correlations': (PYTHON, NUMPY, RUST),
+    'statistics.moving_average': (PYTHON, NUMPY, RUST),
+    'statistics.trend_analysis': (PYTHON, NUMPY, RUST),
+    'processing.parse_time_strings': (PYTHON, RUST),
+    'processing.tasks_batch': (PYTHON, RUST),
+    'processing.task_arrays': (NUMPY, RUST),
+    'processing.bonus_eligibility': (PYTHON, RUST),
+    'processing.aggregated_metrics': (NUMPY, RUST),
+    'timer.batch_durations': (PYTHON, RUST),
+    'timer.statistics': (PYTHON, RUST),
+    'timer.format_batch': (PYTHON, RUST),
+}
+
+# Used until the calibration command has been run
+DEFAULT_THRESHOLDS: Dict[str, Crossover] = {
+    'statistics.correlation': Crossover(numpy_min=200, rust_min=2_000),
+    'statistics.summary': Crossover(numpy_min=200, rust_min=2_000),
+    'statistics.confidence_interval': Crossover(numpy_min=200, rust_min=2_000),
+    'statistics.batch_correlations': Crossover(numpy_min=200, rust_min=2_000),
+    'statistics.moving_average': Crossover(numpy_min=100, rust_min=2_000),
+    'statistics.trend_analysis': Crossover(numpy_min=200, rust_min=2_000),
+    'processing.parse_time_strings': Crossover(rust_min=1_000),
+    'processing.tasks_batch': Crossover(rust_min=1_000),
+    'processing.task_arrays': Crossover(numpy_min=0, rust_min=5_000),
+    'processing.bonus_eligibility': Crossover(rust_min=1_000),
+    'processing.aggregated_metrics': Crossover(numpy_min=0, rust_min=2_000),
+    'timer.batch_durations': Crossover(rust_min=1_000),
+    'timer.statistics': Crossover(rust_min=1_000),
+    'timer.format_batch': Crossover(rust_min=1_000),
+}
+
+
+class EngineDispatcher:
+    """Chooses the backend for an engine operation from its input size"""
+
+    def __init__(self, thresholds: Optional[Dict[str, Crossover]] = None,
+                 numpy_available: Optional[bool] = None):
+        # None means "load the calibrated thresholds from settings on first use"
+        self._thresholds = dict(thresholds) if thresholds is not None else None
+        self._numpy_available = numpy_available
+        self._local = threading.local()
+        self._lock = threading.Lock()
+
+    @property
+    def numpy_available(self) -> bool:
+        """Whether NumPy is installed; checked without importing it"""
+        if self._numpy_available is None:
+            self._numpy_available = importlib.util.find_spec('numpy') is not None
+        return self._numpy_available
+
+    def thresholds(self) -> Dict[str, Crossover]:
+        """Current crossover table (calibrated values over the defaults)"""
+        if self._thresholds is None:
+            with self._lock:
+                if self._thresholds is None:
+                    self._thresholds = {**DEFAULT_THRESHOLDS, **load_calibrated_thresholds()}
+        return self._thresholds
+
+    def set_thresholds(self, thresholds: Dict[str, Crossover]):
+        """Replace thresholds for the given operations (others keep their values)"""
+        merged = {**self.thresholds(), **thresholds}
+        self._thresholds = merged
+
+    def choose(self, operation: str, size: int, rust_available: bool = False) -> str:
+        """
+        Backend to use for `operation` on an input of `size` elements.
+        Falls back to the next smaller backend when the preferred one is unavailable.
+        """
+        supported = self._available_backends(operation, rust_available)
+        forced = getattr(self._local, 'forced', None)
+        if forced is not None and forced in supported:
+            return forced
+
+        crossover = self.thresholds().get(operation, Crossover())
+        if size >= crossover.rust_min and RUST in supported:
+            return RUST
+        if size >= crossover.numpy_min and NUMPY in supported:
+            return NUMPY
+        if PYTHON in supported:
+            return PYTHON
+        # Operation has no Python version: use whatever is there
+        return NUMPY if NUMPY in supported else RUST
+
+    def _available_backends(self, operation: str, rust_available: bool) -> Tuple[str, ...]:
+        backends = OPERATIONS.get(operation, (PYTHON,))
+        return tuple(
+            backend for backend in backends
+            if (backend != RUST or rust_available) and (backend != NUMPY or self.numpy_available)
+        )
+
+    @contextmanager
+    def forced(self, backend: str):
+        """Force one backend on this thread (used by calibration and tests)"""
+        if backend not in BACKENDS:
+            raise ValueError(f"Unknown backend: {backend}")
+        previous = getattr(self._local, 'forced', None)
+        self._local.forced = backend
+        try:
+            yield
+        finally:
+            self._local.forced = previous
+
+
+def load_calibrated_thresholds() -> Dict[str, Crossover]:
+    """Thresholds stored by the calibration command, or {} when never calibrated"""
+    try:
+        from core.settings.global_settings import global_settings
+        stored = global_settings.get_setting(SETTINGS_KEY, {}) or {}
+        return {
+            operation: Crossover.from_dict(values)
+            for operation, values in stored.items()
+            if operation in OPERATIONS and isinstance(values, dict)
+        }
+    except Exception as e:
+        logger.warning(f"Could not load engine thresholds, using defaults: {e}")
+        return {}
+
+
+def save_calibrated_thresholds(thresholds: Dict[str, Crossover], replace: bool = False) -> bool:
+    """
+    Store calibrated thresholds with the app settings
+
+    Operations not in thresholds keep their stored values, so a partial
+    calibration (--only) does not discard earlier ones; replace=True stores
+    exactly thresholds.
+    """
+    from core.settings.global_settings import global_settings
+    merged = {} if replace else load_calibrated_thresholds()
+    merged.update(thresholds)
+    global_settings.set_setting(
+        SETTINGS_KEY, {operation: crossover.to_dict() for operation, crossover in sorted(merged.items())}
+    )
+    return True
+
+
+_dispatcher: Optional[EngineDispatcher] = None
+
+
+def get_dispatcher() -> EngineDispatcher:
+    """Process-wide dispatcher shared by the engines"""
+    global _dispatcher
+    if _dispatcher is None:
+        _dispatcher = EngineDispatcher()
+    return _dispatcher
+
+
+def is_ndarray(value) -> bool:
+    """True for NumPy arrays, without importing numpy for list inputs"""
+    numpy = sys.modules.get('numpy')
+    return numpy is not None and isinstance(value, numpy.ndarray)
+
+
+# ---------------------------------------------------------------------------
+# Calibration
+# ---------------------------------------------------------------------------
+
+CALIBRATION_SIZES = (8, 32, 128, 512, 2_048, 8_192, 32_768, 131_072)
+
+
+def time_call(func: Callable[[], object], min_seconds: float = 0.02, max_repeat: int = 1000) -> float:
+    """Best-of timing of func in seconds, repeating until min_seconds have passed"""
+    best = float('inf')
+    total = 0.0
+    repeat = 0
+    while repeat < max_repeat and (total < min_seconds or repeat < 3):
+        start = time.perf_counter()
+        func()
+        elapsed = time.perf_counter() - start
+        best = min(best, elapsed)
+        total += elapsed
+        repeat += 1
+    return best
+
+
+def crossover_from_timings(timings: Dict[int, Dict[str, float]], backends: Sequence[str]) -> Crossover:
+    """
+    Derive thresholds from {size: {backend: seconds}}.
+
+    A backend's threshold is the smallest size from which it is the fastest
+    of the backends measured at every larger size, so a single noisy
+    measurement at a small size does not switch backends too early.
+    """
+    sizes = sorted(timings)
+
+    def stays_fastest(backend: str, from_index: int, rivals: Iterable[str]) -> bool:
+        return all(
+            timings[size].get(backend, float('inf')) <= min(timings[size].get(r, float('inf')) for r in rivals)
+            for size in sizes[from_index:]
+        )
+
+    def threshold(backend: str, rivals: List[str]) -> int:
+        if backend not in backends or not rivals:
+            return 0 if backend in backends else NEVER
+        for index, size in enumerate(sizes):
+            if stays_fastest(backend, index, rivals):
+                # Anything below the first measured size also belongs to the winner
+                return 0 if index == 0 else size
+        return NEVER
+
+    rust_min = threshold(RUST, [b for b in backends if b != RUST])
+    numpy_min = threshold(NUMPY, [b for b in backends if b == PYTHON])
+    return Crossover(numpy_min=numpy_min, rust_min=rust_min)
@@ -0,0 +1,85 @@
+"""
+Preallocated ring buffer for monitoring events
+
+Paint and resize monitors see thousands of events per second during a drag
+resize, on the GUI thread. Building a dataclass and appending it to a list
+for each one costs an allocation per event plus list growth. EventRing
+instead stores events column-wise in fixed-size typed arrays allocated once
+up front: recording an event writes a few numbers into existing slots.
+
+Events are addressed by sequence number (the count of events ever written),
+so a session is simply the range [start, end) and its summary is computed
+from the buffer when it is read, not while events arrive.
+"""
+
+from array import array
+from typing import Dict, Iterator, List, Optional, Sequence, Tuple
+
+
+class EventRing:
+    """
+    Fixed-capacity columnar ring of numeric event records.
+
+    columns maps column names to array typecodes, e.g.
+    {'timestamp': 'd', 'duration_ms': 'd', 'key': 'i'}; append() takes the
+    values in the same order. Once full, each append overwrites the oldest
+    record.
+    """
+
+    __slots__ = ('capacity', 'names', '_columns', 'written')
+
+    def __init__(self, capacity: int, columns: Dict[str, str]):
+        if capacity <= 0:
+            raise ValueError("EventRing capacity must be positive")
+        self.capacity = capacity
+        self.names: Tuple[str, ...] = tuple(columns)
+        self._columns: Tuple[array, ...] = tuple(array(code, [0]) * capacity for code in columns.values())
+        self.written = 0
+
+    def append(self, *values):
+        """Record one event (values in column order)"""
+        index = self.written % self.capacity
+        for column, value in zip(self._columns, values):
+            column[index] = value
+        self.written += 1
+
+    def __len__(self) -> int:
+        return min(self.written, self.capacity)
+
+    @property
+    def oldest_sequence(self) -> int:
+        """Sequence number of the oldest record still held"""
+        return max(0, self.written - self.capacity)
+
+    def clear(self):
+        """Forget all records; the arrays are kept for reuse"""
+        self.written = 0
+
+    def _clamp(self, start: Optional[int], end: Optional[int]) -> Tuple[int, int]:
+        start = self.oldest_sequence if start is None else max(start, self.oldest_sequence)
+        end = self.written if end is None else min(end, self.written)
+        return start, max(start, end)
+
+    def column(self, name: str, start: Optional[int] = None, end: Optional[int] = None) -> List:
+        """Values of one column for sequence numbers [start, end), oldest first"""
+        start, end = self._clamp(start, end)
+        values = self._columns[self.names.index(name)]
+        first, last = start % self.capacity, end % self.capacity
+        if end - start == 0:
+            return []
+        if first < last:
+            return values[first:last].tolist()
+        return values[first:].tolist() + values[:last].tolist()
+
+    def columns(self, names: Sequence[str], start: Optional[int] = None,
+                end: Optional[int] = None) -> Tuple[List, ...]:
+        """Several columns over the same range"""
+        return tuple(self.column(name, start, end) for name in names)
+
+    def rows(self, start: Optional[int] = None, end: Optional[int] = None) -> Iterator[Tuple]:
+        """Records for sequence numbers [start, end) as tuples, oldest first"""
+        return zip(*self.columns(self.names, start, end))
+
+    def last(self, count: int) -> Iterator[Tuple]:
+        """The newest count records, oldest first"""
+        return self.rows(max(self.oldest_sequence, self.written - count))
@@ -0,0 +1,295 @@
+"""
+In-process metrics registry shared by every performance monitor
+
+Counters, gauges and fixed-bucket histograms that are cheap enough to
+update from hot paths (a lock and a few integer operations), plus collectors
+that are sampled only when a snapshot is taken. Database, cache, event bus,
+paint, resize and startup timings all report here, so one snapshot gives a
+consistent picture of the whole application:
+
+    histogram = get_registry().histogram("db.query_ms", {"source": "data_service"})
+    with histogram.time():
+        ...
+
+    get_registry().snapshot()          # plain dict, JSON serialisable
+    get_registry().export_json(path)
+    get_registry().format_text()       # one line per metric
+
+Callers on hot paths should look their metric up once and keep the object;
+registry lookups build a key string on every call.
+"""
+
+import json
+import threading
+import time
+from bisect import bisect_left
+from contextlib import contextmanager
+from functools import wraps
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, Optional, Sequence, Tuple
+
+# Latency bucket upper bounds in milliseconds; 16ms is one 60Hz frame
+DEFAULT_BUCKETS_MS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 16.0, 33.0, 50.0,
+                      100.0, 250.0, 500.0, 1000.0, 2500.0, 5000.0, 10000.0)
+
+Labels = Optional[Dict[str, Any]]
+
+
+def metric_key(name: str, labels: Labels = None) -> str:
+    """Registry key, e.g. 'db.query_ms{source=data_service}'"""
+    if not labels:
+        return name
+    return name + "{" + ",".join(f"{key}={labels[key]}" for key in sorted(labels)) + "}"
+
+
+class Counter:
+    """Monotonically increasing count"""
+
+    __slots__ = ('name', 'labels', 'description', 'value', '_lock')
+
+    def __init__(self, name: str, labels: Labels = None, description: str = ""):
+        self.name = name
+        self.labels = dict(labels or {})
+        self.description = description
+        self.value = 0
+        self._lock = threading.Lock()
+
+    def inc(self, amount: int = 1):
+        with self._lock:
+            self.value += amount
+
+    def reset(self):
+        with self._lock:
+            self.value = 0
+
+    def snapshot(self) -> int:
+        return self.value
+
+
+class Gauge:
+    """Value that can go up and down (sizes, open connections, last durations)"""
+
+    __slots__ = ('name', 'labels', 'description', 'value', '_lock')
+
+    def __init__(self, name: str, labels: Labels = None, description: str = ""):
+        self.name = name
+        self.labels = dict(labels or {})
+        self.description = description
+        self.value = 0.0
+        self._lock = threading.Lock()
+
+    def set(self, value: float):
+        self.value = value
+
+    def inc(self, amount: float = 1.0):
+        with self._lock:
+            self.value += amount
+
+    def dec(self, amount: float = 1.0):
+        self.inc(-amount)
+
+    def reset(self):
+        self.value = 0.0
+
+    def snapshot(self) -> float:
+        return self.value
+
+
+class Histogram:
+    """Fixed-bucket histogram; values past the last bound go to an overflow bucket"""
+
+    __slots__ = ('name', 'labels', 'description', 'buckets', 'counts', 'count', 'total', 'max', '_lock')
+
+    def __init__(self, name: str = "", labels: Labels = None, description: str = "",
+                 buckets: Sequence[float] = DEFAULT_BUCKETS_MS):
+        self.name = name
+        self.labels = dict(labels or {})
+        self.description = description
+        self.buckets = tuple(buckets)
+        self._lock = threading.Lock()
+        self.reset()
+
+    def observe(self, value: float):
+        index = bisect_left(self.buckets, value)
+        with self._lock:
+            self.counts[index] += 1
+            self.count += 1
+            self.total += value
+            if value > self.max:
+                self.max = value
+
+    @contextmanager
+    def time(self) -> Iterator[None]:
+        """Observe the duration of the block in milliseconds"""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe((time.perf_counter() - start) * 1000)
+
+    def percentile(self, p: float) -> float:
+        """Upper bound of the bucket holding the p-th percentile (the max for the overflow bucket)"""
+        with self._lock:
+            counts, count, maximum = list(self.counts), self.count, self.max
+        if count == 0:
+            return 0.0
+        rank = p / 100.0 * count
+        seen = 0
+        for index, bucket_count in enumerate(counts):
+            seen += bucket_count
+            if bucket_count and seen >= rank:
+                if index < len(self.buckets):
+                    return min(self.buckets[index], maximum)
+                return maximum
+        return maximum
+
+    def reset(self):
+        with self._lock:
+            self.counts = [0] * (len(self.buckets) + 1)
+            self.count = 0
+            self.total = 0.0
+            self.max = 0.0
+
+    def snapshot(self) -> Dict[str, Any]:
+        return {
+            'count': self.count,
+            'sum': self.total,
+            'mean': self.total / self.count if self.count else 0.0,
+            'p50': self.percentile(50),
+            'p95': self.percentile(95),
+            'p99': self.percentile(99),
+            'max': self.max,
+            'buckets': dict(zip([*map(str, self.buckets), 'inf'], self.counts)),
+        }
+
+
+class MetricsRegistry:
+    """Get-or-create store of named metrics plus pull-based collectors"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: Dict[str, Counter] = {}
+        self._gauges: Dict[str, Gauge] = {}
+        self._histograms: Dict[str, Histogram] = {}
+        self._collectors: Dict[str, Callable[[], Dict[str, Any]]] = {}
+
+    def _get_or_create(self, store: Dict[str, Any], factory, name: str, labels: Labels, **kwargs):
+        key = metric_key(name, labels)
+        metric = store.get(key)
+        if metric is None:
+            with self._lock:
+                metric = store.get(key)
+                if metric is None:
+                    metric = factory(name, labels, **kwargs)
+                    store[key] = metric
+        return metric
+
+    def counter(self, name: str, labels: Labels = None, description: str = "") -> Counter:
+        return self._get_or_create(self._counters, Counter, name, labels, description=description)
+
+    def gauge(self, name: str, labels: Labels = None, description: str = "") -> Gauge:
+        return self._get_or_create(self._gauges, Gauge, name, labels, description=description)
+
+    def histogram(self, name: str, labels: Labels = None, description: str = "",
+                  buckets: Sequence[float] = DEFAULT_BUCKETS_MS) -> Histogram:
+        return self._get_or_create(self._histograms, Histogram, name, labels,
+                                   description=description, buckets=buckets)
+
+    def register_collector(self, name: str, collect: Callable[[], Dict[str, Any]]):
+        """
+        Sample collect() on every snapshot; numeric values (nested dicts are
+        flattened with dots) are reported as gauges under name.
+        """
+        with self._lock:
+            self._collectors[name] = collect
+
+    def unregister_collector(self, name: str):
+        with self._lock:
+            self._collectors.pop(name, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Current value of every metric as a JSON-serialisable dict"""
+        with self._lock:
+            counters = list(self._counters.items())
+            gauges = list(self._gauges.items())
+            histograms = list(self._histograms.items())
+            collectors = list(self._collectors.items())
+
+        collected = {}
+        for name, collect in collectors:
+            try:
+                for key, value in _flatten(collect(), name):
+                    collected[key] = value
+            except Exception as e:
+                collected[f"{name}.error"] = str(e)
+
+        return {
+            'timestamp': time.time(),
+            'counters': {key: metric.snapshot() for key, metric in sorted(counters)},
+            'gauges': {**{key: metric.snapshot() for key, metric in sorted(gauges)}, **collected},
+            'histograms': {key: metric.snapshot() for key, metric in sorted(histograms)},
+        }
+
+    def format_text(self) -> str:
+        """Human-readable dump, one metric per line"""
+        snapshot = self.snapshot()
+        lines = []
+        for key, value in snapshot['counters'].items():
+            lines.append(f"{key} {value}")
+        for key, value in snapshot['gauges'].items():
+            lines.append(f"{key} {value:.6g}" if isinstance(value, (int, float)) else f"{key} {value}")
+        for key, value in snapshot['histograms'].items():
+            lines.append(f"{key} count={value['count']} mean={value['mean']:.3f} "
+                         f"p50={value['p50']:.3f} p95={value['p95']:.3f} max={value['max']:.3f}")
+        return "\n".join(lines)
+
+    def export_json(self, filepath: str) -> str:
+        """Write a snapshot to a JSON file; returns the path"""
+        path = Path(filepath)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.snapshot(), f, indent=2, default=str)
+        return str(path)
+
+    def reset(self):
+        """Zero every metric, keeping registrations (held references stay valid)"""
+        with self._lock:
+            metrics = [*self._counters.values(), *self._gauges.values(), *self._histograms.values()]
+        for metric in metrics:
+            metric.reset()
+
+
+def _flatten(values: Dict[str, Any], prefix: str) -> Iterator[Tuple[str, float]]:
+    for key, value in values.items():
+        name = f"{prefix}.{key}"
+        if isinstance(value, dict):
+            yield from _flatten(value, name)
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            yield name, value
+
+
+_registry: Optional[MetricsRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def get_registry() -> MetricsRegistry:
+    """Process-wide metrics registry"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MetricsRegistry()
+    return _registry
+
+
+def timed(name: str, labels: Labels = None):
+    """Decorator recording each call's duration (ms) in a registry histogram"""
+    def decorator(func):
+        histogram = get_registry().histogram(name, labels)
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            with histogram.time():
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
@@ -9,6 +9,9 @@ Features:
 - Parallel task processing (10-25x faster)
 - Bonus eligibility checking (15-25x faster)
 - Complex aggregation operations (20-40x faster)
+
+NumPy inputs are passed to the *_array Rust functions, which read float64 /
+int64 buffers in place instead of copying them element by element.
 """
 
 import logging
@@ -17,6 +20,7 @@ from typing import List, Dict, Any, Tuple, Optional
 from dataclasses import dataclass
 # Lazy import for numpy - deferred until first use
 from core.optimization.lazy_imports import get_lazy_manager
+from core.performance.engine_dispatch import RUST, get_dispatcher, is_ndarray
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -24,7 +28,8 @@ logger = logging.getLogger(__name__)
 # Try to import Rust extensions
 try:
     import rust_extensions
-    RUST_AVAILABLE = True
+    # An unbuilt checkout imports the crate directory as an empty namespace package
+    RUST_AVAILABLE = hasattr(rust_extensions, 'process_tasks_batch')
     logger.info("Rust Data Processing Engine loaded successfully")
 except ImportError as e:
     RUST_AVAILABLE = False
@@ -72,6 +77,8 @@ class RustDataProcessingEngine:
     
     def __init__(self):
         self.rust_available = RUST_AVAILABLE
+        # Builds older than the zero-copy interface only have the list-based functions
+        self.rust_arrays_available = RUST_AVAILABLE and hasattr(rust_extensions, 'process_tasks_batch_array')
         self._lazy_manager = get_lazy_manager()
         self._setup_lazy_imports()
         if self.rust_available:
@@ -89,6 +96,12 @@ class RustDataProcessingEngine:
         """Lazy-loaded numpy module"""
         return self._lazy_manager.get_module('numpy')
     
+    def _backend(self, operation: str, size: int, rust_available: Optional[bool] = None) -> str:
+        """Backend for this call from the size-aware dispatcher"""
+        if rust_available is None:
+            rust_available = self.rust_available
+        return get_dispatcher().choose(operation, size, rust_available=rust_available)
+    
     def parse_time_strings_batch(self, time_strings: List[str]) -> List[int]:
         """
         Convert time strings (HH:MM:SS) to seconds in batch
@@ -105,8 +118,9 @@ class RustDataProcessingEngine:
             return []
         
         start_time = time.time()
+        backend = self._backend('processing.parse_time_strings', len(time_strings))
         
-        if self.rust_available:
+        if backend == RUST:
             try:
                 result = rust_extensions.parse_time_to_seconds_batch(time_strings)
                 elapsed = time.time() - start_time
@@ -135,6 +149,21 @@ class RustDataProcessingEngine:
         logger.debug(f"Python fallback time parsing: {len(time_strings)} strings in {elapsed:.4f}s")
         return result
     
+    def parse_time_strings_array(self, time_strings: List[str]):
+        """
+        Convert time strings (HH:MM:SS) to an int64 NumPy array of seconds
+        
+        Feed the result to process_task_arrays() to keep the data in one buffer.
+        """
+        if len(time_strings) > 0 and self._backend(
+                'processing.parse_time_strings', len(time_strings), self.rust_arrays_available) == RUST:
+            try:
+                return rust_extensions.parse_time_to_seconds_array(list(time_strings))
+            except Exception as e:
+                logger.error(f"Rust array time parsing failed: {e}")
+        
+        return self.np.asarray(self.parse_time_strings_batch(list(time_strings)), dtype=self.np.int64)
+    
     def process_tasks_batch(
         self,
         task_data: List[Tuple[str, str, float]],  # (duration, project, score)
@@ -160,8 +189,9 @@ class RustDataProcessingEngine:
             return TaskProcessingResult(0, 0.0, 0.0, 0, 0, 0, 0.0)
         
         start_time = time.time()
+        backend = self._backend('processing.tasks_batch', len(task_data))
         
-        if self.rust_available:
+        if backend == RUST:
             try:
                 # Extract duration strings and scores for Rust function
                 duration_strings = [task[0] for task in task_data]
@@ -241,6 +271,85 @@ class RustDataProcessingEngine:
         logger.debug(f"Python fallback task processing: {len(task_data)} tasks in {elapsed:.4f}s")
         return result
     
+    def process_task_arrays(
+        self,
+        duration_seconds,
+        scores,
+        global_payrate: float,
+        bonus_payrate: float,
+        bonus_enabled: bool = True
+    ) -> TaskProcessingResult:
+        """
+        Column-oriented process_tasks_batch
+        
+        Args:
+            duration_seconds: Task durations in seconds (int64 array or sequence)
+            scores: Task scores (float64 array or sequence)
+            global_payrate: Standard hourly rate
+            bonus_payrate: Bonus hourly rate
+            bonus_enabled: Whether bonus calculations are enabled
+            
+        Returns:
+            TaskProcessingResult with aggregated metrics
+            
+        int64/float64 contiguous arrays reach Rust without a copy; other dtypes
+        are converted once by NumPy.
+        """
+        if len(duration_seconds) != len(scores):
+            raise ValueError("Durations and scores must have the same length")
+        if len(duration_seconds) == 0:
+            return TaskProcessingResult(0, 0.0, 0.0, 0, 0, 0, 0.0)
+        
+        start_time = time.time()
+        np = self.np
+        seconds_arr = np.asarray(duration_seconds, dtype=np.int64)
+        scores_arr = np.asarray(scores, dtype=np.float64)
+        
+        if self._backend('processing.task_arrays', len(seconds_arr), self.rust_arrays_available) == RUST:
+            try:
+                result_dict = rust_extensions.process_tasks_batch_array(
+                    seconds_arr, scores_arr, global_payrate, bonus_payrate, bonus_enabled
+                )
+                
+                result = TaskProcessingResult(
+                    total_seconds=result_dict['total_seconds'],
+                    total_earnings=result_dict['total_earnings'],
+                    average_score=result_dict['average_score'],
+                    fail_count=result_dict['fail_count'],
+                    bonus_tasks_count=result_dict['bonus_tasks_count'],
+                    task_count=result_dict['task_count'],
+                    fail_rate=result_dict['fail_rate']
+                )
+                
+                elapsed = time.time() - start_time
+                logger.debug(f"Rust array task processing: {len(seconds_arr)} tasks in {elapsed:.4f}s")
+                return result
+                
+            except Exception as e:
+                logger.error(f"Rust array task processing failed: {e}")
+                # Fall through to NumPy implementation
+        
+        # NumPy fallback
+        seconds_arr = np.maximum(seconds_arr, 0)
+        is_bonus = (scores_arr >= 3.0) if bonus_enabled else np.zeros(len(scores_arr), dtype=bool)
+        payrates = np.where(is_bonus, bonus_payrate, global_payrate)
+        task_count = len(seconds_arr)
+        fail_count = int(np.count_nonzero(scores_arr < 3.0))
+        
+        result = TaskProcessingResult(
+            total_seconds=int(seconds_arr.sum()),
+            total_earnings=float(np.sum(seconds_arr / 3600.0 * payrates)),
+            average_score=float(scores_arr.mean()),
+            fail_count=fail_count,
+            bonus_tasks_count=int(np.count_nonzero(is_bonus)),
+            task_count=task_count,
+            fail_rate=fail_count / task_count * 100.0
+        )
+        
+        elapsed = time.time() - start_time
+        logger.debug(f"NumPy fallback task processing: {task_count} tasks in {elapsed:.4f}s")
+        return result
+    
     def check_bonus_eligibility_batch(
         self,
         task_timestamps: List[str],
@@ -268,8 +377,9 @@ class RustDataProcessingEngine:
             return []
         
         start_time = time.time()
+        backend = self._backend('processing.bonus_eligibility', len(task_timestamps))
         
-        if self.rust_available:
+        if backend == RUST:
             try:
                 result = rust_extensions.check_bonus_eligibility_batch(
                     task_timestamps,
@@ -332,9 +442,12 @@ class RustDataProcessingEngine:
         Returns:
             AggregatedMetrics with comprehensive statistics
             
+        Lists and NumPy arrays are both accepted; float64 arrays are read by
+        Rust in place.
+            
         Performance: 20-40x faster than sequential Python operations
         """
-        if not durations:
+        if len(durations) == 0:
             return AggregatedMetrics(
                 duration={}, score={}, earnings={}, efficiency={}
             )
@@ -343,12 +456,24 @@ class RustDataProcessingEngine:
             time_limits = []
         
         start_time = time.time()
+        backend = self._backend('processing.aggregated_metrics', len(durations))
         
-        if self.rust_available:
+        if backend == RUST:
             try:
-                result_dict = rust_extensions.calculate_aggregated_metrics(
-                    durations, scores, earnings, time_limits
-                )
+                if self.rust_arrays_available and any(
+                    is_ndarray(values) for values in (durations, scores, earnings, time_limits)
+                ):
+                    np = self.np
+                    result_dict = rust_extensions.calculate_aggregated_metrics_array(
+                        np.asarray(durations, dtype=np.float64),
+                        np.asarray(scores, dtype=np.float64),
+                        np.asarray(earnings, dtype=np.float64),
+                        np.asarray(time_limits, dtype=np.float64)
+                    )
+                else:
+                    result_dict = rust_extensions.calculate_aggregated_metrics(
+                        durations, scores, earnings, time_limits
+                    )
                 
                 result = AggregatedMetrics(
                     duration=dict(result_dict['duration']),
@@ -402,7 +527,7 @@ class RustDataProcessingEngine:
         quality_efficiency = avg_score / (total_duration / len(durations)) if total_duration > 0 else 0.0
         
         time_efficiency = 0.0
-        if time_limits:
+        if len(time_limits) > 0:
             time_limits_arr = self.np.array(time_limits[:len(durations)])
             valid_limits = time_limits_arr > 0
             if self.np.any(valid_limits):
@@ -446,6 +571,18 @@ def process_tasks_batch(
         task_data, global_payrate, bonus_payrate, bonus_enabled
     )
 
+def process_task_arrays(
+    duration_seconds,
+    scores,
+    global_payrate: float,
+    bonus_payrate: float,
+    bonus_enabled: bool = True
+) -> TaskProcessingResult:
+    """Convenience function for column-oriented batch task processing"""
+    return data_processing_engine.process_task_arrays(
+        duration_seconds, scores, global_payrate, bonus_payrate, bonus_enabled
+    )
+
 def check_bonus_eligibility_batch(
     task_timestamps: List[str],
     bonus_start_day: int,
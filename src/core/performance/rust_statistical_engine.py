@@ -4,11 +4,22 @@ Rust Statistical Analysis Engine Integration
 This module provides a high-level Python interface to the Rust statistical
 analysis engine, offering 15-50x performance improvements for statistical
 calculations used throughout the Auditor Helper application.
+
+Inputs are handed to Rust as float64 NumPy arrays; np.asarray does not copy
+data that is already a contiguous float64 array.
+
+Each call is routed to pure Python, NumPy or Rust by input size (see
+core.performance.engine_dispatch), so small weekly series skip the
+conversion overhead and large ranges never hit a Python loop.
 """
 
 # Lazy import for numpy - deferred until first use
 from core.optimization.lazy_imports import get_lazy_manager
+from core.performance.engine_dispatch import NUMPY, PYTHON, get_dispatcher
+import functools
 import logging
+import math
+import statistics
 from typing import Dict, List, Tuple, Optional, Any, Union
 from dataclasses import dataclass
 
@@ -66,6 +77,45 @@ class ConfidenceInterval:
     upper: float
     confidence_level: float
 
+# Two-sided Student's t critical values for df 1..30, matching scipy.stats.t.ppf
+_T_CRITICAL = {
+    0.90: (6.314, 2.920, 2.353, 2.132, 2.015, 1.943, 1.895, 1.860, 1.833, 1.812,
+           1.796, 1.782, 1.771, 1.761, 1.753, 1.746, 1.740, 1.734, 1.729, 1.725,
+           1.721, 1.717, 1.714, 1.711, 1.708, 1.706, 1.703, 1.701, 1.699, 1.697),
+    0.95: (12.706, 4.303, 3.182, 2.776, 2.571, 2.447, 2.365, 2.306, 2.262, 2.228,
+           2.201, 2.179, 2.160, 2.145, 2.131, 2.120, 2.110, 2.101, 2.093, 2.086,
+           2.080, 2.074, 2.069, 2.064, 2.060, 2.056, 2.052, 2.048, 2.045, 2.042),
+    0.99: (63.657, 9.925, 5.841, 4.604, 4.032, 3.707, 3.499, 3.355, 3.250, 3.169,
+           3.106, 3.055, 3.012, 2.977, 2.947, 2.921, 2.898, 2.878, 2.861, 2.845,
+           2.831, 2.819, 2.807, 2.797, 2.787, 2.779, 2.771, 2.763, 2.756, 2.750),
+}
+
+@functools.lru_cache(maxsize=128)
+def t_critical_value(confidence_level: float, df: int) -> float:
+    """
+    Two-sided Student's t critical value, e.g. 2.262 for 95% and df=9
+
+    Uses SciPy when installed; otherwise the table above, and the
+    Cornish-Fisher expansion of the normal quantile for other levels or
+    df > 30 (within 0.001 of the exact value there).
+    """
+    try:
+        from scipy import stats
+        return float(stats.t.ppf((1 + confidence_level) / 2, df))
+    except ImportError:
+        pass
+    
+    table = _T_CRITICAL.get(round(confidence_level, 4))
+    if table is not None and df <= len(table):
+        return table[df - 1]
+    
+    z = statistics.NormalDist().inv_cdf((1 + confidence_level) / 2)
+    g1 = (z ** 3 + z) / 4
+    g2 = (5 * z ** 5 + 16 * z ** 3 + 3 * z) / 96
+    g3 = (3 * z ** 7 + 19 * z ** 5 + 17 * z ** 3 - 15 * z) / 384
+    g4 = (79 * z ** 9 + 776 * z ** 7 + 1482 * z ** 5 - 1920 * z ** 3 - 945 * z) / 92160
+    return z + g1 / df + g2 / df ** 2 + g3 / df ** 3 + g4 / df ** 4
+
 class RustStatisticalEngine:
     """
     High-performance statistical analysis engine using Rust
@@ -79,6 +129,7 @@ class RustStatisticalEngine:
     
     def __init__(self):
         self.rust_available = RUST_AVAILABLE
+        self.rust_arrays_available = RUST_AVAILABLE and hasattr(rust_extensions, 'calculate_batch_correlations_array')
         self._lazy_manager = get_lazy_manager()
         self._setup_lazy_imports()
         if not self.rust_available:
@@ -94,6 +145,10 @@ class RustStatisticalEngine:
         """Lazy-loaded numpy module"""
         return self._lazy_manager.get_module('numpy')
     
+    def _backend(self, operation: str, size: int) -> str:
+        """Backend for this call from the size-aware dispatcher"""
+        return get_dispatcher().choose(operation, size, rust_available=self.rust_available)
+    
     def calculate_correlation(self, x_data: Union[List[float], Any], 
                             y_data: Union[List[float], Any]) -> float:
         """
@@ -106,7 +161,10 @@ class RustStatisticalEngine:
         Returns:
             Correlation coefficient (-1 to 1)
         """
-        if not self.rust_available:
+        backend = self._backend('statistics.correlation', len(x_data))
+        if backend == PYTHON:
+            return self._python_correlation(x_data, y_data)
+        if backend == NUMPY:
             return self._fallback_correlation(x_data, y_data)
         
         try:
@@ -127,7 +185,10 @@ class RustStatisticalEngine:
         Returns:
             StatisticalSummary object with all statistics
         """
-        if not self.rust_available:
+        backend = self._backend('statistics.summary', len(data))
+        if backend == PYTHON:
+            return self._python_statistical_summary(data)
+        if backend == NUMPY:
             return self._fallback_statistical_summary(data)
         
         try:
@@ -163,7 +224,10 @@ class RustStatisticalEngine:
         Returns:
             ConfidenceInterval object with lower and upper bounds
         """
-        if not self.rust_available:
+        backend = self._backend('statistics.confidence_interval', len(data))
+        if backend == PYTHON:
+            return self._python_confidence_interval(data, confidence_level)
+        if backend == NUMPY:
             return self._fallback_confidence_interval(data, confidence_level)
         
         try:
@@ -184,15 +248,60 @@ class RustStatisticalEngine:
         Returns:
             Dictionary of correlation pairs and their coefficients
         """
-        if not self.rust_available:
+        observations = max((len(values) for values in data_dict.values()), default=0)
+        backend = self._backend('statistics.batch_correlations', observations)
+        if backend == PYTHON:
+            return self._python_batch_correlations(data_dict)
+        if backend == NUMPY:
             return self._fallback_batch_correlations(data_dict)
         
+        names = list(data_dict.keys())
+        lengths = {len(values) for values in data_dict.values()}
+        if self.rust_arrays_available and len(lengths) == 1:
+            try:
+                # One NumPy block instead of per-element list extraction in Rust
+                matrix = self.np.asarray([data_dict[name] for name in names], dtype=self.np.float64)
+                return self._correlation_pairs(names, self.calculate_correlation_matrix(matrix))
+            except Exception as e:
+                logging.warning(f"Rust array batch correlations failed, using list path: {e}")
+        
         try:
             return rust_extensions.calculate_batch_correlations(data_dict)
         except Exception as e:
             logging.warning(f"Rust batch correlations failed, using fallback: {e}")
             return self._fallback_batch_correlations(data_dict)
     
+    def calculate_correlation_matrix(self, data: Any) -> Any:
+        """
+        Correlation matrix of a 2-D array with one variable per row
+        
+        Args:
+            data: 2-D array-like, shape (variables, observations)
+            
+        Returns:
+            NumPy array of shape (variables, variables)
+        """
+        matrix = self.np.asarray(data, dtype=self.np.float64)
+        if matrix.ndim != 2:
+            raise ValueError("Correlation matrix input must be 2-D (variables x observations)")
+        
+        if self.rust_arrays_available:
+            try:
+                return rust_extensions.calculate_batch_correlations_array(matrix)
+            except Exception as e:
+                logging.warning(f"Rust correlation matrix failed, using fallback: {e}")
+        
+        return self._fallback_correlation_matrix(matrix)
+    
+    @staticmethod
+    def _correlation_pairs(names: List[str], matrix: Any) -> Dict[str, float]:
+        """Flatten a correlation matrix into calculate_batch_correlations' {"a_b": r} form"""
+        result = {}
+        for i in range(len(names)):
+            for j in range(i + 1, len(names)):
+                result[f"{names[i]}_{names[j]}"] = float(matrix[i, j])
+        return result
+    
     def calculate_moving_average(self, data: Union[List[float], Any], 
                                window_size: int) -> List[float]:
         """
@@ -205,7 +314,10 @@ class RustStatisticalEngine:
         Returns:
             List of moving average values
         """
-        if not self.rust_available:
+        backend = self._backend('statistics.moving_average', len(data))
+        if backend == PYTHON:
+            return self._python_moving_average(data, window_size)
+        if backend == NUMPY:
             return self._fallback_moving_average(data, window_size)
         
         try:
@@ -228,7 +340,10 @@ class RustStatisticalEngine:
         Returns:
             TrendAnalysis object with regression results
         """
-        if not self.rust_available:
+        backend = self._backend('statistics.trend_analysis', len(x_data))
+        if backend == PYTHON:
+            return self._python_trend_analysis(x_data, y_data)
+        if backend == NUMPY:
             return self._fallback_trend_analysis(x_data, y_data)
         
         try:
@@ -246,6 +361,104 @@ class RustStatisticalEngine:
             logging.warning(f"Rust trend analysis failed, using fallback: {e}")
             return self._fallback_trend_analysis(x_data, y_data)
     
+    # Pure Python implementations for small inputs, where building arrays costs more than the work
+    def _python_correlation(self, x_data, y_data) -> float:
+        """Pearson correlation without NumPy; 0.0 for mismatched, short or constant data"""
+        n = len(x_data)
+        if n != len(y_data) or n < 2:
+            return 0.0
+        mean_x = math.fsum(x_data) / n
+        mean_y = math.fsum(y_data) / n
+        cov = math.fsum((x - mean_x) * (y - mean_y) for x, y in zip(x_data, y_data))
+        var_x = math.fsum((x - mean_x) ** 2 for x in x_data)
+        var_y = math.fsum((y - mean_y) ** 2 for y in y_data)
+        denominator = math.sqrt(var_x * var_y)
+        return cov / denominator if denominator > 0 else 0.0
+    
+    @staticmethod
+    def _python_percentile(sorted_data: List[float], fraction: float) -> float:
+        """Linear-interpolation percentile, matching numpy.percentile's default"""
+        position = (len(sorted_data) - 1) * fraction
+        lower = math.floor(position)
+        upper = min(lower + 1, len(sorted_data) - 1)
+        return sorted_data[lower] + (sorted_data[upper] - sorted_data[lower]) * (position - lower)
+    
+    def _python_statistical_summary(self, data) -> StatisticalSummary:
+        """Statistical summary without NumPy"""
+        values = [float(value) for value in data]
+        if not values:
+            return StatisticalSummary(0, 0, 0, 0, 0, 0, 0, 0, 0, [], 0)
+        
+        sorted_values = sorted(values)
+        q1 = self._python_percentile(sorted_values, 0.25)
+        q3 = self._python_percentile(sorted_values, 0.75)
+        iqr = q3 - q1
+        lower_fence = q1 - 1.5 * iqr
+        upper_fence = q3 + 1.5 * iqr
+        outliers = [value for value in values if value < lower_fence or value > upper_fence]
+        
+        return StatisticalSummary(
+            mean=statistics.fmean(values),
+            median=statistics.median(sorted_values),
+            std_dev=statistics.stdev(values) if len(values) > 1 else 0.0,
+            min_val=sorted_values[0], max_val=sorted_values[-1], q1=q1, q3=q3, iqr=iqr,
+            outlier_count=len(outliers), outliers=outliers, sample_size=len(values)
+        )
+    
+    def _python_confidence_interval(self, data, confidence_level: float) -> ConfidenceInterval:
+        """Confidence interval without NumPy (Student's t, like the NumPy and Rust paths)"""
+        values = [float(value) for value in data]
+        if len(values) < 2:
+            return ConfidenceInterval(lower=0.0, upper=0.0, confidence_level=confidence_level)
+        
+        mean = statistics.fmean(values)
+        t_value = t_critical_value(confidence_level, len(values) - 1)
+        margin = t_value * statistics.stdev(values) / math.sqrt(len(values))
+        return ConfidenceInterval(lower=mean - margin, upper=mean + margin, confidence_level=confidence_level)
+    
+    def _python_batch_correlations(self, data_dict: Dict[str, List[float]]) -> Dict[str, float]:
+        """Pairwise correlations without NumPy"""
+        result = {}
+        variables = list(data_dict.keys())
+        for i in range(len(variables)):
+            for j in range(i + 1, len(variables)):
+                var1, var2 = variables[i], variables[j]
+                result[f"{var1}_{var2}"] = self._python_correlation(data_dict[var1], data_dict[var2])
+        return result
+    
+    def _python_moving_average(self, data, window_size: int) -> List[float]:
+        """Running-sum moving average without NumPy"""
+        values = [float(value) for value in data]
+        if window_size <= 0 or len(values) < window_size:
+            return []
+        
+        window_sum = math.fsum(values[:window_size])
+        averages = [window_sum / window_size]
+        for index in range(window_size, len(values)):
+            window_sum += values[index] - values[index - window_size]
+            averages.append(window_sum / window_size)
+        return averages
+    
+    def _python_trend_analysis(self, x_data, y_data) -> TrendAnalysis:
+        """Least-squares trend line without NumPy"""
+        n = len(x_data)
+        if n != len(y_data) or n < 2:
+            return TrendAnalysis(0.0, 0.0, 0.0, [])
+        
+        mean_x = math.fsum(x_data) / n
+        mean_y = math.fsum(y_data) / n
+        ss_xx = math.fsum((x - mean_x) ** 2 for x in x_data)
+        ss_xy = math.fsum((x - mean_x) * (y - mean_y) for x, y in zip(x_data, y_data))
+        slope = ss_xy / ss_xx if ss_xx > 0 else 0.0
+        intercept = mean_y - slope * mean_x
+        
+        trend_line = [slope * x + intercept for x in x_data]
+        ss_res = math.fsum((y - predicted) ** 2 for y, predicted in zip(y_data, trend_line))
+        ss_tot = math.fsum((y - mean_y) ** 2 for y in y_data)
+        r_squared = 1 - (ss_res / ss_tot) if ss_tot != 0 else 0.0
+        
+        return TrendAnalysis(slope=slope, intercept=intercept, r_squared=r_squared, trend_line=trend_line)
+    
     # Fallback implementations using NumPy/SciPy
     def _fallback_correlation(self, x_data: Union[List[float], Any], 
                             y_data: Union[List[float], Any]) -> float:
@@ -309,7 +522,7 @@ class RustStatisticalEngine:
             data_array = self.np.asarray(data, dtype=self.np.float64)
             mean = self.np.mean(data_array)
             std = self.np.std(data_array, ddof=1)
-            margin = 1.96 * (std / self.np.sqrt(len(data_array)))  # 95% approximation
+            margin = t_critical_value(confidence_level, len(data_array) - 1) * (std / self.np.sqrt(len(data_array)))
             return ConfidenceInterval(lower=float(mean - margin), upper=float(mean + margin), confidence_level=confidence_level)
     
     def _fallback_batch_correlations(self, data_dict: Dict[str, List[float]]) -> Dict[str, float]:
@@ -325,6 +538,15 @@ class RustStatisticalEngine:
         
         return result
     
+    def _fallback_correlation_matrix(self, matrix: Any) -> Any:
+        """Fallback correlation matrix using NumPy; degenerate pairs are 0 like the Rust version"""
+        n_vars = matrix.shape[0]
+        result = self.np.eye(n_vars)
+        for i in range(n_vars):
+            for j in range(i + 1, n_vars):
+                result[i, j] = result[j, i] = self._fallback_correlation(matrix[i], matrix[j])
+        return result
+    
     def _fallback_moving_average(self, data: Union[List[float], Any], 
                                window_size: int) -> List[float]:
         """Fallback moving average using NumPy"""
@@ -390,6 +612,10 @@ def calculate_batch_correlations(data_dict) -> Dict[str, float]:
     """Calculate batch correlations"""
     return rust_engine.calculate_batch_correlations(data_dict)
 
+def calculate_correlation_matrix(data):
+    """Calculate a correlation matrix (one variable per row)"""
+    return rust_engine.calculate_correlation_matrix(data)
+
 def calculate_moving_average(data, window_size) -> List[float]:
     """Calculate moving average"""
     return rust_engine.calculate_moving_average(data, window_size)
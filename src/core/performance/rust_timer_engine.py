@@ -10,6 +10,8 @@ Features:
 - Concurrent timer management (50-100x faster)
 - High-performance time formatting (10-20x faster)
 - Timer statistics calculation (25-50x faster)
+
+NumPy float64 inputs are read by the *_array Rust functions in place.
 """
 
 import logging
@@ -19,13 +21,16 @@ from dataclasses import dataclass
 import threading
 from concurrent.futures import ThreadPoolExecutor
 
+from core.performance.engine_dispatch import RUST, get_dispatcher, is_ndarray
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
 # Try to import Rust extensions
 try:
     import rust_extensions
-    RUST_AVAILABLE = True
+    # An unbuilt checkout imports the crate directory as an empty namespace package
+    RUST_AVAILABLE = hasattr(rust_extensions, 'calculate_timer_statistics')
     logger.info("Rust Timer Engine loaded successfully")
 except ImportError as e:
     RUST_AVAILABLE = False
@@ -63,11 +68,16 @@ class RustTimerEngine:
     
     def __init__(self):
         self.rust_available = RUST_AVAILABLE
+        self.rust_arrays_available = RUST_AVAILABLE and hasattr(rust_extensions, 'calculate_timer_statistics_array')
         if self.rust_available:
             logger.info("Initialized Rust Timer Engine")
         else:
             logger.info("Initialized Python fallback Timer Engine")
     
+    def _backend(self, operation: str, size: int) -> str:
+        """Backend for this call from the size-aware dispatcher"""
+        return get_dispatcher().choose(operation, size, rust_available=self.rust_available)
+    
     def create_high_precision_timer(self) -> int:
         """
         Create a high-precision timer ID
@@ -138,23 +148,30 @@ class RustTimerEngine:
             end_times: List of end timestamps
             
         Returns:
-            TimerResult with durations and statistics
+            TimerResult with durations and statistics; durations is a NumPy
+            array when the inputs are NumPy arrays
             
         Performance: 30-60x faster than sequential Python operations
         """
         if len(start_times) != len(end_times):
             raise ValueError("Start and end times must have the same length")
         
-        if not start_times:
+        if len(start_times) == 0:
             return TimerResult([], 0.0, 0.0, 0)
         
         start_time = time.time()
+        backend = self._backend('timer.batch_durations', len(start_times))
         
-        if self.rust_available:
+        if backend == RUST:
             try:
-                result_dict = rust_extensions.calculate_batch_durations(
-                    start_times, end_times
-                )
+                if self.rust_arrays_available and is_ndarray(start_times) and is_ndarray(end_times):
+                    result_dict = rust_extensions.calculate_batch_durations_array(
+                        start_times.astype('float64', copy=False), end_times.astype('float64', copy=False)
+                    )
+                else:
+                    result_dict = rust_extensions.calculate_batch_durations(
+                        start_times, end_times
+                    )
                 
                 result = TimerResult(
                     durations=result_dict['durations'],
@@ -286,8 +303,9 @@ class RustTimerEngine:
             return []
         
         start_time = time.time()
+        backend = self._backend('timer.format_batch', len(time_seconds))
         
-        if self.rust_available:
+        if backend == RUST:
             try:
                 result = rust_extensions.format_time_batch(time_seconds, format_type)
                 
@@ -343,19 +361,27 @@ class RustTimerEngine:
             
         Performance: 25-50x faster than Python statistical operations
         """
-        if not durations:
+        if len(durations) == 0:
             return TimerStatistics(0.0, 0.0, 0.0, 0.0, 0.0, 0)
         
         if target_durations is None:
             target_durations = []
         
         start_time = time.time()
+        backend = self._backend('timer.statistics', len(durations))
         
-        if self.rust_available:
+        if backend == RUST:
             try:
-                result_dict = rust_extensions.calculate_timer_statistics(
-                    durations, target_durations
-                )
+                if (self.rust_arrays_available and is_ndarray(durations)
+                        and (is_ndarray(target_durations) or len(target_durations) == 0)):
+                    durations_arr = durations.astype('float64', copy=False)
+                    targets_arr = (target_durations.astype('float64', copy=False)
+                                   if is_ndarray(target_durations) else durations_arr[:0])
+                    result_dict = rust_extensions.calculate_timer_statistics_array(durations_arr, targets_arr)
+                else:
+                    result_dict = rust_extensions.calculate_timer_statistics(
+                        durations, target_durations
+                    )
                 
                 result = TimerStatistics(
                     accuracy=result_dict['accuracy'],
@@ -389,14 +415,14 @@ class RustTimerEngine:
         
         # Calculate accuracy (if targets provided)
         accuracy = 0.0
-        if target_durations and len(target_durations) == len(durations):
+        if len(target_durations) > 0 and len(target_durations) == len(durations):
             errors = [abs(actual - target) for actual, target in zip(durations, target_durations)]
             avg_error = sum(errors) / len(errors)
             accuracy = 1.0 - min(1.0, avg_error / average_time) if average_time > 0 else 0.0
         
         # Calculate efficiency (if targets provided)
         efficiency = 0.0
-        if target_durations and len(target_durations) == len(durations):
+        if len(target_durations) > 0 and len(target_durations) == len(durations):
             target_total = sum(target_durations)
             efficiency = min(1.0, target_total / total_time) if total_time > 0 else 0.0
         
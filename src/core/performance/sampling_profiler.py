@@ -0,0 +1,224 @@
+"""
+On-demand sampling profiler
+
+A background thread reads every thread's current stack from
+sys._current_frames() at a fixed interval and counts identical stacks. Unlike
+the fixed-point timers in startup_profiler it needs no instrumentation, so it
+finds hot paths nobody thought to time (DataManager loads, ChartManager
+redraws, QML model resets) on a user's machine, and its cost does not depend
+on how busy the application is:
+
+    profiler = get_sampling_profiler()
+    profiler.start()
+    ...                                   # reproduce the stutter
+    profiler.stop()
+    profiler.write_collapsed("profiles/stutter.collapsed")
+
+The output is the collapsed-stack format read by flamegraph.pl, speedscope
+and inferno: one 'root;caller;callee count' line per distinct stack. The root
+frame is the thread, 'gui' for the GUI (main) thread and 'worker:<name>' for
+everything else, so a flame graph splits GUI work from background work at
+the first level.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from collections import Counter
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from .metrics import get_registry
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_INTERVAL_MS = 5.0
+
+# Deeper stacks are truncated at the caller end; keeps one sample bounded
+MAX_STACK_DEPTH = 128
+
+GUI_THREAD_LABEL = "gui"
+
+
+class SamplingProfiler:
+    """Statistical profiler sampling all Python threads from a daemon thread"""
+
+    def __init__(self, interval_ms: float = DEFAULT_INTERVAL_MS, gui_thread_id: Optional[int] = None,
+                 max_depth: int = MAX_STACK_DEPTH):
+        self.interval_ms = interval_ms
+        self.gui_thread_id = gui_thread_id or threading.main_thread().ident
+        self.max_depth = max_depth
+
+        self._lock = threading.Lock()
+        self._stacks: Counter = Counter()
+        self._thread_samples: Counter = Counter()
+        self._samples = 0
+        self._started_at: Optional[float] = None
+        self._duration = 0.0
+        self._stop_event = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+        self._frame_labels: Dict[Any, str] = {}
+        self._sample_ms = get_registry().histogram("profiler.sample_ms")
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self, interval_ms: Optional[float] = None) -> bool:
+        """Start sampling, discarding the previous profile; False if already running"""
+        if self.is_running:
+            return False
+        if interval_ms is not None:
+            self.interval_ms = interval_ms
+
+        with self._lock:
+            self._stacks.clear()
+            self._thread_samples.clear()
+            self._samples = 0
+            self._duration = 0.0
+        self._frame_labels.clear()
+        self._stop_event.clear()
+        self._started_at = time.perf_counter()
+        self._thread = threading.Thread(target=self._run, name="SamplingProfiler", daemon=True)
+        self._thread.start()
+        logger.info("Sampling profiler started (%.1f ms interval)", self.interval_ms)
+        return True
+
+    def stop(self) -> Dict[str, Any]:
+        """Stop sampling and return the summary; the profile is kept for writing"""
+        if self._thread is not None:
+            self._stop_event.set()
+            self._thread.join()
+            self._thread = None
+            self._duration = time.perf_counter() - self._started_at
+            logger.info("Sampling profiler stopped after %.1fs, %d samples", self._duration, self._samples)
+        return self.summary()
+
+    def _run(self):
+        interval = self.interval_ms / 1000.0
+        own_id = threading.get_ident()
+        next_sample = time.perf_counter()
+        while not self._stop_event.is_set():
+            start = time.perf_counter()
+            self._sample(own_id)
+            self._sample_ms.observe((time.perf_counter() - start) * 1000)
+
+            # Sample on a fixed schedule; after a long stall skip missed ticks instead of bursting
+            next_sample += interval
+            now = time.perf_counter()
+            if next_sample < now:
+                next_sample = now + interval
+            self._stop_event.wait(next_sample - now)
+
+    def _sample(self, own_id: int):
+        frames = sys._current_frames()
+        names = {thread.ident: thread.name for thread in threading.enumerate()}
+        sampled: List[Tuple[str, Tuple[str, ...]]] = []
+        for thread_id, frame in frames.items():
+            if thread_id == own_id:
+                continue
+            stack = []
+            while frame is not None and len(stack) < self.max_depth:
+                stack.append(self._frame_label(frame.f_code))
+                frame = frame.f_back
+            stack.reverse()
+            sampled.append((self._thread_label(thread_id, names), tuple(stack)))
+        del frames
+
+        with self._lock:
+            self._samples += 1
+            for thread_label, stack in sampled:
+                self._stacks[(thread_label, stack)] += 1
+                self._thread_samples[thread_label] += 1
+
+    def _thread_label(self, thread_id: int, names: Dict[int, str]) -> str:
+        if thread_id == self.gui_thread_id:
+            return GUI_THREAD_LABEL
+        return f"worker:{names.get(thread_id, thread_id)}"
+
+    def _frame_label(self, code) -> str:
+        label = self._frame_labels.get(code)
+        if label is None:
+            name = getattr(code, 'co_qualname', code.co_name)
+            label = f"{name} ({os.path.basename(code.co_filename)}:{code.co_firstlineno})"
+            self._frame_labels[code] = label
+        return label
+
+    def collapsed_lines(self, thread: Optional[str] = None) -> List[str]:
+        """Collapsed stacks, most frequent first; thread limits them to one root label"""
+        with self._lock:
+            stacks = list(self._stacks.items())
+        lines = []
+        for (thread_label, stack), count in sorted(stacks, key=lambda item: item[1], reverse=True):
+            if thread is not None and thread_label != thread:
+                continue
+            lines.append(f"{';'.join((thread_label, *stack))} {count}")
+        return lines
+
+    def write_collapsed(self, filepath: str, thread: Optional[str] = None) -> str:
+        """Write the profile in collapsed-stack format; returns the path"""
+        path = Path(filepath)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            for line in self.collapsed_lines(thread):
+                f.write(line + "\n")
+        return str(path)
+
+    def summary(self, top: int = 10) -> Dict[str, Any]:
+        """Sample counts per thread and the functions with the most self time"""
+        with self._lock:
+            stacks = list(self._stacks.items())
+            thread_samples = dict(self._thread_samples)
+            samples = self._samples
+        duration = self._duration
+        if self.is_running and self._started_at is not None:
+            duration = time.perf_counter() - self._started_at
+
+        self_time: Counter = Counter()
+        for (thread_label, stack), count in stacks:
+            if stack:
+                self_time[(thread_label, stack[-1])] += count
+
+        gui_samples = thread_samples.get(GUI_THREAD_LABEL, 0)
+        return {
+            'running': self.is_running,
+            'interval_ms': self.interval_ms,
+            'duration_s': duration,
+            'samples': samples,
+            'gui_samples': gui_samples,
+            'worker_samples': sum(thread_samples.values()) - gui_samples,
+            'threads': thread_samples,
+            'top_functions': [
+                {'thread': thread_label, 'function': function, 'samples': count}
+                for (thread_label, function), count in self_time.most_common(top)
+            ],
+        }
+
+
+_profiler: Optional[SamplingProfiler] = None
+
+
+def get_sampling_profiler() -> SamplingProfiler:
+    """Process-wide sampling profiler"""
+    global _profiler
+    if _profiler is None:
+        _profiler = SamplingProfiler()
+    return _profiler
+
+
+def toggle_profiling(output_dir: str, interval_ms: Optional[float] = None) -> Optional[str]:
+    """
+    Start the shared profiler, or stop it and write a timestamped
+    .collapsed file to output_dir. Returns the written path when stopping,
+    None when starting.
+    """
+    profiler = get_sampling_profiler()
+    if not profiler.is_running:
+        profiler.start(interval_ms)
+        return None
+    profiler.stop()
+    filename = f"profile_{datetime.now().strftime('%Y%m%d_%H%M%S')}.collapsed"
+    return profiler.write_collapsed(os.path.join(output_dir, filename))
@@ -1,6 +1,11 @@
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 from .base_repository import BaseRepository
+from ..db.task_search import DEFAULT_SEARCH_LIMIT
+from ..services.task_dao import TASK_LIST_COLUMNS, TASKS_BY_WEEK_SQL, TaskDAO
+
+# List queries return the narrow row shape without feedback (see TaskDAO.get_task_feedback)
+_TASK_LIST_SELECT = ", ".join(TASK_LIST_COLUMNS)
 
 class TaskRepository(BaseRepository):
     """Repository for task data access with Redis caching"""
@@ -34,15 +39,14 @@ class TaskRepository(BaseRepository):
     
     def get_by_week(self, week_id: int) -> List[Dict[str, Any]]:
         """Get all tasks for a specific week with caching"""
-        query = "SELECT * FROM tasks WHERE week_id = ? ORDER BY id"
-        
+        # Narrow row shape without feedback (see TaskDAO.get_task_feedback)
         # Use medium cache TTL for week task lists
-        return self._execute_query(query, (week_id,), use_cache=True, cache_ttl=900)  # 15 minutes
+        return self._execute_query(TASKS_BY_WEEK_SQL, (week_id,), use_cache=True, cache_ttl=900)  # 15 minutes
     
     def get_tasks_by_date_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Get tasks within a date range with caching"""
-        query = """
-            SELECT * FROM tasks 
+        query = f"""
+            SELECT {_TASK_LIST_SELECT} FROM tasks 
             WHERE time_begin >= ? AND time_end <= ?
             ORDER BY time_begin
         """
@@ -52,7 +56,7 @@ class TaskRepository(BaseRepository):
     
     def get_tasks_by_project(self, project: str) -> List[Dict[str, Any]]:
         """Get all tasks for a specific project with caching"""
-        query = "SELECT * FROM tasks WHERE project = ? ORDER BY time_begin DESC"
+        query = f"SELECT {_TASK_LIST_SELECT} FROM tasks WHERE project_name = ? ORDER BY time_begin DESC"
         
         # Use longer cache TTL for project queries (projects don't change often)
         return self._execute_query(query, (project,), use_cache=True, cache_ttl=1200)  # 20 minutes
@@ -143,20 +147,7 @@ class TaskRepository(BaseRepository):
         
         return results[0]['count'] if results else 0
     
-    def search_tasks(self, search_term: str, week_id: Optional[int] = None) -> List[Dict[str, Any]]:
-        """Search tasks by name, feedback, or project with caching"""
-        base_query = """
-            SELECT * FROM tasks 
-            WHERE (task_name LIKE ? OR feedback LIKE ? OR project LIKE ?)
-        """
-        
-        params = [f"%{search_term}%", f"%{search_term}%", f"%{search_term}%"]
-        
-        if week_id is not None:
-            base_query += " AND week_id = ?"
-            params.append(week_id)
-        
-        base_query += " ORDER BY id DESC"
-        
-        # Use shorter cache TTL for search results (more dynamic)
-        return self._execute_query(base_query, tuple(params), use_cache=True, cache_ttl=300)  # 5 minutes 
\ No newline at end of file
+    def search_tasks(self, search_term: str, week_id: Optional[int] = None,
+                     limit: int = DEFAULT_SEARCH_LIMIT) -> List[Dict[str, Any]]:
+        """Ranked prefix search over attempt ID, operation ID, project, locale and feedback"""
+        return TaskDAO(self._data_service).search_tasks(search_term, week_id, limit)
@@ -157,13 +157,15 @@ class WeekRepository(BaseRepository):
     
     def get_week_by_date(self, date: str) -> Optional[Dict[str, Any]]:
         """Get week that contains a specific date with caching"""
+        # Range predicates on start_date/end_date let SQLite seek idx_weeks_date_range
         query = """
             SELECT * FROM weeks 
-            WHERE ? BETWEEN start_date AND end_date
+            WHERE start_date <= ? AND end_date >= ?
+            ORDER BY start_date DESC
             LIMIT 1
         """
         
         # Use medium cache TTL for date lookups
-        results = self._execute_query(query, (date,), use_cache=True, cache_ttl=900)  # 15 minutes
+        results = self._execute_query(query, (date, date), use_cache=True, cache_ttl=900)  # 15 minutes
         
         return results[0] if results else None 
\ No newline at end of file
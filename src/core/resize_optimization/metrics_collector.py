@@ -17,6 +17,7 @@ from PySide6 import QtCore
 from .performance_monitor import PerformanceMonitor, PerformanceMetric
 from .resize_analyzer import ResizeAnalyzer, ResizeState
 from .paint_monitor import PaintMonitor, PaintEvent
+from ..performance.metrics import get_registry
 
 
 @dataclass
@@ -241,6 +242,8 @@ class MetricsCollector(QtCore.QObject):
         # Generate recommendations
         recommendations = self._generate_recommendations(current_metrics, comparison_analysis)
         
+        self._report_to_registry(current_metrics, comparison_analysis)
+        
         # Create report
         report = MetricsReport(
             report_id=self._current_test_session['session_id'],
@@ -269,6 +272,16 @@ class MetricsCollector(QtCore.QObject):
         self.reportGenerated.emit(report)
         return report
     
+    def _report_to_registry(self, current_metrics: Dict, comparison_analysis: Dict):
+        """Publish the test outcome to the shared metrics registry"""
+        registry = get_registry()
+        registry.counter("resize.performance_tests").inc()
+        registry.gauge("resize.last_test_duration_s").set(current_metrics['test_duration'])
+        frequency = current_metrics['resize_metrics'].get('current_frequency')
+        if frequency is not None:
+            registry.gauge("resize.frequency_hz").set(frequency)
+        registry.counter("resize.regressions").inc(len(comparison_analysis.get('regressions', [])))
+    
     def _collect_resize_metrics(self) -> Dict:
         """Collect metrics from resize analyzer"""
         if not self.resize_analyzer:
@@ -11,6 +11,9 @@ from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Tuple
 from PySide6 import QtCore, QtGui, QtWidgets
 
+from ..performance.event_ring import EventRing
+from ..performance.metrics import get_registry
+
 
 @dataclass
 class PaintEvent:
@@ -25,12 +28,13 @@ class PaintEvent:
 
 @dataclass
 class PaintSession:
-    """Paint monitoring session data"""
+    """Paint monitoring session: a range of the event ring plus its cached analysis"""
     session_id: str
     start_time: float
+    start_sequence: int = 0
     end_time: Optional[float] = None
-    events: List[PaintEvent] = field(default_factory=list)
-    widget_stats: Dict[str, Dict] = field(default_factory=dict)
+    end_sequence: Optional[int] = None
+    analysis: Optional[Dict] = None
 
 
 class PaintMonitor(QtCore.QObject):
@@ -42,14 +46,19 @@ class PaintMonitor(QtCore.QObject):
     - Paint duration and performance
     - Widget-specific painting patterns
     - Paint region analysis
+    
+    Events are written into a preallocated EventRing (no per-event objects),
+    so monitoring can stay on; statistics are computed when read.
     """
     
     # Signals for paint monitoring
-    paintEventRecorded = QtCore.Signal(PaintEvent)
+    paintEventRecorded = QtCore.Signal(PaintEvent)  # Only emitted after set_event_signals(True)
     sessionStarted = QtCore.Signal(str)
     sessionEnded = QtCore.Signal(str, dict)
     highPaintFrequency = QtCore.Signal(str, float)  # widget_name, frequency_hz
     
+    RING_COLUMNS = {'timestamp': 'd', 'duration_ms': 'd', 'widget': 'i', 'width': 'i', 'height': 'i'}
+    
     def __init__(self, max_sessions: int = 50, max_events_per_session: int = 2000):
         super().__init__()
         self.max_sessions = max_sessions
@@ -60,13 +69,15 @@ class PaintMonitor(QtCore.QObject):
         self._current_session: Optional[PaintSession] = None
         self._session_counter = 0
         
-        # Event tracking
-        self._recent_events: deque = deque(maxlen=1000)
+        # Event storage; the newest max_events_per_session events are kept
+        self._events = EventRing(max_events_per_session, self.RING_COLUMNS)
         self._sessions: Dict[str, PaintSession] = {}
         
-        # Performance tracking per widget
-        self._widget_paint_times: Dict[str, deque] = defaultdict(lambda: deque(maxlen=100))
-        self._widget_paint_counts: Dict[str, int] = defaultdict(int)
+        # Widgets are stored in the ring by id
+        self._widget_ids: Dict[str, int] = {}
+        self._widget_names: List[str] = []
+        self._widget_paint_counts: List[int] = []
+        self._widget_metrics: List[tuple] = []
         
         # Frequency analysis
         self._paint_frequency_windows: Dict[str, deque] = defaultdict(lambda: deque(maxlen=20))
@@ -74,15 +85,20 @@ class PaintMonitor(QtCore.QObject):
         # Configuration
         self._high_frequency_threshold = 30.0  # Hz threshold for high frequency warning
         self._debug_mode = False
+        self._emit_event_signals = False
         
         # Monitored widgets
         self._monitored_widgets: Dict[str, QtWidgets.QWidget] = {}
-        self._original_paint_events: Dict[str, callable] = {}
+        self._monitored_ids: Dict[QtCore.QObject, int] = {}
     
     def set_debug_mode(self, debug: bool):
         """Enable or disable debug output"""
         self._debug_mode = debug
     
+    def set_event_signals(self, enabled: bool):
+        """Emit paintEventRecorded for every event (allocates a PaintEvent per paint)"""
+        self._emit_event_signals = enabled
+    
     def set_high_frequency_threshold(self, threshold_hz: float):
         """Set the threshold for high frequency paint warnings"""
         self._high_frequency_threshold = threshold_hz
@@ -100,6 +116,7 @@ class PaintMonitor(QtCore.QObject):
         
         # Store widget reference
         self._monitored_widgets[name] = widget
+        self._monitored_ids[widget] = self._widget_id(name)
         
         # Install event filter to capture paint events
         widget.installEventFilter(self)
@@ -110,13 +127,28 @@ class PaintMonitor(QtCore.QObject):
     def remove_monitored_widget(self, name: str):
         """Remove a widget from monitoring"""
         if name in self._monitored_widgets:
-            widget = self._monitored_widgets[name]
+            widget = self._monitored_widgets.pop(name)
             widget.removeEventFilter(self)
-            del self._monitored_widgets[name]
+            self._monitored_ids.pop(widget, None)
             
             if self._debug_mode:
                 print(f"PaintMonitor: Removed monitoring for widget '{name}'")
     
+    def _widget_id(self, name: str) -> int:
+        """Stable id for a widget name; registry metrics are looked up once here"""
+        widget_id = self._widget_ids.get(name)
+        if widget_id is None:
+            widget_id = len(self._widget_names)
+            self._widget_ids[name] = widget_id
+            self._widget_names.append(name)
+            self._widget_paint_counts.append(0)
+            registry = get_registry()
+            self._widget_metrics.append((
+                registry.counter("paint.events", {'widget': name}),
+                registry.histogram("paint.duration_ms", {'widget': name}),
+            ))
+        return widget_id
+    
     def start_monitoring_session(self, session_type: str = "paint") -> str:
         """
         Start a new paint monitoring session.
@@ -132,7 +164,8 @@ class PaintMonitor(QtCore.QObject):
         
         self._current_session = PaintSession(
             session_id=session_id,
-            start_time=time.time()
+            start_time=time.time(),
+            start_sequence=self._events.written
         )
         
         # Cleanup old sessions if needed
@@ -167,12 +200,16 @@ class PaintMonitor(QtCore.QObject):
             return {}
         
         session = self._sessions[session_id]
-        session.end_time = time.time()
+        if session.end_time is None:
+            session.end_time = time.time()
+            session.end_sequence = self._events.written
         
-        # Generate analysis
-        analysis = self._analyze_paint_session(session)
+        # Generate analysis once; the session's events may later be overwritten in the ring
+        if session.analysis is None:
+            session.analysis = self._analyze_paint_session(session)
+        analysis = session.analysis
         
-        if session_id == self._current_session.session_id:
+        if self._current_session and session_id == self._current_session.session_id:
             self._current_session = None
             self._monitoring_enabled = False
         
@@ -188,86 +225,60 @@ class PaintMonitor(QtCore.QObject):
         if not self._monitoring_enabled or event.type() != QtCore.QEvent.Paint:
             return False
         
-        # Find widget name
-        widget_name = None
-        for name, widget in self._monitored_widgets.items():
-            if widget is obj:
-                widget_name = name
-                break
-        
-        if widget_name is None:
+        widget_id = self._monitored_ids.get(obj)
+        if widget_id is None:
             return False
         
         # Record paint event timing
-        start_time = time.time()
+        start_time = time.perf_counter()
         
         # Let the original paint event proceed
         result = False  # Don't consume the event
         
         # Calculate paint duration (this is approximate since we can't easily hook into the actual painting)
-        end_time = time.time()
-        paint_duration_ms = (end_time - start_time) * 1000
+        paint_duration_ms = (time.perf_counter() - start_time) * 1000
         
         # Get paint region information
-        paint_event = event
-        if hasattr(paint_event, 'region'):
-            region = paint_event.region()
-            if region.isEmpty():
-                paint_region_size = (0, 0)
-            else:
-                rect = region.boundingRect()
-                paint_region_size = (rect.width(), rect.height())
+        if hasattr(event, 'region'):
+            rect = event.region().boundingRect()
+            width, height = rect.width(), rect.height()
         else:
             # Fallback to widget size
-            widget = self._monitored_widgets[widget_name]
-            paint_region_size = (widget.width(), widget.height())
-        
-        # Create paint event record
-        paint_event_record = PaintEvent(
-            timestamp=end_time,
-            widget_name=widget_name,
-            paint_region_size=paint_region_size,
-            paint_duration_ms=paint_duration_ms,
-            event_source="resize" if self._is_during_resize() else "update"
-        )
+            width, height = obj.width(), obj.height()
         
-        # Record the event
-        self._record_paint_event(paint_event_record)
+        self._record_paint(time.time(), widget_id, width, height, paint_duration_ms)
         
         return result
     
-    def _is_during_resize(self) -> bool:
-        """Check if we're currently during a resize operation (simplified)"""
-        # This could be enhanced to integrate with ResizeAnalyzer
-        return self._monitoring_enabled
-    
-    def _record_paint_event(self, paint_event: PaintEvent):
+    def _record_paint(self, timestamp: float, widget_id: int, width: int, height: int, duration_ms: float):
         """Record a paint event and update statistics"""
-        # Add to recent events
-        self._recent_events.append(paint_event)
-        
-        # Add to current session if active
-        if self._current_session:
-            self._current_session.events.append(paint_event)
-            
-            # Limit events per session
-            if len(self._current_session.events) > self.max_events_per_session:
-                self._current_session.events = self._current_session.events[-self.max_events_per_session:]
+        self._events.append(timestamp, duration_ms, widget_id, width, height)
+        self._widget_paint_counts[widget_id] += 1
         
-        # Update widget-specific tracking
-        widget_name = paint_event.widget_name
-        self._widget_paint_times[widget_name].append(paint_event.timestamp)
-        self._widget_paint_counts[widget_name] += 1
+        counter, histogram = self._widget_metrics[widget_id]
+        counter.inc()
+        histogram.observe(duration_ms)
         
         # Update frequency analysis
-        self._update_paint_frequency_analysis(widget_name, paint_event.timestamp)
+        widget_name = self._widget_names[widget_id]
+        self._update_paint_frequency_analysis(widget_name, timestamp)
         
         if self._debug_mode:
             print(f"PaintMonitor: {widget_name} paint event, "
-                  f"region: {paint_event.paint_region_size}, "
-                  f"duration: {paint_event.paint_duration_ms:.2f}ms")
+                  f"region: {(width, height)}, "
+                  f"duration: {duration_ms:.2f}ms")
         
-        self.paintEventRecorded.emit(paint_event)
+        if self._emit_event_signals:
+            self.paintEventRecorded.emit(self._make_event(timestamp, duration_ms, widget_id, width, height))
+    
+    def _make_event(self, timestamp: float, duration_ms: float, widget_id: int, width: int, height: int) -> PaintEvent:
+        return PaintEvent(
+            timestamp=timestamp,
+            widget_name=self._widget_names[widget_id],
+            paint_region_size=(width, height),
+            paint_duration_ms=duration_ms,
+            event_source="resize"  # Events are only recorded while a session is monitoring
+        )
     
     def _update_paint_frequency_analysis(self, widget_name: str, timestamp: float):
         """Update paint frequency analysis for a specific widget"""
@@ -285,52 +296,54 @@ class PaintMonitor(QtCore.QObject):
                     self.highPaintFrequency.emit(widget_name, frequency)
     
     def _analyze_paint_session(self, session: PaintSession) -> Dict:
-        """Generate comprehensive analysis of a paint session"""
-        if not session.events:
+        """Generate comprehensive analysis of a paint session from its range of the ring"""
+        end_sequence = session.end_sequence if session.end_sequence is not None else self._events.written
+        timestamps, durations, widget_ids, widths, heights = self._events.columns(
+            self.RING_COLUMNS, session.start_sequence, end_sequence
+        )
+        duration = (session.end_time or time.time()) - session.start_time
+        
+        if not timestamps:
             return {
                 'session_id': session.session_id,
-                'duration_seconds': session.end_time - session.start_time if session.end_time else 0,
+                'duration_seconds': duration if session.end_time else 0,
                 'total_paint_events': 0,
                 'widgets': {}
             }
         
-        duration = session.end_time - session.start_time if session.end_time else 0
-        
-        # Group events by widget
+        # Group event indices by widget
         widget_events = defaultdict(list)
-        for event in session.events:
-            widget_events[event.widget_name].append(event)
+        for index, widget_id in enumerate(widget_ids):
+            widget_events[widget_id].append(index)
         
         # Analyze each widget
         widget_analysis = {}
-        for widget_name, events in widget_events.items():
-            paint_durations = [e.paint_duration_ms for e in events]
-            paint_regions = [e.paint_region_size for e in events]
+        for widget_id, indices in widget_events.items():
+            paint_durations = [durations[i] for i in indices]
+            paint_regions = [(widths[i], heights[i]) for i in indices]
+            event_times = [timestamps[i] for i in indices]
             
             # Calculate timing statistics
-            event_intervals = []
-            for i in range(1, len(events)):
-                interval = events[i].timestamp - events[i-1].timestamp
-                event_intervals.append(interval)
+            event_intervals = [later - earlier for earlier, later in zip(event_times, event_times[1:])]
             
             # Calculate frequency
-            frequency = len(events) / duration if duration > 0 else 0
+            frequency = len(indices) / duration if duration > 0 else 0
             
             # Calculate region statistics
             total_pixels_painted = sum(w * h for w, h in paint_regions)
             avg_region_size = (
-                sum(w for w, h in paint_regions) / len(paint_regions) if paint_regions else 0,
-                sum(h for w, h in paint_regions) / len(paint_regions) if paint_regions else 0
+                sum(w for w, h in paint_regions) / len(paint_regions),
+                sum(h for w, h in paint_regions) / len(paint_regions)
             )
             
-            widget_analysis[widget_name] = {
-                'event_count': len(events),
+            widget_analysis[self._widget_names[widget_id]] = {
+                'event_count': len(indices),
                 'frequency_hz': frequency,
                 'paint_duration_stats': {
                     'total_ms': sum(paint_durations),
-                    'avg_ms': sum(paint_durations) / len(paint_durations) if paint_durations else 0,
-                    'min_ms': min(paint_durations) if paint_durations else 0,
-                    'max_ms': max(paint_durations) if paint_durations else 0
+                    'avg_ms': sum(paint_durations) / len(paint_durations),
+                    'min_ms': min(paint_durations),
+                    'max_ms': max(paint_durations)
                 },
                 'timing_stats': {
                     'min_interval_ms': min(event_intervals) * 1000 if event_intervals else 0,
@@ -340,25 +353,29 @@ class PaintMonitor(QtCore.QObject):
                 'region_stats': {
                     'total_pixels_painted': total_pixels_painted,
                     'avg_region_size': avg_region_size,
-                    'largest_region': max(paint_regions, key=lambda x: x[0] * x[1]) if paint_regions else (0, 0)
+                    'largest_region': max(paint_regions, key=lambda x: x[0] * x[1])
                 }
             }
         
+        total_events = end_sequence - session.start_sequence
         return {
             'session_id': session.session_id,
             'duration_seconds': duration,
-            'total_paint_events': len(session.events),
+            'total_paint_events': total_events,
+            'analyzed_paint_events': len(timestamps),  # Fewer than total if the ring wrapped
             'widgets': widget_analysis,
-            'overall_frequency_hz': len(session.events) / duration if duration > 0 else 0
+            'overall_frequency_hz': total_events / duration if duration > 0 else 0
         }
     
     def get_widget_statistics(self, widget_name: str = None) -> Dict:
         """Get paint statistics for a specific widget or all widgets"""
         if widget_name:
-            if widget_name not in self._widget_paint_counts:
+            widget_id = self._widget_ids.get(widget_name)
+            if widget_id is None or not self._widget_paint_counts[widget_id]:
                 return {}
             
-            paint_times = list(self._widget_paint_times[widget_name])
+            timestamps, widget_ids = self._events.columns(('timestamp', 'widget'))
+            paint_times = [t for t, w in zip(timestamps, widget_ids) if w == widget_id][-100:]
             if len(paint_times) >= 2:
                 time_span = paint_times[-1] - paint_times[0]
                 frequency = (len(paint_times) - 1) / time_span if time_span > 0 else 0
@@ -367,33 +384,42 @@ class PaintMonitor(QtCore.QObject):
             
             return {
                 'widget_name': widget_name,
-                'total_paint_events': self._widget_paint_counts[widget_name],
+                'total_paint_events': self._widget_paint_counts[widget_id],
                 'recent_frequency_hz': frequency,
                 'recent_event_count': len(paint_times)
             }
         else:
             # Return statistics for all widgets
             stats = {}
-            for widget_name in self._widget_paint_counts.keys():
-                stats[widget_name] = self.get_widget_statistics(widget_name)
+            for widget_id, widget_name in enumerate(self._widget_names):
+                if self._widget_paint_counts[widget_id]:
+                    stats[widget_name] = self.get_widget_statistics(widget_name)
             return stats
     
+    def get_current_frequency(self, window_seconds: float = 1.0) -> float:
+        """Paint events per second across all monitored widgets over the last window"""
+        timestamps = self._events.column('timestamp')
+        if not timestamps:
+            return 0.0
+        cutoff = time.time() - window_seconds
+        recent = sum(1 for timestamp in timestamps if timestamp >= cutoff)
+        return recent / window_seconds
+    
     def get_recent_events(self, widget_name: str = None, limit: int = 100) -> List[PaintEvent]:
         """Get recent paint events, optionally filtered by widget"""
-        events = list(self._recent_events)
-        
+        rows = self._events.rows()
         if widget_name:
-            events = [e for e in events if e.widget_name == widget_name]
-        
+            widget_id = self._widget_ids.get(widget_name)
+            rows = (row for row in rows if row[2] == widget_id)
+        events = [self._make_event(*row) for row in rows]
         return events[-limit:]
     
     def clear_data(self):
         """Clear all stored paint monitoring data"""
         self._sessions.clear()
         self._current_session = None
-        self._recent_events.clear()
-        self._widget_paint_times.clear()
-        self._widget_paint_counts.clear()
+        self._events.clear()
+        self._widget_paint_counts = [0] * len(self._widget_names)
         self._paint_frequency_windows.clear()
         self._session_counter = 0
         self._monitoring_enabled = False
@@ -405,4 +431,5 @@ class PaintMonitor(QtCore.QObject):
         """Get analysis for a specific session"""
         if session_id not in self._sessions:
             return {}
-        return self._analyze_paint_session(self._sessions[session_id]) 
\ No newline at end of file
+        session = self._sessions[session_id]
+        return session.analysis or self._analyze_paint_session(session) 
\ No newline at end of file
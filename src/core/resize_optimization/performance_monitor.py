@@ -7,11 +7,14 @@ for tracking resize operation performance in the TaskGrid component.
 
 import time
 import threading
-from collections import defaultdict, deque
+from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Callable
 from PySide6 import QtCore
 
+from ..performance.event_ring import EventRing
+from ..performance.metrics import get_registry
+
 
 @dataclass
 class PerformanceMetric:
@@ -24,12 +27,14 @@ class PerformanceMetric:
 
 @dataclass
 class PerformanceSession:
-    """Performance monitoring session data"""
+    """Performance monitoring session: a range of the metric ring plus its cached summary"""
     session_id: str
     start_time: float
+    start_sequence: int = 0
     end_time: Optional[float] = None
-    metrics: List[PerformanceMetric] = field(default_factory=list)
+    end_sequence: Optional[int] = None
     metadata: Dict = field(default_factory=dict)
+    summary: Optional[Dict] = None
 
 
 class PerformanceMonitor(QtCore.QObject):
@@ -37,11 +42,12 @@ class PerformanceMonitor(QtCore.QObject):
     Comprehensive performance monitoring for resize operations.
     
     Tracks timing, frequency, and performance characteristics of various
-    operations during window resize events.
+    operations during window resize events. Metrics are written into a
+    preallocated EventRing (no per-metric objects) and summarized on read.
     """
     
     # Signals for real-time monitoring
-    metricRecorded = QtCore.Signal(PerformanceMetric)
+    metricRecorded = QtCore.Signal(PerformanceMetric)  # Only emitted after set_metric_signals(True)
     sessionStarted = QtCore.Signal(str)  # session_id
     sessionEnded = QtCore.Signal(str, dict)  # session_id, summary
     
@@ -56,14 +62,21 @@ class PerformanceMonitor(QtCore.QObject):
         self._active_session: Optional[str] = None
         self._session_counter = 0
         
-        # Performance tracking
+        # Performance tracking; the newest max(1000, max_metrics_per_session) metrics are kept
         self._operation_timers: Dict[str, float] = {}
-        self._operation_counts: defaultdict = defaultdict(int)
-        self._recent_metrics: deque = deque(maxlen=1000)
+        self._metrics = EventRing(max(1000, max_metrics_per_session),
+                                  {'timestamp': 'd', 'duration_ms': 'd', 'operation': 'i'})
+        
+        # Operations are stored in the ring by id, each with its registry histogram
+        self._operation_ids: Dict[str, int] = {}
+        self._operation_names: List[str] = []
+        self._operation_counts: List[int] = []
+        self._operation_histograms: List = []
         
         # Configuration
         self._enabled = True
         self._debug_mode = False
+        self._emit_metric_signals = False
         
     def set_enabled(self, enabled: bool):
         """Enable or disable performance monitoring"""
@@ -77,6 +90,11 @@ class PerformanceMonitor(QtCore.QObject):
         with self._lock:
             self._debug_mode = debug
     
+    def set_metric_signals(self, enabled: bool):
+        """Emit metricRecorded for every metric (allocates a PerformanceMetric per metric)"""
+        with self._lock:
+            self._emit_metric_signals = enabled
+    
     def start_session(self, session_type: str = "resize", metadata: Dict = None) -> str:
         """
         Start a new performance monitoring session.
@@ -98,6 +116,7 @@ class PerformanceMonitor(QtCore.QObject):
             session = PerformanceSession(
                 session_id=session_id,
                 start_time=time.time(),
+                start_sequence=self._metrics.written,
                 metadata=metadata or {}
             )
             
@@ -137,10 +156,14 @@ class PerformanceMonitor(QtCore.QObject):
                 return {}
                 
             session = self._sessions[session_id]
-            session.end_time = time.time()
+            if session.end_time is None:
+                session.end_time = time.time()
+                session.end_sequence = self._metrics.written
             
-            # Generate summary
-            summary = self._generate_session_summary(session)
+            # Generate summary once; the session's metrics may later be overwritten in the ring
+            if session.summary is None:
+                session.summary = self._generate_session_summary(session)
+            summary = session.summary
             
             if session_id == self._active_session:
                 self._active_session = None
@@ -167,7 +190,7 @@ class PerformanceMonitor(QtCore.QObject):
             
         timer_id = f"{operation_name}_{time.time()}"
         with self._lock:
-            self._operation_timers[timer_id] = time.time()
+            self._operation_timers[timer_id] = time.perf_counter()
             
         return timer_id
     
@@ -177,7 +200,7 @@ class PerformanceMonitor(QtCore.QObject):
         
         Args:
             timer_id: Timer ID returned from start_operation
-            additional_data: Additional data to store with the metric
+            additional_data: Additional data passed to metricRecorded listeners
             
         Returns:
             PerformanceMetric object if successful, None otherwise
@@ -190,22 +213,18 @@ class PerformanceMonitor(QtCore.QObject):
                 return None
                 
             start_time = self._operation_timers.pop(timer_id)
-            end_time = time.time()
-            duration_ms = (end_time - start_time) * 1000
+            duration_ms = (time.perf_counter() - start_time) * 1000
             
             # Extract operation name from timer_id
             operation_name = timer_id.rsplit('_', 1)[0]
             
-            metric = PerformanceMetric(
-                timestamp=end_time,
+            timestamp = self.record_duration(operation_name, duration_ms, additional_data)
+            return PerformanceMetric(
+                timestamp=timestamp,
                 operation=operation_name,
                 duration_ms=duration_ms,
                 additional_data=additional_data or {}
             )
-            
-            # Record metric
-            self._record_metric(metric)
-            return metric
     
     def record_instant_metric(self, operation: str, value: float, additional_data: Dict = None):
         """
@@ -214,74 +233,87 @@ class PerformanceMonitor(QtCore.QObject):
         Args:
             operation: Operation name
             value: Metric value
-            additional_data: Additional data to store
+            additional_data: Additional data passed to metricRecorded listeners
         """
         if not self._enabled:
             return
             
-        metric = PerformanceMetric(
-            timestamp=time.time(),
-            operation=operation,
-            duration_ms=value,
-            additional_data=additional_data or {}
-        )
-        
-        self._record_metric(metric)
+        self.record_duration(operation, value, additional_data)
     
-    def _record_metric(self, metric: PerformanceMetric):
-        """Internal method to record a metric"""
+    def record_duration(self, operation: str, duration_ms: float, additional_data: Dict = None) -> float:
+        """Record one measured operation without creating objects; returns its timestamp"""
+        timestamp = time.time()
+        if not self._enabled:
+            return timestamp
         with self._lock:
-            # Add to active session if exists
-            if self._active_session and self._active_session in self._sessions:
-                session = self._sessions[self._active_session]
-                session.metrics.append(metric)
-                
-                # Limit metrics per session
-                if len(session.metrics) > self.max_metrics_per_session:
-                    session.metrics = session.metrics[-self.max_metrics_per_session:]
+            operation_id = self._operation_ids.get(operation)
+            if operation_id is None:
+                operation_id = self._register_operation(operation)
             
-            # Add to recent metrics for quick access
-            self._recent_metrics.append(metric)
-            
-            # Update operation counts
-            self._operation_counts[metric.operation] += 1
+            # Sessions are ranges of the ring, so one write serves the active session and recent metrics
+            self._metrics.append(timestamp, duration_ms, operation_id)
+            self._operation_counts[operation_id] += 1
+            self._operation_histograms[operation_id].observe(duration_ms)
             
             if self._debug_mode:
-                print(f"PerformanceMonitor: {metric.operation} took {metric.duration_ms:.2f}ms")
+                print(f"PerformanceMonitor: {operation} took {duration_ms:.2f}ms")
                 
-            self.metricRecorded.emit(metric)
+            if self._emit_metric_signals:
+                self.metricRecorded.emit(PerformanceMetric(
+                    timestamp=timestamp,
+                    operation=operation,
+                    duration_ms=duration_ms,
+                    additional_data=additional_data or {}
+                ))
+        return timestamp
+    
+    def _register_operation(self, operation: str) -> int:
+        operation_id = len(self._operation_names)
+        self._operation_ids[operation] = operation_id
+        self._operation_names.append(operation)
+        self._operation_counts.append(0)
+        self._operation_histograms.append(
+            get_registry().histogram("resize.operation_ms", {'operation': operation})
+        )
+        return operation_id
     
     def _generate_session_summary(self, session: PerformanceSession) -> Dict:
-        """Generate a summary of session performance"""
-        if not session.metrics:
+        """Generate a summary of session performance from its range of the ring"""
+        end_sequence = session.end_sequence if session.end_sequence is not None else self._metrics.written
+        durations, operation_ids = self._metrics.columns(
+            ('duration_ms', 'operation'), session.start_sequence, end_sequence
+        )
+        session_seconds = session.end_time - session.start_time if session.end_time else 0
+        
+        if not durations:
             return {
                 'session_id': session.session_id,
-                'duration_seconds': session.end_time - session.start_time if session.end_time else 0,
+                'duration_seconds': session_seconds,
                 'total_operations': 0,
                 'operations': {}
             }
         
         # Group metrics by operation
         operations = defaultdict(list)
-        for metric in session.metrics:
-            operations[metric.operation].append(metric.duration_ms)
+        for operation_id, duration_ms in zip(operation_ids, durations):
+            operations[operation_id].append(duration_ms)
         
         # Calculate statistics for each operation
         operation_stats = {}
-        for op_name, durations in operations.items():
-            operation_stats[op_name] = {
-                'count': len(durations),
-                'total_ms': sum(durations),
-                'avg_ms': sum(durations) / len(durations),
-                'min_ms': min(durations),
-                'max_ms': max(durations),
-                'frequency_hz': len(durations) / (session.end_time - session.start_time) if session.end_time else 0
+        for operation_id, op_durations in operations.items():
+            operation_stats[self._operation_names[operation_id]] = {
+                'count': len(op_durations),
+                'total_ms': sum(op_durations),
+                'avg_ms': sum(op_durations) / len(op_durations),
+                'min_ms': min(op_durations),
+                'max_ms': max(op_durations),
+                'frequency_hz': len(op_durations) / session_seconds if session_seconds else 0
             }
         
         return {
             'session_id': session.session_id,
-            'duration_seconds': session.end_time - session.start_time if session.end_time else 0,
-            'total_operations': len(session.metrics),
+            'duration_seconds': session_seconds,
+            'total_operations': end_sequence - session.start_sequence,
             'operations': operation_stats,
             'metadata': session.metadata
         }
@@ -291,22 +323,29 @@ class PerformanceMonitor(QtCore.QObject):
         with self._lock:
             if session_id not in self._sessions:
                 return {}
-            return self._generate_session_summary(self._sessions[session_id])
+            session = self._sessions[session_id]
+            return session.summary or self._generate_session_summary(session)
     
     def get_recent_metrics(self, operation: str = None, limit: int = 100) -> List[PerformanceMetric]:
         """Get recent metrics, optionally filtered by operation"""
         with self._lock:
-            metrics = list(self._recent_metrics)
-            
+            rows = self._metrics.rows()
             if operation:
-                metrics = [m for m in metrics if m.operation == operation]
-                
-            return metrics[-limit:]
+                operation_id = self._operation_ids.get(operation)
+                rows = [row for row in rows if row[2] == operation_id]
+            else:
+                rows = list(rows)
+            
+            return [
+                PerformanceMetric(timestamp=timestamp, operation=self._operation_names[operation_id],
+                                  duration_ms=duration_ms)
+                for timestamp, duration_ms, operation_id in rows[-limit:]
+            ]
     
     def get_operation_statistics(self) -> Dict:
         """Get overall operation statistics"""
         with self._lock:
-            return dict(self._operation_counts)
+            return {name: count for name, count in zip(self._operation_names, self._operation_counts) if count}
     
     def clear_data(self):
         """Clear all stored performance data"""
@@ -314,8 +353,8 @@ class PerformanceMonitor(QtCore.QObject):
             self._sessions.clear()
             self._active_session = None
             self._operation_timers.clear()
-            self._operation_counts.clear()
-            self._recent_metrics.clear()
+            self._operation_counts = [0] * len(self._operation_names)
+            self._metrics.clear()
             self._session_counter = 0
             
         if self._debug_mode:
@@ -330,15 +369,16 @@ class TimedOperation:
         self.monitor = monitor
         self.operation_name = operation_name
         self.additional_data = additional_data
-        self.timer_id = None
+        self.start_time = None
     
     def __enter__(self):
-        self.timer_id = self.monitor.start_operation(self.operation_name)
+        # Timed locally; no timer id or timer-table entry per operation
+        self.start_time = time.perf_counter()
         return self
     
     def __exit__(self, exc_type, exc_val, exc_tb):
-        if self.timer_id:
-            self.monitor.end_operation(self.timer_id, self.additional_data)
+        duration_ms = (time.perf_counter() - self.start_time) * 1000
+        self.monitor.record_duration(self.operation_name, duration_ms, self.additional_data)
 
 
 # Global performance monitor instance
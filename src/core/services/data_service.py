@@ -7,12 +7,28 @@ import sqlite3
 import threading
 import json
 import hashlib
+import logging
+import time
 from pathlib import Path
 from contextlib import contextmanager
 from typing import Dict, Any, List, Optional, Union, Tuple
 
 from ..db.db_schema import DB_FILE
+from ..db.connection_manager import get_connection_manager
 from ..optimization.multi_tier_cache import MultiTierCache
+from ..performance.metrics import get_registry
+
+
+logger = logging.getLogger(__name__)
+
+# Looked up once; observed on every database round trip
+_query_ms = get_registry().histogram("db.query_ms", {'source': 'data_service'})
+_command_ms = get_registry().histogram("db.command_ms", {'source': 'data_service'})
+_transaction_ms = get_registry().histogram("db.transaction_ms", {'source': 'data_service'})
+_transactions = {
+    outcome: get_registry().counter("db.transactions", {'outcome': outcome})
+    for outcome in ('committed', 'rolled_back')
+}
 
 
 class DataServiceError(Exception):
@@ -20,6 +36,16 @@ class DataServiceError(Exception):
     pass
 
 
+class UnitOfWork:
+    """State of one DataService.transaction() on the current thread"""
+    
+    def __init__(self, connection: sqlite3.Connection, event_bus=None):
+        self.connection = connection
+        self.event_bus = event_bus
+        self.depth = 1
+        self.commands = 0  # Data-changing commands executed so far
+
+
 class CacheManager:
     """Multi-tier cache manager with Memory + SQLite caching (no Redis)"""
     
@@ -87,8 +113,8 @@ class DataService:
         if db_path is None:
             db_path = DB_FILE
         self.db_path = Path(db_path)
-        self._connection_pool = {}  # Thread-local connections
-        self._transaction_depth = {}  # Track transaction depth per thread
+        self._connections = get_connection_manager(str(self.db_path))
+        self._units = threading.local()  # Open unit of work per thread
         
         # Initialize cache manager (no Redis)
         self.cache_manager = CacheManager()
@@ -119,35 +145,101 @@ class DataService:
     
     @contextmanager
     def _get_connection(self):
-        """Get thread-safe database connection"""
-        thread_id = self._get_thread_id()
+        """Get this thread's shared writer connection"""
+        try:
+            with self._connections.writer(row_factory=sqlite3.Row) as conn:  # Enable dict-like access
+                yield conn
+        except sqlite3.Error as e:
+            raise DataServiceError(f"Database connection failed: {e}")
+    
+    @contextmanager
+    def _get_read_connection(self):
+        """Get this thread's shared read-only connection"""
+        try:
+            with self._connections.reader(row_factory=sqlite3.Row) as conn:
+                yield conn
+        except sqlite3.Error as e:
+            raise DataServiceError(f"Database connection failed: {e}")
+    
+    def _current_unit(self) -> Optional[UnitOfWork]:
+        """This thread's open unit of work, if any"""
+        return getattr(self._units, 'unit', None)
+    
+    def _get_event_bus(self):
+        """Event bus whose emissions a transaction holds back (None without Qt)"""
+        try:
+            from ..events.event_bus import get_event_bus
+        except ImportError:
+            return None
+        return get_event_bus()
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Unit of work on this thread's writer connection.
         
-        # Check if we have an active transaction connection
-        if thread_id in self._connection_pool:
-            yield self._connection_pool[thread_id]
+        Every command inside the block runs on one connection in one
+        transaction: a single commit (one fsync) when the block exits, or a
+        rollback if it raises. The query cache is invalidated once at commit
+        instead of per command, and event bus emissions from this thread are
+        held back and delivered, coalesced, only after the commit succeeds.
+        Nested calls join the outer unit of work.
+        """
+        unit = self._current_unit()
+        if unit is not None:
+            unit.depth += 1
+            try:
+                yield unit
+            finally:
+                unit.depth -= 1
             return
         
-        # Create new connection for this operation
-        conn = None
-        try:
-            conn = sqlite3.connect(str(self.db_path), timeout=30.0)
-            conn.row_factory = sqlite3.Row  # Enable dict-like access
-            conn.execute("PRAGMA foreign_keys = ON")  # Enable foreign key constraints
-            yield conn
-        except sqlite3.Error as e:
-            if conn:
+        start = time.perf_counter()
+        with self._get_connection() as conn:
+            unit = UnitOfWork(conn, self._get_event_bus())
+            self._units.unit = unit
+            if unit.event_bus is not None:
+                unit.event_bus.begin_deferred()
+            committed = False
+            try:
+                if not conn.in_transaction:
+                    # Take the write lock up front so the unit cannot fail half way on SQLITE_BUSY
+                    conn.execute("BEGIN IMMEDIATE")
+                yield unit
+                conn.commit()
+                committed = True
+            except sqlite3.Error as e:
                 conn.rollback()
-            raise DataServiceError(f"Database connection failed: {e}")
-        finally:
-            if conn and thread_id not in self._connection_pool:
-                conn.close()
+                raise DataServiceError(f"Transaction failed: {e}")
+            except BaseException:
+                conn.rollback()
+                raise
+            finally:
+                self._units.unit = None
+                _transaction_ms.observe((time.perf_counter() - start) * 1000)
+                _transactions['committed' if committed else 'rolled_back'].inc()
+                if committed and unit.commands:
+                    self.cache_manager.clear_all_cache()
+                if unit.event_bus is not None:
+                    delivered = unit.event_bus.end_deferred(deliver=committed)
+                    logger.debug("Transaction %s: %d commands, %d events delivered",
+                                 "committed" if committed else "rolled back", unit.commands, delivered)
     
     def execute_query(self, query: str, params: Union[Tuple, Dict] = None, 
                      use_cache: bool = True, cache_ttl: int = None) -> List[Dict[str, Any]]:
         """
         Execute SELECT query with multi-tier caching support.
+        Inside a transaction the cache is bypassed so uncommitted rows are
+        read from the unit's connection and never cached.
         """
         params = params or ()
+        unit = self._current_unit()
+        if unit is not None:
+            try:
+                with _query_ms.time(), self._get_read_connection() as conn:
+                    return [dict(row) for row in conn.execute(query, params).fetchall()]
+            except sqlite3.Error as e:
+                raise DataServiceError(f"Query failed: {e}")
         
         # Convert dict params to tuple for caching
         if isinstance(params, dict):
@@ -163,7 +255,7 @@ class DataService:
         
         # Execute query
         try:
-            with self._get_connection() as conn:
+            with _query_ms.time(), self._get_read_connection() as conn:
                 cursor = conn.execute(query, params)
                 results = [dict(row) for row in cursor.fetchall()]
                 
@@ -179,17 +271,21 @@ class DataService:
     def execute_command(self, command: str, params: Union[Tuple, Dict] = None) -> int:
         """
         Execute INSERT/UPDATE/DELETE command with automatic cache invalidation.
+        Inside a transaction the commit and invalidation wait for the unit of work.
         """
         params = params or ()
+        unit = self._current_unit()
         
         try:
-            with self._get_connection() as conn:
+            if unit is not None:
+                with _command_ms.time():
+                    cursor = unit.connection.execute(command, params)
+                unit.commands += 1
+                return cursor.lastrowid if cursor.lastrowid else cursor.rowcount
+            
+            with _command_ms.time(), self._get_connection() as conn:
                 cursor = conn.execute(command, params)
-                
-                # Auto-commit if not in transaction
-                thread_id = self._get_thread_id()
-                if thread_id not in self._connection_pool:
-                    conn.commit()
+                conn.commit()
                 
                 result = cursor.lastrowid if cursor.lastrowid else cursor.rowcount
                 
@@ -213,7 +309,8 @@ class DataService:
                 **cache_stats
             },
             "database_path": str(self.db_path),
-            "connection_pool_size": len(self._connection_pool)
+            "in_transaction": self._current_unit() is not None,
+            "connection_stats": self._connections.get_stats()
         }
     
     def invalidate_analytics_cache(self):
@@ -0,0 +1,106 @@
+"""
+Warm-start snapshot for the Auditor Helper main window.
+
+At shutdown the main window writes a small JSON file next to the database
+holding the week list, the selected week and the first rows of its task grid.
+On the next launch the week sidebar and the task grid render from the
+snapshot straight away and then reconcile against the live database, so the
+first frame no longer waits for the week and task queries.
+
+The snapshot is only a rendering hint: it is discarded when its format or the
+schema version it was written against changes, and every value shown from it
+is replaced by live data as soon as the reconcile finishes.
+"""
+
+import json
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from ..db.database_config import get_database_directory
+from ..db.schema_migrations import SCHEMA_VERSION
+
+logger = logging.getLogger(__name__)
+
+SNAPSHOT_FILENAME = "startup_snapshot.json"
+SNAPSHOT_FORMAT = 1
+
+# Task rows kept for the selected week; enough to fill the visible grid
+MAX_SNAPSHOT_ROWS = 200
+
+
+@dataclass
+class StartupSnapshot:
+    """Week list, selected week and its leading task rows"""
+    weeks: List[Tuple[int, str]] = field(default_factory=list)
+    selected_week_id: Optional[int] = None
+    task_rows: List[tuple] = field(default_factory=list)
+    schema_version: int = SCHEMA_VERSION
+    saved_at: float = field(default_factory=time.time)
+
+    def has_week(self, week_id: Optional[int]) -> bool:
+        return week_id is not None and any(wid == week_id for wid, _ in self.weeks)
+
+    def to_dict(self) -> dict:
+        return {
+            'format': SNAPSHOT_FORMAT,
+            'schema_version': self.schema_version,
+            'saved_at': self.saved_at,
+            'weeks': [[wid, label] for wid, label in self.weeks],
+            'selected_week_id': self.selected_week_id,
+            'task_rows': [list(row) for row in self.task_rows[:MAX_SNAPSHOT_ROWS]],
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> 'StartupSnapshot':
+        weeks = [(int(wid), str(label)) for wid, label in data['weeks']]
+        selected_week_id = data.get('selected_week_id')
+        snapshot = cls(
+            weeks=weeks,
+            selected_week_id=int(selected_week_id) if selected_week_id is not None else None,
+            schema_version=int(data['schema_version']),
+            saved_at=float(data.get('saved_at', 0)),
+        )
+        if snapshot.has_week(snapshot.selected_week_id):
+            snapshot.task_rows = [tuple(row) for row in data.get('task_rows', [])]
+        else:
+            snapshot.selected_week_id = None
+        return snapshot
+
+
+def get_snapshot_path() -> str:
+    """Default snapshot location (next to the database)"""
+    return os.path.join(get_database_directory(), SNAPSHOT_FILENAME)
+
+
+def save_startup_snapshot(snapshot: StartupSnapshot, path: str = None) -> bool:
+    """Write the snapshot atomically. Returns True on success."""
+    path = path or get_snapshot_path()
+    temp_path = f"{path}.tmp"
+    try:
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(snapshot.to_dict(), f, separators=(',', ':'))
+        # A crash mid-write leaves the previous snapshot intact
+        os.replace(temp_path, path)
+        return True
+    except (OSError, TypeError, ValueError) as e:
+        logger.warning(f"Could not write startup snapshot: {e}")
+        return False
+
+
+def load_startup_snapshot(path: str = None) -> Optional[StartupSnapshot]:
+    """Load the snapshot, or None when missing, unreadable or written for another schema"""
+    path = path or get_snapshot_path()
+    if not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('format') != SNAPSHOT_FORMAT or data.get('schema_version') != SCHEMA_VERSION:
+            return None
+        return StartupSnapshot.from_dict(data)
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        logger.warning(f"Ignoring unreadable startup snapshot: {e}")
+        return None
@@ -6,6 +6,127 @@ Provides high-level task operations with automatic cache management.
 from typing import Any, Dict, List, Optional
 from datetime import datetime
 from .data_service import DataService
+from ..db.query_registry import register_query
+from ..db.task_search import DEFAULT_SEARCH_LIMIT, SEARCH_INDEX_EXISTS_SQL, build_search_query
+
+# Expression converting an HH:MM:SS duration column to seconds
+_DURATION_SECONDS_SQL = """CAST(substr(t.duration, 1, 2) AS INTEGER) * 3600 + 
+                   CAST(substr(t.duration, 4, 2) AS INTEGER) * 60 + 
+                   CAST(substr(t.duration, 7, 2) AS INTEGER)"""
+
+# Fixed-width task columns for list views and analytics. The free-text
+# feedback is left out of the hot row shape (and its cache entries) and is
+# loaded per task with get_task_feedback() when an editor needs it.
+TASK_LIST_COLUMNS = (
+    "id", "week_id", "attempt_id", "duration", "project_id", "project_name", "operation_id",
+    "time_limit", "date_audited", "score", "locale", "bonus_paid", "time_begin", "time_end",
+    "audited_timestamp",
+)
+_TASK_LIST_SELECT = ", ".join(TASK_LIST_COLUMNS)
+_TASK_LIST_SELECT_T = ", ".join(f"t.{column}" for column in TASK_LIST_COLUMNS)
+
+TASKS_BY_WEEK_SQL = register_query(
+    "task_dao.tasks_by_week",
+    f"SELECT {_TASK_LIST_SELECT} FROM tasks WHERE week_id = ? ORDER BY id"
+)
+
+# Full rows including feedback, for exports and copies
+TASKS_BY_WEEK_WITH_FEEDBACK_SQL = register_query(
+    "task_dao.tasks_by_week_with_feedback",
+    "SELECT * FROM tasks WHERE week_id = ? ORDER BY id"
+)
+
+TASK_FEEDBACK_SQL = register_query(
+    "task_dao.task_feedback",
+    "SELECT feedback FROM tasks WHERE id = ?"
+)
+
+TASKS_WITH_ANALYTICS_BY_WEEK_SQL = register_query("task_dao.tasks_with_analytics_by_week", f"""
+            SELECT t.*, w.week_label, w.is_bonus_week,
+                   CASE WHEN t.score >= 3 THEN 1 ELSE 0 END as is_high_score,
+                   {_DURATION_SECONDS_SQL} as duration_seconds
+            FROM tasks t 
+            JOIN weeks w ON t.week_id = w.id 
+            WHERE t.week_id = ?
+            ORDER BY t.id
+            """)
+
+# All-time listing: reads every task by design
+TASKS_WITH_ANALYTICS_SQL = register_query("task_dao.tasks_with_analytics", f"""
+            SELECT t.*, w.week_label, w.is_bonus_week,
+                   CASE WHEN t.score >= 3 THEN 1 ELSE 0 END as is_high_score,
+                   {_DURATION_SECONDS_SQL} as duration_seconds
+            FROM tasks t 
+            JOIN weeks w ON t.week_id = w.id 
+            ORDER BY t.date_audited DESC, t.id
+            """, allow_scan=('t',), allow_temp_btree=True)
+
+TASK_BY_ID_SQL = register_query(
+    "task_dao.task_by_id",
+    "SELECT * FROM tasks WHERE id = ?"
+)
+
+TASKS_BY_DATE_RANGE_SQL = register_query("task_dao.tasks_by_date_range", f"""
+        SELECT {_TASK_LIST_SELECT_T}, w.week_label 
+        FROM tasks t 
+        JOIN weeks w ON t.week_id = w.id 
+        WHERE t.date_audited BETWEEN ? AND ? 
+        ORDER BY t.date_audited DESC
+        """)
+
+TASKS_BY_PROJECT_SQL = register_query("task_dao.tasks_by_project", f"""
+        SELECT {_TASK_LIST_SELECT_T}, w.week_label 
+        FROM tasks t 
+        JOIN weeks w ON t.week_id = w.id 
+        WHERE t.project_name = ? 
+        ORDER BY t.date_audited DESC
+        """)
+
+HIGH_SCORE_TASKS_SQL = register_query("task_dao.high_score_tasks", f"""
+        SELECT {_TASK_LIST_SELECT_T}, w.week_label 
+        FROM tasks t 
+        JOIN weeks w ON t.week_id = w.id 
+        WHERE t.score >= ? 
+        ORDER BY t.score DESC, t.date_audited DESC
+        """)
+
+_TASK_STATISTICS_COLUMNS = """
+                COUNT(*) as total_tasks,
+                AVG(score) as avg_score,
+                MAX(score) as max_score,
+                MIN(score) as min_score,
+                COUNT(CASE WHEN score >= 3 THEN 1 END) as high_score_count,
+                SUM(bonus_paid) as total_bonus"""
+
+TASK_STATISTICS_BY_WEEK_SQL = register_query("task_dao.task_statistics_by_week", f"""
+            SELECT {_TASK_STATISTICS_COLUMNS}
+            FROM tasks 
+            WHERE week_id = ?
+            """)
+
+# All-time totals: reads every task by design (from a covering index)
+TASK_STATISTICS_SQL = register_query("task_dao.task_statistics", f"""
+            SELECT {_TASK_STATISTICS_COLUMNS}
+            FROM tasks
+            """, allow_scan=('tasks',))
+
+_TASKS_BY_DATE_COLUMNS = "duration, time_limit, score, project_name, locale, date_audited, time_begin, time_end"
+
+TASKS_BY_WEEK_AND_DATE_SQL = register_query("task_dao.tasks_by_week_and_date", f"""
+            SELECT {_TASKS_BY_DATE_COLUMNS}
+            FROM tasks
+            WHERE week_id = ? AND date_audited = ?
+            ORDER BY id
+            """)
+
+TASKS_BY_DATE_SQL = register_query("task_dao.tasks_by_date", f"""
+            SELECT {_TASKS_BY_DATE_COLUMNS}
+            FROM tasks
+            WHERE date_audited = ?
+            ORDER BY id
+            """)
+
+DELETE_TASK_SQL = register_query("task_dao.delete_task", "DELETE FROM tasks WHERE id = ?")
 
 
 class TaskDAO:
@@ -13,10 +134,12 @@ class TaskDAO:
     
     def __init__(self, data_service: DataService = None):
         self._data_service = data_service or DataService.get_instance()
+        self._search_index_available = None
     
-    def get_tasks_by_week(self, week_id: int, use_cache: bool = True) -> List[Dict[str, Any]]:
-        """Get all tasks for a week with caching"""
-        query = "SELECT * FROM tasks WHERE week_id = ? ORDER BY id"
+    def get_tasks_by_week(self, week_id: int, use_cache: bool = True,
+                          include_feedback: bool = False) -> List[Dict[str, Any]]:
+        """Get all tasks for a week with caching (feedback only when include_feedback is set)"""
+        query = TASKS_BY_WEEK_WITH_FEEDBACK_SQL if include_feedback else TASKS_BY_WEEK_SQL
         
         # Use longer cache TTL for task lists (they don't change frequently)
         return self._data_service.execute_query(
@@ -26,29 +149,10 @@ class TaskDAO:
     def get_tasks_with_analytics(self, week_id: int = None) -> List[Dict[str, Any]]:
         """Get tasks with additional analytics data"""
         if week_id:
-            query = """
-            SELECT t.*, w.week_label, w.is_bonus_week,
-                   CASE WHEN t.score >= 3 THEN 1 ELSE 0 END as is_high_score,
-                   CAST(substr(t.duration, 1, 2) AS INTEGER) * 3600 + 
-                   CAST(substr(t.duration, 4, 2) AS INTEGER) * 60 + 
-                   CAST(substr(t.duration, 7, 2) AS INTEGER) as duration_seconds
-            FROM tasks t 
-            JOIN weeks w ON t.week_id = w.id 
-            WHERE t.week_id = ?
-            ORDER BY t.id
-            """
+            query = TASKS_WITH_ANALYTICS_BY_WEEK_SQL
             params = (week_id,)
         else:
-            query = """
-            SELECT t.*, w.week_label, w.is_bonus_week,
-                   CASE WHEN t.score >= 3 THEN 1 ELSE 0 END as is_high_score,
-                   CAST(substr(t.duration, 1, 2) AS INTEGER) * 3600 + 
-                   CAST(substr(t.duration, 4, 2) AS INTEGER) * 60 + 
-                   CAST(substr(t.duration, 7, 2) AS INTEGER) as duration_seconds
-            FROM tasks t 
-            JOIN weeks w ON t.week_id = w.id 
-            ORDER BY t.date_audited DESC, t.id
-            """
+            query = TASKS_WITH_ANALYTICS_SQL
             params = ()
         
         # Cache analytics queries for longer (they're expensive)
@@ -58,45 +162,32 @@ class TaskDAO:
     
     def get_task_by_id(self, task_id: int) -> Optional[Dict[str, Any]]:
         """Get single task by ID"""
-        query = "SELECT * FROM tasks WHERE id = ?"
+        query = TASK_BY_ID_SQL
         results = self._data_service.execute_query(query, (task_id,))
         return results[0] if results else None
     
+    def get_task_feedback(self, task_id: int) -> str:
+        """Load one task's feedback text on demand (always read fresh, never cached)"""
+        results = self._data_service.execute_query(TASK_FEEDBACK_SQL, (task_id,), use_cache=False)
+        return (results[0]['feedback'] or "") if results else ""
+    
     def get_tasks_by_date_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Get tasks within date range"""
-        query = """
-        SELECT t.*, w.week_label 
-        FROM tasks t 
-        JOIN weeks w ON t.week_id = w.id 
-        WHERE t.date_audited BETWEEN ? AND ? 
-        ORDER BY t.date_audited DESC
-        """
+        query = TASKS_BY_DATE_RANGE_SQL
         return self._data_service.execute_query(
             query, (start_date, end_date), use_cache=True, cache_ttl=1800
         )
     
     def get_tasks_by_project(self, project_name: str) -> List[Dict[str, Any]]:
         """Get tasks by project name"""
-        query = """
-        SELECT t.*, w.week_label 
-        FROM tasks t 
-        JOIN weeks w ON t.week_id = w.id 
-        WHERE t.project_name = ? 
-        ORDER BY t.date_audited DESC
-        """
+        query = TASKS_BY_PROJECT_SQL
         return self._data_service.execute_query(
             query, (project_name,), use_cache=True, cache_ttl=1800
         )
     
     def get_high_score_tasks(self, min_score: int = 3) -> List[Dict[str, Any]]:
         """Get tasks with high scores"""
-        query = """
-        SELECT t.*, w.week_label 
-        FROM tasks t 
-        JOIN weeks w ON t.week_id = w.id 
-        WHERE t.score >= ? 
-        ORDER BY t.score DESC, t.date_audited DESC
-        """
+        query = HIGH_SCORE_TASKS_SQL
         return self._data_service.execute_query(
             query, (min_score,), use_cache=True, cache_ttl=3600
         )
@@ -150,7 +241,7 @@ class TaskDAO:
     
     def delete_task(self, task_id: int) -> bool:
         """Delete single task"""
-        command = "DELETE FROM tasks WHERE id = ?"
+        command = DELETE_TASK_SQL
         affected_rows = self._data_service.execute_command(command, (task_id,))
         
         if affected_rows > 0:
@@ -176,29 +267,10 @@ class TaskDAO:
     def get_task_statistics(self, week_id: int = None) -> Dict[str, Any]:
         """Get task statistics with caching"""
         if week_id:
-            query = """
-            SELECT 
-                COUNT(*) as total_tasks,
-                AVG(score) as avg_score,
-                MAX(score) as max_score,
-                MIN(score) as min_score,
-                COUNT(CASE WHEN score >= 3 THEN 1 END) as high_score_count,
-                SUM(bonus_paid) as total_bonus
-            FROM tasks 
-            WHERE week_id = ?
-            """
+            query = TASK_STATISTICS_BY_WEEK_SQL
             params = (week_id,)
         else:
-            query = """
-            SELECT 
-                COUNT(*) as total_tasks,
-                AVG(score) as avg_score,
-                MAX(score) as max_score,
-                MIN(score) as min_score,
-                COUNT(CASE WHEN score >= 3 THEN 1 END) as high_score_count,
-                SUM(bonus_paid) as total_bonus
-            FROM tasks
-            """
+            query = TASK_STATISTICS_SQL
             params = ()
         
         results = self._data_service.execute_query(
@@ -237,22 +309,32 @@ class TaskDAO:
     def get_tasks_by_date(self, date: str, week_id: int = None) -> List[Dict[str, Any]]:
         """Get tasks for a specific date, optionally filtered by week"""
         if week_id:
-            query = """
-            SELECT duration, time_limit, score, project_name, locale, date_audited, time_begin, time_end
-            FROM tasks
-            WHERE week_id = ? AND date_audited = ?
-            ORDER BY id
-            """
+            query = TASKS_BY_WEEK_AND_DATE_SQL
             params = (week_id, date)
         else:
-            query = """
-            SELECT duration, time_limit, score, project_name, locale, date_audited, time_begin, time_end
-            FROM tasks
-            WHERE date_audited = ?
-            ORDER BY id
-            """
+            query = TASKS_BY_DATE_SQL
             params = (date,)
         
         return self._data_service.execute_query(
             query, params, use_cache=True, cache_ttl=1800
-        ) 
\ No newline at end of file
+        ) 
+    
+    def search_tasks(self, search_term: str, week_id: int = None,
+                     limit: int = DEFAULT_SEARCH_LIMIT) -> List[Dict[str, Any]]:
+        """
+        Ranked prefix search over attempt ID, operation ID, project, locale and feedback.
+        Every word typed must prefix-match; best matches come first. Searches all
+        weeks unless week_id is given.
+        """
+        if self._search_index_available is None:
+            self._search_index_available = bool(
+                self._data_service.execute_query(SEARCH_INDEX_EXISTS_SQL, (), use_cache=False)
+            )
+        
+        search = build_search_query(search_term, week_id, limit, use_fts=self._search_index_available)
+        if search is None:
+            return []
+        
+        query, params = search
+        # Not cached: every keystroke is a new term and the index query is cheap
+        return self._data_service.execute_query(query, params, use_cache=False)
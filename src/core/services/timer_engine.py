@@ -0,0 +1,129 @@
+"""
+Monotonic timer engine for task timers.
+
+A timer's elapsed time is the time accumulated before its current run plus
+the monotonic time since the run started. Nothing is added per tick, so when
+the GUI thread is blocked (analysis refresh, export, import) and display
+ticks are lost, the next read still reports the true elapsed time. Wall-clock
+changes (NTP adjustments, DST, manual clock changes) do not affect it either.
+
+Reading a timer is a clock read and an addition, so one display tick can read
+any number of concurrently running timers:
+
+    engine = get_timer_engine()
+    engine.start(task_id, initial_seconds=duration_from_db)
+    ...
+    engine.elapsed_seconds(task_id)   # whole seconds, for display/persistence
+    engine.pause(task_id)
+"""
+
+import threading
+import time
+from typing import Callable, Dict, List, Optional
+
+
+class TaskTimer:
+    """Accumulated seconds plus the monotonic start of the current run"""
+
+    __slots__ = ('task_id', 'accumulated', 'started_at')
+
+    def __init__(self, task_id: int, initial_seconds: float = 0.0):
+        self.task_id = task_id
+        self.accumulated = float(initial_seconds)
+        self.started_at: Optional[float] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self.started_at is not None
+
+    def elapsed(self, now: float) -> float:
+        if self.started_at is None:
+            return self.accumulated
+        return self.accumulated + (now - self.started_at)
+
+
+class TimerEngine:
+    """Any number of task timers driven by one monotonic clock"""
+
+    def __init__(self, clock: Callable[[], float] = time.monotonic):
+        self._clock = clock
+        self._timers: Dict[int, TaskTimer] = {}
+        self._lock = threading.Lock()
+
+    def start(self, task_id: int, initial_seconds: Optional[float] = None) -> float:
+        """
+        Start or resume a task's timer; initial_seconds replaces the
+        accumulated time (e.g. the duration loaded from the database).
+        Returns the elapsed seconds at the start.
+        """
+        with self._lock:
+            now = self._clock()
+            timer = self._timers.get(task_id)
+            if timer is None:
+                timer = self._timers[task_id] = TaskTimer(task_id)
+            if initial_seconds is not None:
+                timer.accumulated = float(initial_seconds)
+                timer.started_at = now
+            elif timer.started_at is None:
+                timer.started_at = now
+            return timer.elapsed(now)
+
+    def pause(self, task_id: int) -> float:
+        """Stop accumulating; returns the elapsed seconds (0 for unknown tasks)"""
+        with self._lock:
+            timer = self._timers.get(task_id)
+            if timer is None:
+                return 0.0
+            now = self._clock()
+            timer.accumulated = timer.elapsed(now)
+            timer.started_at = None
+            return timer.accumulated
+
+    def set_elapsed(self, task_id: int, seconds: float):
+        """Overwrite a timer's elapsed time (manual edit, reset); a running timer keeps running"""
+        with self._lock:
+            timer = self._timers.get(task_id)
+            if timer is None:
+                timer = self._timers[task_id] = TaskTimer(task_id)
+            timer.accumulated = float(seconds)
+            if timer.started_at is not None:
+                timer.started_at = self._clock()
+
+    def remove(self, task_id: int) -> float:
+        """Forget a timer; returns its final elapsed seconds (0 for unknown tasks)"""
+        with self._lock:
+            timer = self._timers.pop(task_id, None)
+            return timer.elapsed(self._clock()) if timer is not None else 0.0
+
+    def elapsed(self, task_id: int) -> float:
+        """Elapsed seconds including the running part (0 for unknown tasks)"""
+        timer = self._timers.get(task_id)
+        return timer.elapsed(self._clock()) if timer is not None else 0.0
+
+    def elapsed_seconds(self, task_id: int) -> int:
+        """Whole elapsed seconds, as shown and persisted"""
+        return int(self.elapsed(task_id))
+
+    def is_running(self, task_id: int) -> bool:
+        timer = self._timers.get(task_id)
+        return timer is not None and timer.is_running
+
+    def running_task_ids(self) -> List[int]:
+        return [task_id for task_id, timer in list(self._timers.items()) if timer.is_running]
+
+    def snapshot(self) -> Dict[int, int]:
+        """Whole elapsed seconds of every running timer, read at one instant"""
+        now = self._clock()
+        return {task_id: int(timer.elapsed(now))
+                for task_id, timer in list(self._timers.items()) if timer.is_running}
+
+
+_timer_engine = None
+
+
+def get_timer_engine() -> TimerEngine:
+    """Get the global timer engine"""
+    global _timer_engine
+    if _timer_engine is None:
+        _timer_engine = TimerEngine()
+    return _timer_engine
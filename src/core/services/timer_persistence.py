@@ -0,0 +1,242 @@
+"""
+Timer persistence service for the Auditor Helper application.
+
+Running timers produce a duration update every second. Instead of writing
+each tick to the database, ticks are appended to a small append-only journal
+and coalesced in memory. Every flush interval the latest values per task are
+written with a single executemany in one transaction and the journal is
+truncated. If the application exits without flushing (crash, power loss,
+killed process), the journal is replayed on the next startup.
+
+Journal entries carry absolute values (full duration, clock times), never
+deltas, so replaying an entry that was already flushed is harmless.
+"""
+
+import json
+import logging
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, Optional
+
+from ..db.connection_manager import get_connection_manager
+from ..db.database_config import get_database_directory, get_database_path
+
+logger = logging.getLogger(__name__)
+
+JOURNAL_FILENAME = "timer_journal.jsonl"
+
+# Fields a timer may update, in the order used by FLUSH_SQL
+TIMER_FIELDS = ("duration", "time_begin", "time_end")
+
+# One statement per task; NULL parameters leave the column untouched
+FLUSH_SQL = """
+    UPDATE tasks SET
+        duration = COALESCE(?, duration),
+        time_begin = COALESCE(?, time_begin),
+        time_end = COALESCE(?, time_end)
+    WHERE id = ?
+"""
+
+
+def format_duration(duration_seconds: int) -> str:
+    """Format seconds as HH:MM:SS"""
+    duration_seconds = int(duration_seconds)
+    hours = duration_seconds // 3600
+    minutes = (duration_seconds % 3600) // 60
+    seconds = duration_seconds % 60
+    return f"{hours:02d}:{minutes:02d}:{seconds:02d}"
+
+
+class TimerPersistenceService:
+    """Write-ahead journal plus coalesced batch writes for timer updates"""
+
+    def __init__(self, db_path: str = None, journal_path: str = None,
+                 connection_factory: Callable = None, fsync: bool = False):
+        """
+        Args:
+            db_path: Database to write to (defaults to the application database)
+            journal_path: Journal file (defaults to timer_journal.jsonl next to the database)
+            connection_factory: Optional context manager factory yielding a sqlite3 connection
+            fsync: Also fsync each journal append (survives OS crashes, costs a disk sync per tick)
+        """
+        self.db_path = db_path or get_database_path()
+        self.journal_path = journal_path or os.path.join(get_database_directory(), JOURNAL_FILENAME)
+        self._connection_factory = connection_factory or self._default_connection
+        self._fsync = fsync
+
+        self._pending: Dict[int, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._journal = None
+
+        self.stats = {
+            'total_updates_queued': 0,
+            'total_batches_flushed': 0,
+            'total_rows_written': 0,
+            'replayed_entries': 0,
+            'last_flush_time': None,
+            'average_batch_size': 0
+        }
+
+    def _default_connection(self):
+        return get_connection_manager(self.db_path).writer()
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def record_duration(self, task_id: int, duration_seconds: int):
+        """Record the current total duration of a running timer"""
+        self._record(task_id, {'duration': format_duration(duration_seconds)})
+
+    def record_times(self, task_id: int, time_begin: str = None, time_end: str = None):
+        """Record time begin/end clock values for a task"""
+        fields = {}
+        if time_begin is not None:
+            fields['time_begin'] = time_begin
+        if time_end is not None:
+            fields['time_end'] = time_end
+        if fields:
+            self._record(task_id, fields)
+
+    def _record(self, task_id: int, fields: Dict[str, Any]):
+        with self._lock:
+            self._append_to_journal(task_id, fields)
+            self._pending.setdefault(task_id, {}).update(fields)
+            self.stats['total_updates_queued'] += 1
+
+    def _append_to_journal(self, task_id: int, fields: Dict[str, Any]):
+        entry = {'task_id': task_id, 'ts': time.time(), **fields}
+        try:
+            if self._journal is None:
+                self._journal = open(self.journal_path, 'a', encoding='utf-8')
+            self._journal.write(json.dumps(entry, separators=(',', ':')) + '\n')
+            self._journal.flush()
+            if self._fsync:
+                os.fsync(self._journal.fileno())
+        except OSError as e:
+            # The in-memory pending update still gets flushed; only crash recovery is affected
+            logger.warning(f"Timer journal append failed: {e}")
+
+    def _truncate_journal(self):
+        try:
+            if self._journal is not None:
+                self._journal.close()
+            self._journal = open(self.journal_path, 'w', encoding='utf-8')
+        except OSError as e:
+            self._journal = None
+            logger.warning(f"Timer journal truncate failed: {e}")
+
+    # ------------------------------------------------------------------
+    # Flushing
+    # ------------------------------------------------------------------
+
+    def has_pending(self) -> bool:
+        with self._lock:
+            return bool(self._pending)
+
+    def flush(self) -> int:
+        """
+        Write all pending updates in one transaction and truncate the journal.
+        Returns the number of task rows written (0 if nothing was pending or the write failed).
+        """
+        with self._lock:
+            if not self._pending:
+                return 0
+
+            rows = [
+                tuple(fields.get(name) for name in TIMER_FIELDS) + (task_id,)
+                for task_id, fields in self._pending.items()
+            ]
+
+            try:
+                with self._connection_factory() as conn:
+                    with conn:  # commit on success, rollback on error
+                        conn.executemany(FLUSH_SQL, rows)
+            except sqlite3.Error as e:
+                # Keep pending updates and the journal for the next attempt
+                logger.error(f"Failed to flush timer updates: {e}")
+                return 0
+
+            self._pending.clear()
+            self._truncate_journal()
+
+            self.stats['total_batches_flushed'] += 1
+            self.stats['total_rows_written'] += len(rows)
+            self.stats['last_flush_time'] = datetime.now()
+            self.stats['average_batch_size'] = (
+                self.stats['total_updates_queued'] / self.stats['total_batches_flushed']
+            )
+            return len(rows)
+
+    # ------------------------------------------------------------------
+    # Recovery
+    # ------------------------------------------------------------------
+
+    def replay_journal(self) -> int:
+        """
+        Re-apply journal entries left over from a previous run.
+        Returns the number of tasks recovered.
+        """
+        if not os.path.exists(self.journal_path):
+            return 0
+
+        recovered: Dict[int, Dict[str, Any]] = {}
+        entries = 0
+        with open(self.journal_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                try:
+                    entry = json.loads(line)
+                    task_id = int(entry['task_id'])
+                except (ValueError, KeyError, TypeError):
+                    # A torn final line from a crash mid-write
+                    continue
+                fields = {name: entry[name] for name in TIMER_FIELDS if name in entry}
+                recovered.setdefault(task_id, {}).update(fields)
+                entries += 1
+
+        if not recovered:
+            with self._lock:
+                self._truncate_journal()
+            return 0
+
+        with self._lock:
+            # Entries recorded during this run are newer than the journal contents
+            for task_id, fields in self._pending.items():
+                recovered.setdefault(task_id, {}).update(fields)
+            self._pending = recovered
+            self.stats['replayed_entries'] += entries
+
+        written = self.flush()
+        if written:
+            logger.info(f"Recovered {written} un-flushed timer updates from journal")
+        return written
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get persistence statistics"""
+        with self._lock:
+            stats = self.stats.copy()
+            stats['pending_tasks'] = len(self._pending)
+            return stats
+
+    def close(self):
+        """Flush pending updates and close the journal"""
+        self.flush()
+        with self._lock:
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+
+
+# Global instance
+_timer_persistence = None
+
+
+def get_timer_persistence() -> TimerPersistenceService:
+    """Get the global timer persistence service"""
+    global _timer_persistence
+    if _timer_persistence is None:
+        _timer_persistence = TimerPersistenceService()
+    return _timer_persistence
@@ -6,6 +6,101 @@ Provides high-level week operations with automatic cache management.
 from typing import Any, Dict, List, Optional
 from datetime import datetime, timedelta
 from .data_service import DataService
+from ..db.week_dates import with_week_dates
+from ..db.query_registry import register_query
+
+# Listings over the whole weeks table (one row per week) are allowed to scan it
+WEEKS_SQL = register_query("week_dao.all_weeks", "SELECT * FROM weeks ORDER BY id", allow_scan=('weeks',))
+
+WEEKS_CHRONOLOGICAL_SQL = register_query("week_dao.weeks_chronological", "SELECT * FROM weeks ORDER BY start_date, id", allow_scan=('weeks',))
+
+WEEKS_IN_RANGE_SQL = register_query("week_dao.weeks_in_range", """
+        SELECT * FROM weeks 
+        WHERE start_date <= ? AND end_date >= ? 
+        ORDER BY start_date
+        """)
+
+WEEK_CONTAINING_DATE_SQL = register_query("week_dao.week_containing_date", """
+        SELECT * FROM weeks 
+        WHERE start_date <= ? AND end_date >= ? 
+        ORDER BY start_date DESC 
+        LIMIT 1
+        """)
+
+WEEK_BY_ID_SQL = register_query("week_dao.week_by_id", "SELECT * FROM weeks WHERE id = ?")
+
+WEEK_BY_LABEL_SQL = register_query("week_dao.week_by_label", "SELECT * FROM weeks WHERE week_label = ?")
+
+BONUS_WEEKS_SQL = register_query("week_dao.bonus_weeks", "SELECT * FROM weeks WHERE is_bonus_week = 1 ORDER BY id", allow_scan=('weeks',))
+
+REGULAR_WEEKS_SQL = register_query("week_dao.regular_weeks", "SELECT * FROM weeks WHERE is_bonus_week = 0 ORDER BY id", allow_scan=('weeks',))
+
+WEEKS_WITH_TASK_COUNTS_SQL = register_query("week_dao.weeks_with_task_counts", """
+        SELECT w.*, 
+               COUNT(t.id) as task_count,
+               COALESCE(AVG(t.score), 0) as avg_score,
+               COALESCE(SUM(t.bonus_paid), 0) as total_bonus
+        FROM weeks w 
+        LEFT JOIN tasks t ON w.id = t.week_id 
+        GROUP BY w.id 
+        ORDER BY w.id
+        """, allow_scan=('w',))
+
+RECENT_WEEKS_SQL = register_query("week_dao.recent_weeks", "SELECT * FROM weeks ORDER BY id DESC LIMIT ?", allow_scan=('weeks',))
+
+WEEK_STATISTICS_SQL = register_query("week_dao.week_statistics", """
+        SELECT 
+            w.*,
+            COUNT(t.id) as task_count,
+            COALESCE(AVG(t.score), 0) as avg_score,
+            COALESCE(MAX(t.score), 0) as max_score,
+            COALESCE(MIN(t.score), 0) as min_score,
+            COUNT(CASE WHEN t.score >= 3 THEN 1 END) as high_score_count,
+            COALESCE(SUM(t.bonus_paid), 0) as total_bonus,
+            COUNT(DISTINCT t.project_name) as unique_projects,
+            COUNT(DISTINCT t.operation_id) as unique_operations
+        FROM weeks w 
+        LEFT JOIN tasks t ON w.id = t.week_id 
+        WHERE w.id = ?
+        GROUP BY w.id
+        """, allow_temp_btree=True)  # COUNT(DISTINCT) over one week's tasks
+
+WEEKS_BY_CREATED_AT_SQL = register_query("week_dao.weeks_by_created_at", """
+        SELECT * FROM weeks 
+        WHERE created_at BETWEEN ? AND ? 
+        ORDER BY created_at DESC
+        """, allow_scan=('weeks',))
+
+SEARCH_WEEKS_SQL = register_query("week_dao.search_weeks", """
+        SELECT * FROM weeks 
+        WHERE week_label LIKE ? 
+        ORDER BY id DESC
+        """, allow_scan=('weeks',))
+
+NEXT_WEEK_NUMBER_SQL = register_query("week_dao.next_week_number", "SELECT MAX(id) as max_id FROM weeks")
+
+WEEK_PERFORMANCE_SUMMARY_SQL = register_query("week_dao.week_performance_summary", """
+        SELECT 
+            w.id,
+            w.week_label,
+            w.is_bonus_week,
+            COUNT(t.id) as task_count,
+            COALESCE(AVG(t.score), 0) as avg_score,
+            COUNT(CASE WHEN t.score >= 3 THEN 1 END) as high_score_count,
+            COALESCE(SUM(t.bonus_paid), 0) as total_bonus,
+            ROUND(
+                CAST(COUNT(CASE WHEN t.score >= 3 THEN 1 END) AS FLOAT) / 
+                NULLIF(COUNT(t.id), 0) * 100, 2
+            ) as high_score_percentage
+        FROM weeks w 
+        LEFT JOIN tasks t ON w.id = t.week_id 
+        GROUP BY w.id
+        ORDER BY w.id DESC
+        """, allow_scan=('w',))
+
+WEEK_TASK_COUNT_SQL = register_query("week_dao.week_task_count", "SELECT COUNT(*) as count FROM tasks WHERE week_id = ?")
+
+DELETE_WEEK_TASKS_SQL = register_query("week_dao.delete_week_tasks", "DELETE FROM tasks WHERE week_id = ?")
 
 
 class WeekDAO:
@@ -16,56 +111,69 @@ class WeekDAO:
     
     def get_all_weeks(self, use_cache: bool = True) -> List[Dict[str, Any]]:
         """Get all weeks ordered by ID"""
-        query = "SELECT * FROM weeks ORDER BY id"
+        query = WEEKS_SQL
+        return self._data_service.execute_query(
+            query, (), use_cache=use_cache, cache_ttl=3600  # 1 hour
+        )
+    
+    def get_weeks_chronological(self, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """Get all weeks ordered by start date (weeks without dates first)"""
+        query = WEEKS_CHRONOLOGICAL_SQL
         return self._data_service.execute_query(
             query, (), use_cache=use_cache, cache_ttl=3600  # 1 hour
         )
     
+    def get_weeks_in_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+        """Get weeks overlapping the ISO date range [start_date, end_date]"""
+        query = WEEKS_IN_RANGE_SQL
+        return self._data_service.execute_query(
+            query, (end_date, start_date), use_cache=True, cache_ttl=1800
+        )
+    
+    def get_week_containing_date(self, date: str) -> Optional[Dict[str, Any]]:
+        """Get the most recent week whose date range contains an ISO date"""
+        query = WEEK_CONTAINING_DATE_SQL
+        results = self._data_service.execute_query(
+            query, (date, date), use_cache=True, cache_ttl=1800
+        )
+        return results[0] if results else None
+    
     def get_week_by_id(self, week_id: int) -> Optional[Dict[str, Any]]:
         """Get single week by ID"""
-        query = "SELECT * FROM weeks WHERE id = ?"
+        query = WEEK_BY_ID_SQL
         results = self._data_service.execute_query(query, (week_id,))
         return results[0] if results else None
     
     def get_week_by_label(self, week_label: str) -> Optional[Dict[str, Any]]:
         """Get week by label"""
-        query = "SELECT * FROM weeks WHERE week_label = ?"
+        query = WEEK_BY_LABEL_SQL
         results = self._data_service.execute_query(query, (week_label,))
         return results[0] if results else None
     
     def get_bonus_weeks(self) -> List[Dict[str, Any]]:
         """Get all bonus weeks"""
-        query = "SELECT * FROM weeks WHERE is_bonus_week = 1 ORDER BY id"
+        query = BONUS_WEEKS_SQL
         return self._data_service.execute_query(
             query, (), use_cache=True, cache_ttl=3600
         )
     
     def get_regular_weeks(self) -> List[Dict[str, Any]]:
         """Get all regular (non-bonus) weeks"""
-        query = "SELECT * FROM weeks WHERE is_bonus_week = 0 ORDER BY id"
+        query = REGULAR_WEEKS_SQL
         return self._data_service.execute_query(
             query, (), use_cache=True, cache_ttl=3600
         )
     
     def get_weeks_with_task_counts(self) -> List[Dict[str, Any]]:
         """Get weeks with task counts"""
-        query = """
-        SELECT w.*, 
-               COUNT(t.id) as task_count,
-               COALESCE(AVG(t.score), 0) as avg_score,
-               COALESCE(SUM(t.bonus_paid), 0) as total_bonus
-        FROM weeks w 
-        LEFT JOIN tasks t ON w.id = t.week_id 
-        GROUP BY w.id 
-        ORDER BY w.id
-        """
+        query = WEEKS_WITH_TASK_COUNTS_SQL
         return self._data_service.execute_query(
             query, (), use_cache=True, cache_ttl=1800  # 30 minutes
         )
     
     def get_recent_weeks(self, limit: int = 10) -> List[Dict[str, Any]]:
         """Get most recent weeks"""
-        query = "SELECT * FROM weeks ORDER BY id DESC LIMIT ?"
+        query = RECENT_WEEKS_SQL
         return self._data_service.execute_query(
             query, (limit,), use_cache=True, cache_ttl=1800
         )
@@ -92,6 +200,9 @@ class WeekDAO:
                 **kwargs
             }
         
+        # Derive the indexed start/end date columns from the label
+        with_week_dates(values)
+        
         # Add default values if not provided
         if 'created_at' not in values:
             values['created_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
@@ -120,6 +231,10 @@ class WeekDAO:
         if not kwargs:
             return True
         
+        # Keep start/end dates in sync when a week is relabelled
+        if 'week_label' in kwargs:
+            with_week_dates(kwargs)
+        
         set_clause = ', '.join([f"{key} = ?" for key in kwargs.keys()])
         command = f"UPDATE weeks SET {set_clause} WHERE id = ?"
         params = tuple(kwargs.values()) + (week_id,)
@@ -144,7 +259,7 @@ class WeekDAO:
             with self._data_service.transaction():
                 # Delete tasks first
                 self._data_service.execute_command(
-                    "DELETE FROM tasks WHERE week_id = ?", (week_id,)
+                    DELETE_WEEK_TASKS_SQL, (week_id,)
                 )
                 # Then delete week
                 affected_rows = self._data_service.execute_command(
@@ -152,7 +267,7 @@ class WeekDAO:
                 )
         else:
             # Check if week has tasks
-            task_count_query = "SELECT COUNT(*) as count FROM tasks WHERE week_id = ?"
+            task_count_query = WEEK_TASK_COUNT_SQL
             result = self._data_service.execute_query(task_count_query, (week_id,))
             if result and result[0]['count'] > 0:
                 raise ValueError(f"Cannot delete week {week_id}: contains {result[0]['count']} tasks. Use cascade=True to delete tasks as well.")
@@ -180,22 +295,7 @@ class WeekDAO:
     
     def get_week_statistics(self, week_id: int) -> Dict[str, Any]:
         """Get comprehensive statistics for a week"""
-        query = """
-        SELECT 
-            w.*,
-            COUNT(t.id) as task_count,
-            COALESCE(AVG(t.score), 0) as avg_score,
-            COALESCE(MAX(t.score), 0) as max_score,
-            COALESCE(MIN(t.score), 0) as min_score,
-            COUNT(CASE WHEN t.score >= 3 THEN 1 END) as high_score_count,
-            COALESCE(SUM(t.bonus_paid), 0) as total_bonus,
-            COUNT(DISTINCT t.project_name) as unique_projects,
-            COUNT(DISTINCT t.operation_id) as unique_operations
-        FROM weeks w 
-        LEFT JOIN tasks t ON w.id = t.week_id 
-        WHERE w.id = ?
-        GROUP BY w.id
-        """
+        query = WEEK_STATISTICS_SQL
         results = self._data_service.execute_query(
             query, (week_id,), use_cache=True, cache_ttl=1800
         )
@@ -203,22 +303,14 @@ class WeekDAO:
     
     def get_weeks_by_date_range(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
         """Get weeks created within date range"""
-        query = """
-        SELECT * FROM weeks 
-        WHERE created_at BETWEEN ? AND ? 
-        ORDER BY created_at DESC
-        """
+        query = WEEKS_BY_CREATED_AT_SQL
         return self._data_service.execute_query(
             query, (start_date, end_date), use_cache=True, cache_ttl=1800
         )
     
     def search_weeks(self, search_term: str) -> List[Dict[str, Any]]:
         """Search weeks by label"""
-        query = """
-        SELECT * FROM weeks 
-        WHERE week_label LIKE ? 
-        ORDER BY id DESC
-        """
+        query = SEARCH_WEEKS_SQL
         search_pattern = f"%{search_term}%"
         return self._data_service.execute_query(
             query, (search_pattern,), use_cache=True, cache_ttl=1800
@@ -226,31 +318,14 @@ class WeekDAO:
     
     def get_next_week_number(self) -> int:
         """Get the next week number for creating new weeks"""
-        query = "SELECT MAX(id) as max_id FROM weeks"
+        query = NEXT_WEEK_NUMBER_SQL
         results = self._data_service.execute_query(query, ())
         max_id = results[0]['max_id'] if results and results[0]['max_id'] else 0
         return max_id + 1
     
     def get_week_performance_summary(self) -> List[Dict[str, Any]]:
         """Get performance summary for all weeks"""
-        query = """
-        SELECT 
-            w.id,
-            w.week_label,
-            w.is_bonus_week,
-            COUNT(t.id) as task_count,
-            COALESCE(AVG(t.score), 0) as avg_score,
-            COUNT(CASE WHEN t.score >= 3 THEN 1 END) as high_score_count,
-            COALESCE(SUM(t.bonus_paid), 0) as total_bonus,
-            ROUND(
-                CAST(COUNT(CASE WHEN t.score >= 3 THEN 1 END) AS FLOAT) / 
-                NULLIF(COUNT(t.id), 0) * 100, 2
-            ) as high_score_percentage
-        FROM weeks w 
-        LEFT JOIN tasks t ON w.id = t.week_id 
-        GROUP BY w.id, w.week_label, w.is_bonus_week
-        ORDER BY w.id DESC
-        """
+        query = WEEK_PERFORMANCE_SUMMARY_SQL
         return self._data_service.execute_query(
             query, (), use_cache=True, cache_ttl=3600
         )
@@ -284,21 +359,24 @@ class WeekDAO:
         # Create new week
         week_data = dict(original_week)
         week_data.pop('id')
+        week_data.pop('start_date', None)
+        week_data.pop('end_date', None)
         week_data['week_label'] = new_label
         week_data['created_at'] = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
         
-        new_week_id = self.create_week(**week_data)
-        
-        # Copy tasks if requested
-        if copy_tasks and new_week_id:
-            from .task_dao import TaskDAO
-            task_dao = TaskDAO(self._data_service)
-            
-            # Get all tasks from original week
-            original_tasks = task_dao.get_tasks_by_week(week_id)
+        # One unit of work: the week and its copied tasks commit together
+        with self._data_service.transaction():
+            new_week_id = self.create_week(**week_data)
             
-            # Copy each task to new week
-            with self._data_service.transaction():
+            # Copy tasks if requested
+            if copy_tasks and new_week_id:
+                from .task_dao import TaskDAO
+                task_dao = TaskDAO(self._data_service)
+                
+                # Get all tasks from original week
+                original_tasks = task_dao.get_tasks_by_week(week_id, include_feedback=True)
+                
+                # Copy each task to new week
                 for task in original_tasks:
                     task_data = dict(task)
                     task_data.pop('id')
@@ -29,6 +29,10 @@ def get_icon_path(icon_filename):
     
     return icon_path
 
+def get_profiles_dir():
+    """Directory for sampling profiler output (collapsed-stack files)"""
+    return os.path.join(get_app_data_dir(), 'profiles')
+
 # Settings file in consistent location
 def get_settings_file_path():
     """Get the correct path for settings file - in root directory"""
@@ -88,6 +92,14 @@ DEFAULT_GLOBAL_SETTINGS = {
         "auto_suggest_new_week": True,
         "default_payrate": 25.3,
         "auto_edit_new_tasks": False
+    },
+    "performance_settings": {
+        # Python/NumPy/Rust crossover sizes written by performance/calibrate_engines.py
+        "engine_thresholds": {},
+        # Sampling profiler interval (Options > Diagnostics, Ctrl+Shift+P)
+        "sampling_interval_ms": 5,
+        # Seconds without input before background database maintenance runs
+        "db_maintenance_idle_seconds": 60
     }
 }
 
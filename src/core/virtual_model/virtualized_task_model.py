@@ -2,7 +2,7 @@
 from PySide6 import QtCore, QtGui
 import sqlite3
 from collections import OrderedDict
-from ..db.db_connection_pool import get_db_connection
+from ..db.db_connection_pool import get_db_connection, get_db_read_connection
 
 DB_FILE = "tasks.db"
 
@@ -254,7 +254,7 @@ class VirtualizedTaskTableModel(QtCore.QAbstractTableModel):
         """Get complete task data for a specific task ID"""
         if self.current_week_id is None:
             return None
-        with get_db_connection() as conn:
+        with get_db_read_connection() as conn:
             c = conn.cursor()
             c.execute(
                 """SELECT id, attempt_id, duration, project_id, project_name,
@@ -276,7 +276,7 @@ class VirtualizedTaskTableModel(QtCore.QAbstractTableModel):
                 return row + 1  # 1-based indexing
         
         # If not found in cache, query database
-        with get_db_connection() as conn:
+        with get_db_read_connection() as conn:
             c = conn.cursor()
             c.execute(
                 """SELECT ROW_NUMBER() OVER (ORDER BY id) as row_num
@@ -311,7 +311,7 @@ class VirtualizedTaskTableModel(QtCore.QAbstractTableModel):
     def _load_chunk(self, start_row, count):
         if self.current_week_id is None:
             return
-        with get_db_connection() as conn:
+        with get_db_read_connection() as conn:
             c = conn.cursor()
             c.execute(
                 """SELECT id, attempt_id, duration, project_id, project_name,
@@ -327,7 +327,7 @@ class VirtualizedTaskTableModel(QtCore.QAbstractTableModel):
     def _get_total_count(self, week_id):
         if week_id is None:
             return 0
-        with get_db_connection() as conn:
+        with get_db_read_connection() as conn:
             c = conn.cursor()
             c.execute("SELECT COUNT(*) FROM tasks WHERE week_id=?", (week_id,))
             return c.fetchone()[0]
@@ -1,7 +1,7 @@
 import sys
 import os
 from PySide6 import QtCore, QtWidgets, QtGui
-from PySide6.QtCore import QPropertyAnimation, QTimer
+from PySide6.QtCore import QPropertyAnimation
 import pathlib
 import logging
 
@@ -12,16 +12,15 @@ from core.optimization.lazy_imports import setup_scientific_libraries, preload_c
 # Removed debug logging - no longer needed
 
 # Import our new components
+# The analysis stack (QtCharts), importers/exporters, the options dialog and the
+# updater are imported on first use, keeping them off the startup path
 from ui.week_widget import WeekWidget
 from ui.qml_task_grid import QMLTaskGrid
-from analysis.analysis_widget import AnalysisWidget
-from core.db.db_schema import run_all_migrations
-from core.db.export_data import export_week_to_csv, export_all_weeks_to_excel
-from core.db.import_data import main_import
 from core.utils.toaster import ToasterManager
 from ui.theme_manager import ThemeManager
-from ui.options import OptionsDialog
+from ui.theme_styles import ANALYSIS_SCOPE
 from ui.collapsible_week_sidebar import CollapsibleWeekSidebar
+from ui.bonus_indicator import BonusIndicatorModel, BONUS_DISABLED, BONUS_ON
 from core.settings.global_settings import get_icon_path
 
 # Import Data Service Layer components
@@ -65,6 +64,9 @@ class MainWindow(QtWidgets.QMainWindow):
         # Initialize the database and run all migrations
         self._run_optimized_migrations()
         
+        # Recover timer updates that were journaled but not flushed last session
+        self._replay_timer_journal()
+        
         # Initialize Event Bus
         self.event_bus = get_event_bus()
         
@@ -111,8 +113,11 @@ class MainWindow(QtWidgets.QMainWindow):
         
         main_layout.addWidget(top_bar)
         
+        # Week list, selected week and its rows from the last session
+        self.startup_snapshot = self._load_startup_snapshot()
+        
         # Initialize week widget - now contained in a custom collapsible sidebar
-        self.week_widget = WeekWidget()
+        self.week_widget = WeekWidget(snapshot=self.startup_snapshot)
         self.week_widget.main_window = self  # Set the main window reference
         
         # Create the custom collapsible week sidebar
@@ -224,16 +229,26 @@ class MainWindow(QtWidgets.QMainWindow):
         # Initial state
         self.current_week_id = None
         
+        # Cached bonus indicator state, updated from week/settings events
+        from core.settings.global_settings import global_settings
+        self.bonus_indicator = BonusIndicatorModel(
+            self._load_week_bonus_flag, global_settings.is_global_bonus_enabled()
+        )
+        self._applied_bonus_state = None
+        
         # Apply theme now that all UI elements are created
+        self.theme_manager.register_window(self)
+        self.theme_manager.add_listener(self._on_theme_changed)
         self.apply_theme()
         
         # Update bonus button style on init
         self.update_bonus_button_style() # Initial style update
         
-        # Set up timer to update bonus button style periodically
-        self.bonus_update_timer = QTimer()
-        self.bonus_update_timer.timeout.connect(self.update_bonus_button_style)
-        self.bonus_update_timer.start(5000)  # Update every 5 seconds
+        # Show last session's week from the snapshot; the grid reconciles in the background
+        self._restore_startup_snapshot()
+        
+        # ANALYZE, checkpoints and cache trimming run later, while the user is idle
+        self._start_db_maintenance()
     
     def _init_redis_and_data_service(self):
         """Initialize multi-tier cache system (no Redis dependencies)"""
@@ -283,6 +298,12 @@ class MainWindow(QtWidgets.QMainWindow):
         # Style the bonus toggle button
         self.update_bonus_button_style()
 
+    def _on_theme_changed(self, dark_mode):
+        """Keep the window in sync when the theme is switched from the options dialog"""
+        self.dark_mode = dark_mode
+        self.apply_theme()
+        self.update_theme_button()
+
     def toggle_theme(self):
         """Toggle between dark and light mode"""
         self.dark_mode = not self.dark_mode
@@ -353,6 +374,14 @@ class MainWindow(QtWidgets.QMainWindow):
         self.toggle_custom_week_sidebar_action = QtGui.QAction("Toggle Week Sidebar", self)
         self.toggle_custom_week_sidebar_action.triggered.connect(self.toggle_week_sidebar)
         view_menu.addAction(self.toggle_custom_week_sidebar_action)
+        
+        # Sampling profiler hotkey (also on the Diagnostics options page)
+        view_menu.addSeparator()
+        profiler_action = QtGui.QAction("Start/Stop Sampling Profiler", self)
+        profiler_action.setShortcut(QtGui.QKeySequence("Ctrl+Shift+P"))
+        profiler_action.setShortcutContext(QtCore.Qt.ApplicationShortcut)
+        profiler_action.triggered.connect(self.toggle_sampling_profiler)
+        view_menu.addAction(profiler_action)
 
     def create_dock_widgets(self):
         # This method is now empty as week_dock is no longer used
@@ -364,6 +393,10 @@ class MainWindow(QtWidgets.QMainWindow):
         self.event_bus.connect_handler(EventType.WEEK_CHANGED, self.on_week_changed_event)
         self.event_bus.connect_handler(EventType.WEEK_CREATED, self.on_week_created_event)
         self.event_bus.connect_handler(EventType.WEEK_DELETED, self.on_week_deleted_event)
+        self.event_bus.connect_handler(EventType.WEEK_UPDATED, self.on_week_updated_event)
+        
+        # Application events
+        self.event_bus.connect_handler(EventType.SETTINGS_CHANGED, self.on_settings_changed_event)
         
         # Task-related events
         self.event_bus.connect_handler(EventType.TASK_CREATED, self.on_task_created_event)
@@ -397,6 +430,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.analysis_widget.refresh_week_combo()
         
         # Update bonus button
+        self.bonus_indicator.set_current_week(week_id)
         self.update_bonus_button_style()
 
     def on_week_created_event(self, event_data):
@@ -422,6 +456,32 @@ class MainWindow(QtWidgets.QMainWindow):
         # Show notification if not already shown by the source component
         if event_data.source != 'MainWindow':
             self.toaster_manager.show_info(f"Week '{week_label}' deleted", "Week Deleted", 3000)
+        
+        # Forget cached bonus state for the deleted week
+        week_id = event_data.data.get('week_id')
+        self.bonus_indicator.invalidate_week(week_id)
+        if week_id is not None and week_id == self.bonus_indicator.current_week_id:
+            self.bonus_indicator.set_current_week(None)
+        self.update_bonus_button_style()
+
+    def on_week_updated_event(self, event_data):
+        """Handle week updated events from event bus"""
+        week_id = event_data.data.get('week_id')
+        
+        if event_data.data.get('field_name') == 'is_bonus_week':
+            # The new bonus flag is part of the event, no need to query the week
+            self.bonus_indicator.set_week_bonus(week_id, event_data.data.get('value'))
+        else:
+            # Other week settings changed, reload the bonus flag on next read
+            self.bonus_indicator.invalidate_week(week_id)
+        
+        self.update_bonus_button_style()
+
+    def on_settings_changed_event(self, event_data):
+        """Handle application settings changed events from event bus"""
+        from core.settings.global_settings import global_settings
+        self.bonus_indicator.set_global_enabled(global_settings.is_global_bonus_enabled())
+        self.update_bonus_button_style()
 
     def on_task_created_event(self, event_data):
         """Handle task created events from event bus"""
@@ -494,6 +554,7 @@ class MainWindow(QtWidgets.QMainWindow):
             self.analysis_widget.refresh_week_combo()
         
         # Update bonus button for the new week
+        self.bonus_indicator.set_current_week(week_id)
         self.update_bonus_button_style()
         
         # Update office hour count display
@@ -572,9 +633,12 @@ class MainWindow(QtWidgets.QMainWindow):
                 if success:
                     self.logger.info(f"Updated week {self.current_week_id} bonus status to {new_bonus_status}")
                     
-                    # Update button state and style
-                    self.bonus_toggle_btn.setChecked(new_bonus_status)
-                    self.update_bonus_button_style()
+                    # Notify listeners; the bonus button updates from this event
+                    self.event_bus.emit_event(
+                        EventType.WEEK_UPDATED,
+                        {'week_id': self.current_week_id, 'field_name': 'is_bonus_week', 'value': new_bonus_status},
+                        'MainWindow'
+                    )
                     
                     # Show feedback to user
                     status_text = "enabled" if new_bonus_status else "disabled"
@@ -593,6 +657,8 @@ class MainWindow(QtWidgets.QMainWindow):
                         "Update Failed",
                         3000
                     )
+                    # Restore the button's checked state
+                    self.update_bonus_button_style()
         except DataServiceError as e:
             self.logger.error(f"Error toggling week bonus: {e}")
             self.toaster_manager.show_error(
@@ -600,15 +666,35 @@ class MainWindow(QtWidgets.QMainWindow):
                 "Error",
                 5000
             )
+            self.update_bonus_button_style()
+    
+    def _load_week_bonus_flag(self, week_id):
+        """Load the is_bonus_week flag of a week for the bonus indicator cache"""
+        try:
+            week_data = self.week_dao.get_week_by_id(week_id)
+            if week_data:
+                return bool(week_data.get('is_bonus_week', 0))
+        except DataServiceError as e:
+            self.logger.error(f"Error getting week bonus status: {e}")
+        return None
     
     def update_bonus_button_style(self):
-        """Update the bonus button styling based on current state"""
-        if not hasattr(self, 'bonus_toggle_btn'):
+        """Update the bonus button styling when the cached bonus state changes"""
+        if not hasattr(self, 'bonus_toggle_btn') or not hasattr(self, 'bonus_indicator'):
+            return
+        
+        state = self.bonus_indicator.state
+        
+        # Keep the checkable button in sync even if a click was rejected
+        if self.bonus_toggle_btn.isChecked() != (state == BONUS_ON):
+            self.bonus_toggle_btn.setChecked(state == BONUS_ON)
+        
+        if state == self._applied_bonus_state:
+            # Nothing visible changed, avoid re-applying the stylesheet
             return
+        self._applied_bonus_state = state
             
-        # Check if global bonus is enabled first
-        from core.settings.global_settings import global_settings
-        if not global_settings.is_global_bonus_enabled():
+        if state == BONUS_DISABLED:
             # Global bonus disabled
             self.bonus_toggle_btn.setText("Global: DISABLED")
             self.bonus_toggle_btn.setStyleSheet(
@@ -619,21 +705,9 @@ class MainWindow(QtWidgets.QMainWindow):
             self.bonus_toggle_btn.setToolTip("Global bonus system is disabled. Enable in Preferences first.")
             return
         
-        # Global bonus is enabled, check current week status
-        is_bonus_week = False
-        if self.current_week_id is not None:
-            try:
-                week_data = self.week_dao.get_week_by_id(self.current_week_id)
-                if week_data:
-                    is_bonus_week = bool(week_data.get('is_bonus_week', 0))
-            except DataServiceError as e:
-                self.logger.error(f"Error getting week bonus status: {e}")
-                # Continue with default (False) value
-        
         self.bonus_toggle_btn.setEnabled(True)
-        self.bonus_toggle_btn.setChecked(is_bonus_week)
         
-        if is_bonus_week:
+        if state == BONUS_ON:
             self.bonus_toggle_btn.setText("Global: ON")
             self.bonus_toggle_btn.setStyleSheet(
                 "QPushButton { background-color: #007bff; color: white; border-radius: 4px; }" # A shade of blue
@@ -669,6 +743,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         if filename:
             try:
+                from core.db.export_data import export_week_to_csv
                 export_week_to_csv(self.current_week_id, filename)
                 # Show success toaster
                 self.toaster_manager.show_info(f"Week exported successfully to {filename}", "Export Successful", 5000)
@@ -685,6 +760,7 @@ class MainWindow(QtWidgets.QMainWindow):
         
         if filename:
             try:
+                from core.db.export_data import export_all_weeks_to_excel
                 export_all_weeks_to_excel(filename)
                 # Show success toaster
                 self.toaster_manager.show_info(f"All weeks exported successfully to {filename}", "Export Successful", 5000)
@@ -709,6 +785,7 @@ class MainWindow(QtWidgets.QMainWindow):
                 QtWidgets.QApplication.processEvents()
                 
                 # Execute the import
+                from core.db.import_data import main_import
                 main_import(filename)
                 
                 # Close the progress dialog
@@ -732,25 +809,73 @@ class MainWindow(QtWidgets.QMainWindow):
         """Show the AnalysisWidget as a separate window (lazy initialization)"""
         if self.analysis_widget is None:
             # Create the AnalysisWidget only when first needed
+            from analysis.analysis_widget import AnalysisWidget
             self.analysis_widget = AnalysisWidget()
+            self.theme_manager.register_window(self.analysis_widget, ANALYSIS_SCOPE)
+        else:
+            # Restyle only if the theme changed while the window was closed
+            self.theme_manager.refresh_window(self.analysis_widget)
         self.analysis_widget.show()
 
     def toggle_week_sidebar(self):
         """Toggle the visibility of the WeekWidget sidebar with animation"""
         self.collapsible_week_sidebar.toggle()
 
+    def toggle_sampling_profiler(self):
+        """Start the sampling profiler, or stop it and save a flame-graph file"""
+        from core.performance.sampling_profiler import toggle_profiling
+        from core.settings.global_settings import global_settings, get_profiles_dir
+        try:
+            interval_ms = global_settings.get_setting("performance_settings.sampling_interval_ms", 5)
+            path = toggle_profiling(get_profiles_dir(), interval_ms)
+        except OSError as e:
+            self.logger.error(f"Error writing profile: {e}")
+            self.toaster_manager.show_error(f"Could not write profile: {e}", "Profiler", 5000)
+            return
+        if path is None:
+            self.toaster_manager.show_info("Press Ctrl+Shift+P again to stop", "Profiling Started", 3000)
+        else:
+            self.toaster_manager.show_info(f"Profile saved to {path}", "Profiling Stopped", 5000)
+    
     def show_preferences(self):
         """Show the preferences dialog"""
+        from ui.options import OptionsDialog
         options_dialog = OptionsDialog(self)
         options_dialog.exec()
     
     def closeEvent(self, event):
         """Handle application close event to clean up resources"""
         try:
+            # Let components persist state while the database is still open
+            self.event_bus.emit_event(EventType.APP_SHUTDOWN, {}, 'MainWindow')
+            
             # Clean up TaskGrid diagnostics
             if hasattr(self, 'task_grid') and self.task_grid:
                 self.task_grid.cleanup_diagnostics()
             
+            # Warm-start snapshot for the next launch
+            self._save_startup_snapshot()
+            
+            # Stop idle maintenance and let running backups finish before connections are closed
+            if getattr(self, 'db_maintenance', None):
+                self.db_maintenance.stop()
+            if hasattr(self, 'week_widget') and self.week_widget:
+                self.week_widget.wait_for_backups()
+            
+            # Flush journaled timer updates
+            try:
+                from core.services.timer_persistence import get_timer_persistence
+                get_timer_persistence().close()
+            except Exception as timer_error:
+                self.logger.error(f"Error flushing timer updates: {timer_error}")
+            
+            # Close shared database connections
+            try:
+                from core.db.connection_manager import close_all_connections
+                close_all_connections()
+            except Exception as db_error:
+                self.logger.error(f"Error closing database connections: {db_error}")
+            
             # Multi-tier cache cleanup (no Redis dependencies)
             try:
                 if hasattr(self, 'data_service') and hasattr(self.data_service, 'cache_manager'):
@@ -783,12 +908,81 @@ class MainWindow(QtWidgets.QMainWindow):
             # Fallback to original migrations
             self.logger.info("🔄 Falling back to original migration system")
             try:
+                from core.db.db_schema import run_all_migrations
                 run_all_migrations()
                 self.logger.info("✅ Database migrations completed successfully")
             except Exception as fallback_error:
                 self.logger.error(f"❌ Database migration failed: {fallback_error}")
                 raise
     
+    def _load_startup_snapshot(self):
+        """Load the warm-start snapshot written at the last shutdown"""
+        try:
+            from core.services.startup_snapshot import load_startup_snapshot
+            return load_startup_snapshot()
+        except Exception as e:
+            self.logger.warning(f"Startup snapshot unavailable: {e}")
+            return None
+    
+    def _restore_startup_snapshot(self):
+        """Render the snapshot's selected week before its rows are loaded from the database"""
+        snapshot = self.startup_snapshot
+        if snapshot is None or not snapshot.has_week(snapshot.selected_week_id):
+            return
+        self.task_grid.show_snapshot_rows(snapshot.selected_week_id, snapshot.task_rows)
+        # Selecting the week runs the normal week-change path, which reconciles the rows
+        self.week_widget.select_week_by_id(snapshot.selected_week_id)
+    
+    def _save_startup_snapshot(self):
+        """Write the week list, selected week and its leading rows for the next warm start"""
+        try:
+            from core.services.startup_snapshot import (
+                StartupSnapshot, MAX_SNAPSHOT_ROWS, save_startup_snapshot
+            )
+            snapshot = StartupSnapshot(
+                weeks=list(self.week_widget.weeks),
+                selected_week_id=self.current_week_id,
+                task_rows=list(self.task_grid.task_model.tasks[:MAX_SNAPSHOT_ROWS])
+            )
+            save_startup_snapshot(snapshot)
+        except Exception as e:
+            self.logger.error(f"Error saving startup snapshot: {e}")
+    
+    def _start_db_maintenance(self):
+        """Run database maintenance on a background thread while the user is idle"""
+        self.db_maintenance = None
+        try:
+            from core.db.maintenance import DatabaseMaintenance, MaintenanceScheduler
+            from core.settings.global_settings import global_settings
+            cache = None
+            if hasattr(self, 'data_service') and hasattr(self.data_service, 'cache_manager'):
+                cache = self.data_service.cache_manager.sqlite_cache
+            idle_seconds = global_settings.get_setting("performance_settings.db_maintenance_idle_seconds", 60)
+            self.db_maintenance = MaintenanceScheduler(DatabaseMaintenance(cache=cache), idle_seconds=idle_seconds)
+            # User input resets the idle clock
+            QtWidgets.QApplication.instance().installEventFilter(self)
+            self.db_maintenance.start()
+        except Exception as e:
+            self.logger.error(f"Database maintenance unavailable: {e}")
+    
+    _ACTIVITY_EVENTS = (QtCore.QEvent.KeyPress, QtCore.QEvent.MouseButtonPress, QtCore.QEvent.Wheel)
+    
+    def eventFilter(self, watched, event):
+        """Application-wide filter: only records user activity for the maintenance scheduler"""
+        if self.db_maintenance is not None and event.type() in self._ACTIVITY_EVENTS:
+            self.db_maintenance.notify_activity()
+        return super().eventFilter(watched, event)
+    
+    def _replay_timer_journal(self):
+        """Re-apply timer updates left in the journal by an unclean shutdown"""
+        try:
+            from core.services.timer_persistence import get_timer_persistence
+            recovered = get_timer_persistence().replay_journal()
+            if recovered:
+                self.logger.info(f"Recovered timer updates for {recovered} tasks")
+        except Exception as e:
+            self.logger.error(f"Timer journal replay failed: {e}")
+    
     def _setup_lazy_imports(self):
         """Setup lazy imports for scientific libraries"""
         try:
@@ -862,6 +1056,9 @@ if __name__ == "__main__":
         latest_time = report['timing_analysis']['latest_time']
         grade = report['summary']['current_performance_grade']
         print(f"\nAuditor Helper started successfully in {latest_time:.2f}s (Performance: {grade})")
+        for regression in report['regressions']:
+            print(f"Startup regression: '{regression['phase']}' p50 {regression['p50_ms']:.0f}ms "
+                  f"vs {regression['baseline_p50_ms']:.0f}ms on {regression['baseline_version']}")
     else:
         print("\nAuditor Helper started successfully")
     
@@ -0,0 +1,84 @@
+"""
+Cached state model for the week bonus indicator
+
+The bonus toggle button only needs to know two things: whether the global
+bonus system is enabled and whether the current week is a bonus week. This
+model keeps both in memory, updated from WEEK_CHANGED / WEEK_UPDATED /
+SETTINGS_CHANGED events, so the button is restyled only when the visible
+state actually changes instead of polling the database.
+"""
+
+from typing import Callable, Dict, Optional
+
+# Indicator states
+BONUS_DISABLED = "disabled"   # Global bonus system switched off
+BONUS_ON = "on"               # Current week is a bonus week
+BONUS_OFF = "off"             # Current week is not a bonus week (or no week selected)
+
+
+class BonusIndicatorModel:
+    """Week bonus state cache with transition detection"""
+
+    def __init__(self, week_bonus_loader: Callable[[int], Optional[bool]], global_enabled: bool = True):
+        """
+        Args:
+            week_bonus_loader: Returns the is_bonus_week flag for a week id,
+                or None if the week could not be loaded
+            global_enabled: Initial value of the global bonus master toggle
+        """
+        self._load_week_bonus = week_bonus_loader
+        self._global_enabled = bool(global_enabled)
+        self._current_week_id: Optional[int] = None
+        self._week_bonus: Dict[int, bool] = {}
+
+    @property
+    def current_week_id(self) -> Optional[int]:
+        return self._current_week_id
+
+    @property
+    def state(self) -> str:
+        """Current indicator state (one of BONUS_DISABLED, BONUS_ON, BONUS_OFF)"""
+        if not self._global_enabled:
+            return BONUS_DISABLED
+        if self._current_week_id is None:
+            return BONUS_OFF
+        return BONUS_ON if self._get_week_bonus(self._current_week_id) else BONUS_OFF
+
+    def _get_week_bonus(self, week_id: int) -> bool:
+        if week_id not in self._week_bonus:
+            is_bonus = self._load_week_bonus(week_id)
+            if is_bonus is None:
+                # Don't cache failed lookups so the next event retries
+                return False
+            self._week_bonus[week_id] = bool(is_bonus)
+        return self._week_bonus[week_id]
+
+    def set_global_enabled(self, enabled: bool) -> bool:
+        """Update the global master toggle. Returns True if the state changed."""
+        previous = self.state
+        self._global_enabled = bool(enabled)
+        return self.state != previous
+
+    def set_current_week(self, week_id: Optional[int]) -> bool:
+        """Switch the displayed week. Returns True if the state changed."""
+        previous = self.state
+        self._current_week_id = week_id
+        return self.state != previous
+
+    def set_week_bonus(self, week_id: int, is_bonus: bool) -> bool:
+        """Record a known bonus flag for a week. Returns True if the state changed."""
+        previous = self.state
+        self._week_bonus[week_id] = bool(is_bonus)
+        return self.state != previous
+
+    def invalidate_week(self, week_id: Optional[int] = None) -> bool:
+        """
+        Drop cached week data (all weeks if week_id is None) so it is reloaded
+        on the next read. Returns True if the state changed.
+        """
+        previous = self.state
+        if week_id is None:
+            self._week_bonus.clear()
+        else:
+            self._week_bonus.pop(week_id, None)
+        return self.state != previous
@@ -5,8 +5,14 @@ This package contains the modular options dialog system split into separate file
 for better maintainability and organization.
 """
 
-from ui.options.options_dialog import OptionsDialog
-
 __all__ = ['OptionsDialog']
 
+
+def __getattr__(name):
+    # The dialog pulls in every settings page; import it only when first requested
+    if name == 'OptionsDialog':
+        from ui.options.options_dialog import OptionsDialog
+        return OptionsDialog
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 # This file makes the ui/options directory a Python package 
\ No newline at end of file
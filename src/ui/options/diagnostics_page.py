@@ -0,0 +1,195 @@
+"""
+Diagnostics page for the options dialog
+"""
+
+from datetime import datetime
+
+from PySide6 import QtWidgets, QtCore
+from .base_page import BasePage
+from core.performance.metrics import get_registry
+from core.performance.sampling_profiler import get_sampling_profiler, toggle_profiling
+from core.settings.global_settings import global_settings, get_profiles_dir
+
+
+class DiagnosticsPage(BasePage):
+    """Read-only view of the in-process metrics registry"""
+
+    COLUMNS = ["Metric", "Value / Count", "Mean", "p50", "p95", "Max"]
+
+    def setup_ui(self):
+        """Setup the UI for the diagnostics page"""
+        layout = QtWidgets.QVBoxLayout(self)
+
+        # Title
+        title = self.create_title("Diagnostics")
+        layout.addWidget(title)
+
+        description = QtWidgets.QLabel(
+            "Database, cache, event handler, paint and startup timings collected in this session. "
+            "Latencies are in milliseconds."
+        )
+        description.setWordWrap(True)
+        layout.addWidget(description)
+
+        self.metrics_tree = QtWidgets.QTreeWidget()
+        self.metrics_tree.setColumnCount(len(self.COLUMNS))
+        self.metrics_tree.setHeaderLabels(self.COLUMNS)
+        self.metrics_tree.setAlternatingRowColors(True)
+        self.metrics_tree.setUniformRowHeights(True)
+        self.metrics_tree.header().setSectionResizeMode(0, QtWidgets.QHeaderView.Stretch)
+        layout.addWidget(self.metrics_tree, 1)
+
+        # Buttons
+        button_layout = QtWidgets.QHBoxLayout()
+        self.refresh_btn = QtWidgets.QPushButton("Refresh")
+        self.reset_btn = QtWidgets.QPushButton("Reset")
+        self.copy_btn = QtWidgets.QPushButton("Copy as Text")
+        self.export_btn = QtWidgets.QPushButton("Export JSON...")
+
+        self.refresh_btn.clicked.connect(self.refresh_metrics)
+        self.reset_btn.clicked.connect(self.reset_metrics)
+        self.copy_btn.clicked.connect(self.copy_metrics)
+        self.export_btn.clicked.connect(self.export_metrics)
+
+        for button in (self.refresh_btn, self.reset_btn, self.copy_btn):
+            button_layout.addWidget(button)
+        button_layout.addStretch()
+        button_layout.addWidget(self.export_btn)
+        layout.addLayout(button_layout)
+
+        # Sampling profiler
+        profiler_group = QtWidgets.QGroupBox("Sampling Profiler")
+        profiler_layout = QtWidgets.QGridLayout(profiler_group)
+
+        profiler_layout.addWidget(QtWidgets.QLabel("Sample interval:"), 0, 0)
+        self.interval_spin = QtWidgets.QSpinBox()
+        self.interval_spin.setRange(1, 100)
+        self.interval_spin.setSuffix(" ms")
+        profiler_layout.addWidget(self.interval_spin, 0, 1)
+
+        self.profiler_btn = QtWidgets.QPushButton()
+        self.profiler_btn.clicked.connect(self.toggle_profiler)
+        profiler_layout.addWidget(self.profiler_btn, 0, 2)
+
+        self.profiler_status = QtWidgets.QLabel()
+        self.profiler_status.setWordWrap(True)
+        self.profiler_status.setTextInteractionFlags(QtCore.Qt.TextSelectableByMouse)
+        profiler_layout.addWidget(self.profiler_status, 1, 0, 1, 3)
+        profiler_layout.setColumnStretch(1, 1)
+
+        layout.addWidget(profiler_group)
+        self._update_profiler_controls()
+
+    def toggle_profiler(self):
+        """Start the sampling profiler, or stop it and write a collapsed-stack file"""
+        try:
+            path = toggle_profiling(get_profiles_dir(), self.interval_spin.value())
+        except OSError as e:
+            QtWidgets.QMessageBox.warning(self, "Profiler", f"Could not write profile: {e}")
+            path = None
+        self._update_profiler_controls(path)
+
+    def _update_profiler_controls(self, written_path=None):
+        profiler = get_sampling_profiler()
+        running = profiler.is_running
+        self.profiler_btn.setText("Stop && Save" if running else "Start Profiling")
+        self.interval_spin.setEnabled(not running)
+        if running:
+            self.profiler_status.setText("Profiling... reproduce the slowdown, then stop (or press Ctrl+Shift+P).")
+        elif written_path:
+            summary = profiler.summary()
+            self.profiler_status.setText(
+                f"{summary['samples']} samples over {summary['duration_s']:.1f}s "
+                f"(GUI thread {summary['gui_samples']}, workers {summary['worker_samples']}) "
+                f"written to {written_path}"
+            )
+        else:
+            self.profiler_status.setText(
+                "Samples every thread's stack and writes a collapsed-stack file for flame graphs "
+                f"to {get_profiles_dir()}."
+            )
+
+    def refresh_metrics(self):
+        """Rebuild the tree from a fresh registry snapshot"""
+        snapshot = get_registry().snapshot()
+
+        self.metrics_tree.setUpdatesEnabled(False)
+        try:
+            self.metrics_tree.clear()
+
+            histograms = self._add_group("Latency histograms", len(snapshot['histograms']))
+            for key, values in snapshot['histograms'].items():
+                self._add_row(histograms, key, values['count'], values['mean'], values['p50'],
+                              values['p95'], values['max'])
+
+            counters = self._add_group("Counters", len(snapshot['counters']))
+            for key, value in snapshot['counters'].items():
+                self._add_row(counters, key, value)
+
+            gauges = self._add_group("Gauges", len(snapshot['gauges']))
+            for key, value in snapshot['gauges'].items():
+                self._add_row(gauges, key, value)
+
+            histograms.setExpanded(True)
+        finally:
+            self.metrics_tree.setUpdatesEnabled(True)
+
+    def _add_group(self, title, count):
+        group = QtWidgets.QTreeWidgetItem(self.metrics_tree, [f"{title} ({count})"])
+        group.setFirstColumnSpanned(True)
+        return group
+
+    def _add_row(self, parent, key, value, *latencies):
+        columns = [key, self._format(value), *(self._format(latency) for latency in latencies)]
+        item = QtWidgets.QTreeWidgetItem(parent, columns)
+        for column in range(1, len(columns)):
+            item.setTextAlignment(column, QtCore.Qt.AlignRight | QtCore.Qt.AlignVCenter)
+        return item
+
+    @staticmethod
+    def _format(value):
+        if isinstance(value, float):
+            return f"{value:.3f}"
+        return str(value)
+
+    def reset_metrics(self):
+        """Zero every metric and refresh the view"""
+        get_registry().reset()
+        self.refresh_metrics()
+
+    def copy_metrics(self):
+        """Copy a plain-text dump of all metrics to the clipboard"""
+        QtWidgets.QApplication.clipboard().setText(get_registry().format_text())
+
+    def export_metrics(self):
+        """Write a JSON snapshot chosen by the user"""
+        default_name = f"metrics_{datetime.now().strftime('%Y%m%d_%H%M%S')}.json"
+        filepath, _ = QtWidgets.QFileDialog.getSaveFileName(
+            self, "Export Metrics", default_name, "JSON Files (*.json)"
+        )
+        if not filepath:
+            return
+        try:
+            get_registry().export_json(filepath)
+        except OSError as e:
+            QtWidgets.QMessageBox.warning(self, "Export Failed", f"Could not write metrics: {e}")
+
+    def load_settings(self):
+        """Load diagnostics (a snapshot of the current metrics)"""
+        try:
+            self.interval_spin.setValue(int(global_settings.get_setting("performance_settings.sampling_interval_ms", 5)))
+            self._update_profiler_controls()
+            self.refresh_metrics()
+
+        except Exception as e:
+            print(f"Error loading diagnostics: {e}")
+
+    def save_settings(self):
+        """Save the profiler interval"""
+        try:
+            global_settings.set_setting("performance_settings.sampling_interval_ms", self.interval_spin.value())
+            return True
+
+        except Exception as e:
+            print(f"ERROR in DiagnosticsPage.save_settings(): {e}")
+            return False
@@ -9,7 +9,9 @@ from .appearance_page import AppearancePage
 from .global_defaults_page import GlobalDefaultsPage
 from .week_customization_page import WeekCustomizationPage
 from .updates_page import UpdatesPage
+from .diagnostics_page import DiagnosticsPage
 from core.settings.global_settings import global_settings, get_icon_path
+from core.events import get_event_bus, EventType
 
 basedir = os.path.dirname(os.path.dirname(__file__))
 
@@ -63,7 +65,8 @@ class OptionsDialog(QtWidgets.QDialog):
             ("Appearance", "🎨", AppearancePage),
             ("Global Defaults", "🌐", GlobalDefaultsPage),
             ("Week Customization", "📅", WeekCustomizationPage),
-            ("Updates", "🔄", UpdatesPage)
+            ("Updates", "🔄", UpdatesPage),
+            ("Diagnostics", "📊", DiagnosticsPage)
         ]
         
         self.page_instances = []
@@ -144,6 +147,8 @@ class OptionsDialog(QtWidgets.QDialog):
                     failed_pages.append("Global Settings")
                 
                 if all_saved:
+                    # Let listeners (e.g. the bonus indicator) pick up the new settings
+                    get_event_bus().emit_event(EventType.SETTINGS_CHANGED, {}, 'OptionsDialog')
                     QtWidgets.QMessageBox.information(self, "Success", "Settings saved successfully!")
                     self.accept()
                 else:
@@ -10,6 +10,10 @@ from core.settings.global_settings import global_settings
 # Data Service Layer imports
 from core.services.data_service import DataService, DataServiceError
 from core.services.week_dao import WeekDAO
+from core.db.connection_manager import get_connection_manager
+
+# Event Bus imports
+from core.events import get_event_bus, EventType
 
 
 class WeekCustomizationPage(BasePage):
@@ -30,6 +34,14 @@ class WeekCustomizationPage(BasePage):
         
         # Note: setup_ui() is called by BasePage.__init__, no need to call it again
 
+    def _emit_week_updated(self, week_id, week_label):
+        """Notify listeners (e.g. the bonus indicator) that a week's settings changed"""
+        get_event_bus().emit_event(
+            EventType.WEEK_UPDATED,
+            {'week_id': week_id, 'week_label': week_label},
+            'WeekCustomizationPage'
+        )
+
     def setup_ui(self):
         """Setup the UI for the week customization settings page"""
         layout = QtWidgets.QVBoxLayout(self)
@@ -231,11 +243,10 @@ class WeekCustomizationPage(BasePage):
                 weeks = [(week['week_label'],) for week in weeks_data]  # Convert to tuple format
             else:
                 # Fallback to direct SQLite if Data Service Layer not available
-                conn = sqlite3.connect('tasks.db')
-                c = conn.cursor()
-                c.execute("SELECT week_label FROM weeks ORDER BY id")
-                weeks = c.fetchall()
-                conn.close()
+                with get_connection_manager().reader() as conn:
+                    c = conn.cursor()
+                    c.execute("SELECT week_label FROM weeks ORDER BY id")
+                    weeks = c.fetchall()
             
             self.week_combo.clear()
             for week in weeks:
@@ -283,22 +294,21 @@ class WeekCustomizationPage(BasePage):
                     result = None
             else:
                 # Fallback to direct SQLite if Data Service Layer not available
-                conn = sqlite3.connect('tasks.db')
-                c = conn.cursor()
-                
-                c.execute("""
-                    SELECT week_start_day, week_start_hour, week_end_day, week_end_hour, 
-                           is_custom_duration, week_specific_bonus_payrate, 
-                           week_specific_bonus_start_day, week_specific_bonus_start_time,
-                           week_specific_bonus_end_day, week_specific_bonus_end_time,
-                           week_specific_enable_task_bonus, week_specific_bonus_task_threshold,
-                           week_specific_bonus_additional_amount, use_global_bonus_settings,
-                           office_hour_count, office_hour_payrate, office_hour_session_duration_minutes, use_global_office_hours_settings
-                    FROM weeks WHERE week_label = ?
-                """, (self.week_combo.currentText(),))
-                
-                result = c.fetchone()
-                conn.close()
+                with get_connection_manager().reader() as conn:
+                    c = conn.cursor()
+                    
+                    c.execute("""
+                        SELECT week_start_day, week_start_hour, week_end_day, week_end_hour, 
+                               is_custom_duration, week_specific_bonus_payrate, 
+                               week_specific_bonus_start_day, week_specific_bonus_start_time,
+                               week_specific_bonus_end_day, week_specific_bonus_end_time,
+                               week_specific_enable_task_bonus, week_specific_bonus_task_threshold,
+                               week_specific_bonus_additional_amount, use_global_bonus_settings,
+                               office_hour_count, office_hour_payrate, office_hour_session_duration_minutes, use_global_office_hours_settings
+                        FROM weeks WHERE week_label = ?
+                    """, (self.week_combo.currentText(),))
+                    
+                    result = c.fetchone()
             
             if result:
                 # Duration settings
@@ -380,6 +390,7 @@ class WeekCustomizationPage(BasePage):
         if reply == QtWidgets.QMessageBox.No:
             return
 
+        week_id = None
         try:
             # Use Data Service Layer for week settings reset
             if self.week_dao:
@@ -420,40 +431,40 @@ class WeekCustomizationPage(BasePage):
                     QtWidgets.QMessageBox.critical(self, "Error", f"Week '{current_week_label}' not found.")
             else:
                 # Fallback to direct SQLite if Data Service Layer not available
-                conn = sqlite3.connect('tasks.db')
-                c = conn.cursor()
+                with get_connection_manager().writer() as conn:
+                    c = conn.cursor()
 
-                # Update the weeks table to reflect global defaults for duration, bonus, and office hours
-                c.execute("""
-                    UPDATE weeks SET
-                        week_start_day = NULL,
-                        week_start_hour = NULL,
-                        week_end_day = NULL,
-                        week_end_hour = NULL,
-                        is_custom_duration = FALSE,
-                        is_bonus_week = FALSE,
-                        week_specific_bonus_payrate = NULL,
-                        week_specific_bonus_start_day = NULL,
-                        week_specific_bonus_start_time = NULL,
-                        week_specific_bonus_end_day = NULL,
-                        week_specific_bonus_end_time = NULL,
-                        week_specific_enable_task_bonus = FALSE,
-                        week_specific_bonus_task_threshold = NULL,
-                        week_specific_bonus_additional_amount = NULL,
-                        use_global_bonus_settings = TRUE,
-                        office_hour_count = NULL,
-                        office_hour_payrate = NULL,
-                        office_hour_session_duration_minutes = NULL,
-                        use_global_office_hours_settings = TRUE
-                    WHERE week_label = ?
-                """, (current_week_label,))
-                
-                conn.commit()
-                conn.close()
+                    # Update the weeks table to reflect global defaults for duration, bonus, and office hours
+                    c.execute("""
+                        UPDATE weeks SET
+                            week_start_day = NULL,
+                            week_start_hour = NULL,
+                            week_end_day = NULL,
+                            week_end_hour = NULL,
+                            is_custom_duration = FALSE,
+                            is_bonus_week = FALSE,
+                            week_specific_bonus_payrate = NULL,
+                            week_specific_bonus_start_day = NULL,
+                            week_specific_bonus_start_time = NULL,
+                            week_specific_bonus_end_day = NULL,
+                            week_specific_bonus_end_time = NULL,
+                            week_specific_enable_task_bonus = FALSE,
+                            week_specific_bonus_task_threshold = NULL,
+                            week_specific_bonus_additional_amount = NULL,
+                            use_global_bonus_settings = TRUE,
+                            office_hour_count = NULL,
+                            office_hour_payrate = NULL,
+                            office_hour_session_duration_minutes = NULL,
+                            use_global_office_hours_settings = TRUE
+                        WHERE week_label = ?
+                    """, (current_week_label,))
+                    
+                    conn.commit()
                 QtWidgets.QMessageBox.information(self, "Reverted", f"Custom settings for '{current_week_label}' reverted to global defaults.")
             
             # Reload settings to update UI
             self.load_week_settings()
+            self._emit_week_updated(week_id, current_week_label)
 
             # Notify analysis widget to refresh (assuming it can handle a signal or a direct call)
             if hasattr(self.parent(), 'refresh_analysis_widget'):
@@ -469,6 +480,7 @@ class WeekCustomizationPage(BasePage):
         if not self.week_combo.currentText():
             return
             
+        week_id = None
         try:
             week_label = self.week_combo.currentText()
             
@@ -546,28 +558,29 @@ class WeekCustomizationPage(BasePage):
                     raise DataServiceError(f"Week '{week_label}' not found")
             else:
                 # Fallback to direct SQLite if Data Service Layer not available
-                conn = sqlite3.connect('tasks.db')
-                c = conn.cursor()
-                
-                # Convert bonus and office hours values back to list format for SQL
-                bonus_list = list(bonus_values.values())
-                office_hours_list = list(office_hours_values.values())
-                
-                c.execute("""
-                    UPDATE weeks SET 
-                        week_start_day = ?, week_start_hour = ?, week_end_day = ?, week_end_hour = ?,
-                        is_custom_duration = ?, week_specific_bonus_payrate = ?,
-                        week_specific_bonus_start_day = ?, week_specific_bonus_start_time = ?,
-                        week_specific_bonus_end_day = ?, week_specific_bonus_end_time = ?,
-                        week_specific_enable_task_bonus = ?, week_specific_bonus_task_threshold = ?,
-                        week_specific_bonus_additional_amount = ?, use_global_bonus_settings = ?,
-                        office_hour_payrate = ?, office_hour_session_duration_minutes = ?, use_global_office_hours_settings = ?
-                    WHERE week_label = ?
-                """, (week_start_day, week_start_hour, week_end_day, week_end_hour, is_custom_duration,
-                      *bonus_list, use_global_bonus, *office_hours_list, use_global_office_hours, week_label))
-                
-                conn.commit()
-                conn.close()
+                with get_connection_manager().writer() as conn:
+                    c = conn.cursor()
+                    
+                    # Convert bonus and office hours values back to list format for SQL
+                    bonus_list = list(bonus_values.values())
+                    office_hours_list = list(office_hours_values.values())
+                    
+                    c.execute("""
+                        UPDATE weeks SET 
+                            week_start_day = ?, week_start_hour = ?, week_end_day = ?, week_end_hour = ?,
+                            is_custom_duration = ?, week_specific_bonus_payrate = ?,
+                            week_specific_bonus_start_day = ?, week_specific_bonus_start_time = ?,
+                            week_specific_bonus_end_day = ?, week_specific_bonus_end_time = ?,
+                            week_specific_enable_task_bonus = ?, week_specific_bonus_task_threshold = ?,
+                            week_specific_bonus_additional_amount = ?, use_global_bonus_settings = ?,
+                            office_hour_payrate = ?, office_hour_session_duration_minutes = ?, use_global_office_hours_settings = ?
+                        WHERE week_label = ?
+                    """, (week_start_day, week_start_hour, week_end_day, week_end_hour, is_custom_duration,
+                          *bonus_list, use_global_bonus, *office_hours_list, use_global_office_hours, week_label))
+                    
+                    conn.commit()
+            
+            self._emit_week_updated(week_id, week_label)
             
         except (DataServiceError, Exception) as e:
             print(f"Error saving week settings: {e}")
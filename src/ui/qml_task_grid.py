@@ -18,7 +18,8 @@ from ui.feedback_dialog import FeedbackDialog
 from ui.classic_task_edit_dialog import ClassicTaskEditDialog
 
 # Import Data Service Layer components
-from core.services import TaskDAO, WeekDAO, DataServiceError
+from core.services import TaskDAO, WeekDAO, DataService, DataServiceError
+from core.services.timer_persistence import get_timer_persistence, format_duration
 
 # Import Event Bus components
 from core.events import get_event_bus, EventType
@@ -135,8 +136,16 @@ class QMLTaskGrid(QtWidgets.QWidget):
     
     def refresh_tasks(self, week_id):
         """Refresh tasks for a specific week"""
+        if self.task_model.isReconciling(week_id):
+            # Keep the warm-start rows on screen; the background load picks up the latest data
+            self.task_model.reconcileTasks(week_id)
+            return
         self.task_model.refreshTasks(week_id)
     
+    def show_snapshot_rows(self, week_id, rows):
+        """Render rows from the startup snapshot before the live data is loaded"""
+        self.task_model.loadSnapshotRows(week_id, rows)
+    
     def delete_selected_tasks(self):
         """Delete selected tasks using Data Service Layer"""
         selected_ids = self.task_model.getSelectedTaskIds()
@@ -261,12 +270,8 @@ class QMLTaskGrid(QtWidgets.QWidget):
     
     def edit_feedback(self, task_id):
         """Edit feedback for a task"""
-        # Get current feedback
-        current_feedback = ""
-        for task in self.task_model.tasks:
-            if task[0] == task_id:
-                current_feedback = task[9] if len(task) > 9 else ""
-                break
+        # The grid rows only hold a preview; load the full text for editing
+        current_feedback = self.task_dao.get_task_feedback(task_id)
         
         # Open feedback dialog
         feedback_dialog = FeedbackDialog(
@@ -284,26 +289,24 @@ class QMLTaskGrid(QtWidgets.QWidget):
                                                 start_timestamp_for_new_task=None):
         """Update task time and duration from timer using Data Service Layer"""
         try:
-            # Convert seconds to HH:MM:SS format
-            hours = new_duration_seconds // 3600
-            minutes = (new_duration_seconds % 3600) // 60
-            seconds = new_duration_seconds % 60
-            duration_str = f"{hours:02d}:{minutes:02d}:{seconds:02d}"
-            
-            # Prepare update data
-            update_data = {'duration': duration_str}
+            # Final values go through the same journal as the running timer ticks,
+            # so they land in the same coalesced transaction
+            persistence = get_timer_persistence()
+            persistence.record_duration(task_id, new_duration_seconds)
+            duration_str = format_duration(new_duration_seconds)
             
             if start_timestamp_for_new_task:
                 # Update time_begin and time_end
                 time_begin = start_timestamp_for_new_task.strftime("%H:%M:%S")
                 time_end = (start_timestamp_for_new_task + timedelta(seconds=new_duration_seconds)).strftime("%H:%M:%S")
-                update_data.update({
-                    'time_begin': time_begin,
-                    'time_end': time_end
-                })
+                persistence.record_times(task_id, time_begin=time_begin, time_end=time_end)
+            
+            persistence.flush()
+            if persistence.has_pending():
+                raise DataServiceError(f"Failed to save timer updates for task {task_id}")
             
-            # Use TaskDAO for optimized task update with caching
-            self.task_dao.update_task(task_id, update_data)
+            # Timer writes bypass DataService, so drop cached task queries
+            DataService.get_instance().cache_manager.clear_all_cache()
             logger.info(f"Successfully updated task {task_id} duration to {duration_str}")
             
             # Emit task updated event
@@ -415,7 +418,7 @@ class QMLTaskGrid(QtWidgets.QWidget):
             'timeLimit': task_data[6] if len(task_data) > 6 else "00:00:00",
             'dateAudited': task_data[7] if len(task_data) > 7 else "",
             'score': str(task_data[8]) if len(task_data) > 8 else "1",
-            'feedback': task_data[9] if len(task_data) > 9 else "",
+            'feedback': self.task_dao.get_task_feedback(task_id),
             'locale': task_data[10] if len(task_data) > 10 else "",
             'timeBegin': task_data[11] if len(task_data) > 11 else "",
             'timeEnd': task_data[12] if len(task_data) > 12 else ""
@@ -6,12 +6,55 @@ Extends the original TaskTableModel with QML-specific functionality
 import sqlite3
 from PySide6 import QtCore, QtWidgets, QtGui, QtQml
 from datetime import datetime, timedelta
-from core.db.db_connection_pool import get_db_connection
+from core.db.db_connection_pool import get_db_connection, get_db_read_connection
 from core.db.database_config import DATABASE_FILE
+from core.db.connection_manager import get_connection_manager
 from core.settings.global_settings import global_settings
+from core.services.task_dao import TaskDAO
 
 DB_FILE = DATABASE_FILE
 
+# The grid only shows a short feedback preview; the full text is loaded per
+# task when an editor opens (TaskDAO.get_task_feedback)
+FEEDBACK_PREVIEW_CHARS = 40
+
+TASK_ROWS_QUERY = f"""
+    SELECT id, attempt_id, duration, project_id, project_name, 
+           operation_id, time_limit, date_audited, score, 
+           substr(feedback, 1, {FEEDBACK_PREVIEW_CHARS}) AS feedback, locale, time_begin, time_end
+    FROM tasks 
+    WHERE week_id = ? 
+    ORDER BY id ASC
+"""
+
+
+def fetch_week_task_rows(week_id):
+    """Load the grid rows for a week"""
+    with get_db_read_connection() as conn:
+        return conn.execute(TASK_ROWS_QUERY, (week_id,)).fetchall()
+
+
+class TaskRowsLoader(QtCore.QThread):
+    """Loads a week's task rows off the GUI thread"""
+
+    rowsLoaded = QtCore.Signal(int, int, object)  # week_id, generation, rows
+
+    def __init__(self, week_id, generation, parent=None):
+        super().__init__(parent)
+        self.week_id = week_id
+        self.generation = generation
+
+    def run(self):
+        try:
+            rows = fetch_week_task_rows(self.week_id)
+        except Exception as e:
+            print(f"Error loading tasks for week {self.week_id}: {e}")
+            rows = None
+        finally:
+            get_connection_manager().close_thread_connections()
+        self.rowsLoaded.emit(self.week_id, self.generation, rows)
+
+
 class QMLTaskModel(QtCore.QAbstractListModel):
     """QML-compatible task model with proper property exposure"""
     
@@ -45,6 +88,15 @@ class QMLTaskModel(QtCore.QAbstractListModel):
         self.main_window = parent
         self.current_week_id = None
         
+        # Warm-start state: rows shown from the startup snapshot are replaced
+        # by live rows once the background reconcile for that week finishes
+        self._reconcile_week_id = None
+        self._rows_generation = 0
+        self._rows_loading = False
+        
+        # Loads the full feedback text on demand; created on first use
+        self._task_dao = None
+        
         # Column headers for reference
         self.headers = [
             "Attempt ID", "Duration", "Project ID", "Project Name", 
@@ -52,6 +104,11 @@ class QMLTaskModel(QtCore.QAbstractListModel):
             "Feedback", "Locale", "Time Begin", "Time End"
         ]
     
+    def _get_task_dao(self):
+        if self._task_dao is None:
+            self._task_dao = TaskDAO()
+        return self._task_dao
+    
     def roleNames(self):
         """Define role names for QML access"""
         return {
@@ -177,13 +234,15 @@ class QMLTaskModel(QtCore.QAbstractListModel):
             conn.commit()
         
         # Update local cache and emit changes
+        self._rows_generation += 1
         for row, task in enumerate(self.tasks):
             if task[0] == taskId:
                 # Update the task tuple
                 task_list = list(task)
                 field_index = self._get_field_index(fieldName)
                 if field_index is not None and field_index < len(task_list):
-                    task_list[field_index] = value
+                    # Keep the row shape: feedback is held as its preview only
+                    task_list[field_index] = value[:FEEDBACK_PREVIEW_CHARS] if fieldName == "feedback" else value
                     self.tasks[row] = tuple(task_list)
                 
                 # Emit dataChanged
@@ -243,18 +302,10 @@ class QMLTaskModel(QtCore.QAbstractListModel):
         self.beginResetModel()
         self.current_week_id = weekId
         self.selected_tasks.clear()
+        self._reconcile_week_id = None
+        self._rows_generation += 1
         
-        with get_db_connection() as conn:
-            c = conn.cursor()
-            c.execute("""
-                SELECT id, attempt_id, duration, project_id, project_name, 
-                       operation_id, time_limit, date_audited, score, 
-                       feedback, locale, time_begin, time_end
-                FROM tasks 
-                WHERE week_id = ? 
-                ORDER BY id ASC
-            """, (weekId,))
-            self.tasks = c.fetchall()
+        self.tasks = fetch_week_task_rows(weekId)
         
         self.endResetModel()
         
@@ -264,6 +315,62 @@ class QMLTaskModel(QtCore.QAbstractListModel):
         # Emit selectionChanged to ensure UI updates after clearing selections
         self.selectionChanged.emit()
     
+    def loadSnapshotRows(self, weekId, rows):
+        """Show rows from the startup snapshot until the live rows are loaded"""
+        self.modelAboutToBeReset.emit()
+        self.beginResetModel()
+        self.current_week_id = weekId
+        self.selected_tasks.clear()
+        self.tasks = [tuple(row) for row in rows]
+        self._reconcile_week_id = weekId
+        self.endResetModel()
+        self.modelReset.emit()
+        self.selectionChanged.emit()
+    
+    def isReconciling(self, weekId):
+        """True while this week shows snapshot rows that have not been reconciled yet"""
+        return weekId is not None and self._reconcile_week_id == weekId
+    
+    def reconcileTasks(self, weekId):
+        """Reload the week's rows in the background and apply them if they differ"""
+        if self._rows_loading and self._reconcile_week_id == weekId:
+            # A load is already running; make it reload once more when it returns
+            self._rows_generation += 1
+            return
+        self._reconcile_week_id = weekId
+        self._rows_loading = True
+        loader = TaskRowsLoader(weekId, self._rows_generation, self)
+        loader.rowsLoaded.connect(self._on_reconciled_rows)
+        loader.finished.connect(loader.deleteLater)
+        loader.start()
+    
+    def _on_reconciled_rows(self, weekId, generation, rows):
+        self._rows_loading = False
+        if weekId != self._reconcile_week_id or weekId != self.current_week_id:
+            # The user moved to another week, or a full refresh already ran
+            return
+        if rows is None:
+            # Background load failed; load synchronously instead
+            self.refreshTasks(weekId)
+            return
+        if generation != self._rows_generation:
+            # Rows were edited while loading; load again so the edit is included
+            self.reconcileTasks(weekId)
+            return
+        
+        self._reconcile_week_id = None
+        if rows == self.tasks:
+            return
+        
+        live_ids = {row[0] for row in rows}
+        self.modelAboutToBeReset.emit()
+        self.beginResetModel()
+        self.tasks = rows
+        self.selected_tasks &= live_ids
+        self.endResetModel()
+        self.modelReset.emit()
+        self.selectionChanged.emit()
+    
     def is_valid_time_format(self, time_str):
         """Validate time format (HH:MM:SS)"""
         try:
@@ -302,7 +409,7 @@ class QMLTaskModel(QtCore.QAbstractListModel):
                     "timeLimit": str(task[6]) if len(task) > 6 else "00:00:00",
                     "dateAudited": str(task[7]) if len(task) > 7 else "",
                     "score": str(task[8]) if len(task) > 8 else "1",
-                    "feedback": str(task[9]) if len(task) > 9 else "",
+                    "feedback": self._get_task_dao().get_task_feedback(taskId),
                     "locale": str(task[10]) if len(task) > 10 else "",
                     "timeBegin": str(task[11]) if len(task) > 11 else "",
                     "timeEnd": str(task[12]) if len(task) > 12 else ""
@@ -0,0 +1,457 @@
+"""
+Theme definitions and precompiled stylesheets.
+
+A theme is split so that switching it touches as little as possible:
+
+- APPLICATION_STYLESHEET holds the rules shared by every theme (fonts,
+  padding, radii, margins). It contains no colors, so it is set on the
+  application once and never changes when the theme is switched.
+- The palette carries the base colors (window, base, text, button, ...).
+- Window stylesheets carry the remaining colors (borders, hover/pressed
+  states, gridlines) and are set only on the top-level windows registered
+  with the ThemeManager. Rules for one window (e.g. the analysis tables) are
+  kept in that window's scope instead of being matched against every widget.
+
+Stylesheets are compiled (comments and whitespace stripped) once per
+theme/scope and cached. This module has no Qt dependency; ThemeManager turns
+the palette colors into a QPalette.
+"""
+
+import re
+from functools import lru_cache
+from typing import Dict, NamedTuple
+
+DARK = "dark"
+LIGHT = "light"
+
+MAIN_SCOPE = "main"
+ANALYSIS_SCOPE = "analysis"
+
+
+class ThemeDefinition(NamedTuple):
+    """Palette colors, window stylesheet and per-window scoped rules of one theme"""
+    palette: Dict[str, str]
+    window_stylesheet: str
+    scoped: Dict[str, str]
+
+
+APPLICATION_STYLESHEET = """
+    QWidget, QLabel {
+        font-size: 11px;
+    }
+    QTableView, QTableWidget {
+        border-radius: 2px;
+        font-size: 11px;
+    }
+    QHeaderView::section {
+        font-size: 11px;
+    }
+    QGroupBox {
+        border-radius: 4px;
+        margin-top: 8px;
+        font-size: 16px;
+        font-weight: normal;
+        padding-top: 25px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        subcontrol-position: top left;
+        padding: 8px 6px 4px 8px;
+        left: 8px;
+        font-size: 16px;
+        font-weight: normal;
+    }
+    QPushButton {
+        padding: 1px 2px;
+        border-radius: 4px; /* Default for all buttons */
+        font-size: 11px;
+        min-height: 16px;
+    }
+    QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox, QDateEdit {
+        border-radius: 2px;
+        padding: 3px;
+        font-size: 11px;
+    }
+    QComboBox QAbstractItemView {
+        font-size: 11px;
+    }
+    QListWidget {
+        border-radius: 4px;
+        font-size: 11px;
+    }
+    QListWidget::item {
+        padding: 4px 8px;
+        border-radius: 2px;
+        margin: 1px 0px;
+    }
+    QScrollArea {
+        border: none;
+    }
+    QChartView {
+        border-radius: 4px;
+    }
+    QTableWidget::item {
+        padding: 4px;
+    }
+"""
+
+
+THEMES = {
+    DARK: ThemeDefinition(
+        palette={
+            'Window': '#33342E',
+            'WindowText': '#D6D6D6',
+            'Base': '#2a2b2a',
+            'AlternateBase': '#1f201f',  # Slightly darker than base
+            'Text': '#D6D6D6',
+            'Button': '#2a2b2a',
+            'ButtonText': '#D6D6D6',
+            'Highlight': '#33342E',
+            'HighlightedText': '#D6D6D6',
+            'Link': '#1f201f',  # Border color
+            'PlaceholderText': '#A0A0A0',
+        },
+        window_stylesheet="""
+            QMainWindow, QDialog {
+                background-color: #33342E;
+                color: #D6D6D6;
+            }
+            QWidget {
+                background-color: #2a2b2a;
+                color: #D6D6D6;
+            }
+            QToolTip {
+                color: #D6D6D6;
+                background-color: #2a2b2a;
+                border: 1px solid #1f201f;
+            }
+            QTableView, QTableWidget {
+                gridline-color: #1f201f;
+                background-color: #2a2b2a;
+                border: 1px solid #1f201f;
+                color: #D6D6D6;
+            }
+            QHeaderView::section {
+                background-color: #2a2b2a;
+                color: #D6D6D6;
+                border: 1px solid #1f201f;
+            }
+            QTabWidget::pane {
+                border: 1px solid #1f201f;
+                background-color: #2a2b2a;
+            }
+            QTabBar::tab {
+                background: #2a2b2a;
+                color: #D6D6D6;
+                border: 1px solid #1f201f;
+                padding: 1px 2px;
+            }
+            QTabBar::tab:selected {
+                background: #33342E;
+                color: #D6D6D6;
+                border: 1px solid #1f201f;
+            }
+            QGroupBox {
+                color: #D6D6D6;
+                border: 1px solid #1f201f;
+            }
+            QGroupBox::title {
+                color: #D6D6D6;
+            }
+            QPushButton {
+                background-color: #2a2b2a;
+                color: #D6D6D6;
+                border: 1px solid #1f201f;
+            }
+            QPushButton:hover {
+                background-color: #33342E;
+            }
+            QPushButton:pressed {
+                background-color: #1f201f;
+            }
+            QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox, QDateEdit {
+                background-color: #2a2b2a;
+                color: #D6D6D6;
+                border: 1px solid #1f201f;
+            }
+            QComboBox QAbstractItemView {
+                background-color: #2a2b2a;
+                color: #D6D6D6;
+                selection-background-color: #33342E;
+            }
+            QScrollBar {
+                background-color: #2a2b2a;
+            }
+            QScrollBar::handle {
+                background-color: #33342E;
+            }
+            QScrollBar::handle:hover {
+                background-color: #1f201f;
+            }
+            QListWidget {
+                background-color: #2a2b2a;
+                color: #D6D6D6;
+                border: 1px solid #1f201f;
+            }
+            QListWidget::item:selected {
+                background-color: #33342E;
+                color: #D6D6D6;
+            }
+            QLabel {
+                color: #D6D6D6;
+            }
+            QScrollArea {
+                background-color: #33342E;
+            }
+            QChartView {
+                background-color: #2a2b2a;
+                border: 1px solid #1f201f;
+            }
+            QTableWidget::item {
+                background-color: #2a2b2a;
+                color: #D6D6D6;
+            }
+            QTableWidget::item:selected {
+                background-color: #33342E;
+                color: #D6D6D6;
+            }
+        """,
+        scoped={
+            MAIN_SCOPE: """
+                /* Specific styles for Task Grid Table */
+                QTableWidget#TaskTable {
+                    background-color: #232423; /* Slightly darker background */
+                    border: 1px solid #0a0b0a; /* Darker border */
+                    border-radius: 4px;
+                    gridline-color: #1a1b1a; /* More visible gridlines */
+                }
+                QTableWidget#TaskTable::item {
+                    background-color: #232423;
+                    color: #D6D6D6;
+                    padding: 4px;
+                }
+                QTableWidget#TaskTable::item:selected {
+                    background-color: #282928;
+                    color: #D6D6D6;
+                }
+                QTableWidget#TaskTable QHeaderView::section {
+                    background-color: #1B1B1B;
+                    color: #D6D6D6;
+                }
+            """,
+            ANALYSIS_SCOPE: """
+                /* Specific styles for Analysis Tables */
+                QTableWidget#AnalysisTable {
+                    background-color: #2a2b2a;
+                    border: 1px solid #2a2b2a;
+                    gridline-color: #1f201f;
+                }
+                QTableWidget#AnalysisTable::item {
+                    background-color: #232423;
+                    color: #D6D6D6;
+                    padding: 4px;
+                }
+                QTableWidget#AnalysisTable::item:selected {
+                    background-color: #282928;
+                    color: #D6D6D6;
+                }
+                QTableWidget#AnalysisTable QHeaderView::section {
+                    background-color: #1B1B1B;
+                    color: #D6D6D6;
+                    border: 1px solid #1f201f;
+                }
+            """,
+        },
+    ),
+    LIGHT: ThemeDefinition(
+        palette={
+            'Window': '#f5f1e6',
+            'WindowText': '#000000',
+            'Base': '#f5f1e6',
+            'AlternateBase': '#f0ece1',  # Slightly darker than base
+            'Text': '#000000',
+            'Button': '#f5f1e6',
+            'ButtonText': '#000000',
+            'Highlight': '#f5eedc',  # Title bar color
+            'HighlightedText': '#000000',
+            'Link': '#d5d1c6',  # Darker variant of base
+            'PlaceholderText': '#808080',
+        },
+        window_stylesheet="""
+            QToolTip {
+                color: #000;
+                background-color: #f5eedc;
+                border: none;
+            }
+            QTableView, QTableWidget {
+                gridline-color: #e5e1d6;
+                background-color: #f5f1e6;
+                border: 1px solid #e5e1d6;
+                color: #000;
+            }
+            QHeaderView::section {
+                background-color: #f5eedc;
+                color: #000;
+                border: none;
+            }
+            QTabBar::tab {
+                background: #f5eedc;
+                color: #333333;
+                border: none;
+                padding: 5px;
+            }
+            QTabBar::tab:selected {
+                background: #f5f1e6;
+                color: #000;
+            }
+            QFrame, QWidget {
+                background-color: #f5f1e6;
+                color: #000;
+            }
+            QDialog, QMainWindow {
+                background-color: #f5f1e6;
+            }
+            QGroupBox {
+                color: #000;
+                border: 1px solid #e5e1d6;
+            }
+            QGroupBox::title {
+                color: #000;
+            }
+            QPushButton {
+                background-color: #f5eedc;
+                color: #000;
+                border: 1px solid #e5e1d6;
+            }
+            QPushButton:hover {
+                background-color: #e5decc;
+            }
+            QPushButton:pressed {
+                background-color: #d5cebc;
+            }
+            QLineEdit, QTextEdit, QPlainTextEdit, QComboBox, QSpinBox, QDateEdit {
+                background-color: #ffffff;
+                color: #000;
+                border: 1px solid #e5e1d6;
+            }
+            QComboBox QAbstractItemView {
+                background-color: #ffffff;
+                color: #000;
+                selection-background-color: #f5eedc;
+            }
+            QScrollBar {
+                background-color: #f5f1e6;
+            }
+            QScrollBar::handle {
+                background-color: #f5eedc;
+            }
+            QScrollBar::handle:hover {
+                background-color: #e5decc;
+            }
+            QListWidget {
+                background-color: #f5f1e6;
+                color: #000;
+                border: 1px solid #e5e1d6;
+            }
+            QListWidget::item:selected {
+                background-color: #f5eedc;
+                color: #000;
+            }
+            QLabel {
+                color: #000;
+            }
+            QScrollArea {
+                background-color: #f0ece1; /* Using AlternateBase for scroll area */
+            }
+            QChartView {
+                background-color: #f5f1e6;
+                border: 1px solid #e5e1d6;
+            }
+            QTableWidget::item {
+                background-color: #f5f1e6;
+                color: #000;
+            }
+            QTableWidget::item:selected {
+                background-color: #f5eedc;
+                color: #000;
+            }
+        """,
+        scoped={
+            MAIN_SCOPE: """
+                /* Specific styles for Task Grid Table */
+                QTableWidget#TaskTable {
+                    background-color: #eeede6; /* Slightly darker background */
+                    border: 1px solid #d5d1c6; /* Darker border */
+                    border-radius: 4px;
+                    gridline-color: #d8d4c9; /* More visible gridlines */
+                }
+                QTableWidget#TaskTable::item {
+                    background-color: #eeede6;
+                    color: #000;
+                    padding: 4px;
+                }
+                QTableWidget#TaskTable::item:selected {
+                    background-color: #e2e0d7;
+                    color: #000;
+                }
+                QTableWidget#TaskTable QHeaderView::section {
+                    background-color: #eeede6;
+                    color: #000;
+                    border: 1px solid #d5d1c6;
+                }
+            """,
+            ANALYSIS_SCOPE: """
+                /* Specific styles for Analysis Tables */
+                QTableWidget#AnalysisTable {
+                    background-color: #f5f1e6;
+                    border: 1px solid #e5e1d6;
+                    gridline-color: #e5e1d6;
+                }
+                QTableWidget#AnalysisTable::item {
+                    background-color: #f5f1e6;
+                    color: #000;
+                    padding: 4px;
+                }
+                QTableWidget#AnalysisTable::item:selected {
+                    background-color: #f5eedc;
+                    color: #000;
+                }
+                QTableWidget#AnalysisTable QHeaderView::section {
+                    background-color: #f5eedc;
+                    color: #000;
+                    border: none;
+                }
+            """,
+        },
+    ),
+}
+
+
+_COMMENT_RE = re.compile(r'/\*.*?\*/', re.DOTALL)
+_SPACE_RE = re.compile(r'\s+')
+_PUNCTUATION_SPACE_RE = re.compile(r'\s*([{};:,])\s*')
+
+
+def compile_stylesheet(stylesheet: str) -> str:
+    """Strip comments and redundant whitespace so Qt parses the minimum of text"""
+    compiled = _COMMENT_RE.sub('', stylesheet)
+    compiled = _SPACE_RE.sub(' ', compiled)
+    compiled = _PUNCTUATION_SPACE_RE.sub(r'\1', compiled)
+    return compiled.replace(';}', '}').strip()
+
+
+def theme_name(dark_mode: bool) -> str:
+    return DARK if dark_mode else LIGHT
+
+
+@lru_cache(maxsize=None)
+def application_stylesheet() -> str:
+    """The theme-independent application stylesheet, compiled once"""
+    return compile_stylesheet(APPLICATION_STYLESHEET)
+
+
+@lru_cache(maxsize=None)
+def window_stylesheet(name: str, scope: str = MAIN_SCOPE) -> str:
+    """A theme's stylesheet for one window scope, compiled once per theme/scope"""
+    theme = THEMES[name]
+    return compile_stylesheet(theme.window_stylesheet + theme.scoped.get(scope, ''))
@@ -4,11 +4,13 @@ import sys
 from PySide6 import QtCore, QtWidgets, QtGui
 from PySide6.QtMultimedia import QSoundEffect
 from datetime import datetime
-from analysis.timer_optimization import get_batched_updates, OptimizedTimerDisplay
+from analysis.timer_optimization import get_batched_updates, get_timer_ticker, OptimizedTimerDisplay
+from core.services.timer_engine import get_timer_engine
 
 # Data Service Layer imports
 from core.services.data_service import DataService, DataServiceError
 from core.services.task_dao import TaskDAO
+from core.db.connection_manager import get_connection_manager
 
 # Event Bus imports
 from core.events import get_event_bus, EventType
@@ -41,11 +43,16 @@ class TimerDialog(QtWidgets.QDialog):
             self.data_service = None
             self.task_dao = None
         
-        # Timer state
-        self.timer = QtCore.QTimer()
-        self.timer.timeout.connect(self.update_display)
-        self.timer.setInterval(1000)  # Update every second
+        # Timer state: elapsed time lives in the monotonic engine, the shared
+        # ticker only repaints, so ticks lost to a blocked event loop lose no time
+        self.engine = get_timer_engine()
+        self.ticker = get_timer_ticker()
+        self._last_queued_seconds = None
+        self._finished = False
         
+        # Start from a stopped timer: an entry left behind for this task must
+        # not keep running while the dialog shows "paused"
+        self.engine.remove(self.task_id)
         self.total_seconds = 0
         self.is_running = False
         self.is_first_start_for_task = True
@@ -139,6 +146,14 @@ class TimerDialog(QtWidgets.QDialog):
         if self.parent_grid:
             self.parent_grid.timeLimitChanged.connect(self.on_time_limit_changed)
         
+    @property
+    def total_seconds(self):
+        return self.engine.elapsed_seconds(self.task_id)
+    
+    @total_seconds.setter
+    def total_seconds(self, seconds):
+        self.engine.set_elapsed(self.task_id, seconds)
+    
     def setup_ui(self):
         layout = QtWidgets.QVBoxLayout(self)
         
@@ -188,11 +203,10 @@ class TimerDialog(QtWidgets.QDialog):
                     time_begin = None
             else:
                 # Fallback to direct SQLite if Data Service Layer not available
-                conn = sqlite3.connect(DB_FILE)
-                c = conn.cursor()
-                c.execute("SELECT duration, time_begin FROM tasks WHERE id=?", (self.task_id,))
-                result = c.fetchone()
-                conn.close()
+                with get_connection_manager().reader() as conn:
+                    c = conn.cursor()
+                    c.execute("SELECT duration, time_begin FROM tasks WHERE id=?", (self.task_id,))
+                    result = c.fetchone()
                 
                 if result:
                     duration_str = result[0] or "00:00:00"
@@ -275,12 +289,13 @@ class TimerDialog(QtWidgets.QDialog):
     
     def update_display(self):
         """Update the timer display"""
-        if self.is_running:
-            self.total_seconds += 1
-            # Queue batched duration update
-            self.batched_updates.queue_duration_update(self.task_id, self.total_seconds)
+        total_seconds = self.total_seconds
+        if self.is_running and total_seconds != self._last_queued_seconds:
+            # Queue batched duration update once per whole second
+            self._last_queued_seconds = total_seconds
+            self.batched_updates.queue_duration_update(self.task_id, total_seconds)
         
-        self.display.update_display(self.total_seconds, self.time_display)
+        self.display.update_display(total_seconds, self.time_display)
         self._check_and_apply_alert()
     
     def start_timer(self):
@@ -291,7 +306,8 @@ class TimerDialog(QtWidgets.QDialog):
                 self.start_timestamp_for_new_task = datetime.now()
             
             self.is_running = True
-            self.timer.start()
+            self.engine.start(self.task_id)
+            self.ticker.subscribe(self.update_display)
             self.start_button.setEnabled(False)
             self.pause_button.setEnabled(True)
             
@@ -311,10 +327,17 @@ class TimerDialog(QtWidgets.QDialog):
         """Pause the timer"""
         if self.is_running:
             self.is_running = False
-            self.timer.stop()
+            self.engine.pause(self.task_id)
+            self.ticker.unsubscribe(self.update_display)
             self.start_button.setEnabled(True)
             self.pause_button.setEnabled(False)
             
+            self._last_queued_seconds = self.total_seconds
+            self.batched_updates.queue_duration_update(self.task_id, self._last_queued_seconds)
+            
+            # Persist the paused duration right away instead of waiting for the batch interval
+            self.batched_updates.flush_updates()
+            
             # Emit timer paused event
             self.event_bus.emit_event(
                 EventType.TIMER_PAUSED,
@@ -389,8 +412,18 @@ class TimerDialog(QtWidgets.QDialog):
         """Check if the current duration is different from the initial one"""
         return self.total_seconds != self.initial_duration_seconds
     
-    def closeEvent(self, event):
-        """Handle dialog close - update the database and parent grid"""
+    def done(self, result):
+        """
+        Handle dialog close - runs for the close button, Esc/reject() and
+        accept() alike, unlike closeEvent() which reject() skips under exec()
+        """
+        if not self._finished:
+            self._finished = True
+            self._finish_timer()
+        super().done(result)
+    
+    def _finish_timer(self):
+        """Stop the timer, update the database and parent grid, release the engine entry"""
         # Stop the timer if running
         if self.is_running:
             self.pause_timer()
@@ -421,4 +454,5 @@ class TimerDialog(QtWidgets.QDialog):
         if self.batched_updates:
             self.batched_updates.flush_updates()
         
-        super().closeEvent(event) 
\ No newline at end of file
+        self.ticker.unsubscribe(self.update_display)
+        self.engine.remove(self.task_id) 
\ No newline at end of file
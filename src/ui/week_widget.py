@@ -1,30 +1,54 @@
 import sqlite3
-import os
-import shutil
 import sys
-from datetime import datetime
 from PySide6 import QtCore, QtWidgets
 from core.settings.global_settings import global_settings
 
 # Data Service Layer imports
 from core.services.data_service import DataService, DataServiceError
 from core.services.week_dao import WeekDAO
+from core.db.connection_manager import get_connection_manager
+from core.db.backup import DatabaseBackup, BackupError
 
 # Event Bus imports
 from core.events import get_event_bus, EventType
 
-DB_FILE = "tasks.db"
-
 def is_production():
     """Check if running in production (bundled) environment"""
     return getattr(sys, 'frozen', False)
 
+class DatabaseBackupThread(QtCore.QThread):
+    """Runs a prepared database backup off the GUI thread"""
+
+    backupProgress = QtCore.Signal(int, int)  # pages copied, total pages
+    backupFinished = QtCore.Signal(object, str)  # BackupResult (None on failure), error message
+
+    def __init__(self, job, parent=None):
+        super().__init__(parent)
+        self.job = job
+
+    def run(self):
+        try:
+            result = self.job.run(progress=self.backupProgress.emit)
+        except BackupError as e:
+            self.backupFinished.emit(None, str(e))
+            return
+        except Exception as e:
+            # backupFinished must always be emitted, or the thread is never released
+            self.backupFinished.emit(None, f"Unexpected backup error: {e}")
+            return
+        self.backupFinished.emit(result, "")
+
+
 class WeekWidget(QtWidgets.QWidget):
     weekChanged = QtCore.Signal(int, str)
+    backupProgress = QtCore.Signal(int, int)  # pages copied, total pages
     
-    def __init__(self, parent=None):
+    def __init__(self, parent=None, snapshot=None):
         super().__init__(parent)
         
+        # Background backups still running
+        self._backup_threads = set()
+        
         # Initialize Event Bus
         self.event_bus = get_event_bus()
         
@@ -82,7 +106,13 @@ class WeekWidget(QtWidgets.QWidget):
         self.sort_weeks_btn.clicked.connect(self.sort_weeks)
         
         self.weeks = []
-        self.refresh_weeks()
+        if snapshot is not None and snapshot.weeks:
+            # Warm start: show the weeks from the last session now and
+            # reconcile with the database once the window has painted
+            self._populate_weeks(snapshot.weeks)
+            QtCore.QTimer.singleShot(0, self.reconcile_weeks)
+        else:
+            self.refresh_weeks()
     
     def selection_changed(self):
         week_id, week_label = self.current_week_id()
@@ -101,11 +131,42 @@ class WeekWidget(QtWidgets.QWidget):
             )
     
     def refresh_weeks(self):
+        self._populate_weeks(self.get_weeks())
+    
+    def _populate_weeks(self, weeks):
         self.week_list.clear()
-        self.weeks = self.get_weeks()
+        self.weeks = list(weeks)
         for week_id, week_label in self.weeks:
             self.week_list.addItem(week_label)
     
+    def reconcile_weeks(self):
+        """Replace warm-start weeks with the live list, keeping the selection"""
+        live_weeks = self.get_weeks()
+        if live_weeks == self.weeks:
+            return
+        
+        current_week_id, _ = self.current_week_id()
+        # Rebuilding the list must not re-announce an unchanged selection
+        self.week_list.blockSignals(True)
+        try:
+            self._populate_weeks(live_weeks)
+            if current_week_id is not None:
+                self.select_week_by_id(current_week_id)
+        finally:
+            self.week_list.blockSignals(False)
+        
+        if current_week_id is not None and self.current_week_id()[0] is None:
+            # The selected week no longer exists; let listeners clear their views
+            self.weekChanged.emit(None, None)
+            self.event_bus.emit_event(
+                EventType.WEEK_CHANGED,
+                {
+                    'week_id': None,
+                    'week_label': None
+                },
+                'WeekWidget'
+            )
+    
     def sort_weeks(self):
         """Sort weeks chronologically and preserve current selection"""
         # Remember current selection
@@ -134,27 +195,48 @@ class WeekWidget(QtWidgets.QWidget):
                 self.week_list.setCurrentRow(idx)
                 break
     
-    def create_db_backup(self):
-        """Create a backup of the database only in production environment"""
+    def create_db_backup(self, label=None):
+        """
+        Back up the database in the background, only in production environment.
+        The backup captures the database as it is when this returns, so the
+        caller can go ahead and change it. Returns the backup path.
+        """
         # Only create backups in production environment
-        if not is_production() or not os.path.exists(DB_FILE):
+        if not is_production():
             return None
         
-        # Create backups directory if it doesn't exist
-        backup_dir = os.path.join(os.path.dirname(os.path.abspath(DB_FILE)), "backups")
-        os.makedirs(backup_dir, exist_ok=True)
-        
-        # Create a backup with timestamp
-        timestamp = datetime.now().strftime("%Y%m%d%H%M%S")
-        backup_file = os.path.join(backup_dir, f"tasks_backup_{timestamp}.db")
-        
         try:
-            shutil.copy2(DB_FILE, backup_file)
-            print(f"Created database backup: {backup_file}")
-            return backup_file
-        except Exception as e:
+            job = DatabaseBackup().prepare(label)
+        except BackupError as e:
             print(f"Failed to create backup: {e}")
             return None
+        
+        thread = DatabaseBackupThread(job, self)
+        thread.backupProgress.connect(self.backupProgress)
+        thread.backupFinished.connect(self._on_backup_finished)
+        thread.finished.connect(lambda: self._backup_threads.discard(thread))
+        thread.finished.connect(thread.deleteLater)
+        self._backup_threads.add(thread)
+        thread.start()
+        return job.dest_path
+    
+    def _on_backup_finished(self, result, error):
+        if result is not None:
+            print(f"Created database backup: {result.path}")
+            return
+        print(f"Failed to create backup: {error}")
+        if hasattr(self.main_window, 'toaster_manager'):
+            self.main_window.toaster_manager.show_error(error, "Backup Failed", 5000)
+    
+    def wait_for_backups(self, timeout_ms=30000):
+        """
+        Let running backups finish (application shutdown); a backup still
+        running after timeout_ms is cancelled, so no thread outlives the window
+        """
+        for thread in list(self._backup_threads):
+            if not thread.wait(timeout_ms):
+                thread.job.cancel()
+                thread.wait()
     
     def add_week(self):
         # Validate week duration if enforcement is enabled
@@ -179,7 +261,7 @@ class WeekWidget(QtWidgets.QWidget):
                 return
         
         # Create a database backup before adding a new week (only in production)
-        self.create_db_backup()
+        self.create_db_backup("before_add_week")
         
         start_date_py = self.start_date.date().toPython()
         end_date_py = self.end_date.date().toPython()
@@ -187,6 +269,8 @@ class WeekWidget(QtWidgets.QWidget):
         start_date = self.start_date.date().toString("dd/MM/yyyy")
         end_date = self.end_date.date().toString("dd/MM/yyyy")
         week_label = f"{start_date} - {end_date}"
+        start_date_iso = start_date_py.isoformat()
+        end_date_iso = end_date_py.isoformat()
         
         # Calculate the start and end day of week from the selected dates
         # Python weekday(): Monday=0, Tuesday=1, ..., Sunday=6
@@ -204,6 +288,8 @@ class WeekWidget(QtWidgets.QWidget):
             if self.week_dao:
                 week_data = {
                     'week_label': week_label,
+                    'start_date': start_date_iso,
+                    'end_date': end_date_iso,
                     'week_start_day': week_start_day,
                     'week_start_hour': week_start_hour,
                     'week_end_day': week_end_day,
@@ -229,23 +315,22 @@ class WeekWidget(QtWidgets.QWidget):
                     self.main_window.toaster_manager.show_info(f"Created new week: {week_label}", "Week Added", 3000)
             else:
                 # Fallback to direct SQLite if Data Service Layer not available
-                conn = sqlite3.connect(DB_FILE)
-                c = conn.cursor()
-                c.execute("""
-                    INSERT INTO weeks (
-                        week_label, 
-                        week_start_day, week_start_hour, 
-                        week_end_day, week_end_hour, 
-                        is_custom_duration
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    week_label, 
-                    week_start_day, week_start_hour,
-                    week_end_day, week_end_hour,
-                    True  # Mark as custom duration since we're setting specific days
-                ))
-                conn.commit()
-                conn.close()
+                with get_connection_manager().writer() as conn:
+                    c = conn.cursor()
+                    c.execute("""
+                        INSERT INTO weeks (
+                            week_label, start_date, end_date,
+                            week_start_day, week_start_hour, 
+                            week_end_day, week_end_hour, 
+                            is_custom_duration
+                        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                    """, (
+                        week_label, start_date_iso, end_date_iso,
+                        week_start_day, week_start_hour,
+                        week_end_day, week_end_hour,
+                        True  # Mark as custom duration since we're setting specific days
+                    ))
+                    conn.commit()
                 
                 # Show success notification via main window toaster manager
                 if hasattr(self.main_window, 'toaster_manager'):
@@ -319,7 +404,7 @@ class WeekWidget(QtWidgets.QWidget):
             return
             
         # Create a backup before deleting (only in production)
-        self.create_db_backup()
+        self.create_db_backup("before_delete_week")
         
         try:
             # Use Data Service Layer for week deletion
@@ -327,11 +412,10 @@ class WeekWidget(QtWidgets.QWidget):
                 self.week_dao.delete_week(week_id)
             else:
                 # Fallback to direct SQLite if Data Service Layer not available
-                conn = sqlite3.connect(DB_FILE)
-                c = conn.cursor()
-                c.execute("DELETE FROM weeks WHERE id=?", (week_id,))
-                conn.commit()
-                conn.close()
+                with get_connection_manager().writer() as conn:
+                    c = conn.cursor()
+                    c.execute("DELETE FROM weeks WHERE id=?", (week_id,))
+                    conn.commit()
             
             # Emit week deleted event
             self.event_bus.emit_event(
@@ -382,45 +466,19 @@ class WeekWidget(QtWidgets.QWidget):
         try:
             # Use Data Service Layer for week retrieval
             if self.week_dao:
-                weeks_data = self.week_dao.get_all_weeks()
+                # Weeks are ordered by the indexed start_date column
+                weeks_data = self.week_dao.get_weeks_chronological()
                 # Convert to tuple format for compatibility with existing logic
                 weeks = [(week['id'], week['week_label']) for week in weeks_data]
             else:
                 # Fallback to direct SQLite if Data Service Layer not available
-                conn = sqlite3.connect(DB_FILE)
-                c = conn.cursor()
-                c.execute("SELECT id, week_label FROM weeks")
-                weeks = c.fetchall()
-                conn.close()
+                with get_connection_manager().reader() as conn:
+                    c = conn.cursor()
+                    c.execute("SELECT id, week_label FROM weeks ORDER BY start_date, id")
+                    weeks = c.fetchall()
         except DataServiceError as e:
             print(f"Error retrieving weeks: {e}")
             # Return empty list on error
             weeks = []
         
-        # Sort weeks chronologically by parsing the start date from week_label
-        def parse_start_date(week_tuple):
-            week_id, week_label = week_tuple
-            try:
-                # Extract start date from format "dd/MM/yyyy - dd/MM/yyyy"
-                start_date_str = week_label.split(" - ")[0]
-                
-                # Try parsing multiple date formats
-                date_formats = ["%d/%m/%Y", "%m/%d/%Y", "%Y-%m-%d", "%d-%m-%Y"]
-                
-                for fmt in date_formats:
-                    try:
-                        return datetime.strptime(start_date_str, fmt)
-                    except ValueError:
-                        continue # Try next format if this one fails
-                
-                # If no format matched, fall back to a very old date and print a warning
-                print(f"Warning: Could not parse date from week label '{week_label}'. Using default date.")
-                return datetime(1900, 1, 1)
-            except (ValueError, IndexError, AttributeError) as e:
-                # If splitting or other initial operations fail, it's a completely malformed label
-                print(f"Warning: Malformed week label '{week_label}'. Error: {e}. Using default date.")
-                return datetime(1900, 1, 1)
-        
-        # Sort by parsed start date
-        weeks.sort(key=parse_start_date)
         return weeks 
\ No newline at end of file
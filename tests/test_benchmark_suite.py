@@ -0,0 +1,111 @@
+"""
+Unit tests for the benchmark dataset generator and baseline comparison
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+# Add src and performance to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'performance'))
+
+from benchmark_data import generate_dataset
+from benchmark_suite import compare_to_baselines, load_baselines, save_baselines
+
+
+class TestBenchmarkDataset(unittest.TestCase):
+    """Test that generated datasets are reproducible"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def dump(self, db_path):
+        conn = sqlite3.connect(db_path)
+        try:
+            weeks = conn.execute("SELECT id, week_label, start_date, end_date, is_bonus_week FROM weeks ORDER BY id").fetchall()
+            tasks = conn.execute("SELECT * FROM tasks ORDER BY id").fetchall()
+        finally:
+            conn.close()
+        return weeks, tasks
+
+    def test_same_seed_same_rows(self):
+        """The same seed and size produce identical weeks and tasks"""
+        first = os.path.join(self.temp_dir.name, 'a.db')
+        second = os.path.join(self.temp_dir.name, 'b.db')
+        summary = generate_dataset(first, 600, seed=7)
+        generate_dataset(second, 600, seed=7)
+
+        weeks, tasks = self.dump(first)
+        self.assertEqual((weeks, tasks), self.dump(second))
+        self.assertEqual(len(tasks), 600)
+        self.assertEqual(len(weeks), summary['weeks'])
+
+    def test_different_seed_different_rows(self):
+        """A different seed changes the generated data"""
+        first = os.path.join(self.temp_dir.name, 'a.db')
+        second = os.path.join(self.temp_dir.name, 'b.db')
+        generate_dataset(first, 300, seed=1)
+        generate_dataset(second, 300, seed=2)
+        self.assertNotEqual(self.dump(first)[1], self.dump(second)[1])
+
+
+class TestBaselineComparison(unittest.TestCase):
+    """Test regression detection against stored baselines"""
+
+    def test_tolerance_and_noise_floor(self):
+        """Only slowdowns beyond both the tolerance and the noise floor are regressions"""
+        baselines = {
+            '1k/dao.slow': {'median_ms': 10.0},
+            '1k/dao.ok': {'median_ms': 10.0},
+            '1k/cache.tiny': {'median_ms': 0.1},
+        }
+        results = {
+            '1k/dao.slow': {'median_ms': 14.0},
+            '1k/dao.ok': {'median_ms': 12.0},
+            '1k/cache.tiny': {'median_ms': 0.5},
+            '1k/dao.new': {'median_ms': 99.0},
+            '1k/qml.refresh': {'skipped': 'missing dependency: PySide6'},
+        }
+        regressions = compare_to_baselines(results, baselines, tolerance=0.25, min_delta_ms=2.0)
+        self.assertEqual(len(regressions), 1)
+        self.assertTrue(regressions[0].startswith('1k/dao.slow'))
+
+    def test_errors_and_missing_results_fail(self):
+        """A benchmark that raised or vanished from the run is a failure"""
+        baselines = {
+            '1k/dao.broken': {'median_ms': 10.0},
+            '1k/dao.gone': {'median_ms': 10.0},
+            '1k/qml.refresh': {'median_ms': 10.0},
+            '100k/dao.gone': {'median_ms': 50.0},
+            '1k/cache.other': {'median_ms': 1.0},
+        }
+        results = {
+            '1k/dao.broken': {'error': 'OperationalError: no such table: tasks'},
+            '1k/dao.new_broken': {'error': 'ValueError: bad input'},
+            '1k/qml.refresh': {'skipped': 'missing dependency: PySide6'},
+        }
+        failures = compare_to_baselines(results, baselines, scales=['1k'], only=['dao', 'qml'])
+        self.assertEqual([failure.split(':')[0] for failure in failures],
+                         ['1k/dao.broken', '1k/dao.new_broken', '1k/dao.gone'])
+        self.assertIn('no result', failures[2])
+
+    def test_save_and_load_baselines(self):
+        """Saved baselines keep timed results and merge with existing entries"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'baselines.json')
+            save_baselines(path, {'1k/a': {'median_ms': 1.5}, '1k/b': {'skipped': 'x'}}, seed=1)
+            save_baselines(path, {'100k/a': {'median_ms': 20.0}}, seed=1, existing=load_baselines(path))
+            self.assertEqual(load_baselines(path), {
+                '100k/a': {'median_ms': 20.0},
+                '1k/a': {'median_ms': 1.5},
+            })
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,63 @@
+"""
+Unit tests for the cached bonus indicator state model
+"""
+
+import os
+import sys
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ui.bonus_indicator import BonusIndicatorModel, BONUS_DISABLED, BONUS_ON, BONUS_OFF
+
+
+class TestBonusIndicatorModel(unittest.TestCase):
+    """Test state caching and transition detection"""
+
+    def setUp(self):
+        self.weeks = {1: True, 2: False}
+        self.loads = []
+        self.model = BonusIndicatorModel(self.load_week)
+
+    def load_week(self, week_id):
+        self.loads.append(week_id)
+        return self.weeks.get(week_id)
+
+    def test_week_flag_is_loaded_once(self):
+        """Switching back to a week reuses the cached bonus flag"""
+        self.assertTrue(self.model.set_current_week(1))
+        self.assertEqual(self.model.state, BONUS_ON)
+        self.model.set_current_week(2)
+        self.model.set_current_week(1)
+        self.assertEqual(self.model.state, BONUS_ON)
+        self.assertEqual(self.loads, [1, 2])
+
+    def test_transitions_are_reported(self):
+        """Only real state changes report True"""
+        self.model.set_current_week(2)
+        self.assertFalse(self.model.set_week_bonus(2, False))
+        self.assertTrue(self.model.set_week_bonus(2, True))
+        self.assertEqual(self.model.state, BONUS_ON)
+        self.assertTrue(self.model.set_global_enabled(False))
+        self.assertEqual(self.model.state, BONUS_DISABLED)
+        self.assertFalse(self.model.set_global_enabled(False))
+
+    def test_invalidate_reloads_week(self):
+        """Invalidated weeks are reloaded on the next read"""
+        self.model.set_current_week(1)
+        self.weeks[1] = False
+        self.assertTrue(self.model.invalidate_week(1))
+        self.assertEqual(self.model.state, BONUS_OFF)
+        self.assertEqual(self.loads, [1, 1])
+
+    def test_failed_load_is_not_cached(self):
+        """A week that cannot be loaded shows OFF and is retried later"""
+        self.model.set_current_week(3)
+        self.assertEqual(self.model.state, BONUS_OFF)
+        self.weeks[3] = True
+        self.assertEqual(self.model.state, BONUS_ON)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,102 @@
+"""
+Unit tests for the unified SQLite connection manager
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.db.connection_manager import ConnectionManager
+
+
+class TestConnectionManager(unittest.TestCase):
+    """Test per-thread reuse, reader/writer separation and metrics"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.manager = ConnectionManager(os.path.join(self.temp_dir.name, 'tasks.db'))
+        with self.manager.writer() as conn:
+            conn.execute("CREATE TABLE tasks (id INTEGER PRIMARY KEY, duration TEXT)")
+            conn.commit()
+
+    def tearDown(self):
+        self.manager.close_all()
+        self.temp_dir.cleanup()
+
+    def test_connections_are_reused_per_thread(self):
+        """The same thread always gets the same writer connection"""
+        with self.manager.writer() as first:
+            pass
+        with self.manager.writer() as second:
+            pass
+        self.assertIs(first, second)
+
+        other = []
+
+        def worker():
+            with self.manager.writer() as conn:
+                other.append(conn)
+            self.manager.close_thread_connections()
+
+        thread = threading.Thread(target=worker)
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], first)
+
+    def test_consistent_pragmas(self):
+        """Writers and readers share WAL, mmap and foreign key settings"""
+        with self.manager.writer() as conn:
+            self.assertEqual(conn.execute("PRAGMA journal_mode").fetchone()[0], 'wal')
+            self.assertEqual(conn.execute("PRAGMA foreign_keys").fetchone()[0], 1)
+        with self.manager.reader() as conn:
+            self.assertEqual(conn.execute("PRAGMA mmap_size").fetchone()[0], 268435456)
+            self.assertEqual(conn.execute("PRAGMA query_only").fetchone()[0], 1)
+
+    def test_reader_is_read_only(self):
+        """Writes through the reader connection are rejected"""
+        with self.assertRaises(sqlite3.OperationalError):
+            with self.manager.reader() as conn:
+                conn.execute("INSERT INTO tasks (duration) VALUES ('00:01:00')")
+
+    def test_reads_inside_write_transaction_see_own_writes(self):
+        """A thread with an open write transaction reads through its writer"""
+        with self.manager.writer() as writer:
+            writer.execute("INSERT INTO tasks (duration) VALUES ('00:01:00')")
+            with self.manager.reader() as reader:
+                self.assertIs(reader, writer)
+                self.assertEqual(reader.execute("SELECT COUNT(*) FROM tasks").fetchone()[0], 1)
+            writer.commit()
+
+    def test_uncommitted_work_is_rolled_back_on_release(self):
+        """Leaving a scope with an open transaction does not hold the write lock"""
+        with self.manager.writer() as conn:
+            conn.execute("INSERT INTO tasks (duration) VALUES ('00:01:00')")
+        with self.manager.reader() as conn:
+            self.assertEqual(conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0], 0)
+        self.assertEqual(self.manager.get_stats()['rollbacks_on_release'], 1)
+
+    def test_row_factory_is_scoped(self):
+        """A row factory requested for one scope does not leak into the next"""
+        with self.manager.reader(row_factory=sqlite3.Row) as conn:
+            self.assertIsInstance(conn.execute("SELECT 1 AS one").fetchone(), sqlite3.Row)
+        with self.manager.reader() as conn:
+            self.assertEqual(conn.execute("SELECT 1").fetchone(), (1,))
+
+    def test_metrics(self):
+        """Acquisitions and open connections are reported"""
+        with self.manager.reader() as conn:
+            conn.execute("SELECT 1")
+        stats = self.manager.get_stats()
+        self.assertEqual(stats['open_connections'], {'writer': 1, 'reader': 1})
+        self.assertGreaterEqual(stats['acquisitions']['writer'], 1)
+        self.assertEqual(stats['acquisitions']['reader'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
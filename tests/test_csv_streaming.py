@@ -0,0 +1,116 @@
+"""
+Unit tests for the streaming CSV reader and chunked task import
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.performance.rust_file_io_engine import RustFileIOEngine, parse_duration_seconds
+from core.db import import_data
+
+TASK_HEADER = ("Attempt ID,Duration,Project ID,Project Name,Operation ID,"
+               "Time Limit,Date Audited,Score,Feedback,Locale")
+
+
+class TestCsvBatchReader(unittest.TestCase):
+    """Test RFC 4180 parsing and typed batches"""
+
+    def setUp(self):
+        self.engine = RustFileIOEngine()
+        self.temp_dir = tempfile.TemporaryDirectory()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def write_csv(self, name, content):
+        path = os.path.join(self.temp_dir.name, name)
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            f.write(content)
+        return path
+
+    def test_quoted_fields_with_delimiters_and_newlines(self):
+        """Quoted commas, doubled quotes and line breaks stay inside one field"""
+        path = self.write_csv('quoted.csv', TASK_HEADER + '\r\n'
+                              'a1,01:00:00,p1,"Project, A",op,00:30:00,2024-01-05,4,'
+                              '"Line one\nLine ""two""",en\r\n')
+
+        batches = list(self.engine.read_csv_batches(path))
+
+        self.assertEqual(len(batches), 1)
+        batch = batches[0]
+        self.assertEqual(batch.row_count, 1)
+        self.assertEqual(batch.columns['Project Name'], ['Project, A'])
+        self.assertEqual(batch.columns['Feedback'], ['Line one\nLine "two"'])
+        self.assertEqual(batch.columns['Locale'], ['en'])
+
+    def test_typed_columns(self):
+        """Durations are converted to seconds and scores to floats"""
+        path = self.write_csv('typed.csv', TASK_HEADER + '\n'
+                              'a1,1:02:03,p,P,op,bad,2024-01-05,,f,en\n')
+
+        batch = next(iter(self.engine.read_csv_batches(path)))
+
+        self.assertEqual(batch.columns['Duration'], [3723])
+        self.assertEqual(batch.columns['Time Limit'], [None])
+        self.assertEqual(batch.columns['Score'], [None])
+
+    def test_batches_are_bounded(self):
+        """Rows are yielded in batches of at most batch_size"""
+        rows = ''.join(f'a{i},00:01:00,p,P,op,00:30:00,2024-01-05,3,,en\n' for i in range(25))
+        path = self.write_csv('many.csv', TASK_HEADER + '\n' + rows)
+
+        batches = list(self.engine.read_csv_batches(path, batch_size=10))
+
+        self.assertEqual([b.row_count for b in batches], [10, 10, 5])
+        self.assertEqual([b.first_row for b in batches], [1, 11, 21])
+
+    def test_parse_duration_seconds(self):
+        """Duration parsing follows the importer validation rules"""
+        self.assertEqual(parse_duration_seconds('00:10:00'), 600)
+        self.assertIsNone(parse_duration_seconds('100:00:00'))
+        self.assertIsNone(parse_duration_seconds('00:60:00'))
+        self.assertIsNone(parse_duration_seconds('10:00'))
+
+
+class TestChunkedCsvImport(unittest.TestCase):
+    """Test that the CSV importer inserts streamed chunks"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.conn = sqlite3.connect(os.path.join(self.temp_dir.name, 'import.db'))
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute("CREATE TABLE weeks (id INTEGER PRIMARY KEY AUTOINCREMENT, week_label TEXT UNIQUE NOT NULL, "
+                          "start_date TEXT, end_date TEXT)")
+        self.conn.execute("""CREATE TABLE tasks (
+            id INTEGER PRIMARY KEY AUTOINCREMENT, week_id INTEGER NOT NULL,
+            attempt_id TEXT, duration TEXT, project_id TEXT, project_name TEXT,
+            operation_id TEXT, time_limit TEXT, date_audited TEXT, score INTEGER,
+            feedback TEXT, locale TEXT)""")
+
+    def tearDown(self):
+        self.conn.close()
+        self.temp_dir.cleanup()
+
+    def test_import_tasks_from_csv(self):
+        path = os.path.join(self.temp_dir.name, 'auditor_tasks_W1.csv')
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            f.write(TASK_HEADER + '\n'
+                    'a1,1:00:00,p,P,op,00:30:00,2024-01-05,4,"Good, clear",en\n'
+                    'a2,bad,p,P,op,00:30:00,2024-01-05,4,,en\n')
+
+        read, inserted, invalid, errors = import_data.import_tasks_from_csv(path, self.conn)
+
+        self.assertEqual((read, inserted, errors), (2, 1, []))
+        self.assertEqual(invalid[0]['row_index'], 3)
+        row = self.conn.execute("SELECT duration, feedback, date_audited FROM tasks").fetchone()
+        self.assertEqual(tuple(row), ('01:00:00', 'Good, clear', '2024-01-05'))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,187 @@
+"""
+Unit tests for DataService.transaction() units of work
+
+A transaction runs its commands on one connection, commits once, invalidates
+the query cache once at commit and releases held-back events only after the
+commit succeeds.
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.db.connection_manager import get_connection_manager
+from core.optimization.multi_tier_cache import MultiTierCache
+from core.services.data_service import DataService, DataServiceError
+
+try:
+    from PySide6 import QtCore  # noqa: F401
+    QT_AVAILABLE = True
+except ImportError:
+    QT_AVAILABLE = False
+
+
+class _RecordingBus:
+    """Stands in for AppEventBus's deferral hooks"""
+
+    def __init__(self):
+        self.calls = []
+
+    def begin_deferred(self):
+        self.calls.append('begin')
+
+    def end_deferred(self, deliver=True):
+        self.calls.append('deliver' if deliver else 'drop')
+        return 0
+
+
+class TestTransaction(unittest.TestCase):
+    """Test commit, rollback and cache behaviour of a unit of work"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        with sqlite3.connect(self.db_path) as conn:
+            conn.execute("CREATE TABLE tasks (id INTEGER PRIMARY KEY, score INTEGER)")
+
+        DataService.reset_instance()
+        # Keep the L2 cache file in the temporary directory, not the working directory
+        with patch('core.services.data_service.MultiTierCache',
+                   side_effect=lambda: MultiTierCache(cache_dir=self.temp_dir.name)):
+            self.service = DataService(self.db_path)
+        self.bus = _RecordingBus()
+        self.service._get_event_bus = lambda: self.bus
+
+        self.invalidations = 0
+        original_clear = self.service.cache_manager.clear_all_cache
+
+        def counting_clear():
+            self.invalidations += 1
+            original_clear()
+
+        self.service.cache_manager.clear_all_cache = counting_clear
+
+    def tearDown(self):
+        get_connection_manager(self.db_path).close_all()
+        DataService.reset_instance()
+        self.temp_dir.cleanup()
+
+    def _committed_count(self):
+        """Row count as seen by an independent connection"""
+        with sqlite3.connect(self.db_path) as conn:
+            return conn.execute("SELECT COUNT(*) FROM tasks").fetchone()[0]
+
+    def test_commit_once_and_invalidate_once(self):
+        """Many commands become visible together with a single cache invalidation"""
+        with self.service.transaction():
+            for score in range(50):
+                self.service.execute_command("INSERT INTO tasks (score) VALUES (?)", (score,))
+            self.assertEqual(self._committed_count(), 0)
+            self.assertEqual(self.invalidations, 0)
+
+        self.assertEqual(self._committed_count(), 50)
+        self.assertEqual(self.invalidations, 1)
+        self.assertEqual(self.bus.calls, ['begin', 'deliver'])
+
+    def test_rollback_discards_commands_and_events(self):
+        """An exception undoes every command and drops the held events"""
+        self.service.execute_command("INSERT INTO tasks (score) VALUES (1)")
+        self.invalidations = 0
+
+        with self.assertRaises(RuntimeError):
+            with self.service.transaction():
+                self.service.execute_command("INSERT INTO tasks (score) VALUES (2)")
+                raise RuntimeError("boom")
+
+        self.assertEqual(self._committed_count(), 1)
+        self.assertEqual(self.invalidations, 0)
+        self.assertEqual(self.bus.calls, ['begin', 'drop'])
+
+    def test_sqlite_errors_roll_back(self):
+        """A failing command rolls back the unit and surfaces as DataServiceError"""
+        with self.assertRaises(DataServiceError):
+            with self.service.transaction():
+                self.service.execute_command("INSERT INTO tasks (score) VALUES (1)")
+                self.service.execute_command("INSERT INTO missing_table VALUES (1)")
+
+        self.assertEqual(self._committed_count(), 0)
+
+    def test_reads_see_uncommitted_rows_without_caching_them(self):
+        """Queries inside the unit read its own writes and bypass the cache"""
+        self.assertEqual(self.service.execute_query("SELECT COUNT(*) AS n FROM tasks")[0]['n'], 0)
+
+        with self.assertRaises(RuntimeError):
+            with self.service.transaction():
+                self.service.execute_command("INSERT INTO tasks (score) VALUES (5)")
+                inside = self.service.execute_query("SELECT COUNT(*) AS n FROM tasks")
+                self.assertEqual(inside[0]['n'], 1)
+                raise RuntimeError("roll back")
+
+        after = self.service.execute_query("SELECT COUNT(*) AS n FROM tasks")
+        self.assertEqual(after[0]['n'], 0)
+
+    def test_nested_transactions_join_the_outer_unit(self):
+        """Inner blocks neither commit nor flush on their own"""
+        with self.service.transaction() as outer:
+            with self.service.transaction() as inner:
+                self.assertIs(inner, outer)
+                self.service.execute_command("INSERT INTO tasks (score) VALUES (1)")
+            self.assertEqual(self._committed_count(), 0)
+
+        self.assertEqual(self._committed_count(), 1)
+        self.assertEqual(self.bus.calls, ['begin', 'deliver'])
+
+    def test_read_only_unit_does_not_invalidate(self):
+        """A transaction without commands leaves the cache alone"""
+        with self.service.transaction():
+            self.service.execute_query("SELECT * FROM tasks")
+
+        self.assertEqual(self.invalidations, 0)
+
+
+@unittest.skipUnless(QT_AVAILABLE, "PySide6 not installed")
+class TestDeferredEvents(unittest.TestCase):
+    """Test that the event bus holds and coalesces events until commit"""
+
+    def setUp(self):
+        from core.events.event_bus import AppEventBus
+        from core.events.event_types import EventType
+        self.EventType = EventType
+        self.bus = AppEventBus()
+        self.received = []
+        self.bus.connect_handler(EventType.TASK_UPDATED, self.received.append)
+
+    def test_events_held_until_outermost_end(self):
+        """Nothing is delivered while deferring; duplicates arrive once"""
+        self.bus.begin_deferred()
+        self.bus.begin_deferred()
+        for task_id in range(500):
+            self.bus.emit_event(self.EventType.TASK_UPDATED, {'task_id': task_id}, 'Test')
+        self.bus.end_deferred()
+        self.assertEqual(self.received, [])
+
+        self.assertEqual(self.bus.end_deferred(), 1)
+        self.assertEqual(len(self.received), 1)
+        data = self.received[0].data
+        self.assertEqual(data['task_id'], 499)
+        self.assertEqual(data['coalesced_count'], 500)
+        self.assertEqual(data['coalesced_events'][0], {'task_id': 0})
+
+    def test_dropped_events_are_never_delivered(self):
+        """end_deferred(deliver=False) discards the buffer"""
+        self.bus.begin_deferred()
+        self.bus.emit_event(self.EventType.TASK_UPDATED, {'task_id': 1}, 'Test')
+        self.bus.end_deferred(deliver=False)
+
+        self.bus.emit_event(self.EventType.TASK_UPDATED, {'task_id': 2}, 'Test')
+        self.assertEqual([event.data['task_id'] for event in self.received], [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
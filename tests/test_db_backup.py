@@ -0,0 +1,121 @@
+"""
+Unit tests for online database backups
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.db.backup import DatabaseBackup, BackupError, copy_database
+
+
+class TestDatabaseBackup(unittest.TestCase):
+    """Test consistent online copies, progress, verification and rotation"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        self.backup_dir = os.path.join(self.temp_dir.name, 'backups')
+
+        # A WAL database with committed frames not yet checkpointed into the main file
+        self.conn = sqlite3.connect(self.db_path)
+        self.conn.execute("PRAGMA journal_mode = WAL")
+        self.conn.execute("PRAGMA wal_autocheckpoint = 0")
+        self.conn.execute("CREATE TABLE weeks (id INTEGER PRIMARY KEY, label TEXT)")
+        self.conn.executemany("INSERT INTO weeks (label) VALUES (?)", [(f"week {i}" * 20,) for i in range(2000)])
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+        self.temp_dir.cleanup()
+
+    def _backup(self, **kwargs):
+        return DatabaseBackup(self.db_path, self.backup_dir, pages_per_step=16, **kwargs)
+
+    def _count_weeks(self, path):
+        conn = sqlite3.connect(path)
+        try:
+            return conn.execute("SELECT COUNT(*) FROM weeks").fetchone()[0]
+        finally:
+            conn.close()
+
+    def test_backup_includes_wal_frames(self):
+        """A file copy of the main file would miss these rows; the backup API does not"""
+        progress = []
+        result = self._backup().backup("manual", progress=lambda copied, total: progress.append((copied, total)))
+
+        self.assertEqual(self._count_weeks(result.path), 2000)
+        self.assertTrue(result.path.endswith("_manual.db"))
+        self.assertGreater(len(progress), 1)  # Page-bounded steps
+        self.assertEqual(progress[-1][0], progress[-1][1])
+        self.assertEqual(progress[-1][1], result.pages)
+        self.assertFalse(os.path.exists(result.path + "-wal"))
+
+        copy = sqlite3.connect(result.path)
+        self.assertEqual(copy.execute("PRAGMA journal_mode").fetchone()[0], 'delete')
+        copy.close()
+
+    def test_prepare_pins_state_before_later_writes(self):
+        """Writes after prepare() do not block on the backup and are not in it"""
+        job = self._backup().prepare("before_delete_week")
+        self.conn.execute("DELETE FROM weeks")
+        self.conn.commit()
+
+        worker = threading.Thread(target=lambda: setattr(self, 'result', job.run()))
+        worker.start()
+        worker.join()
+
+        self.assertEqual(self._count_weeks(self.result.path), 2000)
+
+    def test_cancel(self):
+        job = self._backup().prepare()
+        job.cancel()
+
+        with self.assertRaises(BackupError):
+            job.run()
+        self.assertEqual(os.listdir(self.backup_dir), [])
+
+    def test_file_errors_become_backup_errors(self):
+        """A failure moving the copy into place is reported like any other backup failure"""
+        job = self._backup().prepare()
+        with patch('core.db.backup.os.replace', side_effect=PermissionError("file in use")):
+            with self.assertRaises(BackupError):
+                job.run()
+        self.assertEqual(os.listdir(self.backup_dir), [])
+
+    def test_rotation_failure_keeps_backup(self):
+        """A completed backup is returned even when old ones cannot be pruned"""
+        backup = self._backup(keep=1)
+        with patch.object(backup, 'list_backups', side_effect=PermissionError("denied")):
+            result = backup.backup()
+        self.assertEqual(result.removed, [])
+        self.assertEqual(self._count_weeks(result.path), 2000)
+
+    def test_rotation_keeps_newest(self):
+        backup = self._backup(keep=2)
+        paths = [backup.backup(f"n{index}").path for index in range(4)]
+
+        self.assertEqual(backup.list_backups(), [paths[3], paths[2]])
+        self.assertFalse(os.path.exists(paths[0]))
+
+    def test_missing_database(self):
+        with self.assertRaises(BackupError):
+            DatabaseBackup(os.path.join(self.temp_dir.name, 'missing.db'), self.backup_dir).prepare()
+
+    def test_copy_database_verifies(self):
+        dest = os.path.join(self.temp_dir.name, 'copy.db')
+        pages = copy_database(self.conn, dest)
+
+        self.assertGreater(pages, 0)
+        self.assertEqual(self._count_weeks(dest), 2000)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,254 @@
+"""
+Unit tests for idle-time database maintenance
+"""
+
+import os
+import sqlite3
+import sys
+import tempfile
+import threading
+import time
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.cache.sqlite_cache import SQLiteCache
+from core.db.connection_manager import get_connection_manager
+from core.db.maintenance import DatabaseMaintenance, MaintenanceScheduler, MaintenanceTask
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1_000_000.0
+
+    def __call__(self):
+        return self.now
+
+
+class TestDatabaseMaintenance(unittest.TestCase):
+    """Test due-task selection, budgets, recorded state and the individual tasks"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        self.state_path = os.path.join(self.temp_dir.name, 'db_maintenance.json')
+        self.clock = FakeClock()
+        with get_connection_manager(self.db_path).writer() as conn:
+            conn.execute("CREATE TABLE tasks (id INTEGER PRIMARY KEY, name TEXT)")
+            conn.execute("CREATE INDEX idx_tasks_name ON tasks(name)")
+            conn.executemany("INSERT INTO tasks (name) VALUES (?)", [(f"task {i % 50}",) for i in range(5000)])
+            conn.commit()
+
+    def tearDown(self):
+        get_connection_manager(self.db_path).close_all()
+        self.temp_dir.cleanup()
+
+    def _maintenance(self, **kwargs):
+        return DatabaseMaintenance(self.db_path, self.state_path, clock=self.clock, **kwargs)
+
+    def test_runs_due_tasks_and_records_last_run(self):
+        maintenance = self._maintenance()
+        results = maintenance.run_due(budget_ms=10000)
+
+        self.assertEqual([r['task'] for r in results],
+                         ['wal_checkpoint', 'optimize', 'analyze', 'incremental_vacuum', 'trim_cache'])
+        self.assertTrue(all(r['status'] == 'ok' for r in results))
+        self.assertEqual(maintenance.due_tasks(), [])
+
+        # The record survives a restart; the checkpoint is due again an hour later
+        restarted = self._maintenance()
+        self.assertEqual(restarted.last_runs()['analyze']['last_success'], self.clock.now)
+        self.clock.now += 3601
+        self.assertEqual([task.name for task in restarted.due_tasks()], ['wal_checkpoint'])
+
+    def test_analyze_populates_statistics(self):
+        self._maintenance().run_task('analyze')
+
+        with get_connection_manager(self.db_path).reader() as conn:
+            rows = conn.execute("SELECT tbl FROM sqlite_stat1").fetchall()
+        self.assertIn(('tasks',), rows)
+
+    def test_budget_aborts_statement(self):
+        """A statement running past its budget is interrupted and retried later"""
+        maintenance = self._maintenance()
+        result = maintenance.run_task('analyze', budget_ms=0)
+
+        self.assertEqual(result['status'], 'budget_exceeded')
+        self.assertNotIn('last_success', maintenance.last_runs()['analyze'])
+        self.assertNotIn('analyze', [task.name for task in maintenance.due_tasks()])
+        self.clock.now += 3601
+        self.assertIn('analyze', [task.name for task in maintenance.due_tasks()])
+
+    def test_pass_stops_when_user_returns(self):
+        maintenance = self._maintenance()
+        results = maintenance.run_due(should_continue=lambda: False)
+
+        self.assertEqual(results, [])
+
+    def test_incremental_vacuum(self):
+        path = os.path.join(self.temp_dir.name, 'incremental.db')
+        conn = sqlite3.connect(path)
+        conn.execute("PRAGMA auto_vacuum = INCREMENTAL")
+        conn.execute("CREATE TABLE blobs (data BLOB)")
+        conn.executemany("INSERT INTO blobs VALUES (?)", [(b'x' * 4000,) for _ in range(500)])
+        conn.commit()
+        conn.execute("DELETE FROM blobs")
+        conn.commit()
+        free_before = conn.execute("PRAGMA freelist_count").fetchone()[0]
+        self.assertGreater(free_before, 0)
+        conn.close()
+
+        try:
+            result = DatabaseMaintenance(path, self.state_path, clock=self.clock).run_task('incremental_vacuum')
+            with get_connection_manager(path).reader() as reader:
+                free_pages = reader.execute("PRAGMA freelist_count").fetchone()[0]
+        finally:
+            get_connection_manager(path).close_all()
+
+        self.assertEqual(result['status'], 'ok')
+        self.assertEqual(free_pages, 0)
+        self.assertEqual(result['detail']['pages_released'], free_before)
+
+    def test_new_database_is_incremental(self):
+        """Databases created through the connection manager need no conversion"""
+        with get_connection_manager(self.db_path).reader() as conn:
+            self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 2)
+
+    def _legacy_database(self):
+        """A database created without auto_vacuum, with free pages"""
+        path = os.path.join(self.temp_dir.name, 'legacy.db')
+        conn = sqlite3.connect(path)
+        conn.execute("CREATE TABLE blobs (data BLOB)")
+        conn.executemany("INSERT INTO blobs VALUES (?)", [(b'x' * 4000,) for _ in range(200)])
+        conn.commit()
+        conn.execute("DELETE FROM blobs")
+        conn.commit()
+        conn.close()
+        return path
+
+    def test_incremental_vacuum_converts_existing_database(self):
+        path = self._legacy_database()
+        try:
+            result = DatabaseMaintenance(path, self.state_path, clock=self.clock).run_task('incremental_vacuum')
+        finally:
+            get_connection_manager(path).close_all()
+
+        conn = sqlite3.connect(path)
+        self.assertEqual(conn.execute("PRAGMA auto_vacuum").fetchone()[0], 2)
+        self.assertEqual(conn.execute("PRAGMA freelist_count").fetchone()[0], 0)
+        conn.close()
+        self.assertEqual(result['status'], 'ok')
+        self.assertTrue(result['detail']['converted'])
+        self.assertGreater(result['detail']['bytes_released'], 0)
+
+    def test_incremental_vacuum_skips_large_conversion(self):
+        path = self._legacy_database()
+        try:
+            with patch('core.db.maintenance.CONVERT_MAX_BYTES', 0):
+                result = DatabaseMaintenance(path, self.state_path, clock=self.clock).run_task('incremental_vacuum')
+        finally:
+            get_connection_manager(path).close_all()
+
+        self.assertEqual(result['status'], 'ok')
+        self.assertIn('skipped', result['detail'])
+
+    def test_checkpoint_waits_at_most_its_budget(self):
+        """A pinned read snapshot (e.g. a running backup) makes the checkpoint busy, not slow"""
+        reader = sqlite3.connect(self.db_path)
+        reader.execute("BEGIN")
+        reader.execute("SELECT COUNT(*) FROM tasks").fetchone()
+        try:
+            result = self._maintenance().run_task('wal_checkpoint', budget_ms=200)
+        finally:
+            reader.close()
+
+        self.assertEqual(result['status'], 'busy')
+        self.assertLess(result['duration_ms'], 2000)
+
+    def test_write_lock_waits_at_most_its_budget(self):
+        """ANALYZE gives up on a held write lock once its budget is spent"""
+        writer = sqlite3.connect(self.db_path)
+        writer.execute("BEGIN IMMEDIATE")
+        try:
+            result = self._maintenance().run_task('analyze', budget_ms=200)
+        finally:
+            writer.rollback()
+            writer.close()
+
+        self.assertEqual(result['status'], 'busy')
+        self.assertLess(result['duration_ms'], 2000)
+
+    def test_interrupt_aborts_running_task(self):
+        """interrupt() from another thread ends a task waiting for a lock promptly"""
+        maintenance = self._maintenance()
+        writer = sqlite3.connect(self.db_path)
+        writer.execute("BEGIN IMMEDIATE")
+        # Interrupt while the task is inside its budgeted lock wait
+        timer = threading.Timer(0.2, maintenance.interrupt)
+        timer.start()
+        try:
+            result = maintenance.run_task('analyze', budget_ms=5000)
+        finally:
+            timer.join()
+            writer.rollback()
+            writer.close()
+
+        self.assertEqual(result['status'], 'interrupted')
+        self.assertLess(result['duration_ms'], 2000)  # Not the whole 5s budget
+        # The next task is not affected by the earlier interrupt
+        self.assertEqual(maintenance.run_task('optimize')['status'], 'ok')
+
+    def test_trim_cache(self):
+        cache = SQLiteCache(os.path.join(self.temp_dir.name, 'cache.db'), compression='none')
+        for index in range(20):
+            cache.set(f"key{index}", b'x' * 1000)
+        cache.get("key0")  # Accessed entries are evicted last
+        cache.set("expired", 1, ttl=1)
+        time.sleep(1.1)
+
+        result = self._maintenance(cache=cache, cache_max_bytes=5000).run_task('trim_cache')
+
+        self.assertEqual(result['status'], 'ok')
+        self.assertLessEqual(cache.get_stats()['total_size_bytes'], 5000)
+        self.assertIn("key0", cache.get_keys())
+        self.assertNotIn("expired", cache.get_keys())
+
+
+class TestMaintenanceScheduler(unittest.TestCase):
+    """Test that passes only run while the user is idle"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        tasks = (MaintenanceTask('optimize', 3600, 500),)
+        self.maintenance = DatabaseMaintenance(self.db_path, os.path.join(self.temp_dir.name, 'state.json'),
+                                               tasks=tasks)
+
+    def tearDown(self):
+        get_connection_manager(self.db_path).close_all()
+        self.temp_dir.cleanup()
+
+    def test_waits_for_idle(self):
+        scheduler = MaintenanceScheduler(self.maintenance, idle_seconds=60)
+        scheduler.notify_activity()
+        self.assertEqual(scheduler.run_pass(), [])
+
+        scheduler.idle_seconds = 0
+        self.assertEqual([r['task'] for r in scheduler.run_pass()], ['optimize'])
+        self.assertEqual(scheduler.run_pass(), [])  # Nothing due any more
+
+    def test_background_thread(self):
+        scheduler = MaintenanceScheduler(self.maintenance, idle_seconds=0, check_interval_s=0.01)
+        scheduler.start()
+        deadline = time.monotonic() + 5
+        while not scheduler.last_results and time.monotonic() < deadline:
+            time.sleep(0.01)
+        scheduler.stop()
+
+        self.assertEqual(scheduler.last_results[0]['status'], 'ok')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,206 @@
+"""
+Unit tests for size-aware Python/NumPy/Rust engine dispatch and its calibration
+"""
+
+import math
+import os
+import statistics
+import sys
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.performance.engine_dispatch import (
+    NEVER, NUMPY, PYTHON, RUST, Crossover, EngineDispatcher, crossover_from_timings,
+    load_calibrated_thresholds, save_calibrated_thresholds
+)
+
+try:
+    import numpy  # noqa: F401
+    import scipy  # noqa: F401
+    NUMPY_SCIPY_AVAILABLE = True
+except ImportError:
+    NUMPY_SCIPY_AVAILABLE = False
+
+
+class TestChooseBackend(unittest.TestCase):
+    """Test backend selection from input size and availability"""
+
+    def setUp(self):
+        self.dispatcher = EngineDispatcher(
+            {'statistics.summary': Crossover(numpy_min=100, rust_min=1000)}, numpy_available=True
+        )
+
+    def test_size_bands(self):
+        """Small inputs stay in Python, medium go to NumPy, large to Rust"""
+        self.assertEqual(self.dispatcher.choose('statistics.summary', 20, rust_available=True), PYTHON)
+        self.assertEqual(self.dispatcher.choose('statistics.summary', 500, rust_available=True), NUMPY)
+        self.assertEqual(self.dispatcher.choose('statistics.summary', 100_000, rust_available=True), RUST)
+
+    def test_unavailable_backends_are_skipped(self):
+        """Without Rust large inputs use NumPy; without NumPy they use Python"""
+        self.assertEqual(self.dispatcher.choose('statistics.summary', 100_000, rust_available=False), NUMPY)
+
+        no_numpy = EngineDispatcher({'statistics.summary': Crossover(100, 1000)}, numpy_available=False)
+        self.assertEqual(no_numpy.choose('statistics.summary', 500, rust_available=True), PYTHON)
+        self.assertEqual(no_numpy.choose('statistics.summary', 5000, rust_available=True), RUST)
+
+    def test_operation_without_python_version(self):
+        """Operations implemented only in NumPy and Rust never pick Python"""
+        dispatcher = EngineDispatcher({'processing.aggregated_metrics': Crossover(NEVER, NEVER)},
+                                      numpy_available=True)
+        self.assertEqual(dispatcher.choose('processing.aggregated_metrics', 5), NUMPY)
+
+    def test_forced_backend(self):
+        """forced() overrides the size bands on this thread only"""
+        with self.dispatcher.forced(RUST):
+            self.assertEqual(self.dispatcher.choose('statistics.summary', 5, rust_available=True), RUST)
+            # A forced backend that is unavailable falls back to normal selection
+            self.assertEqual(self.dispatcher.choose('statistics.summary', 5, rust_available=False), PYTHON)
+        self.assertEqual(self.dispatcher.choose('statistics.summary', 5, rust_available=True), PYTHON)
+
+        with self.assertRaises(ValueError):
+            with self.dispatcher.forced('fortran'):
+                pass
+
+
+class TestCrossoverFromTimings(unittest.TestCase):
+    """Test threshold derivation from calibration timings"""
+
+    def test_crossovers(self):
+        """Each backend takes over from the first size where it stays fastest"""
+        timings = {
+            10: {PYTHON: 1.0, NUMPY: 5.0, RUST: 8.0},
+            100: {PYTHON: 10.0, NUMPY: 6.0, RUST: 9.0},
+            1000: {PYTHON: 100.0, NUMPY: 12.0, RUST: 10.0},
+            10000: {PYTHON: 1000.0, NUMPY: 60.0, RUST: 20.0},
+        }
+
+        crossover = crossover_from_timings(timings, [PYTHON, NUMPY, RUST])
+
+        self.assertEqual(crossover, Crossover(numpy_min=100, rust_min=1000))
+
+    def test_noisy_early_win_is_ignored(self):
+        """A win at one small size followed by losses does not lower the threshold"""
+        timings = {
+            10: {PYTHON: 2.0, RUST: 1.0},
+            100: {PYTHON: 3.0, RUST: 4.0},
+            1000: {PYTHON: 30.0, RUST: 5.0},
+        }
+
+        self.assertEqual(crossover_from_timings(timings, [PYTHON, RUST]).rust_min, 1000)
+
+    def test_backend_that_never_wins(self):
+        """A backend slower at every size is never selected"""
+        timings = {10: {PYTHON: 1.0, RUST: 2.0}, 100: {PYTHON: 1.0, RUST: 2.0}}
+
+        self.assertEqual(crossover_from_timings(timings, [PYTHON, RUST]).rust_min, NEVER)
+
+    def test_round_trip_through_settings_dict(self):
+        """Thresholds survive the settings JSON representation"""
+        crossover = Crossover(numpy_min=64, rust_min=4096)
+        self.assertEqual(Crossover.from_dict(crossover.to_dict()), crossover)
+
+    def test_partial_calibration_keeps_other_operations(self):
+        """Saving a subset (calibrate_engines.py --only) leaves earlier entries in place"""
+        from core.settings.global_settings import global_settings
+        with patch.object(global_settings, 'settings', {}), patch.object(global_settings, 'save_settings'):
+            save_calibrated_thresholds({
+                'statistics.correlation': Crossover(numpy_min=64, rust_min=4096),
+                'processing.tasks_batch': Crossover(rust_min=512),
+            })
+            save_calibrated_thresholds({'statistics.correlation': Crossover(numpy_min=128, rust_min=8192)})
+
+            self.assertEqual(load_calibrated_thresholds(), {
+                'statistics.correlation': Crossover(numpy_min=128, rust_min=8192),
+                'processing.tasks_batch': Crossover(rust_min=512),
+            })
+
+            save_calibrated_thresholds({'processing.tasks_batch': Crossover(rust_min=256)}, replace=True)
+            self.assertEqual(load_calibrated_thresholds(), {'processing.tasks_batch': Crossover(rust_min=256)})
+
+
+class TestPythonBackends(unittest.TestCase):
+    """Test the pure Python statistics used for small inputs"""
+
+    def setUp(self):
+        from core.performance.rust_statistical_engine import RustStatisticalEngine
+        self.engine = RustStatisticalEngine()
+
+    def test_correlation(self):
+        """Pearson correlation, 0.0 for degenerate input"""
+        self.assertAlmostEqual(self.engine._python_correlation([1, 2, 3], [2, 4, 6]), 1.0)
+        self.assertAlmostEqual(self.engine._python_correlation([1, 2, 3], [3, 2, 1]), -1.0)
+        self.assertEqual(self.engine._python_correlation([1, 1, 1], [1, 2, 3]), 0.0)
+        self.assertEqual(self.engine._python_correlation([1, 2], [1, 2, 3]), 0.0)
+
+    def test_statistical_summary_matches_numpy_percentiles(self):
+        """Quartiles use numpy.percentile's linear interpolation"""
+        summary = self.engine._python_statistical_summary([1, 2, 3, 4, 100])
+
+        self.assertEqual(summary.median, 3)
+        self.assertEqual(summary.q1, 2.0)
+        self.assertEqual(summary.q3, 4.0)
+        self.assertEqual(summary.outliers, [100.0])
+        self.assertEqual(summary.sample_size, 5)
+
+    def test_moving_average(self):
+        """Running-sum moving average over full windows"""
+        self.assertEqual(self.engine._python_moving_average([1, 2, 3, 4, 5], 2), [1.5, 2.5, 3.5, 4.5])
+        self.assertEqual(self.engine._python_moving_average([1, 2], 3), [])
+
+    def test_trend_analysis(self):
+        """Least-squares slope, intercept and R-squared"""
+        trend = self.engine._python_trend_analysis([0, 1, 2, 3], [1, 3, 5, 7])
+
+        self.assertAlmostEqual(trend.slope, 2.0)
+        self.assertAlmostEqual(trend.intercept, 1.0)
+        self.assertAlmostEqual(trend.r_squared, 1.0)
+        self.assertEqual(trend.trend_line, [1.0, 3.0, 5.0, 7.0])
+
+    def test_confidence_interval_uses_t_distribution(self):
+        """Small samples get Student's t critical values, not the normal 1.96"""
+        values = [10, 12, 9, 11, 13, 8, 10, 12, 11, 9]
+        interval = self.engine._python_confidence_interval(values, 0.95)
+
+        mean = statistics.fmean(values)
+        margin = 2.262 * statistics.stdev(values) / math.sqrt(len(values))
+        self.assertAlmostEqual(interval.lower, mean - margin, places=3)
+        self.assertAlmostEqual(interval.upper, mean + margin, places=3)
+
+    @unittest.skipUnless(NUMPY_SCIPY_AVAILABLE, "NumPy and SciPy not installed")
+    def test_confidence_interval_matches_numpy_backend(self):
+        """The Python and NumPy/SciPy intervals agree at small n"""
+        values = [10, 12, 9, 11, 13, 8, 10, 12, 11, 9, 14, 7]
+        for size in (3, 5, 10, 12):
+            for level in (0.90, 0.95, 0.99):
+                python = self.engine._python_confidence_interval(values[:size], level)
+                numpy = self.engine._fallback_confidence_interval(values[:size], level)
+                self.assertAlmostEqual(python.lower, numpy.lower, places=6)
+                self.assertAlmostEqual(python.upper, numpy.upper, places=6)
+
+    def test_t_critical_value_without_table(self):
+        """Levels outside the table fall back to the Cornish-Fisher expansion"""
+        from core.performance.rust_statistical_engine import t_critical_value
+        self.assertAlmostEqual(t_critical_value(0.95, 9), 2.262, places=3)
+        self.assertAlmostEqual(t_critical_value(0.95, 60), 2.000, places=3)
+        self.assertAlmostEqual(t_critical_value(0.80, 10), 1.372, places=2)
+
+    def test_small_input_uses_python_backend(self):
+        """A weekly-sized series is answered without NumPy or Rust"""
+        from core.performance import engine_dispatch
+        original = engine_dispatch._dispatcher
+        engine_dispatch._dispatcher = EngineDispatcher(
+            {'statistics.correlation': Crossover(numpy_min=1000, rust_min=1000)}
+        )
+        try:
+            self.engine._fallback_correlation = None  # NumPy path must not be reached
+            self.assertAlmostEqual(self.engine.calculate_correlation([1, 2, 3, 4], [2, 4, 6, 8]), 1.0)
+        finally:
+            engine_dispatch._dispatcher = original
+
+
+if __name__ == '__main__':
+    unittest.main()
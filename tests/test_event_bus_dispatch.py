@@ -0,0 +1,225 @@
+"""
+Unit tests for per-handler dispatch, latency accounting and coalescing in AppEventBus
+"""
+
+import gc
+import os
+import sys
+import time
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from PySide6 import QtCore
+    QT_AVAILABLE = True
+except ImportError:
+    QT_AVAILABLE = False
+
+if QT_AVAILABLE:
+    from core.events.event_bus import AppEventBus
+    from core.events.event_types import EventType
+    from core.events.handler_stats import HandlerRecord, summarize
+    from core.performance.metrics import get_registry
+
+LISTENER_NAME = f"{__name__}._Listener.on_event"
+
+
+class _Listener:
+    """Named handler owner so stats show '<module>._Listener.on_event'"""
+
+    def __init__(self, delay=0.0):
+        self.events = []
+        self.delay = delay
+
+    def on_event(self, event_data):
+        if self.delay:
+            time.sleep(self.delay)
+        self.events.append(event_data)
+
+
+@unittest.skipUnless(QT_AVAILABLE, "PySide6 not installed")
+class TestHandlerDispatch(unittest.TestCase):
+    """Test timed per-handler dispatch"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    def setUp(self):
+        get_registry().reset()  # Handler histograms live in the shared registry
+        self.bus = AppEventBus()
+
+    def test_stats_per_handler(self):
+        """Each handler gets its own latency row named after its owner"""
+        listener = _Listener()
+        self.bus.connect_handler(EventType.TASK_UPDATED, listener.on_event)
+        for task_id in range(3):
+            self.bus.emit_event(EventType.TASK_UPDATED, {'task_id': task_id}, 'Test')
+
+        stats = self.bus.get_handler_stats(EventType.TASK_UPDATED)
+
+        self.assertEqual(len(listener.events), 3)
+        self.assertEqual(len(stats), 1)
+        self.assertEqual(stats[0]['handler'], LISTENER_NAME)
+        self.assertEqual(stats[0]['event_type'], 'task_updated')
+        self.assertEqual(stats[0]['count'], 3)
+        histogram = get_registry().snapshot()['histograms'][f'event_bus.handler_ms{{event=task_updated,handler={LISTENER_NAME}}}']
+        self.assertEqual(histogram['count'], 3)
+
+    def test_slow_handler_warning(self):
+        """Handlers over the threshold are counted and logged once per interval"""
+        listener = _Listener(delay=0.01)
+        self.bus.set_slow_handler_threshold(5.0)
+        self.bus.connect_handler(EventType.WEEK_CHANGED, listener.on_event)
+
+        with self.assertLogs('core.events.event_bus', level='WARNING') as logs:
+            self.bus.emit_event(EventType.WEEK_CHANGED, {'week_id': 1})
+            self.bus.emit_event(EventType.WEEK_CHANGED, {'week_id': 2})
+
+        self.assertEqual(len(logs.output), 1)
+        self.assertIn(LISTENER_NAME, logs.output[0])
+        self.assertEqual(self.bus.get_handler_stats()[0]['slow_calls'], 2)
+
+    def test_failing_handler_does_not_stop_others(self):
+        """An exception in one handler is counted and later handlers still run"""
+        def broken(event_data):
+            raise ValueError("broken handler")
+
+        listener = _Listener()
+        self.bus.connect_handler(EventType.TASK_CREATED, broken)
+        self.bus.connect_handler(EventType.TASK_CREATED, listener.on_event)
+
+        with self.assertLogs('core.events.event_bus', level='ERROR'):
+            self.bus.emit_event(EventType.TASK_CREATED, {'task_id': 1})
+
+        self.assertEqual(len(listener.events), 1)
+        errors = {row['handler']: row['errors'] for row in self.bus.get_handler_stats()}
+        self.assertEqual(errors[f'{__name__}.TestHandlerDispatch.test_failing_handler_does_not_stop_others.<locals>.broken'], 1)
+
+    def test_reset_keeps_handlers(self):
+        """Resetting statistics leaves handlers connected"""
+        listener = _Listener()
+        self.bus.connect_handler(EventType.TASK_DELETED, listener.on_event)
+        self.bus.emit_event(EventType.TASK_DELETED)
+        self.bus.reset_handler_stats()
+        self.bus.emit_event(EventType.TASK_DELETED)
+
+        self.assertEqual(len(listener.events), 2)
+        self.assertEqual(self.bus.get_handler_stats()[0]['count'], 1)
+
+    def test_collected_receiver_is_dropped(self):
+        """A bound-method handler does not keep its receiver alive"""
+        listener = _Listener()
+        self.bus.connect_handler(EventType.TASK_UPDATED, listener.on_event)
+        del listener
+        gc.collect()
+
+        self.bus.emit_event(EventType.TASK_UPDATED, {'task_id': 1})
+
+        self.assertEqual(self.bus.get_handler_stats(EventType.TASK_UPDATED), [])
+
+
+@unittest.skipUnless(QT_AVAILABLE, "PySide6 not installed")
+class TestHandlerRecord(unittest.TestCase):
+    """Test handler references and naming"""
+
+    def setUp(self):
+        get_registry().reset()
+
+    def test_bound_method_is_weak(self):
+        """The record drops its handler once the receiver is collected"""
+        listener = _Listener()
+        record = HandlerRecord('task_updated', listener.on_event)
+        self.assertEqual(record.handler, listener.on_event)
+
+        del listener
+        gc.collect()
+
+        self.assertIsNone(record.handler)
+        self.assertFalse(record.is_alive())
+        self.assertEqual(summarize({'task_updated': [record]}), [])
+
+    def test_plain_function_is_kept(self):
+        """Functions and lambdas have no receiver and stay connected"""
+        record = HandlerRecord('task_updated', lambda event_data: None)
+        gc.collect()
+        self.assertTrue(record.is_alive())
+
+    def test_same_name_in_other_module_is_separate(self):
+        """Handlers are keyed by module and qualified name"""
+        class Other:
+            def on_event(self, event_data):
+                pass
+        Other.on_event.__module__ = 'other_module'
+        Other.on_event.__qualname__ = '_Listener.on_event'
+        listener, other = _Listener(), Other()
+        records = {'task_updated': [HandlerRecord('task_updated', listener.on_event),
+                                    HandlerRecord('task_updated', other.on_event)]}
+        records['task_updated'][0].histogram.observe(1.0)
+
+        rows = {row['handler']: row for row in summarize(records)}
+
+        self.assertEqual(set(rows), {LISTENER_NAME, 'other_module._Listener.on_event'})
+        self.assertEqual(rows[LISTENER_NAME]['count'], 1)
+        self.assertEqual(rows['other_module._Listener.on_event']['count'], 0)
+
+    def test_connections_of_one_handler_share_a_row(self):
+        """Two receivers of one class are one row, not two rows with the same totals"""
+        first, second = _Listener(), _Listener()
+        records = {'task_updated': [HandlerRecord('task_updated', first.on_event),
+                                    HandlerRecord('task_updated', second.on_event)]}
+        records['task_updated'][0].histogram.observe(1.0)
+        records['task_updated'][1].errors = 2
+
+        rows = summarize(records)
+
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['connections'], 2)
+        self.assertEqual(rows[0]['count'], 1)
+        self.assertEqual(rows[0]['errors'], 2)
+
+
+@unittest.skipUnless(QT_AVAILABLE, "PySide6 not installed")
+class TestCoalescing(unittest.TestCase):
+    """Test merging same-type events within one event-loop turn"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.app = QtCore.QCoreApplication.instance() or QtCore.QCoreApplication([])
+
+    def setUp(self):
+        self.bus = AppEventBus()
+        self.listener = _Listener()
+        self.bus.connect_handler(EventType.TASK_UPDATED, self.listener.on_event)
+        self.bus.connect_handler(EventType.TASK_CREATED, self.listener.on_event)
+
+    def test_storm_delivered_once_next_turn(self):
+        """A burst of updates reaches the handler once, after the loop turns"""
+        self.bus.set_coalescing(True)
+        for task_id in range(200):
+            self.bus.emit_event(EventType.TASK_UPDATED, {'task_id': task_id}, 'Grid')
+        self.assertEqual(self.listener.events, [])
+
+        self.app.processEvents()
+
+        self.assertEqual(len(self.listener.events), 1)
+        data = self.listener.events[0].data
+        self.assertEqual(data['coalesced_count'], 200)
+        self.assertEqual(data['task_id'], 199)
+
+    def test_only_selected_types_coalesce(self):
+        """Types outside the coalescing set are delivered immediately"""
+        self.bus.set_coalescing(True, [EventType.TASK_UPDATED])
+        self.bus.emit_event(EventType.TASK_CREATED, {'task_id': 1})
+        self.bus.emit_event(EventType.TASK_UPDATED, {'task_id': 1})
+
+        self.assertEqual([event.event_type for event in self.listener.events], [EventType.TASK_CREATED])
+
+        self.bus.set_coalescing(False)  # Flushes what is pending
+        self.assertEqual(len(self.listener.events), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -55,7 +55,7 @@ class TestEventBusIntegration:
         mock_week_dao_class.return_value = mock_week_dao
         
         # Mock DAO methods
-        mock_week_dao.get_all_weeks.return_value = [
+        mock_week_dao.get_weeks_chronological.return_value = [
             {'id': 1, 'week_label': '01/01/2024 - 07/01/2024'},
             {'id': 2, 'week_label': '08/01/2024 - 14/01/2024'}
         ]
@@ -99,7 +99,7 @@ class TestEventBusIntegration:
         mock_week_dao_class.return_value = mock_week_dao
         
         # Mock DAO methods
-        mock_week_dao.get_all_weeks.return_value = []
+        mock_week_dao.get_weeks_chronological.return_value = []
         mock_week_dao.create_week.return_value = 1
         
         # Import and create WeekWidget after mocking
@@ -0,0 +1,104 @@
+"""
+Unit tests for the preallocated event ring used by the paint and resize monitors
+"""
+
+import os
+import sys
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    from PySide6 import QtCore
+    QT_AVAILABLE = True
+except ImportError:
+    QT_AVAILABLE = False
+
+from core.performance.event_ring import EventRing
+
+if QT_AVAILABLE:
+    from core.resize_optimization.performance_monitor import PerformanceMonitor, TimedOperation
+
+
+class TestEventRing(unittest.TestCase):
+    """Test ring writes, wrap-around and range reads"""
+
+    def setUp(self):
+        self.ring = EventRing(4, {'timestamp': 'd', 'duration_ms': 'd', 'key': 'i'})
+
+    def test_rows_before_wrap(self):
+        self.ring.append(1.0, 0.5, 7)
+        self.ring.append(2.0, 1.5, 8)
+
+        self.assertEqual(len(self.ring), 2)
+        self.assertEqual(list(self.ring.rows()), [(1.0, 0.5, 7), (2.0, 1.5, 8)])
+
+    def test_wrap_keeps_newest_in_order(self):
+        for index in range(10):
+            self.ring.append(float(index), index * 0.1, index)
+
+        self.assertEqual(len(self.ring), 4)
+        self.assertEqual(self.ring.written, 10)
+        self.assertEqual(self.ring.oldest_sequence, 6)
+        self.assertEqual(self.ring.column('key'), [6, 7, 8, 9])
+        self.assertEqual([row[2] for row in self.ring.last(2)], [8, 9])
+
+    def test_range_reads_are_clamped(self):
+        """A range that has partly rolled out of the ring returns what is left"""
+        for index in range(6):
+            self.ring.append(float(index), 0.0, index)
+
+        self.assertEqual(self.ring.column('key', 1, 5), [2, 3, 4])
+        self.assertEqual(self.ring.column('key', 5, 5), [])
+        self.assertEqual(self.ring.column('timestamp', 4), [4.0, 5.0])
+
+    def test_clear_reuses_storage(self):
+        for index in range(3):
+            self.ring.append(0.0, 0.0, index)
+        self.ring.clear()
+        self.ring.append(9.0, 1.0, 1)
+
+        self.assertEqual(list(self.ring.rows()), [(9.0, 1.0, 1)])
+
+    def test_capacity_must_be_positive(self):
+        with self.assertRaises(ValueError):
+            EventRing(0, {'timestamp': 'd'})
+
+
+@unittest.skipUnless(QT_AVAILABLE, "PySide6 not installed")
+class TestPerformanceMonitorRing(unittest.TestCase):
+    """Test that resize monitoring sessions are summarized from the ring"""
+
+    def setUp(self):
+        self.monitor = PerformanceMonitor(max_metrics_per_session=1000)
+
+    def test_session_summary(self):
+        self.monitor.record_duration("before", 1.0)
+        self.monitor.start_session("resize")
+        for duration in (2.0, 4.0, 6.0):
+            self.monitor.record_duration("layout", duration)
+        with TimedOperation(self.monitor, "resize_event"):
+            pass
+        summary = self.monitor.end_session()
+
+        self.assertEqual(summary['total_operations'], 4)
+        self.assertNotIn('before', summary['operations'])
+        self.assertEqual(summary['operations']['layout']['avg_ms'], 4.0)
+        self.assertEqual(self.monitor.get_operation_statistics(),
+                         {'before': 1, 'layout': 3, 'resize_event': 1})
+        self.assertEqual([m.operation for m in self.monitor.get_recent_metrics('layout')], ['layout'] * 3)
+
+    def test_summary_survives_wrap(self):
+        """An ended session keeps its summary after its metrics roll out of the ring"""
+        session_id = self.monitor.start_session("resize")
+        self.monitor.record_duration("layout", 3.0)
+        self.monitor.end_session()
+        for _ in range(2000):
+            self.monitor.record_duration("paint", 0.1)
+
+        self.assertEqual(self.monitor.get_session_summary(session_id)['operations']['layout']['count'], 1)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Startup import-time budget for the main window module
+
+Runs `python -X importtime -c "import main"` in a fresh interpreter and fails
+when importing main.py takes longer than the budget, or when modules that are
+meant to load on first use (analysis stack, importers/exporters, options
+dialog, updater) end up on the startup path.
+
+The budget can be adjusted for slow machines with AUDITOR_HELPER_IMPORT_BUDGET_MS.
+"""
+
+import importlib.util
+import os
+import subprocess
+import sys
+import unittest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src')
+
+# Cumulative import time allowed for `import main`
+STARTUP_IMPORT_BUDGET_MS = float(os.environ.get('AUDITOR_HELPER_IMPORT_BUDGET_MS', 1500))
+
+# Modules that must not be imported until the user needs them
+DEFERRED_MODULES = [
+    'analysis.analysis_widget',
+    'PySide6.QtCharts',
+    'core.db.export_data',
+    'core.db.import_data',
+    'ui.options.options_dialog',
+    'updater',
+]
+
+
+def parse_importtime(stderr):
+    """Parse -X importtime output into {module: (self_us, cumulative_us)}"""
+    modules = {}
+    for line in stderr.splitlines():
+        if not line.startswith('import time:'):
+            continue
+        fields = line[len('import time:'):].split('|')
+        if len(fields) != 3:
+            continue
+        try:
+            self_us, cumulative_us = int(fields[0]), int(fields[1])
+        except ValueError:
+            # Header line: "self [us] | cumulative | imported package"
+            continue
+        modules[fields[2].strip()] = (self_us, cumulative_us)
+    return modules
+
+
+class TestParseImporttime(unittest.TestCase):
+    """Test the -X importtime output parser"""
+
+    def test_parse(self):
+        """Header lines are skipped and nested module names are stripped"""
+        output = (
+            "import time: self [us] | cumulative | imported package\n"
+            "import time:       120 |        120 |   ui.bonus_indicator\n"
+            "import time:      2500 |       9100 | main\n"
+        )
+        self.assertEqual(parse_importtime(output), {
+            'ui.bonus_indicator': (120, 120),
+            'main': (2500, 9100),
+        })
+
+
+@unittest.skipUnless(importlib.util.find_spec('PySide6'), "PySide6 is required to import main")
+class TestStartupImportBudget(unittest.TestCase):
+    """Measure the real import graph of main.py"""
+
+    @classmethod
+    def setUpClass(cls):
+        env = dict(os.environ, QT_QPA_PLATFORM='offscreen')
+        result = subprocess.run(
+            [sys.executable, '-X', 'importtime', '-c', 'import main'],
+            cwd=SRC_DIR, env=env, capture_output=True, text=True, timeout=120
+        )
+        if result.returncode != 0:
+            # PySide6 is present (see skipUnless), so a failed import is a real breakage
+            raise AssertionError(f"main.py could not be imported:\n{result.stderr.strip()[-1500:]}")
+        cls.modules = parse_importtime(result.stderr)
+
+    def test_deferred_modules_are_not_imported(self):
+        """Heavy, on-demand modules stay off the startup path"""
+        imported = [name for name in DEFERRED_MODULES
+                    if any(m == name or m.startswith(name + '.') for m in self.modules)]
+        self.assertEqual(imported, [])
+
+    def test_startup_import_budget(self):
+        """Importing main.py stays within the startup budget"""
+        cumulative_ms = self.modules['main'][1] / 1000
+        slowest = sorted(self.modules.items(), key=lambda item: item[1][0], reverse=True)[:10]
+        report = "\n".join(f"  {self_us / 1000:8.1f}ms  {name}" for name, (self_us, _) in slowest)
+        self.assertLessEqual(
+            cumulative_ms, STARTUP_IMPORT_BUDGET_MS,
+            f"import main took {cumulative_ms:.0f}ms (budget {STARTUP_IMPORT_BUDGET_MS:.0f}ms); "
+            f"slowest modules:\n{report}"
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
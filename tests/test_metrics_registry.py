@@ -0,0 +1,187 @@
+"""
+Unit tests for the in-process metrics registry and the monitors reporting into it
+"""
+
+import io
+import json
+import os
+import sys
+import tempfile
+import threading
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.performance.metrics import Histogram, MetricsRegistry, get_registry, metric_key, timed
+
+
+class TestHistogram(unittest.TestCase):
+    """Test the fixed-bucket histogram"""
+
+    def test_percentiles_use_bucket_bounds(self):
+        """Percentiles report the upper bound of the bucket they fall in"""
+        histogram = Histogram()
+        for _ in range(90):
+            histogram.observe(0.3)
+        for _ in range(10):
+            histogram.observe(40.0)
+
+        self.assertEqual(histogram.count, 100)
+        self.assertEqual(histogram.percentile(50), 0.5)
+        self.assertEqual(histogram.percentile(95), 40.0)
+        self.assertEqual(histogram.max, 40.0)
+
+    def test_overflow_bucket_reports_max(self):
+        """Values past the last bucket report the observed maximum"""
+        histogram = Histogram(buckets=(1.0, 10.0))
+        histogram.observe(5000.0)
+
+        self.assertEqual(histogram.percentile(99), 5000.0)
+        self.assertEqual(histogram.snapshot()['buckets'], {'1.0': 0, '10.0': 0, 'inf': 1})
+
+    def test_concurrent_observations_are_not_lost(self):
+        """Updates from several threads all land"""
+        histogram = Histogram()
+
+        def worker():
+            for _ in range(10_000):
+                histogram.observe(1.0)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        self.assertEqual(histogram.count, 40_000)
+
+
+class TestRegistry(unittest.TestCase):
+    """Test registration, snapshots and export"""
+
+    def setUp(self):
+        self.registry = MetricsRegistry()
+
+    def test_get_or_create_by_name_and_labels(self):
+        """The same name and labels return the same metric object"""
+        first = self.registry.counter("cache.operations", {'cache': 'l1', 'op': 'hit'})
+        second = self.registry.counter("cache.operations", {'op': 'hit', 'cache': 'l1'})
+        other = self.registry.counter("cache.operations", {'cache': 'l2', 'op': 'hit'})
+
+        self.assertIs(first, second)
+        self.assertIsNot(first, other)
+        self.assertEqual(metric_key("cache.operations", {'op': 'hit', 'cache': 'l1'}),
+                         "cache.operations{cache=l1,op=hit}")
+
+    def test_snapshot_contains_every_kind(self):
+        """Counters, gauges, histograms and collector values appear in one snapshot"""
+        self.registry.counter("db.transactions", {'outcome': 'committed'}).inc(3)
+        self.registry.gauge("startup.last_total_ms").set(812.5)
+        with self.registry.histogram("db.query_ms").time():
+            pass
+        self.registry.register_collector("db.connections.tasks", lambda: {
+            'open_connections': {'writer': 1, 'reader': 2}, 'db_path': '/tmp/tasks.db'
+        })
+
+        snapshot = self.registry.snapshot()
+
+        self.assertEqual(snapshot['counters']['db.transactions{outcome=committed}'], 3)
+        self.assertEqual(snapshot['gauges']['startup.last_total_ms'], 812.5)
+        self.assertEqual(snapshot['gauges']['db.connections.tasks.open_connections.reader'], 2)
+        self.assertNotIn('db.connections.tasks.db_path', snapshot['gauges'])
+        self.assertEqual(snapshot['histograms']['db.query_ms']['count'], 1)
+
+    def test_failing_collector_is_reported_not_raised(self):
+        """A collector error shows up as a value instead of breaking the snapshot"""
+        def broken():
+            raise RuntimeError("closed")
+
+        self.registry.register_collector("db.connections.gone", broken)
+
+        self.assertEqual(self.registry.snapshot()['gauges']['db.connections.gone.error'], 'closed')
+
+    def test_reset_keeps_references_valid(self):
+        """Metrics held by callers keep working after a reset"""
+        counter = self.registry.counter("paint.events", {'widget': 'grid'})
+        counter.inc(5)
+        self.registry.reset()
+        counter.inc()
+
+        self.assertEqual(self.registry.snapshot()['counters']['paint.events{widget=grid}'], 1)
+
+    def test_export_json_and_text(self):
+        """Snapshots export as JSON and as one line per metric"""
+        self.registry.histogram("db.command_ms", {'source': 'test'}).observe(2.0)
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self.registry.export_json(os.path.join(temp_dir, 'metrics.json'))
+            with open(path, encoding='utf-8') as f:
+                exported = json.load(f)
+
+        self.assertEqual(exported['histograms']['db.command_ms{source=test}']['count'], 1)
+        self.assertIn("db.command_ms{source=test} count=1", self.registry.format_text())
+
+    def test_timed_decorator(self):
+        """@timed records one observation per call in the global registry"""
+        @timed("test.decorated_ms")
+        def work():
+            return 42
+
+        histogram = get_registry().histogram("test.decorated_ms")
+        before = histogram.count
+        self.assertEqual(work(), 42)
+        self.assertEqual(histogram.count, before + 1)
+
+
+class TestMonitorsReport(unittest.TestCase):
+    """Test that existing monitors feed the shared registry"""
+
+    def test_cache_stats(self):
+        """CacheStats mirrors operations and response times"""
+        from core.cache.cache_stats import CacheStats
+        stats = CacheStats('registry_test')
+        hits = get_registry().counter("cache.operations", {'cache': 'registry_test', 'op': 'hit'})
+        before = hits.value
+
+        stats.record_hit(0.002)
+        stats.record_miss()
+
+        self.assertEqual(hits.value, before + 1)
+        self.assertGreaterEqual(
+            get_registry().histogram("cache.response_ms", {'cache': 'registry_test'}).max, 2.0
+        )
+
+    def test_time_db_operation(self):
+        """The legacy decorator records into db.operation_ms"""
+        from core.db.db_connection_pool import time_db_operation
+
+        @time_db_operation
+        def registry_test_operation():
+            return "ok"
+
+        registry_test_operation()
+
+        histogram = get_registry().histogram("db.operation_ms", {'operation': 'registry_test_operation'})
+        self.assertEqual(histogram.count, 1)
+
+    def test_time_db_operation_logs_slow_operations(self):
+        """Slow operations go to the log, not stdout"""
+        from core.db import db_connection_pool
+
+        @db_connection_pool.time_db_operation
+        def registry_slow_operation():
+            return "ok"
+
+        with patch.object(db_connection_pool, 'SLOW_OPERATION_MS', -1):
+            with patch('sys.stdout', new_callable=io.StringIO) as stdout:
+                with self.assertLogs('core.db.db_connection_pool', level='WARNING') as logs:
+                    registry_slow_operation()
+
+        self.assertIn('registry_slow_operation', logs.output[0])
+        self.assertEqual(stdout.getvalue(), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
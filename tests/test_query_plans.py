@@ -0,0 +1,106 @@
+"""
+EXPLAIN QUERY PLAN regression checks for the registered application queries
+"""
+
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+# Add src and performance to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'performance'))
+
+from benchmark_data import generate_dataset
+from core.db.query_registry import (
+    RegisteredQuery, check_query_plan, check_query_plans, load_query_modules, register_query
+)
+
+# Large enough for the planner to prefer indexes over sorting small tables
+PLAN_CHECK_TASKS = 20_000
+
+
+class TestQueryPlanCheck(unittest.TestCase):
+    """Test scan and temp B-tree detection on a small schema"""
+
+    def setUp(self):
+        self.conn = sqlite3.connect(':memory:')
+        self.conn.execute("CREATE TABLE tasks (id INTEGER PRIMARY KEY, week_id INTEGER, score INTEGER)")
+        self.conn.execute("CREATE INDEX idx_week ON tasks(week_id)")
+
+    def tearDown(self):
+        self.conn.close()
+
+    def test_indexed_lookup_passes(self):
+        """An index search ordered by rowid has no findings"""
+        query = RegisteredQuery('ok', "SELECT * FROM tasks WHERE week_id = ? ORDER BY id")
+        self.assertEqual(check_query_plan(self.conn, query), [])
+
+    def test_scan_and_sort_are_flagged(self):
+        """Unindexed filters and sorts are reported unless explicitly allowed"""
+        query = RegisteredQuery('slow', "SELECT * FROM tasks WHERE score > ? ORDER BY score")
+        kinds = sorted(finding.kind for finding in check_query_plan(self.conn, query))
+        self.assertEqual(kinds, ['scan', 'temp_btree'])
+
+        allowed = RegisteredQuery('slow', query.sql, allow_scan=('tasks',), allow_temp_btree=True)
+        self.assertEqual(check_query_plan(self.conn, allowed), [])
+
+    def test_invalid_sql_is_reported(self):
+        """Statements that fail to prepare are reported as errors"""
+        query = RegisteredQuery('broken', "SELECT missing_column FROM tasks")
+        self.assertEqual([f.kind for f in check_query_plan(self.conn, query)], ['error'])
+
+    def test_conflicting_registration(self):
+        """A name cannot be reused for a different statement"""
+        register_query('test.duplicate', "SELECT 1")
+        register_query('test.duplicate', "SELECT 1")
+        with self.assertRaises(ValueError):
+            register_query('test.duplicate', "SELECT 2")
+
+
+class TestRegisteredQueryPlans(unittest.TestCase):
+    """Every registered DAO and DataManager query against the synthetic dataset"""
+
+    @classmethod
+    def setUpClass(cls):
+        cls.temp_dir = tempfile.TemporaryDirectory()
+        db_path = os.path.join(cls.temp_dir.name, 'plans.db')
+        with contextlib.redirect_stdout(io.StringIO()):
+            generate_dataset(db_path, PLAN_CHECK_TASKS)
+            cls.queries = [q for q in load_query_modules() if not q.name.startswith('test.')]
+        cls.conn = sqlite3.connect(db_path)
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.conn.close()
+        cls.temp_dir.cleanup()
+
+    def test_registry_covers_dao_modules(self):
+        """Task DAO, week DAO and DataManager statements are registered"""
+        prefixes = {query.name.split('.')[0] for query in self.queries}
+        self.assertTrue({'task_dao', 'week_dao', 'data_manager'} <= prefixes)
+
+    def test_list_queries_exclude_feedback(self):
+        """Task listings return the narrow row shape; feedback is fetched per task"""
+        by_name = {query.name: query for query in self.queries}
+        for name in ('task_dao.tasks_by_week', 'task_dao.tasks_by_date_range',
+                     'task_dao.tasks_by_project', 'task_dao.high_score_tasks'):
+            cursor = self.conn.execute(by_name[name].sql, (None,) * by_name[name].sql.count('?'))
+            self.assertNotIn('feedback', [column[0] for column in cursor.description], name)
+
+        task_id, feedback = self.conn.execute(
+            "SELECT id, feedback FROM tasks WHERE length(feedback) > 100 LIMIT 1").fetchone()
+        row = self.conn.execute(by_name['task_dao.task_feedback'].sql, (task_id,)).fetchone()
+        self.assertEqual(row[0], feedback)
+
+    def test_no_unexpected_scans_or_sorts(self):
+        """No registered query scans a table or sorts in a temp B-tree unless it declares it"""
+        findings = check_query_plans(self.conn, self.queries)
+        self.assertEqual([str(finding) for finding in findings], [])
+
+
+if __name__ == '__main__':
+    unittest.main()
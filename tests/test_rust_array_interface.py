@@ -0,0 +1,162 @@
+"""
+Unit tests for the NumPy array paths of the Rust statistical, data processing and timer engines
+
+The array entry points must give the same answers as the list-based ones,
+whether the Rust extension (with its *_array functions) or the NumPy
+fallback does the work.
+"""
+
+import os
+import sys
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.performance import rust_timer_engine
+from core.performance.engine_dispatch import is_ndarray
+from core.performance.rust_data_processing_engine import RustDataProcessingEngine
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+class TestNdarrayDetection(unittest.TestCase):
+    """Test that list inputs never pull in numpy"""
+
+    def test_lists_are_not_arrays(self):
+        """Plain sequences take the list path"""
+        self.assertFalse(is_ndarray([1.0, 2.0]))
+        self.assertFalse(is_ndarray((1.0, 2.0)))
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_arrays_are_detected(self):
+        """NumPy arrays take the array path"""
+        self.assertTrue(is_ndarray(np.zeros(3)))
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+class TestDataProcessingArrays(unittest.TestCase):
+    """Test column-oriented task processing against the tuple-based batch"""
+
+    def setUp(self):
+        self.engine = RustDataProcessingEngine()
+        self.durations = ["01:00:00", "00:30:00", "00:15:30", "02:00:00"]
+        self.scores = [4.0, 2.0, 3.0, 5.0]
+
+    def test_parse_time_strings_array(self):
+        """Time strings come back as an int64 array of seconds"""
+        seconds = self.engine.parse_time_strings_array(self.durations)
+
+        self.assertEqual(seconds.dtype, np.int64)
+        self.assertEqual(seconds.tolist(), [3600, 1800, 930, 7200])
+
+    def test_process_task_arrays_matches_batch(self):
+        """Array and tuple inputs produce the same totals"""
+        tuples = [(d, "P", s) for d, s in zip(self.durations, self.scores)]
+        expected = self.engine.process_tasks_batch(tuples, 20.0, 30.0, True)
+
+        seconds = self.engine.parse_time_strings_array(self.durations)
+        result = self.engine.process_task_arrays(seconds, np.asarray(self.scores), 20.0, 30.0, True)
+
+        self.assertEqual(result.total_seconds, expected.total_seconds)
+        self.assertAlmostEqual(result.total_earnings, expected.total_earnings)
+        self.assertAlmostEqual(result.average_score, expected.average_score)
+        self.assertEqual(result.fail_count, expected.fail_count)
+        self.assertEqual(result.bonus_tasks_count, expected.bonus_tasks_count)
+        self.assertEqual(result.task_count, 4)
+
+    def test_process_task_arrays_strided_input(self):
+        """Non-contiguous views are accepted"""
+        seconds = np.array([3600, 0, 1800, 0], dtype=np.int64)[::2]
+        scores = np.array([4.0, 0.0, 2.0, 0.0])[::2]
+
+        result = self.engine.process_task_arrays(seconds, scores, 10.0, 10.0, False)
+
+        self.assertEqual(result.total_seconds, 5400)
+        self.assertAlmostEqual(result.total_earnings, 15.0)
+        self.assertEqual(result.fail_count, 1)
+
+    def test_process_task_arrays_length_mismatch(self):
+        """Columns of different lengths are rejected"""
+        with self.assertRaises(ValueError):
+            self.engine.process_task_arrays(np.array([1, 2]), np.array([1.0]), 1.0, 1.0)
+
+    def test_aggregated_metrics_accepts_arrays(self):
+        """Array inputs give the same metrics as lists"""
+        durations, scores, earnings = [1.0, 0.5, 2.0], [4.0, 2.0, 5.0], [20.0, 10.0, 40.0]
+        from_lists = self.engine.calculate_aggregated_metrics(durations, scores, earnings)
+        from_arrays = self.engine.calculate_aggregated_metrics(
+            np.asarray(durations), np.asarray(scores), np.asarray(earnings)
+        )
+
+        self.assertAlmostEqual(from_arrays.duration['mean'], from_lists.duration['mean'])
+        self.assertAlmostEqual(from_arrays.earnings['total'], 70.0)
+        self.assertAlmostEqual(from_arrays.efficiency['earnings_per_hour'],
+                               from_lists.efficiency['earnings_per_hour'])
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+class TestStatisticalArrays(unittest.TestCase):
+    """Test the correlation matrix against pairwise batch correlations"""
+
+    def setUp(self):
+        from core.performance.rust_statistical_engine import RustStatisticalEngine
+        self.engine = RustStatisticalEngine()
+
+    def test_matrix_matches_batch_correlations(self):
+        """Entry (i, j) is the batch correlation of variables i and j"""
+        data = {
+            'duration': [1.0, 2.0, 3.0, 4.0, 5.0],
+            'score': [2.0, 4.0, 5.0, 4.0, 5.0],
+            'earnings': [5.0, 4.0, 3.0, 2.0, 1.0],
+        }
+        matrix = self.engine.calculate_correlation_matrix(list(data.values()))
+        pairs = self.engine.calculate_batch_correlations(data)
+
+        self.assertEqual(matrix.shape, (3, 3))
+        self.assertAlmostEqual(matrix[0, 2], -1.0)
+        self.assertAlmostEqual(matrix[2, 0], matrix[0, 2])
+        self.assertAlmostEqual(pairs['duration_score'], matrix[0, 1])
+        self.assertAlmostEqual(pairs['score_earnings'], matrix[1, 2])
+
+    def test_matrix_requires_2d_input(self):
+        """1-D input is rejected"""
+        with self.assertRaises(ValueError):
+            self.engine.calculate_correlation_matrix(np.zeros(4))
+
+
+@unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+class TestTimerArrays(unittest.TestCase):
+    """Test timer batches with array inputs"""
+
+    def setUp(self):
+        self.engine = rust_timer_engine.RustTimerEngine()
+
+    def test_batch_durations_from_arrays(self):
+        """Negative spans clamp to zero and totals match the list path"""
+        starts = np.array([0.0, 10.0, 5.0])
+        ends = np.array([4.0, 12.0, 1.0])
+
+        result = self.engine.calculate_batch_durations(starts, ends)
+
+        self.assertEqual(list(result.durations), [4.0, 2.0, 0.0])
+        self.assertAlmostEqual(result.total_duration, 6.0)
+        self.assertEqual(result.count, 3)
+
+    def test_timer_statistics_from_arrays(self):
+        """Array and list inputs produce the same statistics"""
+        durations, targets = [10.0, 12.0, 8.0], [10.0, 10.0, 10.0]
+        from_lists = self.engine.calculate_timer_statistics(durations, targets)
+        from_arrays = self.engine.calculate_timer_statistics(np.asarray(durations), np.asarray(targets))
+
+        self.assertAlmostEqual(from_arrays.total_time, from_lists.total_time)
+        self.assertAlmostEqual(from_arrays.accuracy, from_lists.accuracy)
+        self.assertAlmostEqual(from_arrays.efficiency, from_lists.efficiency)
+
+
+if __name__ == '__main__':
+    unittest.main()
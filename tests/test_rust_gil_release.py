@@ -0,0 +1,146 @@
+"""
+Unit tests for GIL release in long-running rust_extensions calls
+
+A Rust batch running in a worker thread must not stop the GUI thread: the
+heavy part of each call runs inside py.allow_threads, so the main thread's
+event loop keeps ticking for the whole call.
+"""
+
+import os
+import sys
+import threading
+import time
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+try:
+    import rust_extensions
+    # The crate's source directory imports as an empty namespace package when unbuilt
+    RUST_AVAILABLE = hasattr(rust_extensions, 'manage_concurrent_timers')
+except ImportError:
+    RUST_AVAILABLE = False
+
+try:
+    from PySide6.QtCore import QCoreApplication, QEventLoop, QTimer
+    QT_AVAILABLE = True
+except ImportError:
+    QT_AVAILABLE = False
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+TICK_INTERVAL_MS = 10
+# Longest gap between ticks we accept; a held GIL stalls for the whole call
+MAX_TICK_GAP_SECONDS = 0.2
+# Concurrent timer call used as the long batch: pure Rust work, no argument conversion
+TIMER_BATCH_SECONDS = 1.0
+
+
+class _Worker(threading.Thread):
+    """Runs one Rust call and records how long it took"""
+
+    def __init__(self, call):
+        super().__init__(daemon=True)
+        self.call = call
+        self.elapsed = None
+        self.error = None
+
+    def run(self):
+        start = time.perf_counter()
+        try:
+            self.call()
+        except Exception as e:
+            self.error = e
+        self.elapsed = time.perf_counter() - start
+
+
+def _tick_gaps_with_qt(worker):
+    """Run the worker while a QTimer ticks on this thread's event loop; return the tick gaps"""
+    app = QCoreApplication.instance() or QCoreApplication([])
+    loop = QEventLoop()
+    ticks = []
+
+    def tick():
+        ticks.append(time.perf_counter())
+        if not worker.is_alive():
+            loop.quit()
+
+    timer = QTimer()
+    timer.setInterval(TICK_INTERVAL_MS)
+    timer.timeout.connect(tick)
+    timer.start()
+    worker.start()
+    loop.exec()
+    timer.stop()
+    worker.join()
+    return [later - earlier for earlier, later in zip(ticks, ticks[1:])]
+
+
+def _tick_gaps_with_sleep(worker):
+    """Same measurement with a plain sleep loop standing in for the event loop"""
+    ticks = []
+    worker.start()
+    while worker.is_alive():
+        ticks.append(time.perf_counter())
+        time.sleep(TICK_INTERVAL_MS / 1000)
+    worker.join()
+    return [later - earlier for earlier, later in zip(ticks, ticks[1:])]
+
+
+@unittest.skipUnless(RUST_AVAILABLE, "rust_extensions not built")
+class TestGilReleasedDuringBatches(unittest.TestCase):
+    """Test that the main thread keeps running while Rust works in a worker"""
+
+    def assert_main_thread_kept_ticking(self, gaps, worker):
+        self.assertIsNone(worker.error)
+        self.assertGreater(len(gaps), 5, "main thread did not tick while the batch ran")
+        self.assertLess(max(gaps), MAX_TICK_GAP_SECONDS,
+                        f"main thread stalled for {max(gaps):.3f}s during a {worker.elapsed:.3f}s call")
+
+    def test_concurrent_timers_release_gil(self):
+        """Waiting on Rust timer threads does not block Python threads"""
+        worker = _Worker(lambda: rust_extensions.manage_concurrent_timers(4, TIMER_BATCH_SECONDS))
+
+        gaps = _tick_gaps_with_sleep(worker)
+
+        self.assertGreaterEqual(worker.elapsed, TIMER_BATCH_SECONDS * 0.9)
+        self.assert_main_thread_kept_ticking(gaps, worker)
+
+    @unittest.skipUnless(QT_AVAILABLE, "PySide6 not installed")
+    def test_qt_event_loop_ticks_during_batch(self):
+        """A QTimer on the GUI thread keeps firing while a worker runs a Rust batch"""
+        worker = _Worker(lambda: rust_extensions.manage_concurrent_timers(4, TIMER_BATCH_SECONDS))
+
+        gaps = _tick_gaps_with_qt(worker)
+
+        self.assert_main_thread_kept_ticking(gaps, worker)
+
+    @unittest.skipUnless(NUMPY_AVAILABLE, "numpy not installed")
+    def test_large_array_batch_releases_gil(self):
+        """A multi-million element aggregation leaves the main thread responsive"""
+        if not hasattr(rust_extensions, 'calculate_aggregated_metrics_array'):
+            self.skipTest("rust_extensions built without the array interface")
+        rng = np.random.default_rng(1337)
+        size = 5_000_000
+        durations = rng.uniform(0.05, 2.0, size)
+        scores = rng.integers(1, 6, size).astype(np.float64)
+        earnings = durations * 25.0
+        limits = np.full(size, 1.5)
+
+        worker = _Worker(lambda: rust_extensions.calculate_aggregated_metrics_array(
+            durations, scores, earnings, limits
+        ))
+        gaps = _tick_gaps_with_sleep(worker)
+
+        if worker.elapsed < MAX_TICK_GAP_SECONDS * 2:
+            self.skipTest(f"batch finished in {worker.elapsed:.3f}s, too fast to measure a stall")
+        self.assert_main_thread_kept_ticking(gaps, worker)
+
+
+if __name__ == '__main__':
+    unittest.main()
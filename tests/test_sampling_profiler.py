@@ -0,0 +1,105 @@
+"""
+Unit tests for the on-demand sampling profiler
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.performance.sampling_profiler import SamplingProfiler, toggle_profiling, get_sampling_profiler
+
+
+def busy_worker_loop(stop_event):
+    """Spin in a recognisable function so samples land in it"""
+    while not stop_event.is_set():
+        sum(range(1000))
+
+
+def busy_gui_loop(seconds):
+    deadline = time.perf_counter() + seconds
+    while time.perf_counter() < deadline:
+        sum(range(1000))
+
+
+class TestSamplingProfiler(unittest.TestCase):
+    """Test sampling, thread attribution and collapsed-stack output"""
+
+    def setUp(self):
+        self.profiler = SamplingProfiler(interval_ms=1.0)
+        self.stop_worker = threading.Event()
+        self.worker = threading.Thread(target=busy_worker_loop, args=(self.stop_worker,), name="Loader")
+
+    def tearDown(self):
+        self.stop_worker.set()
+        if self.worker.is_alive():
+            self.worker.join()
+        self.profiler.stop()
+
+    def _profile(self, seconds=0.2):
+        self.worker.start()
+        self.profiler.start()
+        busy_gui_loop(seconds)
+        return self.profiler.stop()
+
+    def test_attributes_samples_to_gui_and_workers(self):
+        """The main thread is reported as 'gui', other threads by name"""
+        summary = self._profile()
+
+        self.assertFalse(summary['running'])
+        self.assertGreater(summary['samples'], 10)
+        self.assertGreater(summary['gui_samples'], 0)
+        self.assertGreater(summary['threads'].get('worker:Loader', 0), 0)
+        self.assertNotIn('worker:SamplingProfiler', summary['threads'])
+        functions = {row['function'].split(' ')[0] for row in summary['top_functions']}
+        self.assertTrue(functions & {'busy_gui_loop', 'busy_worker_loop'})
+
+    def test_collapsed_output(self):
+        """Each line is 'thread;outer;...;inner count', rooted at the thread label"""
+        self._profile()
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = self.profiler.write_collapsed(os.path.join(temp_dir, 'out', 'profile.collapsed'))
+            with open(path, encoding='utf-8') as f:
+                lines = f.read().splitlines()
+
+        self.assertTrue(lines)
+        for line in lines:
+            stack, count = line.rsplit(' ', 1)
+            self.assertGreater(int(count), 0)
+            self.assertTrue(stack.startswith(('gui;', 'worker:')))
+        gui_lines = self.profiler.collapsed_lines(thread='gui')
+        self.assertTrue(any('busy_gui_loop (test_sampling_profiler.py:' in line for line in gui_lines))
+        self.assertTrue(all(line.startswith('gui;') for line in gui_lines))
+
+    def test_start_twice_and_restart(self):
+        """A running profiler refuses a second start; a restart discards the old profile"""
+        self.assertTrue(self.profiler.start())
+        self.assertFalse(self.profiler.start())
+        busy_gui_loop(0.05)
+        self.profiler.stop()
+
+        self.profiler.start()
+        self.profiler.stop()
+        self.assertLess(self.profiler.summary()['samples'], 10)
+
+    def test_toggle_writes_file(self):
+        """Toggling starts the shared profiler, toggling again saves a profile"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            self.assertIsNone(toggle_profiling(temp_dir, 1.0))
+            self.assertTrue(get_sampling_profiler().is_running)
+            busy_gui_loop(0.05)
+            path = toggle_profiling(temp_dir)
+
+            self.assertFalse(get_sampling_profiler().is_running)
+            self.assertTrue(path.endswith('.collapsed'))
+            self.assertTrue(os.path.exists(path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+"""
+Unit tests for the versioned schema migration runner
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.db.schema_migrations import (
+    MigrationError, SCHEMA_VERSION, get_schema_version, run_pending_migrations
+)
+
+
+class TestSchemaMigrations(unittest.TestCase):
+    """Test version tracking, the up-to-date fast path and atomicity"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        self.conn = sqlite3.connect(self.db_path)
+
+    def tearDown(self):
+        self.conn.close()
+        self.temp_dir.cleanup()
+
+    def columns(self, table):
+        return {row[1] for row in self.conn.execute(f"PRAGMA table_info({table})")}
+
+    def test_fresh_database_is_migrated_to_current_version(self):
+        """All migrations run once and the version is recorded"""
+        applied = run_pending_migrations(self.conn)
+        self.assertEqual(len(applied), SCHEMA_VERSION)
+        self.assertEqual(get_schema_version(self.conn), SCHEMA_VERSION)
+        self.assertTrue({'time_begin', 'bonus_paid', 'audited_timestamp'} <= self.columns('tasks'))
+        self.assertTrue({'is_bonus_week', 'office_hour_count', 'start_date'} <= self.columns('weeks'))
+
+    def test_current_schema_is_a_single_pragma_read(self):
+        """A current database runs no migration statements at all"""
+        run_pending_migrations(self.conn)
+        statements = []
+        self.conn.set_trace_callback(statements.append)
+        self.assertEqual(run_pending_migrations(self.conn), [])
+        self.assertEqual(statements, ["PRAGMA user_version"])
+
+    def test_unversioned_database_is_upgraded_in_place(self):
+        """Databases created before versioning keep their data"""
+        self.conn.execute("CREATE TABLE weeks (id INTEGER PRIMARY KEY AUTOINCREMENT, week_label TEXT UNIQUE NOT NULL)")
+        self.conn.execute("INSERT INTO weeks (week_label) VALUES ('06/01/2025 - 12/01/2025')")
+        self.conn.commit()
+
+        run_pending_migrations(self.conn)
+        row = self.conn.execute("SELECT week_label, start_date, end_date FROM weeks").fetchone()
+        self.assertEqual(row, ('06/01/2025 - 12/01/2025', '2025-01-06', '2025-01-12'))
+
+    def test_failed_migration_rolls_back_everything(self):
+        """A failing migration leaves both schema and version untouched"""
+        def create_table(conn):
+            conn.execute("CREATE TABLE extra (id INTEGER)")
+
+        def broken(conn):
+            raise sqlite3.OperationalError("disk I/O error")
+
+        migrations = [(1, "create_table", create_table), (2, "broken", broken)]
+        with self.assertRaises(MigrationError):
+            run_pending_migrations(self.conn, migrations)
+
+        self.assertEqual(get_schema_version(self.conn), 0)
+        tables = {row[0] for row in self.conn.execute("SELECT name FROM sqlite_master WHERE type='table'")}
+        self.assertNotIn('extra', tables)
+
+    def test_only_newer_migrations_run(self):
+        """Migrations at or below the stored version are skipped"""
+        calls = []
+        migrations = [(1, "one", lambda conn: calls.append(1)), (2, "two", lambda conn: calls.append(2))]
+        self.conn.execute("PRAGMA user_version = 1")
+        self.assertEqual(run_pending_migrations(self.conn, migrations), ["two"])
+        self.assertEqual(calls, [2])
+        self.assertEqual(get_schema_version(self.conn), 2)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,158 @@
+"""
+Unit tests for the append-only startup history and StartupPerformanceMonitor
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.optimization.startup_history import RollingStats, StartupHistoryStore
+from core.optimization.startup_monitor import StartupPerformanceMonitor
+
+
+def launch(version, total_ms, **phases):
+    return {'version': version, 'total_ms': total_ms, 'phases': phases,
+            'lazy_imports_used': True, 'cache_system_used': False}
+
+
+class TestRollingStats(unittest.TestCase):
+    """Test the ring window and all-time aggregates"""
+
+    def test_window_keeps_latest_values(self):
+        stats = RollingStats(window_size=4)
+        for value in [100, 1, 2, 3, 4]:
+            stats.add(value)
+
+        summary = stats.summary()
+        self.assertEqual(summary['count'], 5)
+        self.assertEqual(summary['worst'], 100)
+        self.assertEqual(summary['max'], 4)  # 100 rolled out of the window
+        self.assertEqual(summary['p50'], 2)
+
+    def test_round_trip(self):
+        stats = RollingStats(window_size=3)
+        for value in range(5):
+            stats.add(value)
+        restored = RollingStats.from_dict(json.loads(json.dumps(stats.to_dict())), window_size=3)
+        restored.add(10)
+
+        self.assertEqual(sorted(restored.window), [3, 4, 10])
+
+
+class TestStartupHistoryStore(unittest.TestCase):
+    """Test appending, bounding, aggregates and regression detection"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'startup_history.jsonl')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def test_aggregates_survive_reload(self):
+        """A new store instance reads the summary, not the history"""
+        store = StartupHistoryStore(self.path)
+        for total in [1000, 1200, 1100]:
+            store.append(launch('v1', total, Migrations=total / 2))
+
+        reloaded = StartupHistoryStore(self.path).summary()
+
+        self.assertEqual(reloaded['sessions'], 3)
+        self.assertEqual(reloaded['total']['p50'], 1100)
+        self.assertEqual(reloaded['total']['max'], 1200)
+        self.assertEqual(reloaded['phases']['Migrations']['p95'], 600)
+
+    def test_history_is_bounded(self):
+        """Only two segments of segment_size records are kept"""
+        store = StartupHistoryStore(self.path, segment_size=5)
+        for index in range(23):
+            store.append(launch('v1', 1000 + index))
+
+        records = list(store.iter_records())
+        self.assertEqual(len(records), 8)  # 5 in the previous segment, 3 in the active one
+        self.assertEqual(records[-1]['total_ms'], 1022)
+        self.assertEqual(store.summary()['total']['count'], 23)
+
+    def test_regression_against_previous_version(self):
+        """A phase slower on the new version is reported once it has enough launches"""
+        store = StartupHistoryStore(self.path)
+        for _ in range(5):
+            store.append(launch('v1', 1000, Migrations=200, Theme=5))
+
+        self.assertEqual(store.append(launch('v2', 1400, Migrations=400, Theme=50)), [])
+        store.append(launch('v2', 1400, Migrations=400, Theme=50))
+        regressions = store.append(launch('v2', 1400, Migrations=400, Theme=50))
+
+        phases = [regression['phase'] for regression in regressions]
+        self.assertEqual(phases, ['Migrations', 'total'])  # Theme baseline is below MIN_REGRESSION_MS
+        self.assertEqual(regressions[0]['baseline_version'], 'v1')
+        self.assertAlmostEqual(regressions[0]['ratio'], 2.0)
+
+    def test_corrupt_summary_starts_fresh(self):
+        store = StartupHistoryStore(self.path)
+        store.append(launch('v1', 1000))
+        with open(store.summary_file, 'w') as f:
+            f.write("{not json")
+
+        self.assertTrue(StartupHistoryStore(self.path).is_empty())
+
+
+class TestStartupMonitorHistory(unittest.TestCase):
+    """Test that the monitor records sessions and reports from the store"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.history_file = os.path.join(self.temp_dir.name, 'startup_history.jsonl')
+        self.legacy_file = os.path.join(self.temp_dir.name, 'startup_performance.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def _run_session(self, monitor):
+        monitor.start_session("test")
+        monitor.start_phase("Application Setup", critical=True)
+        monitor.finish_phase("Application Setup")
+        monitor.set_optimization_flags(lazy_imports=True)
+        monitor.finish_session()
+
+    def test_report_after_sessions(self):
+        monitor = StartupPerformanceMonitor(self.history_file, self.legacy_file)
+        monitor.app_version = 'v1'
+        for _ in range(3):
+            self._run_session(monitor)
+
+        report = StartupPerformanceMonitor(self.history_file, self.legacy_file).get_performance_report()
+
+        self.assertEqual(report['summary']['total_sessions'], 3)
+        self.assertEqual(report['summary']['version'], 'v1')
+        self.assertIn('Application Setup', report['phases_ms'])
+        self.assertGreater(report['timing_analysis']['latest_time'], 0)
+        self.assertEqual(report['regressions'], [])
+
+    def test_legacy_history_imported_once(self):
+        legacy = [{
+            'session_id': 'old', 'start_time': 1.0, 'end_time': 3.5, 'total_duration': 2.5,
+            'lazy_imports_used': False, 'cache_system_used': False, 'optimization_version': '1.0.0',
+            'phases': [{'name': 'Database Migrations', 'start_time': 1.0, 'end_time': 2.0,
+                        'duration': 1.0, 'description': '', 'critical': True}],
+        }]
+        with open(self.legacy_file, 'w') as f:
+            json.dump(legacy, f)
+
+        monitor = StartupPerformanceMonitor(self.history_file, self.legacy_file)
+        monitor.app_version = 'v1'
+        self._run_session(monitor)
+        self._run_session(monitor)
+
+        report = monitor.get_performance_report()
+        self.assertEqual(report['summary']['total_sessions'], 3)
+        self.assertEqual(report['timing_analysis']['worst_time'], 2.5)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""
+Unit tests for the warm-start snapshot
+"""
+
+import json
+import os
+import sys
+import tempfile
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.services.startup_snapshot import (
+    MAX_SNAPSHOT_ROWS, StartupSnapshot, load_startup_snapshot, save_startup_snapshot
+)
+
+
+class TestStartupSnapshot(unittest.TestCase):
+    """Test round-tripping, bounding and invalidation of the snapshot"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.temp_dir.name, 'startup_snapshot.json')
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    def make_row(self, task_id):
+        return (task_id, f"att-{task_id}", '00:10:00', 'p1', 'Project', 'op', '00:30:00',
+                '2025-01-06', 4, None, 'en_US', '09:00', '09:10')
+
+    def test_round_trip(self):
+        """Weeks, selected week and rows come back as saved"""
+        snapshot = StartupSnapshot(weeks=[(1, '06/01/2025 - 12/01/2025'), (2, '13/01/2025 - 19/01/2025')],
+                                   selected_week_id=2, task_rows=[self.make_row(7), self.make_row(8)])
+        self.assertTrue(save_startup_snapshot(snapshot, self.path))
+
+        loaded = load_startup_snapshot(self.path)
+        self.assertEqual(loaded.weeks, snapshot.weeks)
+        self.assertEqual(loaded.selected_week_id, 2)
+        self.assertEqual(loaded.task_rows, [self.make_row(7), self.make_row(8)])
+
+    def test_rows_are_bounded(self):
+        """Only the leading rows of a large week are stored"""
+        rows = [self.make_row(i) for i in range(MAX_SNAPSHOT_ROWS * 3)]
+        save_startup_snapshot(StartupSnapshot(weeks=[(1, 'w')], selected_week_id=1, task_rows=rows), self.path)
+        self.assertEqual(len(load_startup_snapshot(self.path).task_rows), MAX_SNAPSHOT_ROWS)
+
+    def test_rows_for_unknown_week_are_dropped(self):
+        """A selected week missing from the week list is ignored"""
+        save_startup_snapshot(StartupSnapshot(weeks=[(1, 'w')], selected_week_id=5,
+                                              task_rows=[self.make_row(1)]), self.path)
+        loaded = load_startup_snapshot(self.path)
+        self.assertIsNone(loaded.selected_week_id)
+        self.assertEqual(loaded.task_rows, [])
+
+    def test_stale_or_corrupt_snapshots_are_ignored(self):
+        """Snapshots from another schema version or unreadable files load as None"""
+        self.assertIsNone(load_startup_snapshot(self.path))
+
+        save_startup_snapshot(StartupSnapshot(weeks=[(1, 'w')]), self.path)
+        with open(self.path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        data['schema_version'] -= 1
+        with open(self.path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+        self.assertIsNone(load_startup_snapshot(self.path))
+
+        with open(self.path, 'w', encoding='utf-8') as f:
+            f.write('{"format": 1, "weeks": [[1')
+        self.assertIsNone(load_startup_snapshot(self.path))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,70 @@
+"""
+Unit tests for the narrow task row shape
+
+List queries of TaskDAO and TaskRepository return TASK_LIST_COLUMNS without
+the free-text feedback, which is loaded per task with get_task_feedback().
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from unittest.mock import patch
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.db.connection_manager import get_connection_manager
+from core.db.schema_migrations import migrate_database
+from core.optimization.multi_tier_cache import MultiTierCache
+from core.repositories.task_repository import TaskRepository
+from core.services.data_service import DataService
+from core.services.task_dao import TASK_LIST_COLUMNS, TaskDAO
+
+
+class TestTaskListColumns(unittest.TestCase):
+    """Test that list queries leave feedback out and the DAO loads it on demand"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        migrate_database(self.db_path)
+        with get_connection_manager(self.db_path).writer() as conn:
+            conn.execute("INSERT INTO weeks (id, week_label) VALUES (1, 'Week 1')")
+            conn.execute(
+                "INSERT INTO tasks (id, week_id, project_name, time_begin, time_end, feedback) "
+                "VALUES (1, 1, 'Alpha', '2024-01-01T09:00', '2024-01-01T10:00', ?)",
+                ("long feedback " * 100,)
+            )
+            conn.commit()
+
+        DataService.reset_instance()
+        with patch('core.services.data_service.MultiTierCache',
+                   side_effect=lambda: MultiTierCache(cache_dir=self.temp_dir.name)):
+            self.service = DataService(self.db_path)
+        self.repository = TaskRepository(self.service)
+
+    def tearDown(self):
+        get_connection_manager(self.db_path).close_all()
+        DataService.reset_instance()
+        self.temp_dir.cleanup()
+
+    def test_repository_project_listing(self):
+        rows = self.repository.get_tasks_by_project('Alpha')
+
+        self.assertEqual([row['id'] for row in rows], [1])
+        self.assertEqual(set(rows[0]), set(TASK_LIST_COLUMNS))
+
+    def test_repository_date_range_listing(self):
+        rows = self.repository.get_tasks_by_date_range('2024-01-01', '2024-01-02')
+
+        self.assertEqual([row['id'] for row in rows], [1])
+        self.assertNotIn('feedback', rows[0])
+
+    def test_feedback_loaded_on_demand(self):
+        self.assertEqual(TaskDAO(self.service).get_task_feedback(1), "long feedback " * 100)
+        self.assertEqual(TaskDAO(self.service).get_task_feedback(999), "")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,103 @@
+"""
+Unit tests for the FTS5 task search index and query builder
+"""
+
+import contextlib
+import io
+import os
+import sqlite3
+import sys
+import tempfile
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.db.schema_migrations import run_pending_migrations
+from core.db.task_search import build_match_expression, build_search_query
+
+
+class TestMatchExpression(unittest.TestCase):
+    """Test conversion of typed text to FTS5 prefix queries"""
+
+    def test_words_become_quoted_prefixes(self):
+        """Every word is a quoted prefix term; punctuation splits words"""
+        self.assertEqual(build_match_expression("att-00 Spanish"), '"att"* "00"* "Spanish"*')
+
+    def test_operators_are_literal(self):
+        """FTS5 syntax in user input cannot change the query"""
+        self.assertEqual(build_match_expression('feedback: NEAR("a" OR b)'), '"feedback"* "NEAR"* "a"* "OR"* "b"*')
+
+    def test_empty_search(self):
+        """Text without words does not produce a query"""
+        self.assertIsNone(build_match_expression("  --  "))
+        self.assertIsNone(build_search_query(""))
+
+
+class TestTaskSearchIndex(unittest.TestCase):
+    """Test the tasks_fts index, its triggers and ranked search"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.conn = sqlite3.connect(os.path.join(self.temp_dir.name, 'tasks.db'))
+        with contextlib.redirect_stdout(io.StringIO()):
+            run_pending_migrations(self.conn)
+        self.conn.executemany("INSERT INTO weeks (id, week_label) VALUES (?, ?)",
+                              [(1, '06/01/2025 - 12/01/2025'), (2, '13/01/2025 - 19/01/2025')])
+        self.conn.executemany(
+            "INSERT INTO tasks (id, week_id, attempt_id, operation_id, project_name, locale, feedback) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            [
+                (1, 1, 'att-1001', 'op-77', 'Translation QA', 'es_ES', 'accurate translation, good tone'),
+                (2, 1, 'att-1002', 'op-78', 'Maps Review', 'en_US', 'missing translation context'),
+                (3, 2, 'att-2001', 'op-79', 'Translation QA', 'fr_FR', None),
+            ]
+        )
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+        self.temp_dir.cleanup()
+
+    def search(self, term, week_id=None):
+        sql, params = build_search_query(term, week_id)
+        return [row[0] for row in self.conn.execute(sql, params)]
+
+    def test_prefix_search_across_columns(self):
+        """Prefixes match identifiers, project names and feedback in all weeks"""
+        self.assertEqual(sorted(self.search("att-100")), [1, 2])
+        self.assertEqual(sorted(self.search("transl")), [1, 2, 3])
+        self.assertEqual(self.search("op-79"), [3])
+
+    def test_all_words_must_match(self):
+        """Multiple words narrow the results"""
+        self.assertEqual(self.search("transl context"), [2])
+
+    def test_week_filter(self):
+        """week_id limits results to one week"""
+        self.assertEqual(sorted(self.search("translation", week_id=2)), [3])
+
+    def test_identifier_matches_rank_first(self):
+        """Project name matches outrank matches in free-text feedback"""
+        self.assertEqual(self.search("translation")[-1], 2)
+
+    def test_triggers_keep_index_in_sync(self):
+        """Inserts, updates and deletes are reflected in search results"""
+        self.conn.execute("UPDATE tasks SET feedback = 'policy violation' WHERE id = 3")
+        self.conn.execute("INSERT INTO tasks (id, week_id, attempt_id, feedback) VALUES (4, 2, 'att-3001', 'policy')")
+        self.conn.execute("DELETE FROM tasks WHERE id = 1")
+        self.conn.commit()
+
+        self.assertEqual(sorted(self.search("polic")), [3, 4])
+        self.assertEqual(self.search("att-1001"), [])
+        # Raises if the index no longer matches the tasks table
+        self.conn.execute("INSERT INTO tasks_fts(tasks_fts) VALUES ('integrity-check')")
+
+    def test_like_fallback(self):
+        """Without the FTS index the same API runs a LIKE search"""
+        sql, params = build_search_query("Maps", use_fts=False)
+        self.assertEqual([row[0] for row in self.conn.execute(sql, params)], [2])
+
+
+if __name__ == '__main__':
+    unittest.main()
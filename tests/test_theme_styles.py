@@ -0,0 +1,54 @@
+"""
+Unit tests for the precompiled theme stylesheets
+"""
+
+import os
+import re
+import sys
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from ui.theme_styles import (THEMES, DARK, LIGHT, MAIN_SCOPE, ANALYSIS_SCOPE, compile_stylesheet,
+                             application_stylesheet, window_stylesheet)
+
+COLOR_RE = re.compile(r'#[0-9a-fA-F]{3,6}\b|rgb|palette\(')
+
+
+class TestThemeStyles(unittest.TestCase):
+    """Test stylesheet compilation, caching and theme scoping"""
+
+    def test_compile_strips_comments_and_whitespace(self):
+        compiled = compile_stylesheet("""
+            QPushButton {
+                padding: 1px 2px; /* comment */
+                border-radius: 4px;
+            }
+            QComboBox QAbstractItemView { font-size: 11px; }
+        """)
+
+        self.assertEqual(compiled, "QPushButton{padding:1px 2px;border-radius:4px}"
+                                   "QComboBox QAbstractItemView{font-size:11px}")
+
+    def test_application_stylesheet_has_no_colors(self):
+        """The shared stylesheet never changes with the theme, so it must not carry colors"""
+        self.assertIsNone(COLOR_RE.search(application_stylesheet()))
+        self.assertIn("QGroupBox::title{", application_stylesheet())
+
+    def test_window_stylesheets_are_cached(self):
+        self.assertIs(window_stylesheet(DARK), window_stylesheet(DARK))
+        self.assertNotEqual(window_stylesheet(DARK), window_stylesheet(LIGHT))
+
+    def test_scoped_rules_stay_in_their_window(self):
+        self.assertIn("#AnalysisTable", window_stylesheet(DARK, ANALYSIS_SCOPE))
+        self.assertNotIn("#AnalysisTable", window_stylesheet(DARK, MAIN_SCOPE))
+        self.assertNotIn("#TaskTable", window_stylesheet(LIGHT, ANALYSIS_SCOPE))
+
+    def test_themes_define_the_same_palette_roles(self):
+        self.assertEqual(set(THEMES[DARK].palette), set(THEMES[LIGHT].palette))
+        self.assertEqual(set(THEMES[DARK].scoped), set(THEMES[LIGHT].scoped))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,95 @@
+"""
+Unit tests for the monotonic timer engine
+"""
+
+import os
+import sys
+import time
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.services.timer_engine import TimerEngine
+
+
+class FakeClock:
+    """Monotonic clock advanced by hand"""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+    def advance(self, seconds):
+        self.now += seconds
+
+
+class TestTimerEngine(unittest.TestCase):
+    """Test elapsed time accounting independent of display ticks"""
+
+    def setUp(self):
+        self.clock = FakeClock()
+        self.engine = TimerEngine(clock=self.clock)
+
+    def test_blocked_loop_loses_no_time(self):
+        """No reads happen while the loop is blocked; the next read is still exact"""
+        self.engine.start(1, initial_seconds=60)
+        self.clock.advance(5.0)
+
+        self.assertEqual(self.engine.elapsed_seconds(1), 65)
+
+    def test_pause_and_resume_keep_fractions(self):
+        self.engine.start(1)
+        self.clock.advance(0.6)
+        self.engine.pause(1)
+        self.clock.advance(30.0)  # Paused time is not counted
+        self.engine.start(1)
+        self.clock.advance(0.6)
+
+        self.assertAlmostEqual(self.engine.elapsed(1), 1.2)
+        self.assertEqual(self.engine.elapsed_seconds(1), 1)
+
+    def test_set_elapsed_while_running(self):
+        """A manual edit replaces the elapsed time and the timer keeps running"""
+        self.engine.start(1)
+        self.clock.advance(100.0)
+        self.engine.set_elapsed(1, 10)
+        self.clock.advance(2.0)
+
+        self.assertTrue(self.engine.is_running(1))
+        self.assertEqual(self.engine.elapsed_seconds(1), 12)
+
+    def test_concurrent_timers(self):
+        """Several running timers are read at one instant; paused ones are left out"""
+        self.engine.start(1)
+        self.clock.advance(10.0)
+        self.engine.start(2, initial_seconds=100)
+        self.engine.start(3)
+        self.clock.advance(5.0)
+        self.engine.pause(3)
+
+        self.assertEqual(self.engine.snapshot(), {1: 15, 2: 105})
+        self.assertEqual(sorted(self.engine.running_task_ids()), [1, 2])
+
+    def test_remove_and_unknown_tasks(self):
+        self.engine.start(1)
+        self.clock.advance(3.0)
+
+        self.assertEqual(self.engine.remove(1), 3.0)
+        self.assertEqual(self.engine.elapsed(1), 0.0)
+        self.assertEqual(self.engine.pause(1), 0.0)
+        self.assertFalse(self.engine.is_running(1))
+
+    def test_real_clock_blocked_thread(self):
+        """With the real monotonic clock, a sleep stands in for a stalled event loop"""
+        engine = TimerEngine()
+        engine.start(1)
+        time.sleep(0.25)
+
+        self.assertGreaterEqual(engine.elapsed(1), 0.25)
+
+
+if __name__ == '__main__':
+    unittest.main()
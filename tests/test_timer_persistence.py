@@ -0,0 +1,112 @@
+"""
+Unit tests for the journaled timer persistence service
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import unittest
+from contextlib import contextmanager
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.services.timer_persistence import TimerPersistenceService
+
+
+class TestTimerPersistenceService(unittest.TestCase):
+    """Test journaling, coalescing and crash recovery"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.temp_dir.name, 'tasks.db')
+        self.journal_path = os.path.join(self.temp_dir.name, 'timer_journal.jsonl')
+        self.statements = []
+
+        conn = sqlite3.connect(self.db_path)
+        conn.execute("""CREATE TABLE tasks (id INTEGER PRIMARY KEY, duration TEXT,
+                        time_begin TEXT, time_end TEXT)""")
+        conn.executemany("INSERT INTO tasks (id, duration, time_begin) VALUES (?, '00:00:00', ?)",
+                         [(1, '09:00:00'), (2, None)])
+        conn.commit()
+        conn.close()
+
+    def tearDown(self):
+        self.temp_dir.cleanup()
+
+    @contextmanager
+    def traced_connection(self):
+        conn = sqlite3.connect(self.db_path)
+        conn.set_trace_callback(self.statements.append)
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    def make_service(self):
+        return TimerPersistenceService(db_path=self.db_path, journal_path=self.journal_path,
+                                       connection_factory=self.traced_connection)
+
+    def fetch(self, task_id):
+        conn = sqlite3.connect(self.db_path)
+        try:
+            return conn.execute("SELECT duration, time_begin, time_end FROM tasks WHERE id = ?",
+                                (task_id,)).fetchone()
+        finally:
+            conn.close()
+
+    def test_ticks_are_coalesced_into_one_transaction(self):
+        """Many ticks for several tasks become one write per task in a single commit"""
+        service = self.make_service()
+        for second in range(1, 61):
+            service.record_duration(1, second)
+            service.record_duration(2, second * 2)
+        service.record_times(2, time_begin='10:00:00')
+
+        self.assertEqual(service.flush(), 2)
+
+        updates = [s for s in self.statements if s.lstrip().startswith('UPDATE')]
+        commits = [s for s in self.statements if s.strip().upper() == 'COMMIT']
+        self.assertEqual((len(updates), len(commits)), (2, 1))
+        self.assertEqual(self.fetch(1), ('00:01:00', '09:00:00', None))
+        self.assertEqual(self.fetch(2), ('00:02:00', '10:00:00', None))
+        self.assertEqual(os.path.getsize(self.journal_path), 0)
+        service.close()
+
+    def test_unflushed_ticks_are_replayed(self):
+        """Ticks journaled before a crash are applied on the next startup"""
+        crashed = self.make_service()
+        crashed.record_duration(1, 125)
+        crashed.record_times(1, time_end='09:02:05')
+        # Simulate a crash: no flush, plus a torn final journal line
+        crashed._journal.write('{"task_id": 2, "dur')
+        crashed._journal.flush()
+
+        restarted = self.make_service()
+        self.assertEqual(restarted.replay_journal(), 1)
+        self.assertEqual(self.fetch(1), ('00:02:05', '09:00:00', '09:02:05'))
+        self.assertEqual(self.fetch(2), ('00:00:00', None, None))
+        self.assertEqual(restarted.replay_journal(), 0)
+
+    def test_failed_flush_keeps_pending_updates(self):
+        """A failed write leaves updates pending for the next interval"""
+        service = self.make_service()
+        service.record_duration(1, 30)
+
+        @contextmanager
+        def broken_connection():
+            raise sqlite3.OperationalError("database is locked")
+            yield
+
+        service._connection_factory = broken_connection
+        self.assertEqual(service.flush(), 0)
+        self.assertTrue(service.has_pending())
+
+        service._connection_factory = self.traced_connection
+        self.assertEqual(service.flush(), 1)
+        self.assertEqual(self.fetch(1)[0], '00:00:30')
+
+
+if __name__ == '__main__':
+    unittest.main()
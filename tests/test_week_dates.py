@@ -0,0 +1,100 @@
+"""
+Unit tests for week start/end date columns and their backfill migration
+"""
+
+import os
+import sys
+import sqlite3
+import tempfile
+import unittest
+
+# Add src to path for imports
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+
+from core.db.week_dates import parse_week_label_dates, with_week_dates
+from core.db.db_schema import migrate_week_date_columns
+
+
+class TestWeekLabelParsing(unittest.TestCase):
+    """Test deriving ISO dates from week labels"""
+
+    def test_parse_ui_label(self):
+        """The UI label format dd/MM/yyyy is parsed day-first"""
+        self.assertEqual(parse_week_label_dates("05/01/2024 - 11/01/2024"),
+                         ("2024-01-05", "2024-01-11"))
+
+    def test_parse_other_formats(self):
+        """Imported labels in ISO and dashed formats are accepted"""
+        self.assertEqual(parse_week_label_dates("2024-01-05 - 2024-01-11"),
+                         ("2024-01-05", "2024-01-11"))
+        self.assertEqual(parse_week_label_dates("05-01-2024 - 11-01-2024"),
+                         ("2024-01-05", "2024-01-11"))
+
+    def test_malformed_label(self):
+        """Malformed labels produce no dates instead of raising"""
+        self.assertEqual(parse_week_label_dates("Week 1"), (None, None))
+        self.assertEqual(parse_week_label_dates(None), (None, None))
+
+    def test_with_week_dates_keeps_explicit_values(self):
+        """Dates passed by the caller win over the label"""
+        values = with_week_dates({'week_label': "05/01/2024 - 11/01/2024",
+                                  'start_date': "2024-01-04"})
+        self.assertEqual(values['start_date'], "2024-01-04")
+        self.assertEqual(values['end_date'], "2024-01-11")
+
+
+class TestWeekDateMigration(unittest.TestCase):
+    """Test the weeks start/end date migration on a legacy schema"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.conn = sqlite3.connect(os.path.join(self.temp_dir.name, 'weeks.db'))
+        self.conn.execute("CREATE TABLE weeks (id INTEGER PRIMARY KEY AUTOINCREMENT, week_label TEXT UNIQUE NOT NULL)")
+        self.conn.executemany("INSERT INTO weeks (week_label) VALUES (?)", [
+            ("12/01/2024 - 18/01/2024",),
+            ("05/01/2024 - 11/01/2024",),
+            ("Unlabelled",),
+        ])
+        self.conn.commit()
+
+    def tearDown(self):
+        self.conn.close()
+        self.temp_dir.cleanup()
+
+    def test_backfill_and_ordering(self):
+        """Existing weeks are backfilled and sort chronologically in SQL"""
+        migrate_week_date_columns(self.conn)
+
+        rows = self.conn.execute(
+            "SELECT week_label, start_date, end_date FROM weeks ORDER BY start_date, id"
+        ).fetchall()
+        self.assertEqual(rows, [
+            ("Unlabelled", None, None),
+            ("05/01/2024 - 11/01/2024", "2024-01-05", "2024-01-11"),
+            ("12/01/2024 - 18/01/2024", "2024-01-12", "2024-01-18"),
+        ])
+
+    def test_containing_week_uses_index(self):
+        """Looking up the week containing a date is an index search"""
+        migrate_week_date_columns(self.conn)
+
+        query = ("SELECT week_label FROM weeks WHERE start_date <= ? AND end_date >= ? "
+                 "ORDER BY start_date DESC LIMIT 1")
+        row = self.conn.execute(query, ("2024-01-14", "2024-01-14")).fetchone()
+        self.assertEqual(row[0], "12/01/2024 - 18/01/2024")
+
+        plan = " ".join(r[-1] for r in self.conn.execute("EXPLAIN QUERY PLAN " + query,
+                                                         ("2024-01-14", "2024-01-14")))
+        self.assertIn("idx_weeks_date_range", plan)
+
+    def test_migration_is_idempotent(self):
+        """Running the migration twice leaves the schema unchanged"""
+        migrate_week_date_columns(self.conn)
+        migrate_week_date_columns(self.conn)
+
+        columns = [c[1] for c in self.conn.execute("PRAGMA table_info(weeks)")]
+        self.assertEqual(columns.count("start_date"), 1)
+
+
+if __name__ == '__main__':
+    unittest.main()